@@ -5,10 +5,18 @@ Run with: uvicorn api_server:app --reload --port 8000
 
 Install: pip install fastapi uvicorn
 
-Thin HTTP layer — all heavy logic lives in kundali.api.
+Thin HTTP layer — all heavy logic lives in kundali.api.  Engine calls run
+in a process pool (see "Engine worker pool" below for the settings), so one
+uvicorn worker serves concurrent requests on all cores.
 """
 
+import asyncio
+import collections
+import functools
+import multiprocessing
 import os
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 try:
@@ -19,7 +27,7 @@ except ImportError:
 
 from fastapi import FastAPI, HTTPException, Query, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 import datetime
@@ -29,6 +37,7 @@ from kundali.api import (
     calculate as api_calculate,
     serialize_result,
     to_json,
+    dumps,
     PLANET_FULL,
     get_career_decision,
     get_marriage_decision,
@@ -41,8 +50,20 @@ from kundali.api import (
     get_life_analysis,
     get_all_decisions,
 )
+from kundali.decisions import DECISION_SECTIONS
+from kundali.report_jobs import ReportJobs, ReportStore
+from kundali.report_pdf import safe_filename
+
+@asynccontextmanager
+async def _lifespan(app):
+    yield
+    # the pools are created on first use; stop whichever were started
+    _shutdown_executor()
+    _shutdown_report_jobs()
+
 
 app = FastAPI(
+    lifespan=_lifespan,
     title="Vedic Kundali API",
     description="""
 ## 🌟 Complete Vedic Astrology Calculation Engine
@@ -1567,6 +1588,405 @@ Content-Type: application/json
 """
 
 
+# ---------------------------------------------------------------------------
+# Engine worker pool
+# ---------------------------------------------------------------------------
+# Swiss Ephemeris keeps global state (sidereal mode, ephemeris path), so
+# engine work runs in worker *processes*, never concurrently in threads.
+# Handlers stay async and await the pool; when too much work is queued the
+# request is rejected with 429 instead of piling up.
+#
+#   KUNDALI_ENGINE_WORKERS      worker processes (default: CPU count;
+#                               0 = one in-process thread, for development)
+#   KUNDALI_ENGINE_MAX_PENDING  jobs running or queued before 429
+#                               (default: 4 per worker)
+#   KUNDALI_ROUTE_LIMITS        per-route concurrency overrides, e.g.
+#                               "muhurtha=1,calculate=8"
+
+def _env_int(name, default):
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_route_limits(spec):
+    limits = {}
+    for item in (spec or "").split(","):
+        route, _, value = item.partition("=")
+        try:
+            limits[route.strip()] = int(value)
+        except ValueError:
+            continue
+    return limits
+
+
+ENGINE_WORKERS = max(0, _env_int("KUNDALI_ENGINE_WORKERS", os.cpu_count() or 1))
+ENGINE_MAX_PENDING = max(1, _env_int("KUNDALI_ENGINE_MAX_PENDING", max(1, ENGINE_WORKERS) * 4))
+
+# Scans (muhurtha, transit calendar) and two-chart routes are the expensive
+# ones; they get a smaller share so they cannot starve single-chart traffic.
+ROUTE_CONCURRENCY = {
+    "calculate": ENGINE_MAX_PENDING,
+    "decisions": ENGINE_MAX_PENDING,
+    "match": max(1, ENGINE_MAX_PENDING // 2),
+    "muhurtha": max(1, ENGINE_MAX_PENDING // 4),
+    "transit_calendar": max(1, ENGINE_MAX_PENDING // 4),
+}
+ROUTE_CONCURRENCY.update(_parse_route_limits(os.getenv("KUNDALI_ROUTE_LIMITS")))
+
+_executor = None
+_pending = 0
+_route_active = collections.Counter()
+
+
+def _get_executor():
+    """Return the shared engine executor (created on first use)."""
+    global _executor
+    if _executor is None:
+        if ENGINE_WORKERS == 0:
+            _executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            _executor = ProcessPoolExecutor(
+                max_workers=ENGINE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _executor
+
+
+def _shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _discard_executor(executor):
+    """Drop a broken pool so the next job starts a fresh one."""
+    global _executor
+    if _executor is executor:  # concurrent requests may have replaced it already
+        _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_engine(route, fn, *args, **kwargs):
+    """
+    Run ``fn(*args, **kwargs)`` in the engine pool without blocking the event loop.
+
+    Jobs that return pre-encoded JSON bytes are sent as-is, skipping
+    FastAPI's jsonable_encoder pass.
+
+    A pool broken by a dead worker (crash, OOM kill) is replaced and the job
+    retried once.
+
+    Raises HTTPException(429) when the pool or the route is saturated, and
+    HTTPException(503) when the job breaks a fresh pool as well.
+    """
+    global _pending
+    limit = ROUTE_CONCURRENCY.get(route, ENGINE_MAX_PENDING)
+    if _pending >= ENGINE_MAX_PENDING or _route_active[route] >= limit:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Server is busy ({route}); please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+    _pending += 1
+    _route_active[route] += 1
+    try:
+        loop = asyncio.get_running_loop()
+        job = functools.partial(fn, *args, **kwargs)
+        for _attempt in range(2):
+            executor = _get_executor()
+            try:
+                result = await loop.run_in_executor(executor, job)
+                break
+            except BrokenExecutor:
+                _discard_executor(executor)
+        else:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Engine worker failed ({route}); please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+    finally:
+        _pending -= 1
+        _route_active[route] -= 1
+    if isinstance(result, bytes):
+        return Response(content=result, media_type="application/json")
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Report jobs
+# ---------------------------------------------------------------------------
+# PDF reports are rendered in the background by their own worker pool, so
+# interactive chart requests never wait behind a render.  Finished PDFs are
+# kept under content-hashed keys (see kundali.report_jobs).
+#
+#   KUNDALI_REPORT_WORKERS      PDF worker processes (default 1;
+#                               0 = one in-process thread, for development)
+#   KUNDALI_REPORT_MAX_PENDING  reports queued or rendering before 429
+#                               (default: 8 per worker)
+#   KUNDALI_REPORT_DIR          artifact directory
+#                               (default: ~/.cache/kundali/reports)
+#   KUNDALI_REPORT_TTL_HOURS    lifetime of a finished report (default 24)
+
+REPORT_WORKERS = max(0, _env_int("KUNDALI_REPORT_WORKERS", 1))
+REPORT_MAX_PENDING = max(1, _env_int("KUNDALI_REPORT_MAX_PENDING", max(1, REPORT_WORKERS) * 8))
+REPORT_TTL_HOURS = max(1, _env_int("KUNDALI_REPORT_TTL_HOURS", 24))
+
+_report_jobs = None
+
+
+def _default_report_dir():
+    path = os.getenv("KUNDALI_REPORT_DIR")
+    if path:
+        return path
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "kundali", "reports")
+
+
+def _get_report_jobs():
+    """Return the shared report job queue (created on first use)."""
+    global _report_jobs
+    if _report_jobs is None:
+        store = ReportStore(_default_report_dir(), ttl=REPORT_TTL_HOURS * 3600)
+        _report_jobs = ReportJobs(store, workers=REPORT_WORKERS)
+    return _report_jobs
+
+
+def _shutdown_report_jobs():
+    global _report_jobs
+    if _report_jobs is not None:
+        _report_jobs.shutdown()
+        _report_jobs = None
+
+
+def _report_status(job):
+    status = job.to_dict()
+    status["url"] = f"/reports/{job.id}"
+    if job.status == "done":
+        status["download_url"] = f"/reports/{job.id}?download=true"
+    return status
+
+
+# ---------------------------------------------------------------------------
+# Engine jobs (module-level so they can be pickled into worker processes)
+# ---------------------------------------------------------------------------
+
+_DECISION_FUNCS = {
+    "career": get_career_decision,
+    "marriage": get_marriage_decision,
+    "business": get_business_decision,
+    "health": get_health_decision,
+    "travel": get_travel_decision,
+    "daily": get_daily_guidance,
+    "education": get_education_decision,
+    "life_analysis": get_life_analysis,
+    "all": get_all_decisions,
+}
+
+
+def _birth_kwargs(bd: BirthData) -> dict:
+    """Flatten a BirthData model into picklable api_calculate arguments."""
+    return {
+        "birth_date": f"{bd.year:04d}-{bd.month:02d}-{bd.day:02d}",
+        "birth_time": f"{bd.hour:02d}:{bd.minute:02d}",
+        "place": bd.place,
+        "gender": bd.gender,
+        "ayanamsa": bd.ayanamsa,
+        "name": bd.name,
+    }
+
+
+def _parse_fields(fields):
+    """Split a comma-separated ``fields=`` projection (None = everything)."""
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(",") if f.strip()]
+
+
+def _calculate_job(birth_date, birth_time, place, gender, ayanamsa, name, fields=None):
+    result = api_calculate(
+        birth_date, birth_time, place,
+        gender=gender, ayanamsa=ayanamsa, name=name,
+    )
+    return serialize_result(result, fields=fields, as_bytes=True)
+
+
+def _decision_job(kind, birth_date, birth_time, place, gender, ayanamsa, name):
+    result = api_calculate(
+        birth_date, birth_time, place,
+        gender=gender, ayanamsa=ayanamsa, name=name,
+        include=DECISION_SECTIONS[kind],
+    )
+    return dumps(_DECISION_FUNCS[kind](result))
+
+
+def _compatibility_job(birth1, birth2):
+    r1 = api_calculate(**birth1, include=DECISION_SECTIONS["compatibility"])
+    r2 = api_calculate(**birth2, include=DECISION_SECTIONS["compatibility"])
+    return dumps(get_compatibility_decision(r1, r2))
+
+
+def _match_job(birth1, birth2):
+    """Ashtakoot plus extra dosha flags for two birth records."""
+    r1 = api_calculate(**birth1, include=())
+    r2 = api_calculate(**birth2, include=())
+
+    nak1  = r1.get("moon_nakshatra", "")
+    sign1 = r1.get("moon_sign", "")
+    nak2  = r2.get("moon_nakshatra", "")
+    sign2 = r2.get("moon_sign", "")
+
+    guna = _calc_ashtakoot(nak1, sign1, nak2, sign2)
+
+    # Try to use the full kundali_matching module for extra doshas
+    extra_doshas = {}
+    try:
+        from kundali.kundali_matching import match_kundalis
+        full_report = match_kundalis(r1, r2)
+        # Extract dosha flags only (avoid duplicating kuta scores)
+        for key in ("nadi_dosha", "rajju_dosha", "vedha_dosha",
+                    "kuja_dosha_p1", "kuja_dosha_p2",
+                    "mahendra", "stree_deergha"):
+            if key in full_report:
+                extra_doshas[key] = to_json(full_report[key])
+    except Exception:
+        pass
+
+    return {
+        "person1": {"moon_sign": sign1, "moon_nakshatra": nak1},
+        "person2": {"moon_sign": sign2, "moon_nakshatra": nak2},
+        "ashtakoot": guna,
+        "extra_doshas": extra_doshas,
+    }
+
+
+def _muhurtha_find_job(birth, start_date, end_date, purpose):
+    """Score every constant-panchanga window between *start_date* and *end_date*."""
+    from kundali.muhurtha import build_panchanga_timeline, iter_muhurtha_windows
+    from kundali.ephemeris import get_ephemeris
+    import heapq
+    import swisseph as swe
+
+    natal = api_calculate(**birth, include=())
+    eph = get_ephemeris(natal.get("ayanamsa"))
+
+    start_dt = datetime.datetime.fromisoformat(start_date)
+    end_dt   = datetime.datetime.fromisoformat(end_date)
+
+    lat = natal.get("lat", 0.0)
+    lon = natal.get("lon", 0.0)
+
+    start_jd = swe.julday(start_dt.year, start_dt.month, start_dt.day,
+                          start_dt.hour + start_dt.minute / 60.0)
+    end_jd = start_jd + (end_dt - start_dt).total_seconds() / 86400.0
+
+    def _at(jd):
+        return (start_dt + datetime.timedelta(days=jd - start_jd)).isoformat(timespec="minutes")
+
+    timeline = build_panchanga_timeline(start_jd, end_jd, lat, lon,
+                                        natal.get("timezone"), ephemeris=eph)
+    # Top 20 windows by score, earliest first among equal scores
+    top = heapq.nlargest(
+        20,
+        iter_muhurtha_windows(natal, timeline, purpose),
+        key=lambda w: (w["total_score"], -w["start_jd"]),
+    )
+    windows = []
+    for w in top:
+        panchanga = w["panchanga"]
+        windows.append({
+            "datetime":     _at(w["start_jd"]),
+            "end_datetime": _at(w["end_jd"]),
+            "score":        to_json(w["total_score"]),
+            "tithi":        panchanga.get("tithi_name"),
+            "vara":         panchanga.get("vara_name"),
+            "nakshatra":    panchanga.get("nakshatra"),
+            "yoga":         panchanga.get("yoga_name"),
+        })
+
+    return {
+        "purpose":      purpose,
+        "start_date":   start_date,
+        "end_date":     end_date,
+        "top_windows":  windows,
+        "total_scanned": len(timeline),
+    }
+
+
+def _transit_calendar_job(birth, months):
+    """Month-by-month gochara positions relative to the natal Moon."""
+    import swisseph as swe
+    from kundali.utils import get_sign
+    from kundali.constants import gochara_effects, zodiac_signs
+    from kundali.ephemeris import get_ephemeris
+
+    natal = api_calculate(**birth, include=())
+    eph = get_ephemeris(natal.get("ayanamsa"))
+
+    moon_sign = natal.get("moon_sign", "")
+    moon_sign_idx = zodiac_signs.index(moon_sign) if moon_sign in zodiac_signs else 0
+
+    planet_ids = {
+        "Su": swe.SUN, "Mo": swe.MOON, "Ma": swe.MARS,
+        "Me": swe.MERCURY, "Ju": swe.JUPITER, "Ve": swe.VENUS,
+        "Sa": swe.SATURN, "Ra": swe.MEAN_NODE,
+    }
+    PLANET_FULL = {
+        "Su": "Sun", "Mo": "Moon", "Ma": "Mars", "Me": "Mercury",
+        "Ju": "Jupiter", "Ve": "Venus", "Sa": "Saturn",
+        "Ra": "Rahu", "Ke": "Ketu",
+    }
+
+    calendar = []
+    now = datetime.datetime.now()
+
+    for m_offset in range(months):
+        # First day of each future month
+        target_month = (now.month + m_offset - 1) % 12 + 1
+        target_year  = now.year + (now.month + m_offset - 1) // 12
+        dt = datetime.datetime(target_year, target_month, 1, 12, 0)
+        jd = swe.julday(dt.year, dt.month, dt.day, 12.0)
+
+        month_transits = {}
+        for code, pid in planet_ids.items():
+            lon = eph.longitude(jd, pid)
+            sign = get_sign(lon)
+            sign_idx = zodiac_signs.index(sign)
+            house_from_moon = ((sign_idx - moon_sign_idx + 12) % 12) + 1
+            effect = gochara_effects.get(code, {}).get(house_from_moon, "Neutral")
+            month_transits[PLANET_FULL.get(code, code)] = {
+                "sign":            sign,
+                "house_from_moon": house_from_moon,
+                "effect":          to_json(effect),
+            }
+        # Ketu
+        ra_lon = eph.longitude(jd, swe.MEAN_NODE)
+        ke_lon = (ra_lon + 180) % 360
+        ke_sign = get_sign(ke_lon)
+        ke_idx  = zodiac_signs.index(ke_sign)
+        ke_house = ((ke_idx - moon_sign_idx + 12) % 12) + 1
+        month_transits["Ketu"] = {
+            "sign":            ke_sign,
+            "house_from_moon": ke_house,
+            "effect":          to_json(gochara_effects.get("Ke", {}).get(ke_house, "Neutral")),
+        }
+
+        calendar.append({
+            "month":    dt.strftime("%Y-%m"),
+            "transits": month_transits,
+        })
+
+    return {
+        "native":       birth["name"],
+        "moon_sign":    moon_sign,
+        "months":       months,
+        "calendar":     calendar,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -1583,7 +2003,10 @@ async def health():
 
 
 @app.post("/calculate")
-async def calculate(data: BirthData):
+async def calculate(
+    data: BirthData,
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return (e.g. planets,houses)"),
+):
     """
     Calculate complete kundali using JSON input.
     
@@ -1596,13 +2019,11 @@ async def calculate(data: BirthData):
     - And much more...
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
+        return await run_engine(
+            "calculate", _calculate_job, **_birth_kwargs(data), fields=_parse_fields(fields),
         )
-        return serialize_result(result)
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc) + "\n" + traceback.format_exc())
 
@@ -1615,6 +2036,7 @@ async def calculate_simple(
     place: str = Query(..., description="Birth place (City, Country)"),
     gender: str = Query("Male", description="Gender: Male or Female"),
     ayanamsa: str = Query("Lahiri", description="Ayanamsa system"),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return (e.g. planets,houses)"),
 ):
     """
     🌟 **Simple Kundali Calculation** - No JSON needed!
@@ -1636,11 +2058,13 @@ async def calculate_simple(
         if len(time_parts) < 2:
             raise ValueError("Time must be in HH:MM format")
         
-        result = api_calculate(
+        return await run_engine(
+            "calculate", _calculate_job,
             date, time, place,
-            gender=gender, ayanamsa=ayanamsa, name=name,
+            gender, ayanamsa, name, _parse_fields(fields),
         )
-        return serialize_result(result)
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(ve)}")
     except Exception as exc:
@@ -1655,6 +2079,7 @@ async def calculate_form(
     place: str = Form(..., description="Birth place"),
     gender: str = Form("Male"),
     ayanamsa: str = Form("Lahiri"),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return (e.g. planets,houses)"),
 ):
     """
     Calculate kundali using form data (x-www-form-urlencoded).
@@ -1662,11 +2087,13 @@ async def calculate_form(
     Perfect for HTML form submissions!
     """
     try:
-        result = api_calculate(
+        return await run_engine(
+            "calculate", _calculate_job,
             date, time, place,
-            gender=gender, ayanamsa=ayanamsa, name=name,
+            gender, ayanamsa, name, _parse_fields(fields),
         )
-        return serialize_result(result)
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(ve)}")
     except Exception as exc:
@@ -1674,7 +2101,10 @@ async def calculate_form(
 
 
 @app.post("/calculate/json")
-async def calculate_json(data: SimpleBirthData):
+async def calculate_json(
+    data: SimpleBirthData,
+    fields: Optional[str] = Query(None, description="Comma-separated top-level fields to return (e.g. planets,houses)"),
+):
     """
     Calculate kundali using simplified JSON format.
     
@@ -1691,77 +2121,91 @@ async def calculate_json(data: SimpleBirthData):
     ```
     """
     try:
-        result = api_calculate(
+        return await run_engine(
+            "calculate", _calculate_job,
             data.date, data.time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
+            data.gender, data.ayanamsa, data.name, _parse_fields(fields),
         )
-        return serialize_result(result)
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(ve)}")
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
-@app.post("/muhurtha/find")
-async def find_muhurtha(req: MuhurthaRequest):
+@app.post("/reports", status_code=202)
+async def create_report(data: BirthData):
     """
-    Find auspicious muhurtha windows between start_date and end_date.
+    Queue a PDF report for rendering in the background.
 
-    Scans at 1-hour intervals and scores each window using the muhurtha
-    evaluator from the kundali engine.  Returns the top windows sorted
-    by score (descending).
+    Returns the job id and status at once; poll `GET /reports/{id}` and
+    download the file when the status is `done`.  Identical requests made
+    on the same day share one job and one file.
     """
-    try:
-        from kundali.muhurtha import evaluate_muhurtha, get_panchanga
-        import swisseph as swe
-
-        bd = req.birth_data
-        birth_date = f"{bd.year:04d}-{bd.month:02d}-{bd.day:02d}"
-        birth_time = f"{bd.hour:02d}:{bd.minute:02d}"
-        natal = api_calculate(
-            birth_date, birth_time, bd.place,
-            gender=bd.gender, ayanamsa=bd.ayanamsa, name=bd.name,
+    jobs = _get_report_jobs()
+    if jobs.pending >= REPORT_MAX_PENDING:
+        raise HTTPException(
+            status_code=429,
+            detail="Report queue is full; please retry shortly.",
+            headers={"Retry-After": "5"},
         )
+    try:
+        return _report_status(jobs.submit(_birth_kwargs(data)))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
 
-        start_dt = datetime.datetime.fromisoformat(req.start_date)
-        end_dt   = datetime.datetime.fromisoformat(req.end_date)
 
-        lat = natal.get("lat", 0.0)
-        lon = natal.get("lon", 0.0)
+@app.get("/reports/{report_id}")
+async def get_report(
+    report_id: str,
+    download: bool = Query(False, description="Return the PDF instead of the job status"),
+):
+    """
+    Status of a report job (`queued`, `running`, `done` or `failed`).
 
-        windows = []
-        cur = start_dt
-        step = datetime.timedelta(hours=1)
+    With `download=true` the finished PDF is returned; 409 while the job
+    has not finished.  Unknown and expired reports are 404.
+    """
+    jobs = _get_report_jobs()
+    job = jobs.get(report_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report not found or expired.")
+    if not download:
+        return _report_status(job)
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=job.error)
+    path = jobs.artifact(report_id)
+    if path is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Report is {job.status}; please retry shortly.",
+            headers={"Retry-After": "2"},
+        )
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"{safe_filename(job.name or 'kundali')}_report.pdf",
+    )
 
-        while cur <= end_dt:
-            jd = swe.julday(cur.year, cur.month, cur.day,
-                            cur.hour + cur.minute / 60.0)
-            try:
-                score_info = evaluate_muhurtha(jd, natal, lat, lon)
-                score = score_info.get("score", score_info.get("total_score", 0)) if isinstance(score_info, dict) else 0
-                panchanga = get_panchanga(jd, lat, lon)
-                windows.append({
-                    "datetime":  cur.isoformat(),
-                    "score":     to_json(score),
-                    "tithi":     panchanga.get("tithi_name"),
-                    "vara":      panchanga.get("vara_name"),
-                    "nakshatra": panchanga.get("nakshatra"),
-                    "yoga":      panchanga.get("yoga_name"),
-                })
-            except Exception:
-                pass
-            cur += step
-
-        # Return top 20 windows sorted by score
-        windows.sort(key=lambda w: w["score"] or 0, reverse=True)
-        return {
-            "purpose":      req.purpose,
-            "start_date":   req.start_date,
-            "end_date":     req.end_date,
-            "top_windows":  windows[:20],
-            "total_scanned": len(windows),
-        }
 
+@app.post("/muhurtha/find")
+async def find_muhurtha(req: MuhurthaRequest):
+    """
+    Find auspicious muhurtha windows between start_date and end_date.
+
+    Splits the range into intervals of constant panchanga (tithi, vara,
+    nakshatra, yoga, karana and Moon sign change instants) and scores each
+    interval once with the muhurtha evaluator.  Returns the top windows
+    sorted by score (descending).
+    """
+    try:
+        return await run_engine(
+            "muhurtha", _muhurtha_find_job,
+            _birth_kwargs(req.birth_data), req.start_date, req.end_date, req.purpose,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc) + "\n" + traceback.format_exc())
 
@@ -1777,53 +2221,16 @@ async def match_compatibility(req: MatchRequest):
     when available.
     """
     try:
-        def _calc(bd: BirthData):
-            birth_date = f"{bd.year:04d}-{bd.month:02d}-{bd.day:02d}"
-            birth_time = f"{bd.hour:02d}:{bd.minute:02d}"
-            return api_calculate(
-                birth_date, birth_time, bd.place,
-                gender=bd.gender, ayanamsa=bd.ayanamsa, name=bd.name,
-            )
-
-        r1 = _calc(req.person1)
-        r2 = _calc(req.person2)
-
-        nak1  = r1.get("moon_nakshatra", "")
-        sign1 = r1.get("moon_sign", "")
-        nak2  = r2.get("moon_nakshatra", "")
-        sign2 = r2.get("moon_sign", "")
-
-        guna = _calc_ashtakoot(nak1, sign1, nak2, sign2)
-
-        # Try to use the full kundali_matching module for extra doshas
-        extra_doshas = {}
-        try:
-            from kundali.kundali_matching import match_kundalis
-            full_report = match_kundalis(r1, r2)
-            # Extract dosha flags only (avoid duplicating kuta scores)
-            for key in ("nadi_dosha", "rajju_dosha", "vedha_dosha",
-                        "kuja_dosha_p1", "kuja_dosha_p2",
-                        "mahendra", "stree_deergha"):
-                if key in full_report:
-                    extra_doshas[key] = to_json(full_report[key])
-        except Exception:
-            pass
-
-        return {
-            "person1": {
-                "name":           req.person1.name,
-                "moon_sign":      sign1,
-                "moon_nakshatra": nak1,
-            },
-            "person2": {
-                "name":           req.person2.name,
-                "moon_sign":      sign2,
-                "moon_nakshatra": nak2,
-            },
-            "ashtakoot": guna,
-            "extra_doshas": extra_doshas,
-        }
+        report = await run_engine(
+            "match", _match_job,
+            _birth_kwargs(req.person1), _birth_kwargs(req.person2),
+        )
+        report["person1"] = {"name": req.person1.name, **report["person1"]}
+        report["person2"] = {"name": req.person2.name, **report["person2"]}
+        return report
 
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc) + "\n" + traceback.format_exc())
 
@@ -1846,36 +2253,21 @@ async def match_simple(
     Calculate Ashtakoot Guna Milan (36-point compatibility) between two people.
     """
     try:
-        r1 = api_calculate(date1, time1, place1, gender="Male", ayanamsa=ayanamsa, name=name1)
-        r2 = api_calculate(date2, time2, place2, gender="Female", ayanamsa=ayanamsa, name=name2)
-
-        nak1 = r1.get("moon_nakshatra", "")
-        sign1 = r1.get("moon_sign", "")
-        nak2 = r2.get("moon_nakshatra", "")
-        sign2 = r2.get("moon_sign", "")
-
-        guna = _calc_ashtakoot(nak1, sign1, nak2, sign2)
-
-        # Try extra doshas
-        extra_doshas = {}
-        try:
-            from kundali.kundali_matching import match_kundalis
-            full_report = match_kundalis(r1, r2)
-            for key in ("nadi_dosha", "rajju_dosha", "vedha_dosha",
-                        "kuja_dosha_p1", "kuja_dosha_p2",
-                        "mahendra", "stree_deergha"):
-                if key in full_report:
-                    extra_doshas[key] = to_json(full_report[key])
-        except Exception:
-            pass
-
-        return {
-            "person1": {"name": name1, "moon_sign": sign1, "moon_nakshatra": nak1},
-            "person2": {"name": name2, "moon_sign": sign2, "moon_nakshatra": nak2},
-            "ashtakoot": guna,
-            "extra_doshas": extra_doshas,
+        birth1 = {
+            "birth_date": date1, "birth_time": time1, "place": place1,
+            "gender": "Male", "ayanamsa": ayanamsa, "name": name1,
+        }
+        birth2 = {
+            "birth_date": date2, "birth_time": time2, "place": place2,
+            "gender": "Female", "ayanamsa": ayanamsa, "name": name2,
         }
+        report = await run_engine("match", _match_job, birth1, birth2)
+        report["person1"] = {"name": name1, **report["person1"]}
+        report["person2"] = {"name": name2, **report["person2"]}
+        return report
 
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(ve)}")
     except Exception as exc:
@@ -1890,77 +2282,11 @@ async def transit_calendar_endpoint(data: BirthData, months: int = 12):
     Returns month-by-month gochara data for all planets.
     """
     try:
-        import swisseph as swe
-        from kundali.utils import get_sign
-        from kundali.constants import gochara_effects, zodiac_signs
-
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        natal = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
+        return await run_engine(
+            "transit_calendar", _transit_calendar_job, _birth_kwargs(data), months,
         )
-
-        moon_sign = natal.get("moon_sign", "")
-        moon_sign_idx = zodiac_signs.index(moon_sign) if moon_sign in zodiac_signs else 0
-
-        planet_ids = {
-            "Su": swe.SUN, "Mo": swe.MOON, "Ma": swe.MARS,
-            "Me": swe.MERCURY, "Ju": swe.JUPITER, "Ve": swe.VENUS,
-            "Sa": swe.SATURN, "Ra": swe.MEAN_NODE,
-        }
-        PLANET_FULL = {
-            "Su": "Sun", "Mo": "Moon", "Ma": "Mars", "Me": "Mercury",
-            "Ju": "Jupiter", "Ve": "Venus", "Sa": "Saturn",
-            "Ra": "Rahu", "Ke": "Ketu",
-        }
-
-        calendar = []
-        now = datetime.datetime.now()
-
-        for m_offset in range(months):
-            # First day of each future month
-            target_month = (now.month + m_offset - 1) % 12 + 1
-            target_year  = now.year + (now.month + m_offset - 1) // 12
-            dt = datetime.datetime(target_year, target_month, 1, 12, 0)
-            jd = swe.julday(dt.year, dt.month, dt.day, 12.0)
-
-            month_transits = {}
-            for code, pid in planet_ids.items():
-                lon = swe.calc_ut(jd, pid, swe.FLG_SIDEREAL)[0][0]
-                sign = get_sign(lon)
-                sign_idx = zodiac_signs.index(sign)
-                house_from_moon = ((sign_idx - moon_sign_idx + 12) % 12) + 1
-                effect = gochara_effects.get(code, {}).get(house_from_moon, "Neutral")
-                month_transits[PLANET_FULL.get(code, code)] = {
-                    "sign":            sign,
-                    "house_from_moon": house_from_moon,
-                    "effect":          to_json(effect),
-                }
-            # Ketu
-            ra_lon = swe.calc_ut(jd, swe.MEAN_NODE, swe.FLG_SIDEREAL)[0][0]
-            ke_lon = (ra_lon + 180) % 360
-            ke_sign = get_sign(ke_lon)
-            ke_idx  = zodiac_signs.index(ke_sign)
-            ke_house = ((ke_idx - moon_sign_idx + 12) % 12) + 1
-            month_transits["Ketu"] = {
-                "sign":            ke_sign,
-                "house_from_moon": ke_house,
-                "effect":          to_json(gochara_effects.get("Ke", {}).get(ke_house, "Neutral")),
-            }
-
-            calendar.append({
-                "month":    dt.strftime("%Y-%m"),
-                "transits": month_transits,
-            })
-
-        return {
-            "native":       data.name,
-            "moon_sign":    moon_sign,
-            "months":       months,
-            "calendar":     calendar,
-        }
-
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc) + "\n" + traceback.format_exc())
 
@@ -1984,13 +2310,9 @@ async def career_decision(data: BirthData):
     Returns recommended career fields, current period analysis, and actionable advice.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_career_decision(result))
+        return await run_engine("decisions", _decision_job, "career", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2006,8 +2328,13 @@ async def career_decision_simple(
 ):
     """🎯 Career guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_career_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "career",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2026,13 +2353,9 @@ async def marriage_decision(data: BirthData):
     Returns marriage windows, favorable periods, and relationship advice.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_marriage_decision(result))
+        return await run_engine("decisions", _decision_job, "marriage", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2048,8 +2371,13 @@ async def marriage_decision_simple(
 ):
     """💍 Marriage timing guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_marriage_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "marriage",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2068,13 +2396,9 @@ async def business_decision(data: BirthData):
     Returns business timing advice, investment windows, and risk periods.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_business_decision(result))
+        return await run_engine("decisions", _decision_job, "business", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2090,8 +2414,13 @@ async def business_decision_simple(
 ):
     """💼 Business & investment guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_business_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "business",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2110,13 +2439,9 @@ async def health_decision(data: BirthData):
     Returns health focus areas, vulnerable periods, and preventive advice.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_health_decision(result))
+        return await run_engine("decisions", _decision_job, "health", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2132,8 +2457,13 @@ async def health_decision_simple(
 ):
     """🏥 Health guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_health_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "health",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2152,13 +2482,9 @@ async def travel_decision(data: BirthData):
     Returns favorable directions, travel timing, and relocation advice.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_travel_decision(result))
+        return await run_engine("decisions", _decision_job, "travel", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2174,8 +2500,13 @@ async def travel_decision_simple(
 ):
     """✈️ Travel & relocation guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_travel_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "travel",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2194,13 +2525,9 @@ async def daily_guidance(data: BirthData):
     Returns today's favorable/unfavorable activities and timing.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_daily_guidance(result))
+        return await run_engine("decisions", _decision_job, "daily", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2216,8 +2543,13 @@ async def daily_guidance_simple(
 ):
     """📅 Daily guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_daily_guidance(result))
+        return await run_engine(
+            "decisions", _decision_job, "daily",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2236,13 +2568,9 @@ async def education_decision(data: BirthData):
     Returns recommended fields, learning style, and academic timing.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_education_decision(result))
+        return await run_engine("decisions", _decision_job, "education", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2258,8 +2586,13 @@ async def education_decision_simple(
 ):
     """📚 Education guidance via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_education_decision(result))
+        return await run_engine(
+            "decisions", _decision_job, "education",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2278,13 +2611,9 @@ async def life_analysis_decision(data: BirthData):
     a non-fatalistic longevity profile.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_life_analysis(result))
+        return await run_engine("decisions", _decision_job, "life_analysis", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2300,8 +2629,13 @@ async def life_analysis_decision_simple(
 ):
     """🔭 Advanced life analysis via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_life_analysis(result))
+        return await run_engine(
+            "decisions", _decision_job, "life_analysis",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2320,17 +2654,12 @@ async def compatibility_decision(req: MatchRequest):
     Returns compatibility score, detailed breakdown, and relationship advice.
     """
     try:
-        def _calc(bd: BirthData):
-            birth_date = f"{bd.year:04d}-{bd.month:02d}-{bd.day:02d}"
-            birth_time = f"{bd.hour:02d}:{bd.minute:02d}"
-            return api_calculate(
-                birth_date, birth_time, bd.place,
-                gender=bd.gender, ayanamsa=bd.ayanamsa, name=bd.name,
-            )
-
-        r1 = _calc(req.person1)
-        r2 = _calc(req.person2)
-        return to_json(get_compatibility_decision(r1, r2))
+        return await run_engine(
+            "match", _compatibility_job,
+            _birth_kwargs(req.person1), _birth_kwargs(req.person2),
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2347,13 +2676,9 @@ async def all_decisions(data: BirthData):
     Returns a complete decision report for holistic life planning.
     """
     try:
-        birth_date = f"{data.year:04d}-{data.month:02d}-{data.day:02d}"
-        birth_time = f"{data.hour:02d}:{data.minute:02d}"
-        result = api_calculate(
-            birth_date, birth_time, data.place,
-            gender=data.gender, ayanamsa=data.ayanamsa, name=data.name,
-        )
-        return to_json(get_all_decisions(result))
+        return await run_engine("decisions", _decision_job, "all", **_birth_kwargs(data))
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -2369,7 +2694,12 @@ async def all_decisions_simple(
 ):
     """🌟 All decisions via URL parameters."""
     try:
-        result = api_calculate(date, time, place, gender=gender, ayanamsa=ayanamsa, name=name)
-        return to_json(get_all_decisions(result))
+        return await run_engine(
+            "decisions", _decision_job, "all",
+            date, time, place,
+            gender, ayanamsa, name,
+        )
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -5,9 +5,20 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
 # ------------------------------------------------------------
-# 1. Parse report – extracts planets, degrees, retro/combust/NB
+# 1. Chart data – from the report document, or a saved text report
 # ------------------------------------------------------------
+def chart_from_birth(date, time, place, gender="Male"):
+    """Calculate the chart and read positions from its report document."""
+    from kundali.main import calculate_kundali
+    from kundali.printing import build_report
+
+    result = calculate_kundali(date, time, place, gender=gender, include=[])
+    chart = build_report(result).chart
+    return chart["lagna"], chart["planets"]
+
+
 def parse_report(filepath):
+    """Read planets back from a saved text report (older reports)."""
     with open(filepath, 'r', encoding='utf-8') as f:
         text = f.read()
 
@@ -181,12 +192,20 @@ def draw_north_indian(ax, planets, lagna, title):
 # ------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(description='Generate traditional Vedic charts (North & South Indian).')
-    parser.add_argument('file', help='Path to kundali report file')
+    parser.add_argument('file', nargs='?', help='Path to a saved kundali text report')
+    parser.add_argument('--birth', nargs=3, metavar=('DATE', 'TIME', 'PLACE'),
+                        help='Calculate the chart instead of reading a report (YYYY-MM-DD HH:MM "City, Country")')
+    parser.add_argument('--gender', default='Male', help='Gender used with --birth')
     parser.add_argument('--output-prefix', default='kundali', help='Prefix for output PNG files')
     args = parser.parse_args()
+    if not args.file and not args.birth:
+        parser.error('give a report file or --birth DATE TIME PLACE')
 
     try:
-        lagna, planets = parse_report(args.file)
+        if args.birth:
+            lagna, planets = chart_from_birth(*args.birth, gender=args.gender)
+        else:
+            lagna, planets = parse_report(args.file)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
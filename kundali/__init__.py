@@ -3,11 +3,15 @@ Vedic Kundali — Vedic astrology calculation and prediction engine.
 
 Public API (low-level):
     calculate_kundali(birth_date, birth_time, place, gender="Male")
+    refresh_current(result, at=jd_or_datetime)
+    render_artifacts(result, formats=["sky_chart", "north_chart", "pdf"])
     AdvancedSpousePredictor(chart_data)
 
 GUI-ready API (recommended for frontends):
     api.calculate(birth_date, birth_time, place, ...)
     api.serialize_result(result)
+    api.calculate_many(records, workers=4)   # CLI: kundali batch in.jsonl -o out.jsonl
+    api.render_artifacts(result, formats=None)
     api.get_spouse_prediction(chart_data)
     api.get_matching(chart1, chart2)
 
@@ -24,7 +28,7 @@ Decision Engines:
     decisions.get_all_decisions(result)
 """
 
-from .main import calculate_kundali
+from .main import calculate_kundali, refresh_current, render_artifacts
 from .spouse.predictor import AdvancedSpousePredictor
 from .pancha_pakshi import calculate_pancha_pakshi
 from .sky_chart import generate_sky_chart
@@ -47,6 +51,8 @@ from .decisions import (
 
 __all__ = [
     "calculate_kundali",
+    "refresh_current",
+    "render_artifacts",
     "AdvancedSpousePredictor",
     "calculate_pancha_pakshi",
     "generate_sky_chart",
@@ -15,40 +15,78 @@ Usage:
     json_safe = serialize_result(result)
 """
 
+import collections
+import collections.abc
 import datetime
+import multiprocessing
+import re
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 
 
 # ---------------------------------------------------------------------------
 # JSON serializer — handles numpy, datetime, and other non-JSON types
 # ---------------------------------------------------------------------------
 
-def to_json(obj):
-    """Recursively make *obj* JSON-serialisable."""
-    try:
-        import numpy as np
-        _NP_TYPES = (np.integer, np.floating, np.bool_)
-        _NP_ARRAY = np.ndarray
-    except ImportError:
-        _NP_TYPES = ()
-        _NP_ARRAY = None
-
-    if obj is None:
-        return None
-    if isinstance(obj, bool):
-        return obj
-    if isinstance(obj, (int, float, str)):
+try:
+    import numpy as np
+
+    _NP_SCALARS = (np.integer, np.floating, np.bool_)
+    _NP_ARRAY = np.ndarray
+except ImportError:
+    np = None
+    _NP_SCALARS = ()
+    _NP_ARRAY = ()
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _identity(obj):
+    return obj
+
+
+def _convert_dict(obj):
+    return {str(k): to_json(v) for k, v in obj.items()}
+
+
+def _convert_list(obj):
+    return [to_json(i) for i in obj]
+
+
+def _convert_date(obj):
+    return obj.isoformat()
+
+
+# Exact-type dispatch; subclasses and numpy types take the slow path below.
+_CONVERTERS = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    dict: _convert_dict,
+    list: _convert_list,
+    tuple: _convert_list,
+    datetime.datetime: _convert_date,
+    datetime.date: _convert_date,
+}
+
+
+def _convert_other(obj):
+    if isinstance(obj, (bool, int, float, str)):
         return obj
-    if _NP_TYPES and isinstance(obj, _NP_TYPES):
+    if _NP_SCALARS and isinstance(obj, _NP_SCALARS):
         return obj.item()
-    if _NP_ARRAY is not None and isinstance(obj, _NP_ARRAY):
+    if _NP_ARRAY and isinstance(obj, _NP_ARRAY):
         return obj.tolist()
-    if isinstance(obj, dict):
-        return {str(k): to_json(v) for k, v in obj.items()}
+    if isinstance(obj, collections.abc.Mapping):
+        # dict subclasses and read-only views (e.g. vargas.PlanetRecord)
+        return _convert_dict(obj)
     if isinstance(obj, (list, tuple)):
-        return [to_json(i) for i in obj]
-    if isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    if isinstance(obj, datetime.date):
+        return _convert_list(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
         return obj.isoformat()
     try:
         return str(obj)
@@ -56,6 +94,50 @@ def to_json(obj):
         return None
 
 
+def to_json(obj):
+    """Recursively make *obj* JSON-serialisable."""
+    return _CONVERTERS.get(type(obj), _convert_other)(obj)
+
+
+def _json_default(obj):
+    """Encoder hook for types the JSON backend does not know natively."""
+    for base in (str, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+    return _convert_other(obj)
+
+
+if orjson is not None:
+    # Subclasses go through the hook so dict views keep their virtual keys.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def _encode(obj):
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+else:
+    import json as _json
+
+    def _encode(obj):
+        return _json.dumps(
+            obj, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def dumps(obj):
+    """
+    Encode *obj* as compact UTF-8 JSON bytes in a single pass.
+
+    Uses orjson when installed (stdlib json otherwise); numpy values,
+    dates and unknown types are handled like :func:`to_json`.
+    """
+    try:
+        return _encode(obj)
+    except TypeError:
+        # e.g. tuple dict keys, which only to_json stringifies
+        return _encode(to_json(obj))
+
+
 # ---------------------------------------------------------------------------
 # Planet name mapping
 # ---------------------------------------------------------------------------
@@ -84,6 +166,10 @@ def calculate(
     latitude=None,
     longitude=None,
     timezone_name=None,
+    include=None,
+    exclude=None,
+    render=None,
+    use_cache=True,
 ):
     """
     Calculate a complete Vedic kundali.
@@ -101,11 +187,25 @@ def calculate(
         latitude: optional exact birth latitude
         longitude: optional exact birth longitude
         timezone_name: optional IANA timezone like Asia/Kolkata
+        include: optional sections to compute (None = all, see PIPELINE_SECTIONS)
+        exclude: optional sections to skip
+        render: optional artifact formats to write (None = no files, see render_artifacts())
+        use_cache: reuse the natal part of an earlier calculation for the same
+            birth details (see _cached_calculate()); rectification bypasses it
 
     Returns:
         dict: Raw kundali result (pass to serialize_result() for JSON-safe output).
     """
     from .main import calculate_kundali
+    if use_cache and not rectification_events:
+        result = _cached_calculate(
+            birth_date, birth_time, place, gender, ayanamsa, name or "native",
+            latitude, longitude, timezone_name, include, exclude,
+        )
+        if result is not None:
+            if render:
+                render_artifacts(result, formats=render)
+            return result
     result = calculate_kundali(
         birth_date,
         birth_time,
@@ -119,10 +219,254 @@ def calculate(
         latitude=latitude,
         longitude=longitude,
         timezone_name=timezone_name,
+        include=include,
+        exclude=exclude,
+        render=render,
+    )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Bulk calculation
+# ---------------------------------------------------------------------------
+
+# Record keys accepted by calculate_many() (besides the "date"/"time" aliases).
+_RECORD_FIELDS = (
+    "birth_date", "birth_time", "place", "gender", "ayanamsa", "name",
+    "latitude", "longitude", "timezone_name",
+)
+_RECORD_ALIASES = {"date": "birth_date", "time": "birth_time", "timezone": "timezone_name"}
+
+
+def _record_kwargs(record):
+    """Map a birth record (dict, e.g. a CSV row) onto calculate() arguments."""
+    kwargs = {}
+    for key, value in record.items():
+        key = _RECORD_ALIASES.get(key, key)
+        if key in _RECORD_FIELDS and value not in (None, ""):
+            kwargs[key] = value
+    for key in ("latitude", "longitude"):
+        if key in kwargs:
+            kwargs[key] = float(kwargs[key])
+    kwargs.setdefault("place", "")
+    return kwargs
+
+
+def _calculate_record(index, record, include=None, exclude=None):
+    """Calculate and serialize one record; errors are returned, not raised."""
+    try:
+        result = calculate(
+            **_record_kwargs(record), include=include, exclude=exclude, use_cache=False
+        )
+        return {"index": index, "record": record, "result": serialize_result(result)}
+    except Exception as e:
+        return {"index": index, "record": record, "error": f"{type(e).__name__}: {e}"}
+
+
+def calculate_many(records, workers=None, include=None, exclude=None, start=0):
+    """
+    Calculate many charts, yielding serialized results in input order.
+
+    Args:
+        records: iterable of birth-record dicts with calculate() argument names
+            (``date``/``time``/``timezone`` are accepted as aliases)
+        workers: worker processes (None = CPU count, 0 or 1 = in-process)
+        include: optional sections to compute for every record
+        exclude: optional sections to skip for every record
+        start: index of the first record (used when resuming a batch)
+
+    Yields:
+        dict: ``{"index", "record", "result"}`` or, when that record failed,
+        ``{"index", "record", "error"}``.
+    """
+    from .main import resolve_sections
+    resolve_sections(include, exclude)  # fail fast on unknown section names
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers <= 1:
+        for index, record in enumerate(records, start):
+            yield _calculate_record(index, record, include, exclude)
+        return
+
+    # Each process has its own Swiss Ephemeris state; a bounded window of
+    # in-flight records keeps memory flat for arbitrarily long inputs.
+    window = workers * 4
+    pending = collections.deque()
+    executor = _new_pool(workers)
+    try:
+        for index, record in enumerate(records, start):
+            args = (_calculate_record, index, record, include, exclude)
+            try:
+                future = executor.submit(*args)
+            except BrokenExecutor:
+                # a worker died (e.g. killed for memory); records already in
+                # flight come back as errors, the rest go to a fresh pool
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = _new_pool(workers)
+                future = executor.submit(*args)
+            pending.append((index, record, future))
+            if len(pending) >= window:
+                yield _collect(*pending.popleft())
+        while pending:
+            yield _collect(*pending.popleft())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _new_pool(workers):
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _collect(index, record, future):
+    try:
+        return future.result()
+    except Exception as e:
+        return {"index": index, "record": record, "error": f"{type(e).__name__}: {e}"}
+
+
+_CHART_CACHE_VERSION = 1
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def _natal_cache_key(birth_date, birth_time, location, ayanamsa, gender):
+    """Normalized cache key for the birth moment, place and chart settings."""
+    hh, mm = _TIME_RE.fullmatch(birth_time).groups()
+    return (
+        "natal",
+        _CHART_CACHE_VERSION,
+        birth_date,
+        f"{int(hh):02d}:{int(mm):02d}",
+        round(location["lat"], 6),
+        round(location["lon"], 6),
+        location["timezone"],
+        location["location_source"],
+        location["timezone_source"],
+        ayanamsa,
+        gender,
+    )
+
+
+def _cached_calculate(
+    birth_date, birth_time, place, gender, ayanamsa, name,
+    latitude, longitude, timezone_name, include, exclude,
+):
+    """
+    calculate() through the natal chart cache.
+
+    The cache holds the time-invariant natal chart.  On a hit, missing natal
+    sections are added, sections that were not requested are reset to their
+    defaults, and the "now" layer (running dashas, transits, current
+    panchanga/muhurtha, ...) is recomputed.  Returns None when the input
+    cannot be keyed, so the caller falls back to a plain calculation.
+    """
+    from .cache import get_chart_cache
+    from .main import (
+        PIPELINE_SECTIONS,
+        TIME_DEPENDENT_SECTIONS,
+        _build_input_quality,
+        _resolve_birth_location,
+        _run_sections,
+        calculate_kundali,
+        refresh_current,
+        resolve_sections,
+    )
+    from .utils import datetime_to_jd
+
+    if not (
+        isinstance(birth_date, str) and _DATE_RE.fullmatch(birth_date)
+        and isinstance(birth_time, str) and _TIME_RE.fullmatch(birth_time)
+    ):
+        return None
+    cache = get_chart_cache()
+    sections = resolve_sections(include, exclude)
+    location = _resolve_birth_location(
+        place, latitude=latitude, longitude=longitude, timezone_name=timezone_name
+    )
+    key = _natal_cache_key(birth_date, birth_time, location, ayanamsa, gender)
+
+    result = cache.get(key)
+    if result is None:
+        result = calculate_kundali(
+            birth_date, birth_time, place,
+            gender=gender, ayanamsa_name=ayanamsa, name=name,
+            latitude=latitude, longitude=longitude, timezone_name=timezone_name,
+            include=sections,
+        )
+        cache.put(key, result)
+        return result
+
+    current_jd = datetime_to_jd(datetime.datetime.now(datetime.timezone.utc))
+    cached_name = result.get("name")
+    result["name"] = name
+    natal = set(result.get("computed_sections", ())) - set(TIME_DEPENDENT_SECTIONS)
+    missing = [
+        n for n in PIPELINE_SECTIONS
+        if n in sections and n not in natal and n not in TIME_DEPENDENT_SECTIONS
+    ]
+    if missing:
+        _run_sections(result, set(missing), current_jd, stages=missing)
+        result["computed_sections"] = [
+            n for n in PIPELINE_SECTIONS if n in natal or n in missing
+        ]
+        cache.put(key, result)
+    if cached_name != name and "numerology" in sections:
+        _run_sections(result, {"numerology"}, current_jd, stages=["numerology"])
+
+    unrequested = [n for n in PIPELINE_SECTIONS if n not in sections]
+    _run_sections(result, set(), current_jd, stages=unrequested)
+    result["computed_sections"] = [n for n in PIPELINE_SECTIONS if n in sections]
+    refresh_current(result, at=current_jd)
+
+    result["birth_time"] = birth_time
+    result["birth_place"] = location["place"]
+    result["birth_place_input"] = str(place or "")
+    result["birth_place_normalized"] = location["place"]
+    result["input_quality"] = _build_input_quality(
+        birth_time,
+        location["place"],
+        location["timezone"],
+        result.get("birth_time_rectification"),
+        location_source=location["location_source"],
+        timezone_source=location["timezone_source"],
     )
     return result
 
 
+def refresh_current(chart_data, at=None):
+    """
+    Update only the time-dependent ("now") part of a calculated chart.
+
+    Args:
+        chart_data: dict returned by calculate() (updated in place)
+        at: Julian Day (UT) or datetime for the refresh (default: now)
+
+    Returns:
+        dict: chart_data with running dashas, transits, current panchanga etc. for *at*.
+    """
+    from .main import refresh_current as _refresh
+    return _refresh(chart_data, at=at)
+
+
+def render_artifacts(result, formats=None, output_dir=None):
+    """
+    Write chart SVGs and/or the PDF report for a calculated kundali.
+
+    Args:
+        result: dict returned by calculate() (updated with the file paths)
+        formats: any of "sky_chart", "north_chart", "pdf" (None = all)
+        output_dir: optional directory for the files (default kundali/outputs)
+
+    Returns:
+        dict: format -> absolute file path ("" when rendering failed).
+    """
+    from .main import render_artifacts as _render
+    return _render(result, formats=formats, output_dir=output_dir)
+
+
 def get_spouse_prediction(chart_data):
     """
     Run the advanced spouse predictor on a calculated chart.
@@ -177,12 +521,25 @@ def get_matching(chart1, chart2):
 # Serializer — convert raw kundali result to JSON-safe summary
 # ---------------------------------------------------------------------------
 
-def serialize_result(result):
+def serialize_result(result, fields=None, as_bytes=False):
     """
     Convert the full kundali result dict to a JSON-serialisable summary.
 
     Suitable for sending over HTTP, storing in a database, or rendering in a GUI.
+
+    Args:
+        result: dict returned by calculate()
+        fields: optional iterable of top-level keys to keep; sections that
+            are not requested (e.g. life_analysis) are not computed
+        as_bytes: return UTF-8 JSON bytes (see :func:`dumps`) instead of a
+            dict; values go straight to the encoder without a to_json pass
     """
+    conv = _identity if as_bytes else to_json
+    wanted = None if fields is None else set(fields)
+
+    def want(key):
+        return wanted is None or key in wanted
+
     out = {}
 
     # Basic birth details
@@ -191,10 +548,10 @@ def serialize_result(result):
                 "ayanamsa", "lagna_sign", "lagna_deg", "moon_sign",
                 "moon_nakshatra", "sade_sati", "birth_year", "birth_month",
                 "birth_day", "lat", "lon", "timezone", "location_source", "timezone_source"):
-        out[key] = to_json(result.get(key))
+        out[key] = conv(result.get(key))
 
     # Panchanga
-    out["panchanga"] = to_json(result.get("panchanga", {}))
+    out["panchanga"] = conv(result.get("panchanga", {}))
 
     # Planets summary
     planets_raw = result.get("planets", {})
@@ -203,14 +560,14 @@ def serialize_result(result):
         if not isinstance(pdata, dict):
             continue
         planets_out[PLANET_FULL.get(code, code)] = {
-            "sign":       to_json(pdata.get("sign")),
-            "deg":        to_json(pdata.get("deg")),
-            "full_lon":   to_json(pdata.get("full_lon")),
-            "nakshatra":  to_json(pdata.get("nakshatra")),
-            "dignity":    to_json(pdata.get("dignity")),
-            "retro":      to_json(pdata.get("retro")),
-            "combust":    to_json(pdata.get("combust")),
-            "navamsa_sign": to_json(pdata.get("navamsa_sign")),
+            "sign":       conv(pdata.get("sign")),
+            "deg":        conv(pdata.get("deg")),
+            "full_lon":   conv(pdata.get("full_lon")),
+            "nakshatra":  conv(pdata.get("nakshatra")),
+            "dignity":    conv(pdata.get("dignity")),
+            "retro":      conv(pdata.get("retro")),
+            "combust":    conv(pdata.get("combust")),
+            "navamsa_sign": conv(pdata.get("navamsa_sign")),
         }
     out["planets"] = planets_out
 
@@ -227,9 +584,9 @@ def serialize_result(result):
     for y in yogas_raw:
         if isinstance(y, dict):
             yogas_out.append({
-                "name":        to_json(y.get("name", y.get("yoga", ""))),
-                "description": to_json(y.get("description", y.get("planets", ""))),
-                "strength":    to_json(y.get("strength", y.get("score", ""))),
+                "name":        conv(y.get("name", y.get("yoga", ""))),
+                "description": conv(y.get("description", y.get("planets", ""))),
+                "strength":    conv(y.get("strength", y.get("score", ""))),
             })
         else:
             yogas_out.append({"name": str(y), "description": "", "strength": ""})
@@ -249,18 +606,18 @@ def serialize_result(result):
         if isinstance(d, str):
             return {"lord": d, "start": None, "end": None}
         return {
-            "lord":  to_json(d.get("lord", d.get("dasha_lord"))),
-            "start": to_json(d.get("start_date", d.get("start"))),
-            "end":   to_json(d.get("end_date", d.get("end"))),
+            "lord":  conv(d.get("lord", d.get("dasha_lord"))),
+            "start": conv(d.get("start_date", d.get("start"))),
+            "end":   conv(d.get("end_date", d.get("end"))),
         }
 
     out["vimshottari"] = {
-        "starting_lord":          to_json(vims.get("starting_lord")),
-        "balance_at_birth_years": to_json(vims.get("balance_at_birth_years")),
+        "starting_lord":          conv(vims.get("starting_lord")),
+        "balance_at_birth_years": conv(vims.get("balance_at_birth_years")),
         "current_md": _period(cur_md),
         "current_ad": _period(cur_ad),
         "current_pd": _period(cur_pd),
-        "mahadasas":  to_json([
+        "mahadasas":  conv([
             {k: v for k, v in md.items() if k != "antardashas"}
             for md in (vims.get("mahadasas") or [])
         ]),
@@ -270,9 +627,9 @@ def serialize_result(result):
     transits_raw = result.get("transits", {})
     out["transits"] = {
         PLANET_FULL.get(code, code): {
-            "sign":            to_json(t.get("sign")),
-            "house_from_moon": to_json(t.get("house_from_moon")),
-            "effect":          to_json(t.get("effect")),
+            "sign":            conv(t.get("sign")),
+            "house_from_moon": conv(t.get("house_from_moon")),
+            "effect":          conv(t.get("effect")),
         }
         for code, t in transits_raw.items()
         if isinstance(t, dict)
@@ -281,8 +638,8 @@ def serialize_result(result):
     # Muhurtha
     muh = result.get("muhurtha", {})
     if isinstance(muh, dict):
-        out["muhurtha_score"] = to_json(muh.get("score", muh.get("total_score")))
-        out["muhurtha_summary"] = to_json(muh.get("summary", muh.get("verdict", "")))
+        out["muhurtha_score"] = conv(muh.get("score", muh.get("total_score")))
+        out["muhurtha_summary"] = conv(muh.get("summary", muh.get("verdict", "")))
     else:
         out["muhurtha_score"] = None
         out["muhurtha_summary"] = None
@@ -291,16 +648,16 @@ def serialize_result(result):
     tajika = result.get("tajika", {})
     if isinstance(tajika, dict):
         out["tajika"] = {
-            "solar_return_year": to_json(tajika.get("solar_return_year")),
-            "muntha_sign":       to_json(tajika.get("muntha_sign")),
-            "year_verdict":      to_json(tajika.get("year_verdict", tajika.get("verdict"))),
+            "solar_return_year": conv(tajika.get("solar_return_year")),
+            "muntha_sign":       conv(tajika.get("muntha_sign")),
+            "year_verdict":      conv(tajika.get("year_verdict", tajika.get("verdict"))),
         }
     else:
         out["tajika"] = {}
 
     # Yogini dasha
     yogini = result.get("yogini_dasha", {})
-    out["yogini_current"] = to_json(yogini.get("current")) if isinstance(yogini, dict) else None
+    out["yogini_current"] = conv(yogini.get("current")) if isinstance(yogini, dict) else None
 
     # Neecha bhanga
     out["neecha_bhanga_planets"] = [
@@ -310,43 +667,45 @@ def serialize_result(result):
     # Jaimini
     jaimini = result.get("jaimini", {})
     if isinstance(jaimini, dict):
-        out["atmakaraka"] = to_json(jaimini.get("atmakaraka"))
-        out["karakamsa_lagna"] = to_json(jaimini.get("karakamsa_lagna"))
+        out["atmakaraka"] = conv(jaimini.get("atmakaraka"))
+        out["karakamsa_lagna"] = conv(jaimini.get("karakamsa_lagna"))
 
     # Problems / Doshas
-    out["problems"] = to_json(result.get("problems", []))
+    out["problems"] = conv(result.get("problems", []))
 
     # Accuracy metadata
-    out["birth_time_rectification"] = to_json(result.get("birth_time_rectification", {}))
-    out["input_quality"] = to_json(result.get("input_quality", {}))
+    out["birth_time_rectification"] = conv(result.get("birth_time_rectification", {}))
+    out["input_quality"] = conv(result.get("input_quality", {}))
 
     # Unified life analysis
-    try:
-        life_analysis = get_life_analysis(result)
-        out["life_analysis"] = life_analysis
-    except Exception:
-        life_analysis = {}
-        out["life_analysis"] = {}
-
-    try:
-        from .decisions import get_all_decisions
-
-        out["decision_confidence_summary"] = to_json(
-            get_all_decisions(result).get("confidence_summary", {})
-        )
-    except Exception:
-        out["decision_confidence_summary"] = {}
+    if want("life_analysis"):
+        try:
+            out["life_analysis"] = get_life_analysis(result)
+        except Exception:
+            out["life_analysis"] = {}
+
+    if want("decision_confidence_summary"):
+        try:
+            from .decisions import get_all_decisions
+
+            out["decision_confidence_summary"] = conv(
+                get_all_decisions(result).get("confidence_summary", {})
+            )
+        except Exception:
+            out["decision_confidence_summary"] = {}
 
     # Final analysis text
-    out["final_analysis"] = to_json(result.get("final_analysis", ""))
+    out["final_analysis"] = conv(result.get("final_analysis", ""))
 
     # Chart file paths (GUI can use these to display)
-    out["north_chart_path"] = to_json(result.get("north_chart_path", ""))
-    out["sky_chart_path"] = to_json(result.get("sky_chart_path", ""))
-    out["pdf_report_path"] = to_json(result.get("pdf_report_path", ""))
-    out["pdf_report_error"] = to_json(result.get("pdf_report_error", ""))
-
-    return out
+    out["north_chart_path"] = conv(result.get("north_chart_path", ""))
+    out["sky_chart_path"] = conv(result.get("sky_chart_path", ""))
+    out["pdf_report_path"] = conv(result.get("pdf_report_path", ""))
+    out["pdf_report_error"] = conv(result.get("pdf_report_error", ""))
+
+    if wanted is not None:
+        out = {key: value for key, value in out.items() if key in wanted}
+    return dumps(out) if as_bytes else out
 
 
 # ---------------------------------------------------------------------------
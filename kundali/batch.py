@@ -0,0 +1,136 @@
+"""
+Bulk chart generation: ``kundali batch INPUT -o OUTPUT``.
+
+Reads birth records from JSONL or CSV, calculates them across worker
+processes (see ``api.calculate_many``) and streams one JSON line per record
+to the output file.  Failed records are written with an ``"error"`` field
+instead of a ``"result"``.  Progress is checkpointed next to the output
+(``OUTPUT.ckpt``) so an interrupted run resumes where it stopped.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+from .api import calculate_many
+
+CHECKPOINT_EVERY = 100
+
+
+def read_records(path):
+    """Yield birth-record dicts from a ``.csv`` file or JSON Lines."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _checkpoint_path(output_path):
+    return output_path + ".ckpt"
+
+
+def _load_checkpoint(output_path):
+    try:
+        with open(_checkpoint_path(output_path)) as f:
+            state = json.load(f)
+        return int(state["done"]), int(state["offset"])
+    except (OSError, ValueError, KeyError):
+        return 0, 0
+
+
+def _output_size(output_path):
+    try:
+        return os.path.getsize(output_path)
+    except OSError:
+        return -1
+
+
+def _save_checkpoint(output_path, done, offset):
+    tmp = _checkpoint_path(output_path) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"done": done, "offset": offset}, f)
+    os.replace(tmp, _checkpoint_path(output_path))
+
+
+def run_batch(
+    input_path,
+    output_path,
+    workers=None,
+    include=None,
+    exclude=None,
+    restart=False,
+    checkpoint_every=CHECKPOINT_EVERY,
+):
+    """
+    Calculate every record in *input_path* and write JSON lines to *output_path*.
+
+    Resumes from ``OUTPUT.ckpt`` unless *restart* is set; output written after
+    the last checkpoint is discarded and recalculated.  When the output is
+    missing or shorter than the checkpoint says, it does not hold the
+    checkpointed records and the run starts over.
+
+    Returns:
+        dict: ``{"done", "errors", "skipped"}`` counts for this run.
+    """
+    done, offset = (0, 0) if restart else _load_checkpoint(output_path)
+    if done and _output_size(output_path) < offset:
+        done, offset = 0, 0
+    skipped = done
+    errors = 0
+
+    records = itertools.islice(read_records(input_path), done, None)
+    with open(output_path, "ab" if done else "wb") as out:
+        out.truncate(offset)
+        out.seek(offset)
+        for item in calculate_many(
+            records, workers=workers, include=include, exclude=exclude, start=done
+        ):
+            if "error" in item:
+                errors += 1
+            out.write(json.dumps(item, ensure_ascii=False).encode("utf-8") + b"\n")
+            done += 1
+            if done % checkpoint_every == 0:
+                out.flush()
+                os.fsync(out.fileno())
+                _save_checkpoint(output_path, done, out.tell())
+        out.flush()
+        _save_checkpoint(output_path, done, out.tell())
+
+    return {"done": done - skipped, "errors": errors, "skipped": skipped}
+
+
+def main(argv=None):
+    """Entry point for ``kundali batch``."""
+    parser = argparse.ArgumentParser(
+        prog="kundali batch", description="Calculate charts for a file of birth records."
+    )
+    parser.add_argument("input", help="JSONL or CSV file of birth records")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to write")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--include", nargs="+", default=None, help="sections to compute")
+    parser.add_argument("--exclude", nargs="+", default=None, help="sections to skip")
+    parser.add_argument("--restart", action="store_true",
+                        help="ignore an existing checkpoint and start over")
+    args = parser.parse_args(argv)
+
+    try:
+        stats = run_batch(
+            args.input, args.output, workers=args.workers,
+            include=args.include, exclude=args.exclude, restart=args.restart,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(
+        f"Wrote {stats['done']} records to '{args.output}' "
+        f"({stats['errors']} errors, {stats['skipped']} resumed from checkpoint)"
+    )
+    return 0
@@ -1,14 +1,24 @@
 """
-Caching layer for expensive operations: geocoding and timezone lookups.
+Caching layer for expensive operations: geocoding, timezone lookups and
+calculated natal charts.
 
 Singletons avoid re-instantiating heavy objects (TimezoneFinder, Nominatim)
-on every call.  Geocoding results are cached in-memory and persisted to a
-small JSON file so repeated lookups for the same city are near-instant.
+on every call.  Geocodes and timezones live in a LocationStore (in-memory LRU
+over SQLite in WAL mode) shared by threads and worker processes, so repeated
+lookups for the same city are near-instant and never hit the network.
+Natal charts are kept in a bounded in-memory LRU with an optional SQLite tier;
+the native-independent transit sky events use the same two-tier store.
 """
 
+import collections
+import copy
+import csv
 import json
 import os
+import pickle
+import sqlite3
 import threading
+import time
 
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
@@ -48,36 +58,308 @@ def get_geocoder():
 
 
 # ---------------------------------------------------------------------------
-# Geocoding cache  (in-memory dict + optional JSON file on disk)
+# Location store  (geocodes + timezones: in-memory LRU over SQLite/WAL)
 # ---------------------------------------------------------------------------
-_geo_cache: dict = {}
-_CACHE_FILE = os.path.join(os.path.dirname(__file__), ".geocache.json")
+#   KUNDALI_LOCATION_DB              SQLite path (default: ~/.cache/kundali/
+#                                    locations.db; "" or ":memory:" = memory only)
+#   KUNDALI_GEOCODE_TTL_DAYS         lifetime of geocoder answers (default 365)
+#   KUNDALI_GEOCODE_MISS_TTL_HOURS   lifetime of "not found" answers (default 24)
 
+GEOCODE_TTL = 365 * 86400.0
+NEGATIVE_TTL = 24 * 3600.0
+# 4 decimals ≈ 11 m; timezones are cached per rounded coordinate.
+_TZ_DECIMALS = 4
+# Written by earlier versions next to the package; imported once if present.
+_LEGACY_GEOCACHE = os.path.join(os.path.dirname(__file__), ".geocache.json")
 
-def _load_cache():
-    global _geo_cache
-    if os.path.exists(_CACHE_FILE):
+
+def _place_key(place):
+    return str(place).strip().lower()
+
+
+def _tz_key(lat, lon):
+    return f"{round(lat, _TZ_DECIMALS):.{_TZ_DECIMALS}f},{round(lon, _TZ_DECIMALS):.{_TZ_DECIMALS}f}"
+
+
+class LocationStore:
+    """Geocodes and timezones shared by threads and worker processes.
+
+    A bounded in-memory LRU sits in front of an optional SQLite database in
+    WAL mode: each lookup inserts one row (no whole-file rewrites), and
+    workers see each other's answers.  Geocoder answers expire after *ttl*
+    seconds and "not found" answers after *negative_ttl*; imported places
+    never expire.  Concurrent lookups of the same key in one process are
+    coalesced so only one of them reaches the geocoder.
+    """
+
+    NOT_FOUND = "__not_found__"
+
+    def __init__(self, db_path=None, maxsize=4096, ttl=GEOCODE_TTL, negative_ttl=NEGATIVE_TTL):
+        self.db_path = db_path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+        if db_path:
+            try:
+                directory = os.path.dirname(os.path.abspath(db_path))
+                os.makedirs(directory, exist_ok=True)
+                with self._connect() as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    for table in ("places", "timezones"):
+                        conn.execute(
+                            f"CREATE TABLE IF NOT EXISTS {table} ("
+                            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+                        )
+                self.purge_expired()
+            except (OSError, sqlite3.Error):
+                self.db_path = None
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    # -- generic tiers ------------------------------------------------------
+    def _get(self, table, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get((table, key))
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._memory.move_to_end((table, key))
+                    return value
+                del self._memory[(table, key)]
+        if not self.db_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"SELECT value, expires FROM {table} WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or (row[1] is not None and row[1] <= now):
+            return None
+        value = json.loads(row[0])
+        with self._lock:
+            self._remember((table, key), value, row[1])
+        return value
+
+    def _put_many(self, table, items):
+        """Store (key, value, expires) triples in one transaction."""
+        items = list(items)
+        with self._lock:
+            for key, value, expires in items:
+                self._remember((table, key), value, expires)
+        if not self.db_path or not items:
+            return
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (key, value, expires) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), expires) for key, value, expires in items],
+                )
+        except sqlite3.Error:
+            pass
+
+    def _remember(self, memory_key, value, expires):
+        if self.maxsize <= 0:
+            return
+        self._memory[memory_key] = (value, expires)
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _resolve(self, table, key, compute):
+        """Return the stored value or ``compute()`` it, once per key at a time.
+
+        *compute* returns ``(value, ttl)``; a value of None is not stored.
+        Callers arriving while another thread computes the same key wait for
+        it and reuse its answer.
+        """
+        value = self._get(table, key)
+        if value is not None:
+            return value
+        with self._lock:
+            event = self._inflight.get((table, key))
+            owner = event is None
+            if owner:
+                event = self._inflight[(table, key)] = threading.Event()
+        if not owner:
+            event.wait(timeout=60)
+            value = self._get(table, key)
+            if value is not None:
+                return value
         try:
-            with open(_CACHE_FILE, "r") as f:
-                _geo_cache = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            _geo_cache = {}
+            value, ttl = compute()
+            if value is not None:
+                self._put_many(table, [(key, value, time.time() + ttl)])
+            return value
+        finally:
+            if owner:
+                with self._lock:
+                    self._inflight.pop((table, key), None)
+                event.set()
+
+    # -- places and timezones ------------------------------------------------
+    def get_place(self, place):
+        """Return ``(lat, lon)``, ``NOT_FOUND`` for a cached miss, or None if unknown."""
+        value = self._get("places", _place_key(place))
+        return tuple(value) if isinstance(value, list) else value
+
+    def put_place(self, place, lat_lon, ttl=None):
+        """Cache a geocode; *lat_lon* None records a "not found" answer."""
+        if lat_lon is None:
+            value, ttl = self.NOT_FOUND, self.negative_ttl if ttl is None else ttl
+        else:
+            value, ttl = list(lat_lon), self.ttl if ttl is None else ttl
+        self._put_many("places", [(_place_key(place), value, time.time() + ttl)])
+
+    def get_timezone(self, lat, lon):
+        """Return the cached IANA timezone for the rounded coordinate, or None."""
+        return self._get("timezones", _tz_key(lat, lon))
 
+    def put_timezone(self, lat, lon, tz_name, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        self._put_many("timezones", [(_tz_key(lat, lon), tz_name, time.time() + ttl)])
 
-def _save_cache():
-    try:
-        with open(_CACHE_FILE, "w") as f:
-            json.dump(_geo_cache, f, indent=1)
-    except IOError:
-        pass
+    def import_places(self, rows):
+        """
+        Bulk-load ``(place, lat, lon[, timezone])`` rows that never expire.
 
+        Returns:
+            int: number of places imported.
+        """
+        places, timezones = [], []
+        for row in rows:
+            place, lat, lon = row[0], float(row[1]), float(row[2])
+            places.append((_place_key(place), [lat, lon], None))
+            if len(row) > 3 and row[3]:
+                timezones.append((_tz_key(lat, lon), row[3], None))
+        self._put_many("places", places)
+        self._put_many("timezones", timezones)
+        return len(places)
 
-# Load on first import
-_load_cache()
+    def import_file(self, path):
+        """
+        Bulk-load a gazetteer file without touching the network.
+
+        Accepts CSV/TSV with a header naming the place (``place`` or
+        ``name``), ``lat``/``latitude``, ``lon``/``lng``/``longitude`` and an
+        optional ``timezone`` column, or a JSON object ``{place: [lat, lon]}``
+        (the old ``.geocache.json`` format).
+
+        Returns:
+            int: number of places imported.
+        """
+        if path.lower().endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return self.import_places((place, ll[0], ll[1]) for place, ll in data.items())
+
+        def column(fieldnames, *names):
+            lowered = {name.strip().lower(): name for name in fieldnames or ()}
+            for name in names:
+                if name in lowered:
+                    return lowered[name]
+            return None
+
+        delimiter = "\t" if path.lower().endswith((".tsv", ".txt")) else ","
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            place_col = column(reader.fieldnames, "place", "name")
+            lat_col = column(reader.fieldnames, "lat", "latitude")
+            lon_col = column(reader.fieldnames, "lon", "lng", "longitude")
+            tz_col = column(reader.fieldnames, "timezone", "tz")
+            if not (place_col and lat_col and lon_col):
+                raise ValueError(f"{path}: expected place, lat and lon columns")
+            return self.import_places(
+                (row[place_col], row[lat_col], row[lon_col], row.get(tz_col) if tz_col else None)
+                for row in reader
+                if row.get(place_col)
+            )
+
+    def __len__(self):
+        """Number of stored places (database rows, or in-memory entries)."""
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    return conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        with self._lock:
+            return sum(1 for table, _key in self._memory if table == "places")
+
+    def purge_expired(self):
+        """Drop expired rows from the database."""
+        if not self.db_path:
+            return
+        try:
+            with self._connect() as conn:
+                for table in ("places", "timezones"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE expires IS NOT NULL AND expires <= ?",
+                        (time.time(),),
+                    )
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM places")
+                conn.execute("DELETE FROM timezones")
+
+
+_location_store = None
+
+
+def _default_location_db():
+    path = os.getenv("KUNDALI_LOCATION_DB")
+    if path is not None:
+        return None if path in ("", ":memory:") else path
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "kundali", "locations.db")
+
+
+def get_location_store():
+    """Return the shared LocationStore (configured from the environment)."""
+    global _location_store
+    if _location_store is None:
+        with _lock:
+            if _location_store is None:
+                try:
+                    ttl = float(os.getenv("KUNDALI_GEOCODE_TTL_DAYS", "365")) * 86400
+                    negative_ttl = float(os.getenv("KUNDALI_GEOCODE_MISS_TTL_HOURS", "24")) * 3600
+                except ValueError:
+                    ttl, negative_ttl = GEOCODE_TTL, NEGATIVE_TTL
+                store = LocationStore(_default_location_db(), ttl=ttl, negative_ttl=negative_ttl)
+                if os.path.exists(_LEGACY_GEOCACHE) and not len(store):
+                    try:
+                        store.import_file(_LEGACY_GEOCACHE)
+                    except (OSError, ValueError, TypeError, IndexError):
+                        pass
+                _location_store = store
+    return _location_store
+
+
+def set_location_store(store):
+    """Replace the shared LocationStore (e.g. with a preloaded one)."""
+    global _location_store
+    _location_store = store
 
 
 def get_lat_lon_cached(place):
-    """Geocode a place string with in-memory + disk cache.
+    """Geocode a place string through the shared LocationStore.
+
+    Places the store has never seen (or whose entry expired) are looked up
+    in the offline gazetteer when one is configured (KUNDALI_GAZETTEER),
+    which also seeds the timezone cache, and only then reach Nominatim;
+    "not found" answers are cached too.
 
     Returns:
         tuple[float, float]: (latitude, longitude)
@@ -85,18 +367,220 @@ def get_lat_lon_cached(place):
     Raises:
         ValueError: If the place cannot be geocoded.
     """
-    key = place.strip().lower()
-    if key in _geo_cache:
-        return tuple(_geo_cache[key])
+    store = get_location_store()
+
+    def geocode():
+        from .gazetteer import get_gazetteer
 
-    geo = get_geocoder()
-    loc = geo.geocode(place, timeout=15)
-    if not loc:
+        gazetteer = get_gazetteer()
+        match = gazetteer.lookup(place) if gazetteer is not None else None
+        if match is not None:
+            if match["timezone"]:
+                store.put_timezone(match["lat"], match["lon"], match["timezone"])
+            return [match["lat"], match["lon"]], store.ttl
+        loc = get_geocoder().geocode(place, timeout=15)
+        if not loc:
+            return store.NOT_FOUND, store.negative_ttl
+        return [loc.latitude, loc.longitude], store.ttl
+
+    value = store._resolve("places", _place_key(place), geocode)
+    if value == store.NOT_FOUND or value is None:
         raise ValueError(
             f"Location not found: {place}. Try 'Mumbai, Maharashtra, India'"
         )
+    return tuple(value)
+
+
+def get_timezone_cached(lat, lon):
+    """IANA timezone at (lat, lon), cached per coordinate rounded to ~11 m.
+
+    Known places never construct the TimezoneFinder.  Returns None when no
+    timezone can be determined.
+    """
+    store = get_location_store()
+
+    def lookup():
+        return (
+            get_timezone_finder().timezone_at(
+                lat=round(lat, _TZ_DECIMALS), lng=round(lon, _TZ_DECIMALS)
+            ),
+            store.ttl,
+        )
+
+    return store._resolve("timezones", _tz_key(lat, lon), lookup)
+
+
+# ---------------------------------------------------------------------------
+# Natal chart cache  (in-memory LRU + optional SQLite file with size limit)
+# ---------------------------------------------------------------------------
+#   KUNDALI_CHART_CACHE_SIZE    in-memory entries (default 256, 0 disables)
+#   KUNDALI_CHART_CACHE_DB      SQLite path for the disk tier (unset = off)
+#   KUNDALI_CHART_CACHE_DB_MB   disk tier size limit in MB (default 256)
+
+
+class ChartCache:
+    """Two-tier store for calculated charts keyed by a hashable key.
+
+    Values are deep-copied in and out so callers can mutate what they get.
+    The disk tier evicts least-recently-used rows once the stored pickles
+    exceed ``db_max_bytes``.  A database that cannot be opened leaves the
+    cache memory-only; disk errors never reach the caller.
+    """
+
+    def __init__(self, maxsize=256, db_path=None, db_max_bytes=256 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.db_path = db_path
+        self.db_max_bytes = db_max_bytes
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            try:
+                directory = os.path.dirname(os.path.abspath(db_path))
+                os.makedirs(directory, exist_ok=True)
+                with self._connect() as conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS charts ("
+                        "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                        "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+                    )
+            except (OSError, sqlite3.Error):
+                self.db_path = None
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def get(self, key):
+        """Return a copy of the cached value for *key*, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._memory[key])
+        value = self._db_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return copy.deepcopy(value)
 
-    result = (loc.latitude, loc.longitude)
-    _geo_cache[key] = list(result)
-    _save_cache()
-    return result
+    def put(self, key, value):
+        """Store a copy of *value* under *key* in both tiers."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+        self._db_put(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = 0
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM charts")
+            except (OSError, sqlite3.Error):
+                pass
+
+    def _remember(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key):
+        if not self.db_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM charts WHERE key = ?", (repr(key),)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE charts SET accessed = ? WHERE key = ?",
+                    (time.time(), repr(key)),
+                )
+            return pickle.loads(row[0])
+        except (OSError, sqlite3.Error, pickle.PickleError, EOFError):
+            return None
+
+    def _db_put(self, key, value):
+        if not self.db_path:
+            return
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO charts (key, value, size, accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (repr(key), blob, len(blob), time.time()),
+                )
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM charts").fetchone()[0]
+                if total > self.db_max_bytes:
+                    excess = total - self.db_max_bytes
+                    freed = 0
+                    for old_key, size in conn.execute(
+                        "SELECT key, size FROM charts ORDER BY accessed"
+                    ).fetchall():
+                        if freed >= excess:
+                            break
+                        conn.execute("DELETE FROM charts WHERE key = ?", (old_key,))
+                        freed += size
+        except (OSError, sqlite3.Error, pickle.PickleError):
+            pass
+
+
+_chart_cache = None
+
+
+def get_chart_cache():
+    """Return the shared natal chart cache (configured from the environment)."""
+    global _chart_cache
+    if _chart_cache is None:
+        with _lock:
+            if _chart_cache is None:
+                try:
+                    maxsize = int(os.getenv("KUNDALI_CHART_CACHE_SIZE", "256"))
+                    db_mb = float(os.getenv("KUNDALI_CHART_CACHE_DB_MB", "256"))
+                except ValueError:
+                    maxsize, db_mb = 256, 256.0
+                _chart_cache = ChartCache(
+                    maxsize=maxsize,
+                    db_path=os.getenv("KUNDALI_CHART_CACHE_DB") or None,
+                    db_max_bytes=int(db_mb * 1024 * 1024),
+                )
+    return _chart_cache
+
+
+# ---------------------------------------------------------------------------
+# Sky event cache  (transit calendar events shared by every native)
+# ---------------------------------------------------------------------------
+#   KUNDALI_SKY_EVENT_CACHE_SIZE  in-memory windows (default 32, 0 disables)
+#   KUNDALI_SKY_EVENT_DB          SQLite path for the disk tier (unset = off)
+
+_sky_event_cache = None
+
+
+def get_sky_event_cache():
+    """Return the shared store for native-independent transit events."""
+    global _sky_event_cache
+    if _sky_event_cache is None:
+        with _lock:
+            if _sky_event_cache is None:
+                try:
+                    maxsize = int(os.getenv("KUNDALI_SKY_EVENT_CACHE_SIZE", "32"))
+                except ValueError:
+                    maxsize = 32
+                _sky_event_cache = ChartCache(
+                    maxsize=maxsize,
+                    db_path=os.getenv("KUNDALI_SKY_EVENT_DB") or None,
+                    db_max_bytes=16 * 1024 * 1024,
+                )
+    return _sky_event_cache
@@ -3,10 +3,26 @@
 Dasha calculations:
   - Vimshottari: Mahadasha → Antardasha → Pratyantar → Sookshma (4 levels)
   - Ashtottari : alternate 108-year dasha system (Rahu-based)
+  - Yogini     : 36-year cycle of 8 Yoginis
+  - DashaTimeline: bisect lookups over any of these (and Jaimini Chara), with
+    levels 2-5 (antar, pratyantar, sookshma, prana) generated on demand
+
+    timeline = DashaTimeline.from_mahadashas(result["vimshottari"]["mahadasas"], VIMSHOTTARI)
+    md, ad, pd = timeline.active(jd, depth=3)
+    timeline.periods_between(jd1, jd2, depth=2)
+    timeline.active_many(jds, depth=4)
 """
 
+from bisect import bisect_right
+
 import swisseph as swe
-from .constants import dasha_lords, dasha_periods, nakshatra_lord_index
+from .constants import (
+    SIGN_LORDS,
+    dasha_lords,
+    dasha_periods,
+    nakshatra_lord_index,
+    zodiac_signs,
+)
 from .utils import get_nakshatra_progress
 
 # ─── Ashtottari constants ────────────────────────────────────────────────────
@@ -168,22 +184,25 @@ def find_current_dasha(birth_jd, current_jd, dashas):
     Args:
         birth_jd (float): Birth Julian Day.
         current_jd (float): Current Julian Day.
-        dashas (list): List of mahadasha dicts (with antardashas).
+        dashas (list): List of mahadasha dicts.
 
     Returns:
         tuple: (md_lord, ad_lord) or (None, None) if not found.
     """
-    years_since = (current_jd - birth_jd) / 365.25
-    for md in dashas:
-        md_start_y = (md["start_jd"] - birth_jd) / 365.25
-        md_end_y = (md["end_jd"] - birth_jd) / 365.25
-        if md_start_y <= years_since < md_end_y:
-            for ad in md["antardashas"]:
-                ad_start_y = (ad["start_jd"] - birth_jd) / 365.25
-                ad_end_y = (ad["end_jd"] - birth_jd) / 365.25
-                if ad_start_y <= years_since < ad_end_y:
-                    return md["lord"], ad["lord"]
-    return None, None
+    path = DashaTimeline.from_mahadashas(dashas, VIMSHOTTARI).active(current_jd, depth=2)
+    if not path:
+        return None, None
+    return path[0].lord, path[1].lord
+
+
+def _current_sub_period(current_jd, lords, dashas):
+    """Running period one level below *lords* (MD, AD, ...) as (lord, start, end)."""
+    path = DashaTimeline.from_mahadashas(dashas, VIMSHOTTARI).active(
+        current_jd, depth=len(lords) + 1
+    )
+    if not path or [p.lord for p in path[:-1]] != list(lords):
+        return None, None, None
+    return path[-1].lord, path[-1].start_jd, path[-1].end_jd
 
 
 def get_current_pratyantar(birth_jd, current_jd, current_md, current_ad, dashas):
@@ -200,29 +219,7 @@ def get_current_pratyantar(birth_jd, current_jd, current_md, current_ad, dashas)
     Returns:
         tuple: (pd_lord, pd_start_jd, pd_end_jd) or (None, None, None).
     """
-    years_since = (current_jd - birth_jd) / 365.25
-    for md in dashas:
-        if md["lord"] != current_md:
-            continue
-        for ad in md["antardashas"]:
-            if ad["lord"] != current_ad:
-                continue
-            # Compute pratyantars for this AD on the fly
-            ad_days = ad["end_jd"] - ad["start_jd"]
-            ad_years = ad_days / 365.25
-            current_pd_jd = ad["start_jd"]
-            ad_idx = dasha_lords.index(current_ad)
-            for i in range(9):
-                pd_idx = (ad_idx + i) % 9
-                pd_lord = dasha_lords[pd_idx]
-                pd_years = ad_years * (dasha_periods[pd_lord] / 120.0)
-                pd_end_jd = current_pd_jd + pd_years * 365.25
-                pd_start_y = (current_pd_jd - birth_jd) / 365.25
-                pd_end_y = (pd_end_jd - birth_jd) / 365.25
-                if pd_start_y <= years_since < pd_end_y:
-                    return pd_lord, current_pd_jd, pd_end_jd
-                current_pd_jd = pd_end_jd
-    return None, None, None
+    return _current_sub_period(current_jd, (current_md, current_ad), dashas)
 
 
 def get_current_sookshma(
@@ -233,38 +230,7 @@ def get_current_sookshma(
 
     Returns (sd_lord, sd_start_jd, sd_end_jd) or (None, None, None).
     """
-    years_since = (current_jd - birth_jd) / 365.25
-    for md in dashas:
-        if md["lord"] != current_md:
-            continue
-        for ad in md["antardashas"]:
-            if ad["lord"] != current_ad:
-                continue
-            ad_years = (ad["end_jd"] - ad["start_jd"]) / 365.25
-            ad_idx = dasha_lords.index(current_ad)
-            pd_jd = ad["start_jd"]
-            for i in range(9):
-                pd_idx = (ad_idx + i) % 9
-                pd_lord_name = dasha_lords[pd_idx]
-                pd_years = ad_years * (dasha_periods[pd_lord_name] / 120.0)
-                pd_end_jd = pd_jd + pd_years * 365.25
-                if pd_lord_name != current_pd:
-                    pd_jd = pd_end_jd
-                    continue
-                # Now iterate Sookshma within this PD
-                sd_jd = pd_jd
-                pd_idx2 = dasha_lords.index(current_pd)
-                for j in range(9):
-                    sd_idx = (pd_idx2 + j) % 9
-                    sd_lord_name = dasha_lords[sd_idx]
-                    sd_years = pd_years * (dasha_periods[sd_lord_name] / 120.0)
-                    sd_end = sd_jd + sd_years * 365.25
-                    sd_start_y = (sd_jd - birth_jd) / 365.25
-                    sd_end_y = (sd_end - birth_jd) / 365.25
-                    if sd_start_y <= years_since < sd_end_y:
-                        return sd_lord_name, sd_jd, sd_end
-                    sd_jd = sd_end
-    return None, None, None
+    return _current_sub_period(current_jd, (current_md, current_ad, current_pd), dashas)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -356,17 +322,10 @@ def calculate_ashtottari_antardashas(md_dasha):
 
 def find_current_ashtottari(birth_jd, current_jd, dashas):
     """Find current Ashtottari MD and AD."""
-    years_since = (current_jd - birth_jd) / 365.25
-    for md in dashas:
-        ms = (md["start_jd"] - birth_jd) / 365.25
-        me = (md["end_jd"] - birth_jd) / 365.25
-        if ms <= years_since < me:
-            for ad in md["antardashas"]:
-                as_ = (ad["start_jd"] - birth_jd) / 365.25
-                ae = (ad["end_jd"] - birth_jd) / 365.25
-                if as_ <= years_since < ae:
-                    return md["lord"], ad["lord"]
-    return None, None
+    path = DashaTimeline.from_mahadashas(dashas, ASHTOTTARI).active(current_jd, depth=2)
+    if not path:
+        return None, None
+    return path[0].lord, path[1].lord
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -529,14 +488,241 @@ def calculate_yogini_antardashas(md_dasha):
 
 def find_current_yogini(birth_jd, current_jd, dashas):
     """Find current Yogini MD and AD at current_jd."""
-    years_since = (current_jd - birth_jd) / 365.25
-    for md in dashas:
-        ms = (md["start_jd"] - birth_jd) / 365.25
-        me = (md["end_jd"] - birth_jd) / 365.25
-        if ms <= years_since < me:
-            for ad in md.get("antardashas", []):
-                as_ = (ad["start_jd"] - birth_jd) / 365.25
-                ae = (ad["end_jd"] - birth_jd) / 365.25
-                if as_ <= years_since < ae:
-                    return md["yogini"], md["lord"], ad["yogini"], ad["lord"]
-    return None, None, None, None
+    path = DashaTimeline.from_mahadashas(dashas, YOGINI).active(current_jd, depth=2)
+    if not path:
+        return None, None, None, None
+    md, ad = path
+    return md.key, md.lord, ad.key, ad.lord
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Dasha timeline (shared by Vimshottari, Ashtottari, Yogini and Chara)
+# ─────────────────────────────────────────────────────────────────────────────
+DASHA_LEVELS = ("mahadasha", "antardasha", "pratyantar", "sookshma", "prana")
+
+
+class DashaSystem:
+    """
+    Cycle of a nakshatra/sign dasha system.
+
+    A period of *key* lasting Y years divides into one sub-period per key in
+    the cycle, starting from *key*, each lasting Y * years[sub] / total.
+    """
+
+    __slots__ = ("name", "sequence", "years", "total", "lords", "key_field")
+
+    def __init__(self, name, sequence, years, lords=None, key_field="lord"):
+        self.name = name
+        self.sequence = tuple(sequence)
+        self.years = dict(years)
+        self.total = sum(self.years[key] for key in self.sequence)
+        # key -> ruling planet (keys are planets unless given)
+        self.lords = dict(lords) if lords else {key: key for key in self.sequence}
+        # mahadasha dict field holding the key
+        self.key_field = key_field
+
+    def sub_sequence(self, key):
+        idx = self.sequence.index(key)
+        return self.sequence[idx:] + self.sequence[:idx]
+
+    def __repr__(self):
+        return f"DashaSystem({self.name!r})"
+
+
+VIMSHOTTARI = DashaSystem("vimshottari", dasha_lords, dasha_periods)
+ASHTOTTARI = DashaSystem("ashtottari", _ASHTO_LORDS, _ASHTO_PERIODS)
+YOGINI = DashaSystem(
+    "yogini",
+    _YOGINI_NAMES,
+    _YOGINI_PERIODS,
+    lords=dict(zip(_YOGINI_NAMES, _YOGINI_LORDS)),
+    key_field="yogini",
+)
+# Jaimini Chara: sub-periods are twelfths of the dasha, in zodiacal order
+# from the dasha sign.
+CHARA = DashaSystem(
+    "chara",
+    zodiac_signs,
+    {sign: 1 for sign in zodiac_signs},
+    lords=SIGN_LORDS,
+    key_field="sign",
+)
+
+
+class DashaPeriod:
+    """One period of a timeline; *path* indexes it from the mahadasha down."""
+
+    __slots__ = ("level", "key", "lord", "start_jd", "end_jd", "path")
+
+    def __init__(self, level, key, lord, start_jd, end_jd, path):
+        self.level = level
+        self.key = key
+        self.lord = lord
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.path = path
+
+    @property
+    def years(self):
+        return (self.end_jd - self.start_jd) / 365.25
+
+    def to_dict(self):
+        return {
+            "level": DASHA_LEVELS[self.level - 1],
+            "key": self.key,
+            "lord": self.lord,
+            "start_jd": self.start_jd,
+            "end_jd": self.end_jd,
+            "years": round(self.years, 3),
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, DashaPeriod):
+            return NotImplemented
+        return (self.level, self.key, self.start_jd, self.end_jd) == (
+            other.level, other.key, other.start_jd, other.end_jd
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"DashaPeriod({DASHA_LEVELS[self.level - 1]} {self.key} {self.start_jd:.3f}-{self.end_jd:.3f})"
+
+
+class DashaTimeline:
+    """
+    Nested dasha periods with bisect lookups.
+
+    Each level is stored as sorted boundary JDs plus keys; mahadashas are
+    given, deeper levels (up to DASHA_LEVELS) are expanded from the system's
+    cycle the first time a query reaches them and then kept.
+    """
+
+    max_depth = len(DASHA_LEVELS)
+
+    def __init__(self, system, keys, bounds):
+        """*bounds* holds len(keys) + 1 ascending JDs (start of each period, then the end)."""
+        if len(bounds) != len(keys) + 1:
+            raise ValueError("bounds must have one more entry than keys")
+        self.system = system
+        # path of the parent period -> (keys, bounds) of its sub-periods
+        self._levels = {(): (tuple(keys), list(bounds))}
+
+    @classmethod
+    def from_mahadashas(cls, mahadashas, system):
+        """Timeline over a list of mahadasha dicts (start_jd, end_jd, system key field)."""
+        keys = [md[system.key_field] for md in mahadashas]
+        bounds = [md["start_jd"] for md in mahadashas]
+        if mahadashas:
+            bounds.append(mahadashas[-1]["end_jd"])
+        else:
+            bounds.append(0.0)
+        return cls(system, keys, bounds)
+
+    def __repr__(self):
+        keys, bounds = self._levels[()]
+        return f"DashaTimeline({self.system.name}, {len(keys)} mahadashas)"
+
+    @property
+    def start_jd(self):
+        return self._levels[()][1][0]
+
+    @property
+    def end_jd(self):
+        return self._levels[()][1][-1]
+
+    def _check_depth(self, depth):
+        if not 1 <= depth <= self.max_depth:
+            raise ValueError(f"depth must be 1..{self.max_depth}")
+
+    def _period(self, level, keys, bounds, path, i):
+        key = keys[i]
+        return DashaPeriod(level, key, self.system.lords[key], bounds[i], bounds[i + 1], path + (i,))
+
+    def _sub_level(self, period):
+        """(keys, bounds) of *period*'s sub-periods, expanded on first use."""
+        level = self._levels.get(period.path)
+        if level is None:
+            system = self.system
+            keys = system.sub_sequence(period.key)
+            parent_years = (period.end_jd - period.start_jd) / 365.25
+            bounds = [period.start_jd]
+            jd = period.start_jd
+            for key in keys:
+                jd = jd + parent_years * (system.years[key] / system.total) * 365.25
+                bounds.append(jd)
+            level = self._levels[period.path] = (keys, bounds)
+        return level
+
+    def mahadashas(self):
+        keys, bounds = self._levels[()]
+        return [self._period(1, keys, bounds, (), i) for i in range(len(keys))]
+
+    def sub_periods(self, period):
+        """The periods one level below *period*."""
+        if period.level >= self.max_depth:
+            return []
+        keys, bounds = self._sub_level(period)
+        return [self._period(period.level + 1, keys, bounds, period.path, i) for i in range(len(keys))]
+
+    def active(self, jd, depth=2):
+        """
+        Running periods at *jd*, mahadasha first, down to *depth* levels.
+
+        Returns an empty list outside the timeline.
+        """
+        self._check_depth(depth)
+        keys, bounds = self._levels[()]
+        i = bisect_right(bounds, jd) - 1
+        if i < 0 or i >= len(keys):
+            return []
+        path = [self._period(1, keys, bounds, (), i)]
+        for level in range(2, depth + 1):
+            keys, bounds = self._sub_level(path[-1])
+            # clamp: accumulated sub-period ends can fall a hair short of the parent end
+            i = min(max(bisect_right(bounds, jd) - 1, 0), len(keys) - 1)
+            path.append(self._period(level, keys, bounds, path[-1].path, i))
+        return path
+
+    def active_many(self, jds, depth=2):
+        """``active()`` for many JDs; sub-levels are shared across the batch."""
+        self._check_depth(depth)
+        return [self.active(jd, depth) for jd in jds]
+
+    def periods_between(self, jd1, jd2, depth=1):
+        """Periods at *depth* overlapping [jd1, jd2), in time order."""
+        self._check_depth(depth)
+        out = []
+
+        def walk(keys, bounds, path, level):
+            first = max(bisect_right(bounds, jd1) - 1, 0)
+            for i in range(first, len(keys)):
+                if bounds[i] >= jd2:
+                    break
+                if bounds[i + 1] <= jd1:
+                    continue
+                period = self._period(level, keys, bounds, path, i)
+                if level == depth:
+                    out.append(period)
+                else:
+                    walk(*self._sub_level(period), period.path, level + 1)
+
+        walk(*self._levels[()], (), 1)
+        return out
+
+
+_CHART_DASHAS = {
+    "vimshottari": (VIMSHOTTARI, "vimshottari", "mahadasas"),
+    "ashtottari": (ASHTOTTARI, "ashtottari", "mahadasas"),
+    "yogini": (YOGINI, "yogini_dasha", "dashas"),
+    "chara": (CHARA, "chara_dasha", "dashas"),
+}
+
+
+def get_dasha_timeline(result, system="vimshottari"):
+    """Timeline over the mahadashas a chart *result* holds for *system*."""
+    if system not in _CHART_DASHAS:
+        raise ValueError(f"Unknown dasha system: {system}")
+    dasha_system, section, field = _CHART_DASHAS[system]
+    mahadashas = (result.get(section) or {}).get(field) or []
+    return DashaTimeline.from_mahadashas(mahadashas, dasha_system)
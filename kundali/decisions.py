@@ -18,6 +18,7 @@ JSON-serializable dicts.
 """
 
 import datetime
+import functools
 
 from .constants import (
     zodiac_signs,
@@ -28,6 +29,88 @@ from .constants import (
 from .utils import get_dignity, get_house_from_sign
 
 
+# Optional calculate_kundali() sections each engine reads, beyond the natal
+# core.  Pass as ``include=`` to compute only what a decision needs.
+_BASE_DECISION_SECTIONS = {
+    "career": (),
+    "marriage": ("upapadha_lagna",),
+    "business": ("muhurtha", "transit_calendar"),
+    "health": (),
+    "travel": (),
+    "education": (),
+    "daily": ("current_panchanga", "pancha_pakshi", "current_muhurtha"),
+    "compatibility": (),
+}
+DECISION_SECTIONS = dict(_BASE_DECISION_SECTIONS)
+DECISION_SECTIONS["life_analysis"] = tuple(sorted({
+    name
+    for key in ("career", "marriage", "business", "health", "travel", "education")
+    for name in _BASE_DECISION_SECTIONS[key]
+}))
+DECISION_SECTIONS["all"] = tuple(sorted({
+    name for names in _BASE_DECISION_SECTIONS.values() for name in names
+}))
+
+
+# ===================================================================
+# Per-chart memo
+# ===================================================================
+# Engine outputs are memoized on the result dict itself, so
+# get_all_decisions(), get_life_analysis(), serialize_result(), print_kundali()
+# and the PDF report share one computation per chart.  The memo is dropped
+# whenever the chart's identity or "now" changes (rectified birth time,
+# refresh_current(), different computed sections).
+
+DECISION_CACHE_KEY = "_decision_cache"
+
+
+def _decision_stamp(result):
+    rectification = result.get("birth_time_rectification") or {}
+    return (
+        result.get("birth_jd"),
+        result.get("birth_time"),
+        result.get("current_jd"),
+        result.get("ayanamsa"),
+        result.get("name"),
+        tuple(result.get("computed_sections") or ()),
+        rectification.get("applied"),
+        rectification.get("corrected_birth_time"),
+    )
+
+
+def clear_decision_cache(result):
+    """Drop memoized decision outputs from *result* (if any)."""
+    if isinstance(result, dict):
+        result.pop(DECISION_CACHE_KEY, None)
+
+
+def _memoized(kind):
+    """Memoize a single-chart engine on its result dict.
+
+    Callers get a shallow copy: top-level keys may be added or replaced, but
+    nested values are shared with the memo and must be treated as read-only.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(result):
+            if not isinstance(result, dict):
+                return fn(result)
+            stamp = _decision_stamp(result)
+            memo = result.get(DECISION_CACHE_KEY)
+            if not isinstance(memo, dict) or memo.get("stamp") != stamp:
+                memo = {"stamp": stamp, "values": {}}
+                result[DECISION_CACHE_KEY] = memo
+            values = memo["values"]
+            if kind not in values:
+                values[kind] = fn(result)
+            return dict(values[kind])
+
+        return wrapper
+
+    return decorator
+
+
 # ===================================================================
 # Helpers
 # ===================================================================
@@ -208,6 +291,7 @@ _SIGN_CAREER = {
 }
 
 
+@_memoized("career")
 def get_career_decision(result):
     """Analyse the chart for career guidance.
 
@@ -336,6 +420,7 @@ def get_career_decision(result):
 # 2. MARRIAGE TIMING
 # ===================================================================
 
+@_memoized("marriage")
 def get_marriage_decision(result):
     """Analyse the chart for marriage timing and readiness."""
     lagna = result.get("lagna_sign", "Aries")
@@ -457,6 +542,7 @@ def get_marriage_decision(result):
 # 3. BUSINESS DECISIONS
 # ===================================================================
 
+@_memoized("business")
 def get_business_decision(result):
     """Analyse chart for business, investment, and financial timing."""
     lagna = result.get("lagna_sign", "Aries")
@@ -580,6 +666,7 @@ _HEALTH_PLANET = {
 }
 
 
+@_memoized("health")
 def get_health_decision(result):
     """Identify health vulnerabilities and risky periods."""
     lagna = result.get("lagna_sign", "Aries")
@@ -699,6 +786,7 @@ _SIGN_DIRECTION = {
 }
 
 
+@_memoized("travel")
 def get_travel_decision(result):
     """Analyse chart for travel and relocation guidance."""
     lagna = result.get("lagna_sign", "Aries")
@@ -807,6 +895,7 @@ def get_travel_decision(result):
 # 6. DAILY / WEEKLY GUIDANCE
 # ===================================================================
 
+@_memoized("daily")
 def get_daily_guidance(result):
     """Generate daily/weekly guidance from current transits, dasha, panchanga."""
     transits = result.get("transits", {})
@@ -1072,6 +1161,7 @@ _SIGN_EDUCATION = {
 }
 
 
+@_memoized("education")
 def get_education_decision(result):
     """Analyse chart for best educational fields and timing."""
     lagna = result.get("lagna_sign", "Aries")
@@ -1201,6 +1291,7 @@ def get_education_decision(result):
 # 9. ADVANCED LIFE ANALYSIS
 # ===================================================================
 
+@_memoized("life_analysis")
 def get_life_analysis(result):
     """Return a unified life-domain synthesis from chart data."""
     from .life_analysis import build_life_analysis
@@ -1237,6 +1328,7 @@ def get_life_analysis(result):
 # Master functions
 # ===================================================================
 
+@_memoized("all")
 def get_all_decisions(result):
     """Return all single-chart decision categories including life analysis."""
     decisions = {
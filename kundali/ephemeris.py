@@ -0,0 +1,122 @@
+"""
+Sidereal ephemeris context.
+
+``swe.set_sid_mode`` is process-global, so modules that set it (or rely on
+whatever an earlier caller set) silently mix ayanamsas when charts with
+different ayanamsas — or concurrent requests in threads — interleave.  An
+``Ephemeris`` carries the ayanamsa instead: positions are computed tropically
+and the ayanamsa (including nutation) is subtracted per call, which matches
+``FLG_SIDEREAL`` output exactly.  Only the ayanamsa lookup touches the global
+sidereal mode, and it does so under a lock.
+
+    eph = Ephemeris("Raman")
+    lon = eph.longitude(jd, swe.MOON)
+    cusps, ascmc = eph.houses(jd, lat, lon, b"W")
+"""
+
+import threading
+
+import swisseph as swe
+
+from .constants import AYANAMSA_OPTIONS
+
+_sid_lock = threading.Lock()
+
+# ascmc entries that are ecliptic longitudes (index 2 is ARMC, in RA).
+_ASCMC_LONGITUDES = (0, 1, 3, 4, 5, 6, 7)
+# Ayanamsa rates are cached at whole-day nodes; this many per ephemeris.
+_RATE_CACHE_SIZE = 4096
+
+
+class Ephemeris:
+    """Sidereal positions for one ayanamsa, independent of global swisseph state."""
+
+    def __init__(self, ayanamsa=swe.SIDM_LAHIRI):
+        """*ayanamsa* is a swisseph ``SIDM_*`` constant or an AYANAMSA_OPTIONS name."""
+        if ayanamsa is None or isinstance(ayanamsa, str):
+            ayanamsa = AYANAMSA_OPTIONS.get(ayanamsa, swe.SIDM_LAHIRI)
+        self.sid_mode = ayanamsa
+        self._rates = {}
+
+    def __repr__(self):
+        return f"Ephemeris(sid_mode={self.sid_mode})"
+
+    def ayanamsa(self, jd):
+        """Ayanamsa in degrees (with nutation) at Julian Day *jd* (UT)."""
+        with _sid_lock:
+            swe.set_sid_mode(self.sid_mode)
+            return swe.get_ayanamsa_ex_ut(jd, swe.FLG_SWIEPH)[1]
+
+    def ayanamsa_rate(self, jd):
+        """
+        Ayanamsa speed in degrees/day at *jd*.
+
+        The rate changes slowly (precession plus nutation), so it is taken
+        at the neighbouring whole-day nodes and interpolated; node values are
+        cached, which keeps repeated calls off the locked ayanamsa lookup.
+        """
+        node = int(jd // 1.0)
+        frac = jd - node
+        low = self._node_rate(node)
+        return low + frac * (self._node_rate(node + 1) - low) if frac else low
+
+    def _node_rate(self, node):
+        rate = self._rates.get(node)
+        if rate is None:
+            rate = self.ayanamsa(node + 0.5) - self.ayanamsa(node - 0.5)
+            if len(self._rates) >= _RATE_CACHE_SIZE:
+                self._rates.clear()
+            self._rates[node] = rate
+        return rate
+
+    def calc(self, jd, planet_id, flags=0):
+        """
+        Sidereal equivalent of ``swe.calc_ut(jd, planet_id, flags | FLG_SIDEREAL)[0]``.
+
+        Returns the 6-tuple (lon, lat, dist, lon_speed, lat_speed, dist_speed);
+        only the longitude and its speed are converted to the sidereal frame.
+        """
+        return self.calc_many(jd, (planet_id,), flags)[0]
+
+    def calc_many(self, jd, planet_ids, flags=0):
+        """``calc()`` for several planets at one instant, sharing the ayanamsa lookups."""
+        flags &= ~swe.FLG_SIDEREAL
+        aya = self.ayanamsa(jd)
+        aya_rate = self.ayanamsa_rate(jd) if flags & swe.FLG_SPEED else 0.0
+        positions = []
+        for planet_id in planet_ids:
+            pos = list(swe.calc_ut(jd, planet_id, flags)[0])
+            pos[0] = (pos[0] - aya) % 360.0
+            pos[3] -= aya_rate
+            positions.append(tuple(pos))
+        return positions
+
+    def longitude(self, jd, planet_id):
+        """Sidereal longitude of *planet_id* at *jd*."""
+        return self.calc(jd, planet_id)[0]
+
+    def houses(self, jd, lat, lon, hsys=b"W"):
+        """Sidereal equivalent of ``swe.houses_ex(jd, lat, lon, hsys, FLG_SIDEREAL)``."""
+        cusps, ascmc = swe.houses_ex(jd, lat, lon, hsys, 0)
+        aya = self.ayanamsa(jd)
+        ascmc = list(ascmc)
+        for i in _ASCMC_LONGITUDES:
+            if i < len(ascmc):
+                ascmc[i] = (ascmc[i] - aya) % 360.0
+        if hsys == b"W":
+            first = int(ascmc[0] // 30) * 30.0
+            cusps = tuple((first + 30.0 * i) % 360.0 for i in range(len(cusps)))
+        else:
+            cusps = tuple((c - aya) % 360.0 for c in cusps)
+        return cusps, tuple(ascmc)
+
+
+_cache_lock = threading.Lock()
+_instances = {}
+
+
+def get_ephemeris(ayanamsa=swe.SIDM_LAHIRI):
+    """Return a shared Ephemeris for *ayanamsa* (``SIDM_*`` constant or name)."""
+    eph = Ephemeris(ayanamsa)
+    with _cache_lock:
+        return _instances.setdefault(eph.sid_mode, eph)
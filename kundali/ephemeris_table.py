@@ -0,0 +1,202 @@
+"""
+Precomputed sidereal ephemeris on a fixed grid.
+
+Scans (transits, solar returns, muhurtha windows) evaluate planet positions
+at thousands of instants.  An ``EphemerisTable`` holds the sidereal longitude
+and speed of the nine grahas at every grid node over a year range and answers
+batched queries by cubic Hermite interpolation (node values + node speeds),
+so a whole scan becomes one vectorized call.
+
+Tables are stored as ``.npy`` (memory-mapped on load) with a small JSON
+sidecar describing the grid.  NumPy is optional; without it the module
+imports but ``build_table`` / ``EphemerisTable`` raise ImportError.
+
+    table = build_table(2000, 2050)
+    table.save("lahiri_2000_2050.npy")
+    lon, speed = EphemerisTable.load("lahiri_2000_2050.npy").positions(jds)
+"""
+
+import json
+import os
+import threading
+
+import swisseph as swe
+
+from .ephemeris import Ephemeris
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+GRAHAS = ("Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa", "Ra", "Ke")
+_GRAHA_IDS = {
+    "Su": swe.SUN,
+    "Mo": swe.MOON,
+    "Ma": swe.MARS,
+    "Me": swe.MERCURY,
+    "Ju": swe.JUPITER,
+    "Ve": swe.VENUS,
+    "Sa": swe.SATURN,
+    "Ra": swe.MEAN_NODE,
+}
+
+# Half-day nodes keep the Moon within ~1e-5° of Swiss Ephemeris.
+DEFAULT_STEP = 0.5
+_TABLE_VERSION = 1
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for the ephemeris table")
+
+
+class EphemerisTable:
+    """Sidereal longitudes/speeds of the nine grahas on a regular JD grid.
+
+    ``data`` has shape (nodes, 9, 2): longitude in degrees [0, 360) and
+    speed in degrees/day for each graha in ``GRAHAS`` order.
+    """
+
+    def __init__(self, start_jd, step, data, sid_mode=swe.SIDM_LAHIRI):
+        _require_numpy()
+        self.start_jd = float(start_jd)
+        self.step = float(step)
+        self.data = data
+        self.sid_mode = sid_mode
+
+    @property
+    def end_jd(self):
+        return self.start_jd + (len(self.data) - 1) * self.step
+
+    def covers(self, jds):
+        """True if every JD in *jds* lies inside the table range."""
+        jds = np.asarray(jds, dtype=float)
+        return bool(np.all((jds >= self.start_jd) & (jds <= self.end_jd)))
+
+    def positions(self, jds):
+        """
+        Interpolate all nine grahas at the given Julian Days (UT).
+
+        Args:
+            jds: scalar or array-like of Julian Days
+
+        Returns:
+            tuple: (longitudes, speeds), each of shape ``jds.shape + (9,)``
+
+        Raises:
+            ValueError: If any JD lies outside the table range.
+        """
+        jds = np.asarray(jds, dtype=float)
+        if not self.covers(jds):
+            raise ValueError(
+                f"JD outside ephemeris table range {self.start_jd}..{self.end_jd}"
+            )
+        x = (jds - self.start_jd) / self.step
+        i = np.minimum(np.floor(x).astype(np.intp), len(self.data) - 2)
+        t = (x - i)[..., None]
+
+        lon0, spd0 = self.data[i, :, 0], self.data[i, :, 1]
+        lon1, spd1 = self.data[i + 1, :, 0], self.data[i + 1, :, 1]
+        delta = (lon1 - lon0 + 180.0) % 360.0 - 180.0
+        m0, m1 = spd0 * self.step, spd1 * self.step
+
+        t2, t3 = t * t, t * t * t
+        lon = lon0 + (t3 - 2 * t2 + t) * m0 + (-2 * t3 + 3 * t2) * delta + (t3 - t2) * m1
+        dlon = (3 * t2 - 4 * t + 1) * m0 + (-6 * t2 + 6 * t) * delta + (3 * t2 - 2 * t) * m1
+        return lon % 360.0, dlon / self.step
+
+    def longitude(self, planet, jds):
+        """Interpolated sidereal longitude of one graha (e.g. ``"Ju"``) at *jds*."""
+        return self.positions(jds)[0][..., GRAHAS.index(planet)]
+
+    def save(self, path):
+        """Write the grid to *path* (``.npy``) plus a ``.json`` sidecar."""
+        np.save(path, np.ascontiguousarray(self.data))
+        with open(_meta_path(path), "w") as f:
+            json.dump(
+                {
+                    "version": _TABLE_VERSION,
+                    "start_jd": self.start_jd,
+                    "step": self.step,
+                    "sid_mode": self.sid_mode,
+                    "grahas": list(GRAHAS),
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a table written by :meth:`save` (memory-mapped by default)."""
+        _require_numpy()
+        with open(_meta_path(path)) as f:
+            meta = json.load(f)
+        if meta.get("version") != _TABLE_VERSION or meta.get("grahas") != list(GRAHAS):
+            raise ValueError(f"Incompatible ephemeris table: {path}")
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        return cls(meta["start_jd"], meta["step"], data, sid_mode=meta["sid_mode"])
+
+
+def _meta_path(path):
+    return os.fspath(path) + ".json"
+
+
+def build_table(start_year=1900, end_year=2100, step=DEFAULT_STEP, sid_mode=swe.SIDM_LAHIRI):
+    """
+    Compute an ephemeris table from Swiss Ephemeris.
+
+    Args:
+        start_year: first calendar year covered (from Jan 1, 0h UT)
+        end_year: last calendar year covered (through Dec 31)
+        step: grid spacing in days
+        sid_mode: swisseph ayanamsa constant
+
+    Returns:
+        EphemerisTable
+    """
+    _require_numpy()
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    nodes = int(np.ceil((end_jd - start_jd) / step)) + 1
+    data = np.empty((nodes, len(GRAHAS), 2))
+
+    eph = Ephemeris(sid_mode)
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    for n in range(nodes):
+        jd = start_jd + n * step
+        aya = eph.ayanamsa(jd)
+        aya_rate = eph.ayanamsa_rate(jd)
+        for col, graha in enumerate(GRAHAS[:-1]):
+            pos = swe.calc_ut(jd, _GRAHA_IDS[graha], flags)[0]
+            data[n, col, 0] = (pos[0] - aya) % 360.0
+            data[n, col, 1] = pos[3] - aya_rate
+    data[:, -1, 0] = (data[:, GRAHAS.index("Ra"), 0] + 180.0) % 360.0
+    data[:, -1, 1] = data[:, GRAHAS.index("Ra"), 1]
+    return EphemerisTable(start_jd, step, data, sid_mode=sid_mode)
+
+
+# ---------------------------------------------------------------------------
+# Shared table  (KUNDALI_EPHEMERIS_TABLE = path to a saved .npy)
+# ---------------------------------------------------------------------------
+_shared_table = None
+_shared_loaded = False
+_lock = threading.Lock()
+
+
+def get_ephemeris_table():
+    """Return the table configured via KUNDALI_EPHEMERIS_TABLE, or None."""
+    global _shared_table, _shared_loaded
+    if not _shared_loaded:
+        with _lock:
+            if not _shared_loaded:
+                path = os.getenv("KUNDALI_EPHEMERIS_TABLE")
+                if path and NUMPY_AVAILABLE:
+                    try:
+                        _shared_table = EphemerisTable.load(path)
+                    except (OSError, ValueError):
+                        _shared_table = None
+                _shared_loaded = True
+    return _shared_table
@@ -0,0 +1,334 @@
+"""
+Offline gazetteer: place names to coordinates and timezone without a network.
+
+Loads a GeoNames-style TSV (``cities500.txt``, ``cities15000.txt``, ...) into
+a compact in-memory index:
+
+  - exact lookups on normalized names (accents, case and punctuation folded),
+    including the ASCII alternate names ("Bombay" -> Mumbai);
+  - fuzzy lookups through a trigram index over the primary names, verified
+    by a bounded edit distance ("Mumbaai", "Mumabi" -> Mumbai);
+  - qualifiers after the first comma ("Mumbai, Maharashtra", "London,
+    Canada") are matched against country and admin1 codes/names to break
+    ties, then population decides.  A qualifier spelling out a known country
+    or state that no candidate lies in rejects the lookup, so "London,
+    Kentucky" is left to the online geocoder instead of answering London GB.
+    Short codes only rank: "MH" or "TN" is as often a state abbreviation
+    (Maharashtra, Tamil Nadu) as the ISO code of another country.
+
+``countryInfo.txt`` and ``admin1CodesASCII.txt`` next to the TSV are used for
+country and state names when present.  Point KUNDALI_GAZETTEER at the TSV to
+have ``cache.get_lat_lon_cached`` consult the gazetteer before Nominatim.
+
+    gaz = Gazetteer.load("cities15000.txt")
+    gaz.lookup("Bombay, India")   # {"name": "Mumbai", "lat": ..., "timezone": ...}
+"""
+
+import array
+import collections
+import os
+import re
+import threading
+import unicodedata
+
+# GeoNames "geoname" table columns
+_COL_NAME, _COL_ASCII, _COL_ALT = 1, 2, 3
+_COL_LAT, _COL_LON, _COL_CLASS = 4, 5, 6
+_COL_COUNTRY, _COL_ADMIN1, _COL_POP, _COL_TZ = 8, 10, 14, 17
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_ASCII_NAME = re.compile(r"^[a-z0-9 ]+$")
+
+# Fuzzy matches allow one edit (insert, delete, substitute, transpose) per
+# _EDITS_PER_CHARS characters of the query.  An edit changes at most
+# _GRAMS_PER_EDIT trigrams, which bounds how many a candidate must share.
+_EDITS_PER_CHARS = 4
+_GRAMS_PER_EDIT = 4
+# Only the names sharing the most trigrams are checked for edit distance.
+_FUZZY_CANDIDATES = 256
+# Fuzzy matches below this similarity (1 - edits / length) are rejected;
+# one edit in a name of four letters or fewer is too likely another place.
+_MIN_SIMILARITY = 0.8
+# Qualifiers this short are codes ("MH", "USA"); they rank but never reject.
+_MAX_CODE_LENGTH = 3
+
+
+def normalize_name(text):
+    """Fold accents, case and punctuation: ``"São Paulo!"`` -> ``"sao paulo"``."""
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def _trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a, b, limit):
+    """Optimal-string-alignment distance between *a* and *b*, or None if > *limit*."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    before, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return None
+        before, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class Gazetteer:
+    """Normalized and fuzzy place-name index over GeoNames records."""
+
+    def __init__(self):
+        # Record columns (parallel arrays keep ~200k places small)
+        self.names = []
+        self.lat = array.array("d")
+        self.lon = array.array("d")
+        self.population = array.array("q")
+        self.country = []
+        self.admin1 = []
+        self.tz_index = array.array("H")
+        self.timezones = []
+        self._tz_ids = {}
+        # normalized name -> record ids, most populous first
+        self._exact = {}
+        # fuzzy index over primary names: trigram -> ids into _fuzzy_names
+        self._fuzzy_names = []
+        self._fuzzy_records = []
+        self._trigram_index = {}
+        # qualifier aliases: normalized code/name -> set of country / admin1 keys
+        self._country_aliases = collections.defaultdict(set)
+        self._admin1_aliases = collections.defaultdict(set)
+
+    def __len__(self):
+        return len(self.names)
+
+    # -- loading --------------------------------------------------------------
+    @classmethod
+    def load(cls, path, min_population=0, alternate_names=True):
+        """
+        Build an index from a GeoNames TSV (populated places only).
+
+        Args:
+            path: GeoNames ``cities*.txt`` / ``allCountries.txt`` style file
+            min_population: skip smaller places
+            alternate_names: also index ASCII alternate names for exact lookups
+        """
+        gaz = cls()
+        exact = collections.defaultdict(list)
+        fuzzy = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                cols = line.rstrip("\n").split("\t")
+                if len(cols) <= _COL_TZ or (cols[_COL_CLASS] and cols[_COL_CLASS] != "P"):
+                    continue
+                try:
+                    lat, lon = float(cols[_COL_LAT]), float(cols[_COL_LON])
+                    population = int(cols[_COL_POP] or 0)
+                except ValueError:
+                    continue
+                if population < min_population:
+                    continue
+                rid = gaz._add_record(cols, lat, lon, population)
+
+                primary = {normalize_name(cols[_COL_NAME]), normalize_name(cols[_COL_ASCII])}
+                primary.discard("")
+                keys = set(primary)
+                if alternate_names and cols[_COL_ALT]:
+                    for alt in cols[_COL_ALT].split(","):
+                        alt = normalize_name(alt)
+                        if alt and _ASCII_NAME.match(alt):
+                            keys.add(alt)
+                for key in keys:
+                    exact[key].append(rid)
+                for key in primary:
+                    fuzzy.setdefault(key, []).append(rid)
+
+        pop = gaz.population
+        for key, ids in exact.items():
+            ids.sort(key=lambda r: -pop[r])
+            gaz._exact[key] = array.array("I", ids)
+        postings = collections.defaultdict(list)
+        for name, ids in fuzzy.items():
+            fid = len(gaz._fuzzy_names)
+            gaz._fuzzy_names.append(name)
+            gaz._fuzzy_records.append(ids[0] if len(ids) == 1 else array.array("I", ids))
+            for gram in _trigrams(name):
+                postings[gram].append(fid)
+        gaz._trigram_index = {gram: array.array("I", ids) for gram, ids in postings.items()}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        gaz._load_country_info(os.path.join(directory, "countryInfo.txt"))
+        gaz._load_admin1_codes(os.path.join(directory, "admin1CodesASCII.txt"))
+        return gaz
+
+    def _add_record(self, cols, lat, lon, population):
+        rid = len(self.names)
+        self.names.append(cols[_COL_NAME])
+        self.lat.append(lat)
+        self.lon.append(lon)
+        self.population.append(population)
+        country = cols[_COL_COUNTRY].upper()
+        self.country.append(country)
+        self.admin1.append(f"{country}.{cols[_COL_ADMIN1]}")
+        tz = cols[_COL_TZ]
+        if tz not in self._tz_ids:
+            self._tz_ids[tz] = len(self.timezones)
+            self.timezones.append(tz)
+        self.tz_index.append(self._tz_ids[tz])
+        self._country_aliases[normalize_name(country)].add(country)
+        self._admin1_aliases[normalize_name(cols[_COL_ADMIN1])].add(self.admin1[-1])
+        return rid
+
+    def _load_country_info(self, path):
+        """ISO, ISO3 and country names from GeoNames ``countryInfo.txt``."""
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#"):
+                    continue
+                cols = line.rstrip("\n").split("\t")
+                if len(cols) > 4:
+                    for alias in (cols[1], cols[4]):
+                        self._country_aliases[normalize_name(alias)].add(cols[0].upper())
+
+    def _load_admin1_codes(self, path):
+        """State/province names from GeoNames ``admin1CodesASCII.txt``."""
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                cols = line.rstrip("\n").split("\t")
+                if len(cols) > 2:
+                    for alias in (cols[1], cols[2]):
+                        self._admin1_aliases[normalize_name(alias)].add(cols[0])
+
+    # -- lookup ---------------------------------------------------------------
+    def _fuzzy_candidates(self, name):
+        """(record id, similarity) for primary names within a few edits of *name*."""
+        grams = _trigrams(name)
+        counts = collections.Counter()
+        for gram in grams:
+            counts.update(self._trigram_index.get(gram, ()))
+        limit = max(1, len(name) // _EDITS_PER_CHARS)
+        min_shared = max(1, len(grams) - _GRAMS_PER_EDIT * limit)
+        found = []
+        for fid, shared in counts.most_common(_FUZZY_CANDIDATES):
+            if shared < min_shared:
+                break
+            distance = _edit_distance(name, self._fuzzy_names[fid], limit)
+            if distance is None:
+                continue
+            similarity = 1.0 - distance / max(len(name), len(self._fuzzy_names[fid]))
+            if similarity < _MIN_SIMILARITY:
+                continue
+            ids = self._fuzzy_records[fid]
+            for rid in ids if isinstance(ids, array.array) else (ids,):
+                found.append((rid, similarity))
+        return found
+
+    def _matches_qualifier(self, rid, qualifier):
+        return (
+            self.country[rid] in self._country_aliases.get(qualifier, ())
+            or self.admin1[rid] in self._admin1_aliases.get(qualifier, ())
+        )
+
+    def _qualifier_score(self, rid, qualifiers):
+        return sum(1 for qualifier in qualifiers if self._matches_qualifier(rid, qualifier))
+
+    def search(self, place, limit=5):
+        """
+        Rank records for a place string such as ``"Mumbai, Maharashtra"``.
+
+        Qualifiers that are codes, or not known country/admin1 names, only
+        take part in the ranking; a known name that no candidate matches
+        makes the result empty.
+
+        Returns:
+            list of dicts: {name, lat, lon, timezone, country, population,
+            match ("exact" or "fuzzy"), similarity}, best first.
+        """
+        parts = [normalize_name(p) for p in str(place).split(",")]
+        parts = [p for p in parts if p]
+        if not parts:
+            return []
+        name, qualifiers = parts[0], parts[1:]
+
+        ids = self._exact.get(name)
+        if ids is not None:
+            candidates = [(rid, 1.0) for rid in ids]
+            match = "exact"
+        else:
+            candidates = self._fuzzy_candidates(name)
+            match = "fuzzy"
+
+        for qualifier in qualifiers:
+            if len(qualifier) <= _MAX_CODE_LENGTH:
+                continue
+            known = qualifier in self._country_aliases or qualifier in self._admin1_aliases
+            if known and not any(self._matches_qualifier(rid, qualifier) for rid, _ in candidates):
+                return []
+
+        ranked = sorted(
+            candidates,
+            key=lambda c: (-self._qualifier_score(c[0], qualifiers), -c[1], -self.population[c[0]]),
+        )
+        return [self._describe(rid, match, similarity) for rid, similarity in ranked[:limit]]
+
+    def lookup(self, place):
+        """Best match for *place* (see :meth:`search`), or None."""
+        matches = self.search(place, limit=1)
+        return matches[0] if matches else None
+
+    def _describe(self, rid, match, similarity):
+        return {
+            "name": self.names[rid],
+            "lat": self.lat[rid],
+            "lon": self.lon[rid],
+            "timezone": self.timezones[self.tz_index[rid]] or None,
+            "country": self.country[rid],
+            "population": self.population[rid],
+            "match": match,
+            "similarity": round(similarity, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Shared gazetteer  (KUNDALI_GAZETTEER = path to a GeoNames TSV)
+# ---------------------------------------------------------------------------
+_shared_gazetteer = None
+_shared_loaded = False
+_lock = threading.Lock()
+
+
+def get_gazetteer():
+    """Return the gazetteer configured via KUNDALI_GAZETTEER, or None."""
+    global _shared_gazetteer, _shared_loaded
+    if not _shared_loaded:
+        with _lock:
+            if not _shared_loaded:
+                path = os.getenv("KUNDALI_GAZETTEER")
+                if path:
+                    try:
+                        min_population = int(os.getenv("KUNDALI_GAZETTEER_MIN_POPULATION", "0"))
+                        _shared_gazetteer = Gazetteer.load(path, min_population=min_population)
+                    except (OSError, ValueError):
+                        _shared_gazetteer = None
+                _shared_loaded = True
+    return _shared_gazetteer
+
+
+def set_gazetteer(gazetteer):
+    """Replace the shared gazetteer (None disables it)."""
+    global _shared_gazetteer, _shared_loaded
+    with _lock:
+        _shared_gazetteer = gazetteer
+        _shared_loaded = True
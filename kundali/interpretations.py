@@ -15,6 +15,14 @@ from .constants import (
     NATURAL_MALEFICS,
 )
 from .utils import get_dignity
+from .report_document import ReportWriter
+
+
+def _report_lines(write_fn, result):
+    """Text lines written by ``write_fn(report, result)``."""
+    report = ReportWriter()
+    write_fn(report, result)
+    return report.document().lines()
 
 
 def get_aspect_quality_score(
@@ -73,7 +81,7 @@ def get_aspect_quality_score(
     return base, nature_label
 
 
-def interpret_aspects(result):
+def write_aspect_analysis(report, result):
     """Full Drishti analysis per house with strength, nature, and life outcomes.
     Uses functional nature + dignity for balanced assessment instead of just natural benefic/malefic.
     """
@@ -81,7 +89,6 @@ def interpret_aspects(result):
     lagna_sign = result["lagna_sign"]
     lagna_idx = zodiac_signs.index(lagna_sign)
     planets_data = result["planets"]
-    out = []
 
     strength_labels = {
         "7th": "100%",
@@ -99,8 +106,8 @@ def interpret_aspects(result):
             continue
         house_sign = zodiac_signs[(lagna_idx + h - 1) % 12]
         signif = HOUSE_SIGNIFICATIONS[h]
-        out.append(f"\nHouse {h:2d} ({house_sign}) – {signif.split(',')[0]}:")
-        out.append(f"  Significations: {signif}")
+        report.heading(f"House {h:2d} ({house_sign}) – {signif.split(',')[0]}", gap=True)
+        report.kv("Significations", signif, indent="  ")
 
         total_score = 0
         aspect_details = []
@@ -149,40 +156,49 @@ def interpret_aspects(result):
                 f"{pl_full} brings its significations into this house.",
             )
 
-            out.append(
-                f"  • {pl_full:8} ({asp_type} aspect, {asp_pct}, {nature_label}, {strength_note})"
+            report.bullet(
+                f"{pl_full:8} ({asp_type} aspect, {asp_pct}, {nature_label}, {strength_note})",
+                indent="  ",
             )
-            out.append(f"    → {theme}")
+            report.bullet(theme, "→", "    ")
 
         # Net summary based on total score
         h_area = signif.split(",")[0]
         if total_score >= 3:
-            out.append(
-                f"  ✓ Net: Strongly positive influences – {h_area} is well-supported; results come naturally."
+            report.bullet(
+                f"Net: Strongly positive influences – {h_area} is well-supported; results come naturally.",
+                "✓", "  ",
             )
         elif total_score >= 1:
-            out.append(
-                f"  ✓ Net: Positive overall – {h_area} benefits from supportive planetary energy."
+            report.bullet(
+                f"Net: Positive overall – {h_area} benefits from supportive planetary energy.",
+                "✓", "  ",
             )
         elif total_score >= -1:
-            out.append(
-                f"  ~ Net: Mixed influences – {h_area} has balanced energies; results depend on dasha periods."
+            report.bullet(
+                f"Net: Mixed influences – {h_area} has balanced energies; results depend on dasha periods.",
+                "~", "  ",
             )
         elif total_score >= -3:
-            out.append(
-                f"  ~ Net: Multiple planetary influences – {h_area} has strong but complex energy; "
-                f"conscious direction during benefic dashas brings best results."
+            report.bullet(
+                f"Net: Multiple planetary influences – {h_area} has strong but complex energy; "
+                f"conscious direction during benefic dashas brings best results.",
+                "~", "  ",
             )
         else:
-            out.append(
-                f"  ~ Net: Concentrated planetary energy in {h_area}; active management and benefic "
-                f"dashas recommended for optimal outcomes."
+            report.bullet(
+                f"Net: Concentrated planetary energy in {h_area}; active management and benefic "
+                f"dashas recommended for optimal outcomes.",
+                "~", "  ",
             )
 
-    return out
 
+def interpret_aspects(result):
+    """Full Drishti analysis as report lines (see ``write_aspect_analysis``)."""
+    return _report_lines(write_aspect_analysis, result)
 
-def interpret_navamsa(result):
+
+def write_navamsa_analysis(report, result):
     """Full D9 Navamsa analysis – marriage, spouse, dharma, inner soul."""
     navamsa = result["navamsa"]
     planets_data = result["planets"]
@@ -191,8 +207,7 @@ def interpret_navamsa(result):
     spouse_karaka = "Jupiter" if gender == "Female" else "Venus"
     spouse_karaka_short = "Ju" if gender == "Female" else "Ve"
 
-    out = []
-    out.append(
+    report.note(
         f"(D9 reveals {spouse_term} character, marriage quality, dharmic path, and "
         "the soul's evolutionary direction. D1 shows the promise; D9 confirms or modifies it. "
         "Strong D1 + strong D9 = highly reliable results; strong D1 + weak D9 = fluctuating results; "
@@ -237,34 +252,39 @@ def interpret_navamsa(result):
         nav_dig = get_dignity(pl, nav_sign)
         dig_note = f" [{nav_dig}]" if nav_dig else ""
         pl_full = short_to_full.get(pl, pl)
-        out.append(f"  {pl_full:9} in {nav_sign:12} {d['deg']:5.2f}°{dig_note}")
-        out.append(f"    → {planet_d9_meanings[pl]}")
+        report.heading(f"{pl_full:9} in {nav_sign:12} {d['deg']:5.2f}°{dig_note}", "  ", "")
+        report.bullet(planet_d9_meanings[pl], "→", "    ")
         if nav_dig == "Debilitated":
             # Softer, more nuanced language for D9 debilitation
             if pl == "Ju":
-                out.append(
-                    f"    ⚠ Debilitated in D9: Jupiter's marriage/dharma significations require "
-                    f"spiritual growth and conscious effort; wisdom develops through challenges."
+                report.bullet(
+                    f"Debilitated in D9: Jupiter's marriage/dharma significations require "
+                    f"spiritual growth and conscious effort; wisdom develops through challenges.",
+                    "⚠", "    ",
                 )
             elif pl == "Ve":
-                out.append(
-                    f"    ⚠ Debilitated in D9: Venus's marriage significations require refinement; "
-                    f"love matures through service and practical effort."
+                report.bullet(
+                    f"Debilitated in D9: Venus's marriage significations require refinement; "
+                    f"love matures through service and practical effort.",
+                    "⚠", "    ",
                 )
             elif pl == "Mo":
-                out.append(
-                    f"    ⚠ Debilitated in D9: Emotional fulfillment in marriage requires "
-                    f"transformation; deep bonding develops over time."
+                report.bullet(
+                    f"Debilitated in D9: Emotional fulfillment in marriage requires "
+                    f"transformation; deep bonding develops over time.",
+                    "⚠", "    ",
                 )
             else:
-                out.append(
-                    f"    ⚠ Debilitated in D9: {pl_full}'s marriage/dharma significations require "
-                    f"conscious development; strengthen through D1 placement or remedies."
+                report.bullet(
+                    f"Debilitated in D9: {pl_full}'s marriage/dharma significations require "
+                    f"conscious development; strengthen through D1 placement or remedies.",
+                    "⚠", "    ",
                 )
         elif nav_dig in ("Exalt", "Own"):
-            out.append(
-                f"    ✓ {nav_dig} in D9: {pl_full}'s significations are powerfully reliable "
-                f"in marriage and dharmic areas."
+            report.bullet(
+                f"{nav_dig} in D9: {pl_full}'s significations are powerfully reliable "
+                f"in marriage and dharmic areas.",
+                "✓", "    ",
             )
 
     # Vargottama check
@@ -275,14 +295,15 @@ def interpret_navamsa(result):
         and pl in navamsa
         and planets_data[pl]["sign"] == navamsa[pl]["sign"]
     ]
-    out.append("\n  Vargottama (same sign in D1 and D9 – doubled strength):")
+    report.heading("Vargottama (same sign in D1 and D9 – doubled strength)", "  ", gap=True)
     if vargottama:
-        out.append(
-            f"  → {', '.join(vargottama)}: These planets are extremely stable and reliable "
-            f"in their results; their placement in D1 is fully confirmed by D9."
+        report.bullet(
+            f"{', '.join(vargottama)}: These planets are extremely stable and reliable "
+            f"in their results; their placement in D1 is fully confirmed by D9.",
+            "→", "  ",
         )
     else:
-        out.append("  → No Vargottama planets.")
+        report.bullet("No Vargottama planets.", "→", "  ")
 
     # Best and worst D9 placements
     exalt_d9 = [
@@ -296,12 +317,14 @@ def interpret_navamsa(result):
         if pl in navamsa and get_dignity(pl, navamsa[pl]["sign"]) == "Debilitated"
     ]
     if exalt_d9:
-        out.append(
-            f"  ✓ Exalted in D9: {', '.join(exalt_d9)} – Marriage/dharma blessings are magnified."
+        report.bullet(
+            f"Exalted in D9: {', '.join(exalt_d9)} – Marriage/dharma blessings are magnified.",
+            "✓", "  ",
         )
     if deb_d9:
-        out.append(
-            f"  ⚠ Debilitated in D9: {', '.join(deb_d9)} – D1 promise may fluctuate; conscious effort helps stabilise results."
+        report.bullet(
+            f"Debilitated in D9: {', '.join(deb_d9)} – D1 promise may fluctuate; conscious effort helps stabilise results.",
+            "⚠", "  ",
         )
 
     # Gender-specific spouse karaka analysis
@@ -319,8 +342,8 @@ def interpret_navamsa(result):
             else:
                 ju_note = "Moderate – good husband qualities but may need conscious nurturing."
             dig_tag = f", {ju_d9_dig}" if ju_d9_dig else ""
-            out.append(
-                f"\n  Jupiter in D9 ({ju_d9_sign}{dig_tag}) [HUSBAND KARAKA]: {ju_note}"
+            report.kv(
+                f"Jupiter in D9 ({ju_d9_sign}{dig_tag}) [HUSBAND KARAKA]", ju_note, indent="  ", gap=True
             )
         # Also check Venus for marital harmony
         if "Ve" in navamsa:
@@ -333,9 +356,7 @@ def interpret_navamsa(result):
             else:
                 ve_note = "Moderate – marriage has affection but may need conscious nurturing."
             dig_tag = f", {ve_d9_dig}" if ve_d9_dig else ""
-            out.append(
-                f"  Venus in D9 ({ve_d9_sign}{dig_tag}) [Marital Harmony]: {ve_note}"
-            )
+            report.kv(f"Venus in D9 ({ve_d9_sign}{dig_tag}) [Marital Harmony]", ve_note, indent="  ")
     else:
         # Venus is the primary wife karaka for males
         if "Ve" in navamsa:
@@ -350,20 +371,23 @@ def interpret_navamsa(result):
             else:
                 ve_note = "Moderate – marriage has affection but may need conscious nurturing."
             dig_tag = f", {ve_d9_dig}" if ve_d9_dig else ""
-            out.append(
-                f"\n  Venus in D9 ({ve_d9_sign}{dig_tag}) [WIFE KARAKA]: {ve_note}"
+            report.kv(
+                f"Venus in D9 ({ve_d9_sign}{dig_tag}) [WIFE KARAKA]", ve_note, indent="  ", gap=True
             )
-    return out
 
 
-def interpret_d7(result):
+def interpret_navamsa(result):
+    """Full D9 Navamsa analysis as report lines (see ``write_navamsa_analysis``)."""
+    return _report_lines(write_navamsa_analysis, result)
+
+
+def write_d7_analysis(report, result):
     """Full D7 Saptamsa analysis – children, progeny, generative energy."""
     d7 = result["d7"]
     lagna_idx = zodiac_signs.index(result["lagna_sign"])
     fifth_sign = zodiac_signs[(lagna_idx + 4) % 12]
     fifth_lord = sign_lords[fifth_sign]
-    out = []
-    out.append(
+    report.note(
         "(D7 reveals potential for children, timing of progeny, their "
         "nature and quality. Jupiter and 5th lord are the primary karakas.)"
     )
@@ -389,51 +413,61 @@ def interpret_d7(result):
         d7_dig = get_dignity(pl, d7_sign)
         dig_note = f" [{d7_dig}]" if d7_dig else ""
         pl_full = short_to_full.get(pl, pl)
-        out.append(f"  {pl_full:9} in {d7_sign:12} {d['deg']:5.2f}°{dig_note}")
-        out.append(f"    → {planet_d7_meanings[pl]}")
+        report.heading(f"{pl_full:9} in {d7_sign:12} {d['deg']:5.2f}°{dig_note}", "  ", "")
+        report.bullet(planet_d7_meanings[pl], "→", "    ")
         if d7_dig == "Debilitated":
-            out.append(
-                f"    ⚠ Debilitated in D7: challenges to above; remedies (Jupiter mantra, charity) advised."
+            report.bullet(
+                "Debilitated in D7: challenges to above; remedies (Jupiter mantra, charity) advised.",
+                "⚠", "    ",
             )
         elif d7_dig in ("Exalt", "Own"):
-            out.append(
-                f"    ✓ {d7_dig} in D7: above significations fully activated and reliable."
+            report.bullet(
+                f"{d7_dig} in D7: above significations fully activated and reliable.", "✓", "    "
             )
 
     # Jupiter in D7 summary
-    out.append(
-        f"\n  Key Karakas: Jupiter (natural) + 5th lord {short_to_full.get(fifth_lord, fifth_lord)} (functional)"
+    report.kv(
+        "Key Karakas",
+        f"Jupiter (natural) + 5th lord {short_to_full.get(fifth_lord, fifth_lord)} (functional)",
+        indent="  ",
+        gap=True,
     )
     if "Ju" in d7:
         ju_sign = d7["Ju"]["sign"]
         ju_dig = get_dignity("Ju", ju_sign)
         if ju_dig == "Exalt":
-            out.append(
-                f"  ✓ Jupiter Exalted in D7 ({ju_sign}) – Excellent, abundant, and wise progeny strongly indicated."
+            report.bullet(
+                f"Jupiter Exalted in D7 ({ju_sign}) – Excellent, abundant, and wise progeny strongly indicated.",
+                "✓", "  ",
             )
         elif ju_dig == "Own":
-            out.append(
-                f"  ✓ Jupiter in Own sign in D7 ({ju_sign}) – Good number of children; wise and fortunate progeny."
+            report.bullet(
+                f"Jupiter in Own sign in D7 ({ju_sign}) – Good number of children; wise and fortunate progeny.",
+                "✓", "  ",
             )
         elif ju_dig == "Debilitated":
-            out.append(
-                f"  ⚠ Jupiter Debilitated in D7 ({ju_sign}) – Progeny challenges; possible delays or health issues for children; remedies essential."
+            report.bullet(
+                f"Jupiter Debilitated in D7 ({ju_sign}) – Progeny challenges; possible delays or health issues for children; remedies essential.",
+                "⚠", "  ",
             )
         else:
-            out.append(
+            report.write(
                 f"  Jupiter in {ju_sign} in D7 – Moderate progeny; timing through Jupiter/5th lord Dasha is key."
             )
-    return out
 
 
-def interpret_d10(result):
+def interpret_d7(result):
+    """Full D7 Saptamsa analysis as report lines (see ``write_d7_analysis``)."""
+    return _report_lines(write_d7_analysis, result)
+
+
+def write_d10_analysis(report, result):
     """Full D10 Dasamsa analysis – career, profession, public life."""
     d10 = result["d10"]
     lagna_idx = zodiac_signs.index(result["lagna_sign"])
     tenth_sign = zodiac_signs[(lagna_idx + 9) % 12]
     tenth_lord = sign_lords[tenth_sign]
-    out = []
-    out.append(
+    report.note(
         "(D10 reveals true professional destiny, career field, authority level, "
         "and the quality of public life. Sun, Saturn, and 10th lord are primary karakas.)"
     )
@@ -459,34 +493,40 @@ def interpret_d10(result):
         d10_dig = get_dignity(pl, d10_sign)
         dig_note = f" [{d10_dig}]" if d10_dig else ""
         pl_full = short_to_full.get(pl, pl)
-        out.append(f"  {pl_full:9} in {d10_sign:12} {d['deg']:5.2f}°{dig_note}")
-        out.append(f"    → {planet_d10_meanings[pl]}")
+        report.heading(f"{pl_full:9} in {d10_sign:12} {d['deg']:5.2f}°{dig_note}", "  ", "")
+        report.bullet(planet_d10_meanings[pl], "→", "    ")
         if d10_dig == "Debilitated":
-            out.append(
-                f"    ⚠ Debilitated in D10: professional obstacles in this area; choose field aligned with planet's strength elsewhere."
+            report.bullet(
+                "Debilitated in D10: professional obstacles in this area; choose field aligned with planet's strength elsewhere.",
+                "⚠", "    ",
             )
         elif d10_dig in ("Exalt", "Own"):
-            out.append(
-                f"    ✓ {d10_dig} in D10: career success in this domain is strongly supported."
+            report.bullet(
+                f"{d10_dig} in D10: career success in this domain is strongly supported.", "✓", "    "
             )
 
     # 10th lord summary
-    out.append(
-        f"\n  Primary Karaka: Sun (fame/authority) | Functional 10th Lord: {short_to_full.get(tenth_lord, tenth_lord)}"
+    report.kv(
+        "Primary Karaka",
+        f"Sun (fame/authority) | Functional 10th Lord: {short_to_full.get(tenth_lord, tenth_lord)}",
+        indent="  ",
+        gap=True,
     )
     if tenth_lord in d10:
         tl_sign = d10[tenth_lord]["sign"]
         tl_dig = get_dignity(tenth_lord, tl_sign)
         if tl_dig in ("Exalt", "Own"):
-            out.append(
-                f"  ✓ 10th lord ({short_to_full.get(tenth_lord, tenth_lord)}) {tl_dig} in D10 ({tl_sign}) – Peak career success; prominence and rise to authority highly indicated."
+            report.bullet(
+                f"10th lord ({short_to_full.get(tenth_lord, tenth_lord)}) {tl_dig} in D10 ({tl_sign}) – Peak career success; prominence and rise to authority highly indicated.",
+                "✓", "  ",
             )
         elif tl_dig == "Debilitated":
-            out.append(
-                f"  ⚠ 10th lord Debilitated in D10 ({tl_sign}) – Career hurdles; switching to the planet's natural field (see above) and remedies help significantly."
+            report.bullet(
+                f"10th lord Debilitated in D10 ({tl_sign}) – Career hurdles; switching to the planet's natural field (see above) and remedies help significantly.",
+                "⚠", "  ",
             )
         else:
-            out.append(
+            report.write(
                 f"  10th lord in {tl_sign} in D10 – Career grows steadily through hard work; major rise during 10th lord's Mahadasha."
             )
 
@@ -513,18 +553,20 @@ def interpret_d10(result):
         house_meaning = D10_HOUSE_MEANINGS.get(
             tl_d10_house, f"10th lord in House {tl_d10_house} of D10."
         )
-        out.append(f"  10th lord in D10 House {tl_d10_house}: {house_meaning}")
+        report.kv(f"10th lord in D10 House {tl_d10_house}", house_meaning, indent="  ")
 
     # Sun in D10
     if "Su" in d10:
         su_dig = get_dignity("Su", d10["Su"]["sign"])
         if su_dig in ("Exalt", "Own"):
-            out.append(
-                f"  ✓ Sun ({su_dig}) in D10 – Strong public image, authority, and social recognition."
+            report.bullet(
+                f"Sun ({su_dig}) in D10 – Strong public image, authority, and social recognition.",
+                "✓", "  ",
             )
         elif su_dig == "Debilitated":
-            out.append(
-                f"  ⚠ Sun Debilitated in D10 – Ego conflicts with authority; avoid confrontations with superiors; build reputation quietly."
+            report.bullet(
+                "Sun Debilitated in D10 – Ego conflicts with authority; avoid confrontations with superiors; build reputation quietly.",
+                "⚠", "  ",
             )
 
     # Exalted/debilitated summary
@@ -539,14 +581,20 @@ def interpret_d10(result):
         if pl in d10 and get_dignity(pl, d10[pl]["sign"]) == "Debilitated"
     ]
     if exalt_d10:
-        out.append(
-            f"  ✓ Exalted in D10: {', '.join(exalt_d10)} – Career domains of these planets thrive."
+        report.bullet(
+            f"Exalted in D10: {', '.join(exalt_d10)} – Career domains of these planets thrive.",
+            "✓", "  ",
         )
     if deb_d10:
-        out.append(
-            f"  ⚠ Debilitated in D10: {', '.join(deb_d10)} – Avoid career fields solely dependent on these planets."
+        report.bullet(
+            f"Debilitated in D10: {', '.join(deb_d10)} – Avoid career fields solely dependent on these planets.",
+            "⚠", "  ",
         )
-    return out
+
+
+def interpret_d10(result):
+    """Full D10 Dasamsa analysis as report lines (see ``write_d10_analysis``)."""
+    return _report_lines(write_d10_analysis, result)
 
 
 def calculate_functional_strength_index(result, planet):
@@ -697,27 +745,27 @@ def calculate_functional_strength_index(result, planet):
     }
 
 
-def interpret_d60(result):
+def write_d60_analysis(report, result):
     """
     Full D60 Shashtiamsa analysis – past life karma, planetary strength,
     and karmic lessons for this incarnation.
     """
     d60 = result.get("d60", {})
     if not d60:
-        return ["(D60 data not available)"]
+        report.note("(D60 data not available)")
+        return
 
     lagna_sign = result["lagna_sign"]
     lagna_idx = zodiac_signs.index(lagna_sign)
     planets_data = result.get("planets", {})
 
-    out = []
-    out.append(
+    report.note(
         "(D60 reveals the accumulated karma from past lives. A strong planet in D60 indicates"
     )
-    out.append(
+    report.note(
         "good karma and effortless results in that planet's domains; a weak planet shows"
     )
-    out.append("karmic debts that must be worked through consciously in this life.)")
+    report.note("karmic debts that must be worked through consciously in this life.)")
 
     # Order of planets for display
     order = ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa", "Ra", "Ke"]
@@ -757,33 +805,37 @@ def interpret_d60(result):
         dig = get_dignity(pl, sign)
         dig_note = f" [{dig}]" if dig else ""
 
-        out.append(f"\n  {pl_full:9} in {sign:12} {deg:5.2f}°{dig_note}")
+        report.heading(f"{pl_full:9} in {sign:12} {deg:5.2f}°{dig_note}", "  ", "", gap=True)
 
         # Base meaning from dignity
         meaning = dignity_meanings.get(dig, "Karmic signature.")
-        out.append(f"    → {meaning}")
+        report.bullet(meaning, "→", "    ")
 
         # Add planet-specific insight
-        out.append(f"      {planet_specific.get(pl, '')}")
+        report.write(f"      {planet_specific.get(pl, '')}")
 
         # Additional remarks for exaltation/debilitation in D60
         if dig == "Exalt":
-            out.append(
-                "      ✓ This planet's exaltation in D60 indicates you have earned exceptional grace in this area; you can manifest its gifts effortlessly."
+            report.bullet(
+                "This planet's exaltation in D60 indicates you have earned exceptional grace in this area; you can manifest its gifts effortlessly.",
+                "✓", "      ",
             )
         elif dig == "Own":
-            out.append(
-                "      ✓ Own sign in D60 shows you are a master of this energy; you understand its lessons deeply."
+            report.bullet(
+                "Own sign in D60 shows you are a master of this energy; you understand its lessons deeply.",
+                "✓", "      ",
             )
         elif dig == "Debilitated":
-            out.append(
-                "      ⚠ Debilitation in D60 is a karmic challenge. You will need to consciously work on this planet's themes – but overcoming it brings great spiritual growth."
+            report.bullet(
+                "Debilitation in D60 is a karmic challenge. You will need to consciously work on this planet's themes – but overcoming it brings great spiritual growth.",
+                "⚠", "      ",
             )
 
         # Check if same sign as D1 (Vargottama) – extra strength
         if pl in planets_data and planets_data[pl]["sign"] == sign:
-            out.append(
-                "      ✦ Vargottama (same sign in D1 and D60) – this planet's karma is doubly reinforced; its results are highly reliable and destiny-driven."
+            report.bullet(
+                "Vargottama (same sign in D1 and D60) – this planet's karma is doubly reinforced; its results are highly reliable and destiny-driven.",
+                "✦", "      ",
             )
 
     # Overall summary: count strong vs weak planets
@@ -799,23 +851,31 @@ def interpret_d60(result):
         elif dig in ("Debilitated", "Enemy"):
             weak.append(short_to_full[pl])
 
-    out.append("\n  Karmic Summary:")
+    report.heading("Karmic Summary", "  ", gap=True)
     if strong:
-        out.append(
-            f"    Strong positive karma: {', '.join(strong[:5])}"
-            + (" ..." if len(strong) > 5 else "")
+        report.kv(
+            "Strong positive karma",
+            ", ".join(strong[:5]) + (" ..." if len(strong) > 5 else ""),
+            indent="    ",
         )
     if weak:
-        out.append(
-            f"    Karmic challenges to overcome: {', '.join(weak[:5])}"
-            + (" ..." if len(weak) > 5 else "")
+        report.kv(
+            "Karmic challenges to overcome",
+            ", ".join(weak[:5]) + (" ..." if len(weak) > 5 else ""),
+            indent="    ",
         )
     if not strong and not weak:
-        out.append(
+        report.write(
             "    Most planets are neutrally placed – your karma is balanced and flexible."
         )
 
-    out.append(
-        "\n  (Note: D60 does not override D1 – it shows the karmic background. Strong D1 + strong D60 = effortless success; strong D1 + weak D60 = you must work to maintain blessings; weak D1 + strong D60 = slow but steady improvement.)"
+    report.note(
+        "(Note: D60 does not override D1 – it shows the karmic background. Strong D1 + strong D60 = effortless success; strong D1 + weak D60 = you must work to maintain blessings; weak D1 + strong D60 = slow but steady improvement.)",
+        "  ",
+        gap=True,
     )
-    return out
+
+
+def interpret_d60(result):
+    """Full D60 Shashtiamsa analysis as report lines (see ``write_d60_analysis``)."""
+    return _report_lines(write_d60_analysis, result)
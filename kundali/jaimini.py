@@ -5,6 +5,7 @@ Based on the Jaimini Sutras, using the highest degrees (or lowest for nodes) to
 """
 
 from .constants import short_to_full, zodiac_signs
+from .dasha import CHARA, DashaTimeline
 from .utils import get_navamsa_sign
 
 
@@ -179,18 +180,18 @@ def find_current_chara_dasha(birth_jd, current_jd, dashas):
     if current_jd < birth_jd:
         return None
 
-    for dasha in dashas:
-        if dasha["start_jd"] <= current_jd < dasha["end_jd"]:
-            years_elapsed = (current_jd - dasha["start_jd"]) / JD_PER_YEAR
-            years_remaining = (dasha["end_jd"] - current_jd) / JD_PER_YEAR
-            return {
-                "current_sign": dasha["sign"],
-                "current_lord": dasha["lord"],
-                "years_elapsed": round(years_elapsed, 2),
-                "years_remaining": round(years_remaining, 2),
-            }
-
-    return None
+    path = DashaTimeline.from_mahadashas(dashas, CHARA).active(current_jd, depth=1)
+    if not path:
+        return None
+    dasha = path[0]
+    years_elapsed = (current_jd - dasha.start_jd) / JD_PER_YEAR
+    years_remaining = (dasha.end_jd - current_jd) / JD_PER_YEAR
+    return {
+        "current_sign": dasha.key,
+        "current_lord": dashas[dasha.path[0]]["lord"],
+        "years_elapsed": round(years_elapsed, 2),
+        "years_remaining": round(years_remaining, 2),
+    }
 
 
 def calculate_argala(result):
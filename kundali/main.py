@@ -7,6 +7,7 @@ Coordinates all calculations and provides the primary API.
 import os
 import datetime
 import re as _re
+import sys
 import warnings
 import swisseph as swe
 import pytz
@@ -44,37 +45,22 @@ from .utils import (
     get_panchanga,
     get_sunrise_based_day,
     get_sade_sati_status,
-    get_navamsa_sign_and_deg,
-    get_d7_sign_and_deg,
-    get_d10_sign_and_deg,
-    get_d2_sign_and_deg,
-    get_d60_sign_and_deg,
-    get_d3_sign_and_deg,
-    get_d4_sign_and_deg,
-    get_d12_sign_and_deg,
-    get_d16_sign_and_deg,
-    get_d20_sign_and_deg,
-    get_d24_sign_and_deg,
-    get_d27_sign_and_deg,
-    get_d30_sign_and_deg,
-    get_d40_sign_and_deg,
-    get_d45_sign_and_deg,
 )
+from .vargas import VARGA_KEYS, PlanetRecord, VargaTable
 from .neecha_bhanga import check_neecha_bhanga
 from .yoga_detection import detect_yogas
 from .dosha_detection import detect_problems
 from .dasha import (
+    VIMSHOTTARI,
+    DashaTimeline,
     calculate_vimshottari_dasha,
     calculate_antardashas,
-    find_current_dasha,
-    get_current_pratyantar,
-    get_current_sookshma,
     calculate_ashtottari_dasha,
     calculate_ashtottari_antardashas,
     find_current_ashtottari,
 )
 from .marriage_scoring import calculate_marriage_score
-from .timings import generate_timings
+from .timings import generate_timings, marriage_dasha_periods
 from .ashtakavarga import calculate_ashtakavarga
 from .interpretations import (
     interpret_aspects,
@@ -109,7 +95,8 @@ from .jaimini import (
 from .vimshopak_bala import calculate_vimshopak_bala, detect_graha_yuddha
 from .transit_calendar import generate_transit_calendar
 from .north_indian_chart import generate_north_indian_chart
-from .report_pdf import generate_pdf_report
+from .report_pdf import generate_pdf_report, safe_filename
+from .ephemeris import get_ephemeris
 
 
 # -------------------------------------------------------------------
@@ -217,20 +204,8 @@ def calculate_integrity_index(result):
 
 
 def extract_dasha_periods_for_marriage(timings):
-    """Parse marriage timing lines into list of (start_year, end_year, md, ad)."""
-    periods = []
-    marriage_lines = timings.get("Marriage", [])
-    for line in marriage_lines:
-        m = _re.search(r"[└─]\s*(\w+)/(\w+)\s*\((\d{4})-(\d{4})\)", line)
-        if m:
-            md = m.group(1)
-            ad = m.group(2)
-            start = int(m.group(3))
-            end = int(m.group(4))
-            periods.append(
-                {"maha": md, "antara": ad, "start": start, "end": end, "score": 8}
-            )  # Default score for predictor
-    return periods
+    """Marriage Antardashas from the timing table as {maha, antara, start, end, score} dicts."""
+    return marriage_dasha_periods(timings)
 
 
 def _normalize_place_input(place):
@@ -292,10 +267,9 @@ def _resolve_birth_location(place, latitude=None, longitude=None, timezone_name=
         except Exception as exc:
             raise ValueError(f"Unknown timezone '{tz_name}'.") from exc
     else:
-        from .cache import get_timezone_finder
+        from .cache import get_timezone_cached
 
-        tf = get_timezone_finder()
-        tz_name = tf.timezone_at(lat=lat, lng=lon)
+        tz_name = get_timezone_cached(lat, lon)
         if not tz_name:
             raise ValueError(
                 "Timezone could not be determined. Provide timezone_name for exact coordinates."
@@ -378,6 +352,366 @@ def _build_input_quality(
     }
 
 
+# -------------------------------------------------------------------
+# Time-dependent ("now") core
+# -------------------------------------------------------------------
+
+
+def _jd_to_utc(jd):
+    """Convert a Julian Day (UT) to an aware UTC datetime."""
+    year, month, day, hour = swe.revjul(jd)
+    return datetime.datetime(year, month, day, tzinfo=pytz.utc) + datetime.timedelta(hours=hour)
+
+
+def _current_dasha_state(birth_jd, current_jd, dashas, ashto_dashas):
+    """Return the running Vimshottari/Ashtottari periods at *current_jd*."""
+    path = DashaTimeline.from_mahadashas(dashas, VIMSHOTTARI).active(current_jd, depth=4)
+    current_md, current_ad, pd, sd = path or (None,) * 4
+    current_md = current_md and current_md.lord
+    current_ad = current_ad and current_ad.lord
+    current_pd, pd_start_jd, pd_end_jd = (pd.lord, pd.start_jd, pd.end_jd) if pd else (None,) * 3
+    current_sd, sd_start_jd, sd_end_jd = (sd.lord, sd.start_jd, sd.end_jd) if sd else (None,) * 3
+    ashto_md, ashto_ad = find_current_ashtottari(birth_jd, current_jd, ashto_dashas)
+    return {
+        "vimshottari": {"current_md": current_md, "current_ad": current_ad},
+        "ashtottari": {"current_md": ashto_md, "current_ad": ashto_ad},
+        "vimshottari_pd": {
+            "current_pd": current_pd,
+            "pd_start_jd": pd_start_jd,
+            "pd_end_jd": pd_end_jd,
+        },
+        "vimshottari_sd": {
+            "current_sd": current_sd,
+            "sd_start_jd": sd_start_jd,
+            "sd_end_jd": sd_end_jd,
+        },
+    }
+
+
+def _current_transits(current_jd, moon_sign, ephemeris):
+    """Return (transits, sade_sati_status) for *current_jd* relative to the natal Moon."""
+    from .constants import gochara_effects
+
+    transits = {}
+    for pcode, pid in planets.items():
+        lon = ephemeris.longitude(current_jd, pid)
+        sign = get_sign(lon)
+        sign_idx = zodiac_signs.index(sign)
+        rel_house = ((sign_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
+        effect = gochara_effects.get(pcode, {}).get(rel_house, "Neutral")
+        transits[pcode] = {"sign": sign, "house_from_moon": rel_house, "effect": effect}
+    # Add Rahu/Ketu transits
+    ra_lon = ephemeris.longitude(current_jd, swe.MEAN_NODE)
+    ra_sign = get_sign(ra_lon)
+    ra_idx = zodiac_signs.index(ra_sign)
+    ra_house = ((ra_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
+    transits["Ra"] = {
+        "sign": ra_sign,
+        "house_from_moon": ra_house,
+        "effect": gochara_effects.get("Ra", {}).get(ra_house, "Neutral"),
+    }
+    ke_lon = (ra_lon + 180) % 360
+    ke_sign = get_sign(ke_lon)
+    ke_idx = zodiac_signs.index(ke_sign)
+    ke_house = ((ke_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
+    transits["Ke"] = {
+        "sign": ke_sign,
+        "house_from_moon": ke_house,
+        "effect": gochara_effects.get("Ke", {}).get(ke_house, "Neutral"),
+    }
+
+    # Sade Sati / Dhaiya
+    sa_transit_sign = transits.get("Sa", {}).get("sign", None)
+    sade_sati_status = (
+        get_sade_sati_status(moon_sign, sa_transit_sign) if sa_transit_sign else None
+    )
+    return transits, sade_sati_status
+
+
+# -------------------------------------------------------------------
+# Optional pipeline sections
+# -------------------------------------------------------------------
+# The natal core (planets, houses, vargas, dashas, yogas, timings, problems,
+# ashtakavarga) is always computed.  Everything below is an optional stage
+# that can be selected with ``include=`` / ``exclude=``.  Each builder takes
+# the partially built result plus the "now" Julian Day and returns the keys it
+# contributes; skipped or failing stages fall back to their empty defaults so
+# consumers using ``result.get(...)`` keep working.
+
+
+def _section_shadbala(result, current_jd):
+    return {"shadbala": calculate_shadbala(result)}
+
+
+def _section_upagrahas(result, current_jd):
+    return {"upagrahas": calculate_upagrahas(result)}
+
+
+def _section_avasthas(result, current_jd):
+    return {"avasthas": calculate_avasthas(result)}
+
+
+def _section_arudha_lagna(result, current_jd):
+    arudha_sign, arudha_house = calculate_arudha_lagna(result)
+    return {"arudha_lagna": {"sign": arudha_sign, "house": arudha_house}}
+
+
+def _section_numerology(result, current_jd):
+    return {"numerology": calculate_numerology(result, result.get("name", ""))}
+
+
+def _section_muhurtha(result, current_jd):
+    return {
+        "muhurtha": evaluate_muhurtha(
+            result["birth_jd"], result, result["lat"], result["lon"]
+        )
+    }
+
+
+def _section_current_panchanga(result, current_jd):
+    return {
+        "current_panchanga": get_live_panchanga(
+            current_jd, result["lat"], result["lon"], result.get("timezone"),
+            ephemeris=get_ephemeris(result.get("ayanamsa")),
+        )
+    }
+
+
+def _section_current_muhurtha(result, current_jd):
+    return {
+        "current_muhurtha": evaluate_muhurtha(
+            current_jd, result, result["lat"], result["lon"]
+        )
+    }
+
+
+# Time-dependent builders reuse the natal part of their previous output (if
+# any) so refresh_current() only pays for the "now" lookups.
+
+
+def _section_tajika(result, current_jd):
+    target_year = _jd_to_utc(current_jd).year
+    previous = result.get("tajika") or {}
+    if previous.get("year") == target_year:
+        return {"tajika": previous}
+    return {"tajika": calculate_tajika(result, target_year=target_year)}
+
+
+def _section_yogini_dasha(result, current_jd):
+    birth_jd = result["birth_jd"]
+    previous = result.get("yogini_dasha") or {}
+    if previous.get("dashas"):
+        y_start = previous["start_yogini"]
+        y_balance = previous["balance_years"]
+        y_dashas = previous["dashas"]
+        y_antardashas = previous["antardashas"]
+    else:
+        moon_lon_val = result["planets"]["Mo"]["full_lon"]
+        y_start, y_balance, y_dashas = calculate_yogini_dasha(moon_lon_val, birth_jd)
+        # Populate antardashas first so find_current_yogini can read them
+        y_antardashas = {}
+        for yd in y_dashas:
+            try:
+                calculate_yogini_antardashas(yd)  # mutates yd["antardashas"] in place
+                y_antardashas[yd["yogini"]] = yd
+            except Exception:
+                pass
+    now = _jd_to_utc(current_jd)
+    now_jd = swe.julday(now.year, now.month, now.day, 12.0)
+    current_yog = find_current_yogini(birth_jd, now_jd, y_dashas)
+    cur_yd_md, cur_yd_md_lord, cur_yd_ad, cur_yd_ad_lord = (
+        current_yog if current_yog[0] else (None, None, None, None)
+    )
+    return {
+        "yogini_dasha": {
+            "start_yogini": y_start,
+            "balance_years": y_balance,
+            "dashas": y_dashas,
+            "current": {
+                "yogini": cur_yd_md,
+                "lord": cur_yd_md_lord,
+                "antardasha": {"yogini": cur_yd_ad, "lord": cur_yd_ad_lord}
+                if cur_yd_ad
+                else None,
+            },
+            "antardashas": y_antardashas,
+        }
+    }
+
+
+def _section_pancha_pakshi(result, current_jd):
+    return {"pancha_pakshi": calculate_pancha_pakshi(result, query_dt=_jd_to_utc(current_jd))}
+
+
+def _section_chara_dasha(result, current_jd):
+    chara_dashas = (result.get("chara_dasha") or {}).get("dashas") or calculate_chara_dasha(result)
+    current_chara = find_current_chara_dasha(result["birth_jd"], current_jd, chara_dashas)
+    return {"chara_dasha": {"dashas": chara_dashas, "current": current_chara}}
+
+
+def _section_argala(result, current_jd):
+    return {"argala": calculate_argala(result)}
+
+
+def _section_pada_lagnas(result, current_jd):
+    return {"pada_lagnas": calculate_pada_lagnas(result)}
+
+
+def _section_upapadha_lagna(result, current_jd):
+    return {"upapadha_lagna": get_upapadha_lagna(result)}
+
+
+def _section_vimshopak_bala(result, current_jd):
+    return {"vimshopak_bala": calculate_vimshopak_bala(result)}
+
+
+def _section_graha_yuddha(result, current_jd):
+    return {"graha_yuddha": detect_graha_yuddha(result)}
+
+
+def _section_transit_calendar(result, current_jd):
+    return {
+        "transit_calendar": generate_transit_calendar(result, months=12, start_jd=current_jd)
+    }
+
+
+# name -> (builder, defaults used when the section is skipped or fails).
+# Insertion order is the execution order.
+PIPELINE_SECTIONS = {
+    "shadbala": (_section_shadbala, {"shadbala": {}}),
+    "upagrahas": (_section_upagrahas, {"upagrahas": {}}),
+    "avasthas": (_section_avasthas, {"avasthas": {}}),
+    "arudha_lagna": (_section_arudha_lagna, {"arudha_lagna": {}}),
+    "numerology": (_section_numerology, {"numerology": {}}),
+    "muhurtha": (_section_muhurtha, {"muhurtha": {}}),
+    "current_panchanga": (_section_current_panchanga, {"current_panchanga": {}}),
+    "current_muhurtha": (_section_current_muhurtha, {"current_muhurtha": {}}),
+    "tajika": (_section_tajika, {"tajika": {}}),
+    "yogini_dasha": (_section_yogini_dasha, {"yogini_dasha": {}}),
+    "pancha_pakshi": (_section_pancha_pakshi, {"pancha_pakshi": {}}),
+    "chara_dasha": (_section_chara_dasha, {"chara_dasha": {}}),
+    "argala": (_section_argala, {"argala": {}}),
+    "pada_lagnas": (_section_pada_lagnas, {"pada_lagnas": {}}),
+    "upapadha_lagna": (_section_upapadha_lagna, {"upapadha_lagna": {}}),
+    "vimshopak_bala": (_section_vimshopak_bala, {"vimshopak_bala": {}}),
+    "graha_yuddha": (_section_graha_yuddha, {"graha_yuddha": []}),
+    "transit_calendar": (_section_transit_calendar, {"transit_calendar": {}}),
+}
+
+# Sections whose output depends on the current moment rather than the birth.
+TIME_DEPENDENT_SECTIONS = (
+    "current_panchanga",
+    "current_muhurtha",
+    "tajika",
+    "yogini_dasha",
+    "pancha_pakshi",
+    "chara_dasha",
+    "transit_calendar",
+)
+
+
+def resolve_sections(include=None, exclude=None):
+    """
+    Resolve an ``include`` / ``exclude`` selection into the set of sections to run.
+
+    Args:
+        include (iterable): Section names to compute (None = all sections).
+        exclude (iterable): Section names to skip.
+
+    Returns:
+        set: Section names to run.
+
+    Raises:
+        ValueError: On unknown section names.
+    """
+    requested = set(PIPELINE_SECTIONS) if include is None else set(include)
+    skipped = set(exclude or ())
+    unknown = (requested | skipped) - set(PIPELINE_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown section(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(PIPELINE_SECTIONS)}"
+        )
+    return requested - skipped
+
+
+def _run_sections(result, sections, current_jd, stages=None):
+    """Run the selected optional *stages* in order, filling defaults for the rest."""
+    for name in PIPELINE_SECTIONS if stages is None else stages:
+        builder, defaults = PIPELINE_SECTIONS[name]
+        if name not in sections:
+            result.update(defaults)
+            continue
+        try:
+            result.update(builder(result, current_jd))
+        except Exception:
+            result.update(defaults)
+    return result
+
+
+# -------------------------------------------------------------------
+# Rendering (off the calculation path)
+# -------------------------------------------------------------------
+# format -> (renderer, result key, output filename suffix).  The PDF comes
+# last so its text report can reference the SVG paths.
+RENDER_FORMATS = {
+    "sky_chart": (generate_sky_chart, "sky_chart_path", "sky_chart.svg"),
+    "north_chart": (generate_north_indian_chart, "north_chart_path", "north_chart.svg"),
+    "pdf": (generate_pdf_report, "pdf_report_path", "report.pdf"),
+}
+
+
+def render_artifacts(result, formats=None, output_dir=None):
+    """
+    Write chart SVGs and/or the PDF report for a calculated kundali.
+
+    calculate_kundali() does no file I/O; call this when the files are needed.
+
+    Args:
+        result (dict): Result from calculate_kundali().  Updated in place with
+            the ``*_path`` keys (and ``pdf_report_error``).
+        formats (iterable): Any of RENDER_FORMATS (None = all).
+        output_dir (str): Directory for the files.  Defaults to kundali/outputs.
+
+    Returns:
+        dict: format -> absolute path ("" when rendering failed).
+
+    Raises:
+        ValueError: On unknown format names.
+    """
+    requested = set(RENDER_FORMATS) if formats is None else set(formats)
+    unknown = requested - set(RENDER_FORMATS)
+    if unknown:
+        raise ValueError(
+            f"Unknown render format(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(RENDER_FORMATS)}"
+        )
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    paths = {}
+    for fmt, (renderer, key, suffix) in RENDER_FORMATS.items():
+        if fmt not in requested:
+            continue
+        output_path = None
+        if output_dir:
+            safe_name = safe_filename(result.get("name") or "native")
+            output_path = os.path.join(output_dir, f"{safe_name}_{suffix}")
+        try:
+            path = renderer(result, output_path) or ""
+            path = os.path.abspath(path) if path else ""
+            if fmt == "pdf":
+                result["pdf_report_error"] = ""
+        except Exception as exc:
+            path = ""
+            if fmt == "pdf":
+                result["pdf_report_error"] = str(exc)
+                warnings.warn(f"PDF report generation failed: {exc}")
+        result[key] = path
+        paths[fmt] = path
+    return paths
+
+
 def calculate_kundali(
     birth_date_str, birth_time_str, place, gender="Male", ayanamsa_name=DEFAULT_AYANAMSA,
     name="native",
@@ -387,6 +721,9 @@ def calculate_kundali(
     latitude=None,
     longitude=None,
     timezone_name=None,
+    include=None,
+    exclude=None,
+    render=None,
     _rectification_context=False,
 ):
     """
@@ -405,12 +742,20 @@ def calculate_kundali(
         latitude (float): Optional exact birth latitude.
         longitude (float): Optional exact birth longitude.
         timezone_name (str): Optional IANA timezone name like Asia/Kolkata.
+        include (iterable): Optional sections to compute (see PIPELINE_SECTIONS).
+            None computes everything; the natal core is always computed.
+        exclude (iterable): Optional sections to skip.
+        render (iterable): Artifact formats to write after calculating (see
+            RENDER_FORMATS).  None (default) writes no files; see
+            render_artifacts().
 
     Returns:
-        dict: Complete kundali result with all calculated data.
+        dict: Complete kundali result with all calculated data.  Skipped
+        sections keep their empty defaults; ``computed_sections`` lists the
+        optional sections that were run.
 
     Raises:
-        ValueError: On invalid date/time/place/gender/ayanamsa input.
+        ValueError: On invalid date/time/place/gender/ayanamsa/section input.
     """
     # --- Input validation ---
     if not birth_date_str or not _re.fullmatch(r"\d{4}-\d{2}-\d{2}", birth_date_str):
@@ -426,6 +771,7 @@ def calculate_kundali(
             f"Unknown ayanamsa '{ayanamsa_name}'. "
             f"Choose from: {', '.join(AYANAMSA_OPTIONS)}"
         )
+    sections = resolve_sections(include, exclude)
 
     raw_place_input = str(place or "")
 
@@ -465,12 +811,11 @@ def calculate_kundali(
         utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour + utc_dt.minute / 60.0
     )
 
-    # Set ayanamsa
-    ayanamsa_code = AYANAMSA_OPTIONS.get(ayanamsa_name, swe.SIDM_LAHIRI)
-    swe.set_sid_mode(ayanamsa_code)
+    # Ayanamsa context (no global swisseph sidereal state)
+    eph = get_ephemeris(ayanamsa_name)
 
     # Houses & Lagna
-    house_data = swe.houses_ex(birth_jd, birth_lat, birth_lon, b"W", swe.FLG_SIDEREAL)
+    house_data = eph.houses(birth_jd, birth_lat, birth_lon, b"W")
     cusps, ascmc = house_data
     lagna_deg = ascmc[0]
     lagna_sign = get_sign(lagna_deg)
@@ -485,7 +830,7 @@ def calculate_kundali(
     nakshatras_d1 = {}
 
     for code, pid in planets.items():
-        pos_speed = swe.calc_ut(birth_jd, pid, swe.FLG_SIDEREAL)[0]
+        pos_speed = eph.calc(birth_jd, pid)
         lon = pos_speed[0]
         speed = pos_speed[3]
         sign = get_sign(lon)
@@ -495,7 +840,7 @@ def calculate_kundali(
         retro = is_retrograde(speed)
         if code == "Su":
             sun_full_lon = lon
-        planet_data[code] = {
+        planet_data[code] = PlanetRecord({
             "deg": deg_in_sign,
             "full_lon": round(lon, 4),
             "sign": sign,
@@ -505,37 +850,7 @@ def calculate_kundali(
             "speed": round(speed, 4),
             "combust": False,  # filled after Sun lon is known
             "neecha_bhanga": False,  # filled after all planets are placed
-            "navamsa_sign": None,
-            "navamsa_deg": None,
-            "d7_sign": None,
-            "d7_deg": None,
-            "d10_sign": None,
-            "d10_deg": None,
-            "d2_sign": None,
-            "d2_deg": None,
-            "d3_sign": None,
-            "d3_deg": None,
-            "d4_sign": None,
-            "d4_deg": None,
-            "d12_sign": None,
-            "d12_deg": None,
-            "d16_sign": None,
-            "d16_deg": None,
-            "d20_sign": None,
-            "d20_deg": None,
-            "d24_sign": None,
-            "d24_deg": None,
-            "d27_sign": None,
-            "d27_deg": None,
-            "d30_sign": None,
-            "d30_deg": None,
-            "d40_sign": None,
-            "d40_deg": None,
-            "d45_sign": None,
-            "d45_deg": None,
-            "d60_sign": None,
-            "d60_deg": None,
-        }
+        }, code)
         nakshatras_d1[code] = nak
         if code == "Mo":
             moon_sign = sign
@@ -574,13 +889,13 @@ def calculate_kundali(
             neecha_bhanga_planets.append(code)
 
     # Ketu (from Rahu)
-    ra_lon = swe.calc_ut(birth_jd, swe.MEAN_NODE, swe.FLG_SIDEREAL)[0][0]
+    ra_lon = eph.longitude(birth_jd, swe.MEAN_NODE)
     ke_lon = (ra_lon + 180) % 360
     ke_sign = get_sign(ke_lon)
     ke_deg = round(ke_lon % 30, 2)
     ke_nak = get_nakshatra(ke_lon)
     ke_dignity = get_dignity("Ke", ke_sign)
-    planet_data["Ke"] = {
+    planet_data["Ke"] = PlanetRecord({
         "deg": ke_deg,
         "sign": ke_sign,
         "nakshatra": ke_nak,
@@ -589,37 +904,7 @@ def calculate_kundali(
         "speed": -0.053,
         "combust": False,
         "neecha_bhanga": False,
-        "navamsa_sign": None,
-        "navamsa_deg": None,
-        "d7_sign": None,
-        "d7_deg": None,
-        "d10_sign": None,
-        "d10_deg": None,
-        "d2_sign": None,
-        "d2_deg": None,
-        "d3_sign": None,
-        "d3_deg": None,
-        "d4_sign": None,
-        "d4_deg": None,
-        "d12_sign": None,
-        "d12_deg": None,
-        "d16_sign": None,
-        "d16_deg": None,
-        "d20_sign": None,
-        "d20_deg": None,
-        "d24_sign": None,
-        "d24_deg": None,
-        "d27_sign": None,
-        "d27_deg": None,
-        "d30_sign": None,
-        "d30_deg": None,
-        "d40_sign": None,
-        "d40_deg": None,
-        "d45_sign": None,
-        "d45_deg": None,
-        "d60_sign": None,
-        "d60_deg": None,
-    }
+    }, "Ke")
     nakshatras_d1["Ke"] = ke_nak
     ke_idx = zodiac_signs.index(ke_sign)
     ke_house = get_house_from_sign(lagna_idx, ke_idx)
@@ -666,58 +951,34 @@ def calculate_kundali(
 
     # Birth Panchanga
     sun_lon_birth = planet_data["Su"]["full_lon"]
-    moon_lon_birth = swe.calc_ut(birth_jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+    moon_lon_birth = eph.longitude(birth_jd, swe.MOON)
     panchanga = get_panchanga(
         birth_jd, sun_lon_birth, moon_lon_birth, birth_lat, birth_lon, tz_name
     )
     birth_day_info = get_sunrise_based_day(birth_jd, birth_lat, birth_lon, tz_name)
 
-    # Divisional Charts — all 11 vargas
-    for code in planet_data:
-        p_lon = planet_data[code]["full_lon"]
-        for fn, k in [
-            (get_navamsa_sign_and_deg, "navamsa"),
-            (get_d2_sign_and_deg, "d2"),
-            (get_d3_sign_and_deg, "d3"),
-            (get_d4_sign_and_deg, "d4"),
-            (get_d7_sign_and_deg, "d7"),
-            (get_d10_sign_and_deg, "d10"),
-            (get_d12_sign_and_deg, "d12"),
-            (get_d16_sign_and_deg, "d16"),
-            (get_d20_sign_and_deg, "d20"),
-            (get_d24_sign_and_deg, "d24"),
-            (get_d27_sign_and_deg, "d27"),
-            (get_d30_sign_and_deg, "d30"),
-            (get_d40_sign_and_deg, "d40"),
-            (get_d45_sign_and_deg, "d45"),
-            (get_d60_sign_and_deg, "d60"),
-        ]:
-            s, deg = fn(p_lon)
-            planet_data[code][f"{k}_sign"] = s
-            planet_data[code][f"{k}_deg"] = deg
+    # Divisional Charts — every varga in one compact table
+    vargas = VargaTable.from_longitudes(
+        {code: pdata["full_lon"] for code, pdata in planet_data.items()}
+    )
+    for pdata in planet_data.values():
+        pdata.table = vargas
 
     # Vimshottari
-    moon_lon = swe.calc_ut(birth_jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+    moon_lon = eph.longitude(birth_jd, swe.MOON)
     start_lord, balance_y, dashas_raw = calculate_vimshottari_dasha(moon_lon, birth_jd)
     dashas = [calculate_antardashas(md) for md in dashas_raw]
 
     # Current time (UTC)
     now_utc = datetime.datetime.now(pytz.utc)
     current_jd = datetime_to_jd(now_utc)
-    current_md, current_ad = find_current_dasha(birth_jd, current_jd, dashas)
-    current_pd, pd_start_jd, pd_end_jd = get_current_pratyantar(
-        birth_jd, current_jd, current_md, current_ad, dashas
-    )
-    current_sd, sd_start_jd, sd_end_jd = get_current_sookshma(
-        birth_jd, current_jd, current_md, current_ad, current_pd, dashas
-    )
 
     # Ashtottari Dasha
     ashto_start, ashto_balance, ashto_raw = calculate_ashtottari_dasha(
         moon_lon, birth_jd
     )
     ashto_dashas = [calculate_ashtottari_antardashas(md) for md in ashto_raw]
-    ashto_md, ashto_ad = find_current_ashtottari(birth_jd, current_jd, ashto_dashas)
+    current_dashas = _current_dasha_state(birth_jd, current_jd, dashas, ashto_dashas)
 
     # Aspects
     aspects = {h: [] for h in range(1, 13)}
@@ -741,42 +1002,8 @@ def calculate_kundali(
                 ah = ((nh - 1 + offset) % 12) + 1
                 aspects[ah].append(f"{node}-5/9")
 
-    # Transits
-    from .constants import gochara_effects
-
-    transits = {}
-    for pcode, pid in planets.items():
-        lon = swe.calc_ut(current_jd, pid, swe.FLG_SIDEREAL)[0][0]
-        sign = get_sign(lon)
-        sign_idx = zodiac_signs.index(sign)
-        rel_house = ((sign_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
-        effect = gochara_effects.get(pcode, {}).get(rel_house, "Neutral")
-        transits[pcode] = {"sign": sign, "house_from_moon": rel_house, "effect": effect}
-    # Add Rahu/Ketu transits
-    ra_lon = swe.calc_ut(current_jd, swe.MEAN_NODE, swe.FLG_SIDEREAL)[0][0]
-    ra_sign = get_sign(ra_lon)
-    ra_idx = zodiac_signs.index(ra_sign)
-    ra_house = ((ra_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
-    transits["Ra"] = {
-        "sign": ra_sign,
-        "house_from_moon": ra_house,
-        "effect": gochara_effects.get("Ra", {}).get(ra_house, "Neutral"),
-    }
-    ke_lon = (ra_lon + 180) % 360
-    ke_sign = get_sign(ke_lon)
-    ke_idx = zodiac_signs.index(ke_sign)
-    ke_house = ((ke_idx - zodiac_signs.index(moon_sign) + 12) % 12) + 1
-    transits["Ke"] = {
-        "sign": ke_sign,
-        "house_from_moon": ke_house,
-        "effect": gochara_effects.get("Ke", {}).get(ke_house, "Neutral"),
-    }
-
-    # Sade Sati / Dhaiya
-    sa_transit_sign = transits.get("Sa", {}).get("sign", None)
-    sade_sati_status = (
-        get_sade_sati_status(moon_sign, sa_transit_sign) if sa_transit_sign else None
-    )
+    # Transits and Sade Sati
+    transits, sade_sati_status = _current_transits(current_jd, moon_sign, eph)
 
     # Build result dictionary
     result = {
@@ -799,77 +1026,17 @@ def calculate_kundali(
             "starting_lord": start_lord,
             "balance_at_birth_years": round(balance_y, 2),
             "mahadasas": dashas,
-            "current_md": current_md,
-            "current_ad": current_ad,
+            **current_dashas["vimshottari"],
         },
         "ashtottari": {
             "starting_lord": ashto_start,
             "balance_at_birth_years": round(ashto_balance, 2),
             "mahadasas": ashto_dashas,
-            "current_md": ashto_md,
-            "current_ad": ashto_ad,
+            **current_dashas["ashtottari"],
         },
         "aspects": aspects,
-        "navamsa": {
-            p: {"sign": d["navamsa_sign"], "deg": d["navamsa_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d7": {
-            p: {"sign": d["d7_sign"], "deg": d["d7_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d10": {
-            p: {"sign": d["d10_sign"], "deg": d["d10_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d2": {
-            p: {"sign": d["d2_sign"], "deg": d["d2_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d3": {
-            p: {"sign": d["d3_sign"], "deg": d["d3_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d4": {
-            p: {"sign": d["d4_sign"], "deg": d["d4_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d12": {
-            p: {"sign": d["d12_sign"], "deg": d["d12_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d16": {
-            p: {"sign": d["d16_sign"], "deg": d["d16_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d20": {
-            p: {"sign": d["d20_sign"], "deg": d["d20_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d24": {
-            p: {"sign": d["d24_sign"], "deg": d["d24_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d27": {
-            p: {"sign": d["d27_sign"], "deg": d["d27_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d30": {
-            p: {"sign": d["d30_sign"], "deg": d["d30_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d40": {
-            p: {"sign": d["d40_sign"], "deg": d["d40_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d45": {
-            p: {"sign": d["d45_sign"], "deg": d["d45_deg"]}
-            for p, d in planet_data.items()
-        },
-        "d60": {
-            p: {"sign": d["d60_sign"], "deg": d["d60_deg"]}
-            for p, d in planet_data.items()
-        },
+        "vargas": vargas,
+        **{key: vargas[key] for key in VARGA_KEYS},
         "transits": transits,
         "birth_year": y,
         "birth_month": m,
@@ -888,16 +1055,8 @@ def calculate_kundali(
         "ayanamsa": ayanamsa_name,
         "timezone": tz_name,
         "sade_sati": sade_sati_status,
-        "vimshottari_pd": {
-            "current_pd": current_pd,
-            "pd_start_jd": pd_start_jd,
-            "pd_end_jd": pd_end_jd,
-        },
-        "vimshottari_sd": {
-            "current_sd": current_sd,
-            "sd_start_jd": sd_start_jd,
-            "sd_end_jd": sd_end_jd,
-        },
+        "vimshottari_pd": current_dashas["vimshottari_pd"],
+        "vimshottari_sd": current_dashas["vimshottari_sd"],
         "nakshatras_d1": nakshatras_d1,
         "neecha_bhanga_planets": neecha_bhanga_planets,
     }
@@ -917,175 +1076,9 @@ def calculate_kundali(
         "karakamsa_lagna": karakamsa_lagna,
     }
 
-    # Add yogas, timings, problems, and ashtakavarga
-    result["yogas"] = detect_yogas(result)
-    result["timings"] = generate_timings(result, y, birth_jd)
-    result["problems"] = detect_problems(result)
-    result["ashtakavarga"] = calculate_ashtakavarga(result)
-
-    # New modules — Tier 1 features
-    try:
-        result["shadbala"] = calculate_shadbala(result)
-    except Exception:
-        result["shadbala"] = {}
-
-    try:
-        result["upagrahas"] = calculate_upagrahas(result)
-    except Exception:
-        result["upagrahas"] = {}
-
-    try:
-        result["avasthas"] = calculate_avasthas(result)
-    except Exception:
-        result["avasthas"] = {}
-
-    try:
-        arudha_sign, arudha_house = calculate_arudha_lagna(result)
-        result["arudha_lagna"] = {"sign": arudha_sign, "house": arudha_house}
-    except Exception:
-        result["arudha_lagna"] = {}
-
-    try:
-        result["numerology"] = calculate_numerology(result, result.get("name", ""))
-    except Exception:
-        result["numerology"] = {}
-
-    # ── Tier 2: New modules ───────────────────────────────────────────────────
-    try:
-        result["muhurtha"] = evaluate_muhurtha(
-            birth_jd, result, result["lat"], result["lon"]
-        )
-    except Exception:
-        result["muhurtha"] = {}
-
-    try:
-        result["current_panchanga"] = get_live_panchanga(
-            current_jd, result["lat"], result["lon"], result.get("timezone")
-        )
-    except Exception:
-        result["current_panchanga"] = {}
-
-    try:
-        result["current_muhurtha"] = evaluate_muhurtha(
-            current_jd, result, result["lat"], result["lon"]
-        )
-    except Exception:
-        result["current_muhurtha"] = {}
-
-    try:
-        result["tajika"] = calculate_tajika(result)
-    except Exception:
-        result["tajika"] = {}
-
-    try:
-        moon_lon_val = planet_data["Mo"]["full_lon"]
-        y_start, y_balance, y_dashas = calculate_yogini_dasha(moon_lon_val, birth_jd)
-        # Populate antardashas first so find_current_yogini can read them
-        y_antardashas = {}
-        for yd in y_dashas:
-            try:
-                calculate_yogini_antardashas(yd)  # mutates yd["antardashas"] in place
-                y_antardashas[yd["yogini"]] = yd
-            except Exception:
-                pass
-        now_jd = swe.julday(
-            datetime.datetime.now().year,
-            datetime.datetime.now().month,
-            datetime.datetime.now().day,
-            12.0,
-        )
-        current_yog = find_current_yogini(birth_jd, now_jd, y_dashas)
-        cur_yd_md, cur_yd_md_lord, cur_yd_ad, cur_yd_ad_lord = (
-            current_yog if current_yog[0] else (None, None, None, None)
-        )
-        result["yogini_dasha"] = {
-            "start_yogini": y_start,
-            "balance_years": y_balance,
-            "dashas": y_dashas,
-            "current": {
-                "yogini": cur_yd_md,
-                "lord": cur_yd_md_lord,
-                "antardasha": {"yogini": cur_yd_ad, "lord": cur_yd_ad_lord}
-                if cur_yd_ad
-                else None,
-            },
-            "antardashas": y_antardashas,
-        }
-    except Exception:
-        result["yogini_dasha"] = {}
-
-    try:
-        result["pancha_pakshi"] = calculate_pancha_pakshi(result)
-    except Exception:
-        result["pancha_pakshi"] = {}
-
-    try:
-        result["sky_chart_path"] = generate_sky_chart(result)
-    except Exception:
-        result["sky_chart_path"] = ""
-
-    # ── Tier 4: Jaimini Extensions ───────────────────────────────────────────
-    try:
-        chara_dashas = calculate_chara_dasha(result)
-        current_chara = find_current_chara_dasha(birth_jd, current_jd, chara_dashas)
-        result["chara_dasha"] = {"dashas": chara_dashas, "current": current_chara}
-    except Exception:
-        result["chara_dasha"] = {}
-
-    try:
-        result["argala"] = calculate_argala(result)
-    except Exception:
-        result["argala"] = {}
-
-    try:
-        result["pada_lagnas"] = calculate_pada_lagnas(result)
-    except Exception:
-        result["pada_lagnas"] = {}
-
-    try:
-        result["upapadha_lagna"] = get_upapadha_lagna(result)
-    except Exception:
-        result["upapadha_lagna"] = {}
-
-    # ── Tier 4: Strength & War ────────────────────────────────────────────────
-    try:
-        result["vimshopak_bala"] = calculate_vimshopak_bala(result)
-    except Exception:
-        result["vimshopak_bala"] = {}
-
-    try:
-        result["graha_yuddha"] = detect_graha_yuddha(result)
-    except Exception:
-        result["graha_yuddha"] = []
-
-    # ── Tier 4: Transit Calendar ──────────────────────────────────────────────
-    try:
-        result["transit_calendar"] = generate_transit_calendar(result, months=12)
-    except Exception:
-        result["transit_calendar"] = {}
-
-    # ── Tier 4: Charts ────────────────────────────────────────────────────────
-    try:
-        result["north_chart_path"] = generate_north_indian_chart(result)
-    except Exception:
-        result["north_chart_path"] = ""
-
-    # Additional fields for spouse predictor
-    result["functional_nature"] = calculate_functional_nature(result)
-    result["integrity"] = calculate_integrity_index(result)
-    result["dasha_periods_for_marriage"] = extract_dasha_periods_for_marriage(
-        result["timings"]
-    )
-    result["lord7_full"] = short_to_full.get(seventh_lord, seventh_lord)
-    # Planets with full names and longitudes for marriage date prediction
-    result["planets_full_long"] = {}
-    for code, data in planet_data.items():
-        full = short_to_full.get(code, code)
-        result["planets_full_long"][full] = data["full_lon"]
-    result["final_analysis"] = generate_final_analysis(result)
-    result["pdf_report_path"] = ""
-    result["pdf_report_error"] = ""
-
+    # Birth-time rectification only needs the birth moment and location, so it
+    # runs before the heavier analysis: when a correction is applied the chart
+    # is rebuilt from the corrected time without finishing this one first.
     rectification_summary = None
     if rectification_events and not _rectification_context:
         rectification_summary = rectify_birth_time(result, rectification_events)
@@ -1113,6 +1106,9 @@ def calculate_kundali(
                 latitude=birth_lat,
                 longitude=birth_lon,
                 timezone_name=tz_name,
+                include=include,
+                exclude=exclude,
+                render=render,
                 _rectification_context=True,
             )
             corrected_result["birth_time_original_input"] = birth_time_str
@@ -1128,6 +1124,34 @@ def calculate_kundali(
             )
             return corrected_result
 
+    # Add yogas, timings, problems, and ashtakavarga
+    result["yogas"] = detect_yogas(result)
+    result["timings"] = generate_timings(result, y, birth_jd)
+    result["problems"] = detect_problems(result)
+    result["ashtakavarga"] = calculate_ashtakavarga(result)
+
+    # Optional sections (Tier 1/2/4 modules)
+    _run_sections(result, sections, current_jd)
+
+    # Additional fields for spouse predictor
+    result["functional_nature"] = calculate_functional_nature(result)
+    result["integrity"] = calculate_integrity_index(result)
+    result["dasha_periods_for_marriage"] = extract_dasha_periods_for_marriage(
+        result["timings"]
+    )
+    result["lord7_full"] = short_to_full.get(seventh_lord, seventh_lord)
+    # Planets with full names and longitudes for marriage date prediction
+    result["planets_full_long"] = {}
+    for code, data in planet_data.items():
+        full = short_to_full.get(code, code)
+        result["planets_full_long"][full] = data["full_lon"]
+    result["final_analysis"] = generate_final_analysis(result)
+    result["sky_chart_path"] = ""
+    result["north_chart_path"] = ""
+    result["pdf_report_path"] = ""
+    result["pdf_report_error"] = ""
+
+    if rectification_summary is not None:
         rectification_summary["applied"] = False
         if not apply_rectification:
             rectification_summary["applied_reason"] = "Rectification was analyzed but not auto-applied."
@@ -1155,17 +1179,75 @@ def calculate_kundali(
         timezone_source=result.get("timezone_source", "lookup"),
     )
 
-    try:
-        result["pdf_report_path"] = generate_pdf_report(result)
-        result["pdf_report_error"] = ""
-    except Exception as exc:
-        result["pdf_report_path"] = ""
-        result["pdf_report_error"] = str(exc)
-        warnings.warn(f"PDF report generation failed: {exc}")
+    result["computed_sections"] = [name for name in PIPELINE_SECTIONS if name in sections]
+    result["current_jd"] = current_jd
+    if render:
+        render_artifacts(result, formats=render)
 
     return result
 
 
+def refresh_current(natal, at=None):
+    """
+    Recompute only the "now" layer of a calculated kundali, in place.
+
+    Natal data (planets, vargas, yogas, ashtakavarga, shadbala, ...) is left
+    untouched.  Running dashas, transits, Sade Sati, timings, the final
+    analysis and the time-dependent optional sections that were computed
+    (see TIME_DEPENDENT_SECTIONS) are refreshed for the instant *at*.
+
+    Args:
+        natal (dict): Result from calculate_kundali() (or a stored copy).
+        at (float | datetime): Julian Day (UT) or datetime; naive datetimes
+            are taken as UTC.  Defaults to now.
+
+    Returns:
+        dict: *natal*, updated.
+    """
+    if at is None:
+        at = datetime.datetime.now(pytz.utc)
+    if isinstance(at, datetime.datetime):
+        if at.tzinfo is None:
+            at = pytz.utc.localize(at)
+        at = datetime_to_jd(at.astimezone(pytz.utc))
+    current_jd = float(at)
+    result = natal
+
+    birth_jd = result["birth_jd"]
+    current = _current_dasha_state(
+        birth_jd,
+        current_jd,
+        result["vimshottari"]["mahadasas"],
+        result["ashtottari"]["mahadasas"],
+    )
+    result["vimshottari"].update(current["vimshottari"])
+    result["ashtottari"].update(current["ashtottari"])
+    result["vimshottari_pd"] = current["vimshottari_pd"]
+    result["vimshottari_sd"] = current["vimshottari_sd"]
+    result["transits"], result["sade_sati"] = _current_transits(
+        current_jd, result["moon_sign"], get_ephemeris(result.get("ayanamsa"))
+    )
+
+    # Timings only depend on the current year
+    current_year = _jd_to_utc(current_jd).year
+    previous_jd = result.get("current_jd")
+    if previous_jd is None or _jd_to_utc(previous_jd).year != current_year:
+        result["timings"] = generate_timings(
+            result, result["birth_year"], birth_jd, current_year=current_year
+        )
+        result["dasha_periods_for_marriage"] = extract_dasha_periods_for_marriage(
+            result["timings"]
+        )
+
+    computed = set(result.get("computed_sections", ()))
+    stages = [name for name in TIME_DEPENDENT_SECTIONS if name in computed]
+    if stages:
+        _run_sections(result, computed, current_jd, stages=stages)
+    result["final_analysis"] = generate_final_analysis(result)
+    result["current_jd"] = current_jd
+    return result
+
+
 def generate_final_analysis(result):
     """Generate a final summary analysis of the kundali."""
     yogas = result["yogas"]
@@ -1205,20 +1287,12 @@ def generate_final_analysis(result):
     # over broad Mahadasha lines or past/seed/formative entries.
     first_event = list(timings.keys())[0]
     first_range = "upcoming years"
-    _found_timing = False
-    for _event, _periods in timings.items():
-        for _p in _periods:
-            if "KARMIC SEED" in _p or "FORMATIVE" in _p:
-                continue
-            if "[PAST]" in _p:
-                continue
-            first_event = _event
-            _m = _re.search(r"\((\d{4}-\d{4})\)", _p)
-            first_range = _m.group(1) if _m else "upcoming years"
-            _found_timing = True
-            break
-        if _found_timing:
-            break
+    for period in timings.periods():
+        if period.tag or period.status == "PAST":
+            continue
+        first_event = period.event
+        first_range = f"{period.start_year}-{period.end_year}"
+        break
 
     # --- Dynamic: current dasha description ---
     current_md_full = (
@@ -1285,7 +1359,23 @@ def generate_final_analysis(result):
 
 
 def main():
-    """Command-line entry point."""
+    """Command-line entry point (``kundali batch ...`` runs bulk generation,
+    ``kundali import-places FILE...`` preloads the location store)."""
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from .batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "import-places":
+        from .cache import get_location_store
+
+        store = get_location_store()
+        for path in sys.argv[2:]:
+            try:
+                print(f"Imported {store.import_file(path)} places from '{path}'")
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+        sys.exit(0)
+
     print("Vedic Kundali Generator – Full Version with D7, D10 & Marriage Timing")
     print("─────────────────────────────────────────────────────────────────────\n")
     try:
@@ -1312,7 +1402,7 @@ def main():
             try:
                 result = calculate_kundali(
                     date_str, time_str, place, gender=gender, ayanamsa_name=ayanamsa_choice,
-                    name=name,
+                    name=name, render=RENDER_FORMATS,
                 )
 
                 outputs_dir = os.path.join(os.path.dirname(__file__), "outputs")
@@ -1401,6 +1491,7 @@ def main():
                                 gender=gender,
                                 ayanamsa_name=ayanamsa_choice,
                                 name=name,
+                                render=RENDER_FORMATS,
                             )
                             rect_filename = os.path.join(outputs_dir, f"{name}_kundali_rectified.txt")
                             with open(rect_filename, "w", encoding="utf-8") as f:
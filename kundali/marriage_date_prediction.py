@@ -4,11 +4,14 @@ Nadi-style marriage date prediction using Jupiter progression, transits, and das
 Enhanced with Panchanga-based day scoring.
 """
 
+import calendar
 import math
 from datetime import datetime, timezone
 from math import floor
 from typing import Dict, List, Optional, Tuple
 
+import swisseph as swe
+
 from .constants import (
     SHORT_TO_FULL,
     ZODIAC_SIGNS,
@@ -16,8 +19,11 @@ from .constants import (
     MARRIAGE_AUSPICIOUS_TITHIS,
     MARRIAGE_AUSPICIOUS_NAKSHATRAS,
 )
+from .ephemeris import get_ephemeris
+from .ephemeris_table import GRAHAS, get_ephemeris_table
 from .utils import (
-    get_sign,
+    datetime_to_jd,
+    get_sign_index as get_sign,
     get_nakshatra,
     get_seventh_sign,
     signs_have_nadi_relation,
@@ -25,7 +31,7 @@ from .utils import (
     has_aspect,
 )
 
-# Optional Astropy for real transits
+# Optional Astropy, kept as an independent cross-check of Swiss Ephemeris
 try:
     from astropy.time import Time
     from astropy.coordinates import solar_system_ephemeris, get_body
@@ -35,11 +41,32 @@ try:
 except ImportError:
     ASTROPY_AVAILABLE = False
 
+_PLANET_IDS = {
+    "sun": swe.SUN,
+    "moon": swe.MOON,
+    "mercury": swe.MERCURY,
+    "venus": swe.VENUS,
+    "mars": swe.MARS,
+    "jupiter": swe.JUPITER,
+    "saturn": swe.SATURN,
+}
+_TABLE_CODES = {
+    "sun": "Su",
+    "moon": "Mo",
+    "mercury": "Me",
+    "venus": "Ve",
+    "mars": "Ma",
+    "jupiter": "Ju",
+    "saturn": "Sa",
+}
+# Bodies a day is scored on (evaluate_marriage_date)
+_DAY_PLANETS = ("sun", "moon", "jupiter", "saturn")
+
 
 def approximate_lahiri_ayanamsa(jd):
     """
     Rough Lahiri ayanamsa in degrees (error ~0.5–1° in 20th–21st century).
-    For higher accuracy, use pyswisseph in production.
+    The backends use the engine's exact ayanamsa; kept for callers.
     """
     t = (jd - 2451545.0) / 36525.0  # centuries from J2000
     precess = 5029.0966 * t + 1.11161 * t ** 2 - 0.000060 * t ** 3
@@ -47,77 +74,149 @@ def approximate_lahiri_ayanamsa(jd):
     return ayan % 360
 
 
-def get_sidereal_lon(planet, dt, use_jpl=False):
+def _to_jd(dt):
+    """Julian Day (UT) of a naive-UTC or aware datetime."""
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc)
+    return datetime_to_jd(dt) + dt.second / 86400.0
+
+
+# ---------------------------------------------------------------------------
+# Ephemeris backends
+#
+# A backend answers ``longitudes(jds, planets)`` -> {planet: [sidereal
+# longitude at each jd]} for lowercase planet names ("moon", "jupiter", ...),
+# so a whole month of days is one call.
+# ---------------------------------------------------------------------------
+class SwissEphBackend:
+    """Sidereal longitudes from Swiss Ephemeris, as used by the rest of the engine.
+
+    When a precomputed ``EphemerisTable`` (KUNDALI_EPHEMERIS_TABLE) covers the
+    requested days and ayanamsa, the batch is one vectorized interpolation;
+    pass ``table=False`` to always call Swiss Ephemeris.
     """
-    Get geocentric sidereal ecliptic longitude (degrees) for planet at given datetime.
-    planet: 'jupiter', 'saturn', 'moon', 'venus', 'mars', 'sun', etc.
-    Returns None if Astropy not available.
+
+    name = "swisseph"
+
+    def __init__(self, ephemeris=None, table=None):
+        self.ephemeris = ephemeris or get_ephemeris()
+        self.table = get_ephemeris_table() if table is None else (table or None)
+
+    def longitudes(self, jds, planets):
+        jds = list(jds)
+        table = self.table
+        if (
+            table is not None
+            and jds
+            and table.sid_mode == self.ephemeris.sid_mode
+            and table.covers(jds)
+        ):
+            lons = table.positions(jds)[0]
+            return {
+                p: lons[:, GRAHAS.index(_TABLE_CODES[p])].tolist() for p in planets
+            }
+        ids = [_PLANET_IDS[p] for p in planets]
+        rows = [self.ephemeris.calc_many(jd, ids) for jd in jds]
+        return {p: [row[i][0] for row in rows] for i, p in enumerate(planets)}
+
+
+class AstropyBackend:
+    """Sidereal longitudes from Astropy (builtin or JPL DE440s ephemeris).
+
+    Tropical true-ecliptic-of-date positions minus the engine's ayanamsa, so
+    any difference from SwissEphBackend is the planetary theory alone.
     """
-    if not ASTROPY_AVAILABLE:
-        return None
 
-    try:
-        # Convert datetime to Julian Day (Meeus algorithm)
-        naive = dt.replace(tzinfo=None) if dt.tzinfo else dt
-        yr, mo, dy = naive.year, naive.month, naive.day
-        hr = naive.hour + naive.minute / 60.0 + naive.second / 3600.0
-
-        y, m = (yr - 1, mo + 12) if mo <= 2 else (yr, mo)
-        A = y // 100
-        B = 2 - A + A // 4
-        jd = (
-            int(365.25 * (y + 4716))
-            + int(30.6001 * (m + 1))
-            + dy
-            + hr / 24.0
-            + B
-            - 1524.5
-        )
+    name = "astropy"
+
+    def __init__(self, use_jpl=False, ephemeris=None):
+        if not ASTROPY_AVAILABLE:
+            raise ImportError("astropy is required for AstropyBackend")
+        self.ephem = "de440s" if use_jpl else "builtin"
+        self.ephemeris = ephemeris or get_ephemeris()
+
+    def longitudes(self, jds, planets):
+        jds = list(jds)
+        if not jds:
+            return {p: [] for p in planets}
+        t = Time(jds, format="jd", scale="utc")
+        ayanamsas = [self.ephemeris.ayanamsa(jd) for jd in jds]
+        out = {}
+        with solar_system_ephemeris.set(self.ephem):
+            for p in planets:
+                ecl = get_body(p, t).transform_to(GeocentricTrueEcliptic(equinox=t))
+                out[p] = [
+                    (lon - aya) % 360 for lon, aya in zip(ecl.lon.deg.tolist(), ayanamsas)
+                ]
+        return out
+
+
+def get_backend(backend=None, use_jpl=False, ephemeris=None):
+    """
+    *backend* if given, else Astropy for ``use_jpl`` (when installed), else
+    Swiss Ephemeris; new backends use *ephemeris*'s ayanamsa (default Lahiri).
+    """
+    if backend is not None:
+        return backend
+    if use_jpl and ASTROPY_AVAILABLE:
+        return AstropyBackend(use_jpl=True, ephemeris=ephemeris)
+    return SwissEphBackend(ephemeris=ephemeris)
+
 
-        t = Time(jd, format="jd", scale="tdb")
-        ephem = "de440s" if use_jpl else "builtin"
-        with solar_system_ephemeris.set(ephem):
-            body = get_body(planet, t)
-            ecl = body.transform_to(GeocentricTrueEcliptic())
-            tropical_lon = ecl.lon.deg % 360
+def cross_check_backends(jds, planets=_DAY_PLANETS, reference=None, candidate=None):
+    """
+    Largest longitude disagreement (degrees) per planet between two backends.
+
+    Defaults to Swiss Ephemeris as the reference and Astropy as the candidate.
+    """
+    reference = reference or SwissEphBackend()
+    candidate = candidate or AstropyBackend()
+    ref = reference.longitudes(jds, planets)
+    cand = candidate.longitudes(jds, planets)
+    return {
+        p: max((abs((a - b + 180) % 360 - 180) for a, b in zip(ref[p], cand[p])), default=0.0)
+        for p in planets
+    }
 
-        ayan = approximate_lahiri_ayanamsa(jd)
-        sid_lon = (tropical_lon - ayan) % 360
-        return sid_lon
+
+def get_sidereal_lon(planet, dt, use_jpl=False, backend=None):
+    """
+    Get geocentric sidereal ecliptic longitude (degrees) for planet at given datetime.
+    planet: 'jupiter', 'saturn', 'moon', 'venus', 'mars', 'sun', etc.
+    Returns None if the backend cannot compute it.
+    """
+    try:
+        return get_backend(backend, use_jpl).longitudes([_to_jd(dt)], (planet,))[planet][0]
     except Exception:
         return None
 
 
-def get_moon_transit_days(year, month, seventh_sign, sig_sign, use_jpl=False):
+def _month_days(year, month):
+    """Noon-UTC datetimes for every day of a month."""
+    return [
+        datetime(year, month, day, 12, 0, tzinfo=timezone.utc)
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+    ]
+
+
+def get_moon_transit_days(year, month, seventh_sign, sig_sign, use_jpl=False, backend=None):
     """
     Find days in the given month when Moon transits 7th sign or significator sign.
     Filters out Amavasya (new moon) and Ashtami (8th tithi) as inauspicious.
     Returns list of day numbers (1-31).
     """
-    if not ASTROPY_AVAILABLE:
-        return []
-
+    days = _month_days(year, month)
+    lons = get_backend(backend, use_jpl).longitudes(
+        [_to_jd(d) for d in days], ("sun", "moon")
+    )
     favorable_days = []
-    try:
-        for day in range(1, 32):
-            try:
-                check_dt = datetime(year, month, day, 12, 0, tzinfo=timezone.utc)
-                moon_lon = get_sidereal_lon("moon", check_dt, use_jpl)
-                if moon_lon is not None:
-                    moon_sign = get_sign(moon_lon)
-                    if moon_sign == seventh_sign or moon_sign == sig_sign:
-                        sun_lon = get_sidereal_lon("sun", check_dt, use_jpl)
-                        if sun_lon is not None:
-                            tithi_num = int(((moon_lon - sun_lon) % 360) / 12)
-                            if tithi_num in (7, 22, 29):  # Ashtami, Ashtami, Amavasya
-                                continue
-                            favorable_days.append(day)
-                        else:
-                            favorable_days.append(day)
-            except ValueError:
-                break
-    except Exception:
-        pass
+    for day, sun_lon, moon_lon in zip(days, lons["sun"], lons["moon"]):
+        moon_sign = get_sign(moon_lon)
+        if moon_sign == seventh_sign or moon_sign == sig_sign:
+            tithi_num = int(((moon_lon - sun_lon) % 360) / 12)
+            if tithi_num in (7, 22, 29):  # Ashtami, Ashtami, Amavasya
+                continue
+            favorable_days.append(day.day)
     return favorable_days
 
 
@@ -156,17 +255,21 @@ def check_nadi_promise(planets, gender="male"):
         return f"⚠️ WEAK PROMISE (Neither Jupiter nor Saturn strongly relate to {sig_key}) - May face delays or challenges"
 
 
-def evaluate_marriage_date(date, natal_data, gender):
+def evaluate_marriage_date(date, natal_data, gender, backend=None):
     """
     Score a specific date (datetime) for marriage suitability.
     Returns a score 0-100 based on multiple Vedic factors.
     """
+    lons = get_backend(backend).longitudes([_to_jd(date)], _DAY_PLANETS)
+    return _score_day(date, natal_data, *(lons[p][0] for p in _DAY_PLANETS))
+
+
+def _score_day(date, natal_data, sun_lon, moon_lon, jup_lon, sat_lon):
+    """evaluate_marriage_date from precomputed sidereal longitudes (None = unknown)."""
     score = 50  # baseline
     factors = []
 
     # --- Tithi ---
-    sun_lon = get_sidereal_lon("sun", date)
-    moon_lon = get_sidereal_lon("moon", date)
     if sun_lon is not None and moon_lon is not None:
         tithi_num = int(((moon_lon - sun_lon) % 360) / 12)
         if tithi_num in MARRIAGE_AUSPICIOUS_TITHIS:
@@ -231,12 +334,11 @@ def evaluate_marriage_date(date, natal_data, gender):
             score -= 10
 
     # --- Transiting Jupiter aspects ---
-    jup_lon = get_sidereal_lon("jupiter", date)
+    lagna_sign = get_sign(natal_data["lagna"])
+    seventh_lagna_sign = (lagna_sign + 6) % 12
     if jup_lon is not None:
         jup_sign = get_sign(jup_lon)
         # Check if Jupiter aspects 7th house from Lagna or Moon
-        lagna_sign = get_sign(natal_data["lagna"])
-        seventh_lagna_sign = (lagna_sign + 6) % 12
         if jup_sign == seventh_lagna_sign or signs_have_nadi_relation(
             jup_sign, seventh_lagna_sign
         ):
@@ -244,7 +346,6 @@ def evaluate_marriage_date(date, natal_data, gender):
             factors.append("Jupiter aspects 7th house")
 
     # --- Transiting Saturn aspects ---
-    sat_lon = get_sidereal_lon("saturn", date)
     if sat_lon is not None:
         sat_sign = get_sign(sat_lon)
         if signs_have_nadi_relation(sat_sign, seventh_lagna_sign):
@@ -262,18 +363,23 @@ def find_marriage_date(
     gender="male",
     use_real_transits=True,
     show_all_periods=False,
+    backend=None,
 ):
     """
     Enhanced Nadi-style marriage timing prediction with real transits.
     - Uses sign-based Jupiter progression (1 sign/year)
     - Checks progression relation to significator (Venus male / Mars female)
     - Filters by dasha (Maha + Antardasha in significators)
-    - Uses REAL Jupiter transits (Astropy) for month refinement
+    - Uses REAL Jupiter transits for month refinement
     - Uses REAL Moon transits for day-level triggers
+    - Transits come from *backend* (default Swiss Ephemeris in the chart's
+      ayanamsa; see AstropyBackend), one batched call per year and per
+      candidate month
     - Tracks 12-year cycles (rounds)
     - Returns detailed prediction with confidence levels
 
     kundali: dict from calculate_kundali() containing:
+        - ayanamsa: ayanamsa name (default Lahiri)
         - planets: dict of {planet: longitude}
         - lagna: lagna longitude
         - lord7: 7th lord name
@@ -310,6 +416,7 @@ def find_marriage_date(
         significators_ad.add(kundali.get("lord7_full", ""))
 
     sign_names = ZODIAC_SIGNS
+    backend = get_backend(backend, ephemeris=get_ephemeris(kundali.get("ayanamsa")))
 
     results = []
 
@@ -354,16 +461,28 @@ def find_marriage_date(
         probable_months = []
         peak_months = []
         saturn_months = set()
-        for month in range(1, 13):
-            check_date = datetime(year, month, 15, 12, 0, tzinfo=timezone.utc)
-
-            if future_only and check_date < datetime.now(timezone.utc):
-                continue
-
-            if use_real_transits and ASTROPY_AVAILABLE:
+        now = datetime.now(timezone.utc)
+        months = [
+            month
+            for month in range(1, 13)
+            if not future_only
+            or datetime(year, month, 15, 12, 0, tzinfo=timezone.utc) >= now
+        ]
+        # Mid-month Jupiter/Saturn for the whole year in one backend call
+        mid_month = {}
+        if use_real_transits and months:
+            try:
+                lons = backend.longitudes(
+                    [_to_jd(datetime(year, m, 15, 12, 0, tzinfo=timezone.utc)) for m in months],
+                    ("jupiter", "saturn"),
+                )
+                mid_month = dict(zip(months, zip(lons["jupiter"], lons["saturn"])))
+            except Exception:
+                pass
+        for month in months:
+            if use_real_transits:
                 try:
-                    jup_trans_lon = get_sidereal_lon("jupiter", check_date)
-                    sat_trans_lon = get_sidereal_lon("saturn", check_date)
+                    jup_trans_lon, sat_trans_lon = mid_month[month]
 
                     if jup_trans_lon is not None:
                         jup_trans_sign = get_sign(jup_trans_lon)
@@ -429,18 +548,18 @@ def find_marriage_date(
         best_date = None
         best_factors = []
         for month in probable_months:
-            for day in range(1, 32):
-                try:
-                    check_date = datetime(year, month, day, 12, 0, tzinfo=timezone.utc)
-                    if future_only and check_date < datetime.now(timezone.utc):
-                        continue
-                    score, factors = evaluate_marriage_date(check_date, kundali, gender)
-                    if score > best_score:
-                        best_score = score
-                        best_date = check_date
-                        best_factors = factors
-                except ValueError:
-                    break  # invalid day (e.g., Feb 30)
+            days = [d for d in _month_days(year, month) if not (future_only and d < now)]
+            if not days:
+                continue
+            lons = backend.longitudes([_to_jd(d) for d in days], _DAY_PLANETS)
+            for i, check_date in enumerate(days):
+                score, factors = _score_day(
+                    check_date, kundali, *(lons[p][i] for p in _DAY_PLANETS)
+                )
+                if score > best_score:
+                    best_score = score
+                    best_date = check_date
+                    best_factors = factors
 
         if best_date:
             best_date_str = best_date.strftime("%Y-%m-%d")
@@ -463,7 +582,7 @@ def find_marriage_date(
         if has_saturn:
             confidence += " [Saturn confirms]"
 
-        date_strings = [f"{y}-{m:02d}-{d:02d}" for y, m, d in favorable_dates[:15]]
+        date_strings = favorable_dates[:15]
 
         result = {
             "date": best_date_str,
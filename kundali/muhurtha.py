@@ -8,10 +8,17 @@ Covers:
   - Panchaka   : 5 inauspicious combinations based on Panchanga elements
   - Panchanga  : Tithi, Vara, Nakshatra, Yoga, Karana for any JD
   - Muhurtha evaluator: Score a time window for overall auspiciousness
+  - Panchanga timeline: Exact change instants of every element over a range,
+    so a search scores each constant interval once instead of sampling
 """
 
+import heapq
+import math
+
 import swisseph as swe
+from .ephemeris import get_ephemeris
 from .nakshatra import NAKSHATRAS, TARA_NAMES
+from .solar_events import sunrise_after
 from .utils import get_sunrise_based_day
 
 # ─── Panchanga constants ──────────────────────────────────────────────────────
@@ -168,20 +175,20 @@ INAUSPICIOUS_NAKSHATRAS = {
 # ─── Panchanga calculation ────────────────────────────────────────────────────
 
 
-def get_panchanga(jd, lat=0.0, lon=0.0, tz_name=None):
+def get_panchanga(jd, lat=0.0, lon=0.0, tz_name=None, ephemeris=None):
     """
     Calculate Panchanga (five elements) for a given Julian Day.
 
+    *ephemeris* selects the ayanamsa (default Lahiri).
+
     Returns dict with:
       tithi, tithi_name, vara, vara_name, vara_lord,
       nakshatra, nakshatra_idx, yoga, yoga_name, karana, karana_name,
       moon_lon, sun_lon
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
-    flags = swe.FLG_SIDEREAL | swe.FLG_SPEED
-
-    sun_lon = swe.calc_ut(jd, swe.SUN, flags)[0][0]
-    moon_lon = swe.calc_ut(jd, swe.MOON, flags)[0][0]
+    eph = ephemeris or get_ephemeris()
+    sun_lon = eph.longitude(jd, swe.SUN)
+    moon_lon = eph.longitude(jd, swe.MOON)
 
     # Tithi: each tithi = 12° of Moon-Sun longitude difference
     diff = (moon_lon - sun_lon) % 360
@@ -375,7 +382,18 @@ def evaluate_muhurtha(jd, birth_result, lat=0.0, lon=0.0, purpose="general"):
         }
     """
     tz_name = birth_result.get("timezone") if isinstance(birth_result, dict) else None
-    panchanga = get_panchanga(jd, lat, lon, tz_name)
+    ayanamsa = birth_result.get("ayanamsa") if isinstance(birth_result, dict) else None
+    panchanga = get_panchanga(jd, lat, lon, tz_name, ephemeris=get_ephemeris(ayanamsa))
+    return score_panchanga(panchanga, birth_result, purpose)
+
+
+def score_panchanga(panchanga, birth_result, purpose="general"):
+    """
+    Score an already computed Panchanga for a native (see evaluate_muhurtha).
+
+    The score depends only on the Panchanga elements and the Moon's sign, so
+    it is constant between the change instants of a panchanga timeline.
+    """
     warnings = []
     score = 0
     max_score = 100
@@ -549,13 +567,178 @@ def evaluate_muhurtha(jd, birth_result, lat=0.0, lon=0.0, purpose="general"):
     }
 
 
+# ─── Panchanga timeline ───────────────────────────────────────────────────────
+
+# Angles whose multiples of *span* mark a change in the muhurtha score.  Each
+# is a function of (sun_lon, sun_speed, moon_lon, moon_speed) returning
+# (angle, rate); all of them increase monotonically.  Tithi changes are every
+# other karana change, so the 6° elongation grid covers both.
+_TIMELINE_ANGLES = (
+    ("karana", lambda s, sd, m, md: (m - s, md - sd), 6.0),
+    ("nakshatra", lambda s, sd, m, md: (m, md), 360 / 27),
+    ("moon_sign", lambda s, sd, m, md: (m, md), 30.0),
+    ("yoga", lambda s, sd, m, md: (s + m, sd + md), 360 / 27),
+)
+# Crossings closer than this (≈1 s) are the same instant, e.g. a Moon sign
+# change that is also a nakshatra change.
+_MIN_SEGMENT_DAYS = 1e-5
+
+
+def _sun_moon(eph, jd):
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    sun = eph.calc(jd, swe.SUN, flags)
+    moon = eph.calc(jd, swe.MOON, flags)
+    return sun[0], sun[3], moon[0], moon[3]
+
+
+def _angle_crossings(eph, angle, span, start_jd, end_jd, tolerance=1e-6):
+    """
+    Yield the JDs in (start_jd, end_jd] where *angle* crosses a multiple of *span*.
+
+    Each crossing is found by Newton iteration on the angle and its rate,
+    starting from the previous crossing.
+    """
+    value, _ = angle(*_sun_moon(eph, start_jd))
+    index = math.floor((value % 360) / span)
+    jd = start_jd
+    while True:
+        index += 1
+        target = index * span
+        for _ in range(20):
+            value, rate = angle(*_sun_moon(eph, jd))
+            step = ((target - value + 180) % 360 - 180) / rate
+            jd += step
+            if abs(step) < tolerance:
+                break
+        if jd > end_jd:
+            return
+        yield jd
+
+
+def _sunrises(start_jd, end_jd, lat, lon):
+    """Yield the sunrises (Vara changes) in (start_jd, end_jd]."""
+    jd = start_jd
+    while True:
+        jd = sunrise_after(jd, lat, lon)
+        if jd is None or jd > end_jd:
+            return
+        yield jd
+
+
+def build_panchanga_timeline(start_jd, end_jd, lat=0.0, lon=0.0, tz_name=None, ephemeris=None):
+    """
+    Split [start_jd, end_jd] into intervals with a constant Panchanga.
+
+    Boundaries are the tithi, karana, nakshatra, yoga and Moon-sign change
+    instants (root-found on the Sun/Moon longitudes) and the sunrises that
+    change the Vara.  The timeline depends only on the range, location and
+    ayanamsa, so one timeline can be scored for any number of natives.
+
+    Returns:
+        list of dicts: {start_jd, end_jd, panchanga} in time order, where
+        panchanga is get_panchanga() at the interval's midpoint.
+    """
+    eph = ephemeris or get_ephemeris()
+    boundaries = [start_jd, end_jd]
+    for _name, angle, span in _TIMELINE_ANGLES:
+        boundaries.extend(_angle_crossings(eph, angle, span, start_jd, end_jd))
+    boundaries.extend(_sunrises(start_jd, end_jd, lat, lon))
+
+    edges = [start_jd]
+    for jd in sorted(boundaries):
+        if jd - edges[-1] >= _MIN_SEGMENT_DAYS:
+            edges.append(jd)
+    edges[-1] = max(edges[-1], end_jd)
+
+    timeline = []
+    for seg_start, seg_end in zip(edges, edges[1:]):
+        midpoint = (seg_start + seg_end) / 2
+        timeline.append(
+            {
+                "start_jd": seg_start,
+                "end_jd": seg_end,
+                "panchanga": get_panchanga(midpoint, lat, lon, tz_name, ephemeris=eph),
+            }
+        )
+    return timeline
+
+
+def iter_muhurtha_windows(birth_result, timeline, purpose="general", start_jd=None, end_jd=None):
+    """
+    Score every interval of a panchanga timeline for one native, in time order.
+
+    Intervals are clipped to [start_jd, end_jd] when given.  Each yielded
+    dict is an evaluate_muhurtha() result plus start_jd/end_jd of the window
+    (``jd`` is the window start).
+    """
+    for segment in timeline:
+        seg_start = segment["start_jd"] if start_jd is None else max(segment["start_jd"], start_jd)
+        seg_end = segment["end_jd"] if end_jd is None else min(segment["end_jd"], end_jd)
+        if seg_end <= seg_start:
+            continue
+        window = score_panchanga(segment["panchanga"], birth_result, purpose)
+        window["jd"] = seg_start
+        window["start_jd"] = seg_start
+        window["end_jd"] = seg_end
+        yield window
+
+
+def _jd_to_str(jd):
+    cal = swe.revjul(jd, swe.GREG_CAL)
+    return (
+        f"{int(cal[0])}-{int(cal[1]):02d}-{int(cal[2]):02d} "
+        f"{int(cal[3]):02d}:{int((cal[3] % 1) * 60):02d}"
+    )
+
+
+def find_muhurtha_windows(
+    birth_result,
+    start_jd,
+    end_jd,
+    purpose="general",
+    lat=0.0,
+    lon=0.0,
+    min_score=65,
+    top_k=20,
+    timeline=None,
+):
+    """
+    Return the top_k muhurtha windows between start_jd and end_jd.
+
+    Every interval of constant Panchanga is scored exactly once, so windows
+    of any length are found and the search is linear in the range.  Pass a
+    prebuilt *timeline* (same location and ayanamsa) to search it for many
+    natives without recomputing the panchanga.
+
+    Returns:
+        list of window dicts (see iter_muhurtha_windows) with datetime_str
+        (UT), sorted by score descending, earliest first among equal scores.
+    """
+    if timeline is None:
+        ayanamsa = birth_result.get("ayanamsa") if isinstance(birth_result, dict) else None
+        tz_name = birth_result.get("timezone") if isinstance(birth_result, dict) else None
+        timeline = build_panchanga_timeline(
+            start_jd, end_jd, lat, lon, tz_name, ephemeris=get_ephemeris(ayanamsa)
+        )
+    windows = (
+        w
+        for w in iter_muhurtha_windows(birth_result, timeline, purpose, start_jd, end_jd)
+        if w["total_score"] >= min_score
+    )
+    best = heapq.nlargest(top_k, windows, key=lambda w: (w["total_score"], -w["start_jd"]))
+    for window in best:
+        window["datetime_str"] = _jd_to_str(window["start_jd"])
+    return best
+
+
 def find_best_muhurtha(
     birth_result, start_jd, days=7, purpose="general", lat=0.0, lon=0.0, min_score=65
 ):
     """
     Search for the best Muhurtha windows over a range of days.
 
-    Scans every 2 hours and returns windows scoring above min_score.
+    Scores every interval of constant Panchanga (see find_muhurtha_windows)
+    and returns windows scoring above min_score.
 
     Args:
         birth_result (dict): Kundali result for the native.
@@ -568,25 +751,9 @@ def find_best_muhurtha(
     Returns:
         list of dicts sorted by score descending.
     """
-    results = []
-    step = 2 / 24.0  # 2-hour steps
-    total_steps = int(days * 24 / 2)
-
-    for i in range(total_steps):
-        jd_check = start_jd + i * step
-        try:
-            m = evaluate_muhurtha(jd_check, birth_result, lat, lon, purpose)
-            if m["total_score"] >= min_score:
-                # Convert JD to calendar date
-                cal = swe.revjul(jd_check, swe.GREG_CAL)
-                m["datetime_str"] = (
-                    f"{int(cal[0])}-{int(cal[1]):02d}-{int(cal[2]):02d} "
-                    f"{int(cal[3]):02d}:{int((cal[3] % 1) * 60):02d}"
-                )
-                m["jd"] = jd_check
-                results.append(m)
-        except Exception:
-            continue
-
-    results.sort(key=lambda x: x["total_score"], reverse=True)
-    return results[:20]  # Top 20 windows
+    try:
+        return find_muhurtha_windows(
+            birth_result, start_jd, start_jd + days, purpose, lat, lon, min_score, top_k=20
+        )
+    except Exception:
+        return []
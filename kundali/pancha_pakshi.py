@@ -22,6 +22,7 @@ from zoneinfo import ZoneInfo
 
 import swisseph as swe
 from .utils import get_sunrise_based_day
+from .solar_events import get_sun_rise_set
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
@@ -505,32 +506,8 @@ WEEKDAY_NAMES = [
 
 def _get_sun_rise_set(jd: float, lat: float, lon: float):
     """Return (sunrise_jd, sunset_jd) for the given Julian Day and location."""
-    try:
-        sr_res, sr_tret = swe.rise_trans(
-            jd - 1.0,
-            swe.SUN,
-            swe.CALC_RISE,
-            (lon, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        ss_res, ss_tret = swe.rise_trans(
-            jd - 1.0,
-            swe.SUN,
-            swe.CALC_SET,
-            (lon, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        sunrise_jd = sr_tret[0] if sr_res == 0 and sr_tret else jd - 0.25
-        sunset_jd = ss_tret[0] if ss_res == 0 and ss_tret else jd + 0.25
-    except Exception:
-        # Fallback: assume 6am sunrise, 6pm sunset
-        sunrise_jd = jd - 0.25
-        sunset_jd = jd + 0.25
-    return sunrise_jd, sunset_jd
+    # Falls back to 6am sunrise, 6pm sunset when no event is found
+    return get_sun_rise_set(jd, lat, lon)
 
 
 def _jd_to_utc_datetime(jd: float) -> datetime.datetime:
@@ -19,15 +19,16 @@ from .constants import (
 )
 from .utils import get_dignity
 from .interpretations import (
-    interpret_aspects,
-    interpret_navamsa,
-    interpret_d7,
-    interpret_d10,
-    interpret_d60,
+    write_aspect_analysis,
+    write_navamsa_analysis,
+    write_d7_analysis,
+    write_d10_analysis,
+    write_d60_analysis,
     calculate_functional_strength_index,
     get_aspect_quality_score,
 )
 from . import decisions
+from .report_document import ReportWriter
 
 
 def _format_confidence(value):
@@ -44,7 +45,18 @@ def _format_confidence(value):
     return f"{score}/100"
 
 
-def _write_prediction_quality_section(write, result, all_decisions):
+def _write_markdown(report, text):
+    """Write analysis text that uses "### Title" and "- item" lines."""
+    for line in text.split("\n"):
+        if line.startswith("### "):
+            report.heading(line[4:], "### ", "")
+        elif line.startswith("- "):
+            report.bullet(line[2:], "-")
+        else:
+            report.write(line)
+
+
+def _write_prediction_quality_section(report, result, all_decisions):
     input_quality = result.get("input_quality", {})
     rectification = result.get("birth_time_rectification", {})
     confidence_summary = all_decisions.get("confidence_summary", {})
@@ -52,417 +64,429 @@ def _write_prediction_quality_section(write, result, all_decisions):
     if not any((input_quality, rectification, confidence_summary)):
         return
 
-    write("\n┌─ PREDICTION CONFIDENCE & DATA QUALITY ───────────────────────────────────────────────┐")
+    report.box("PREDICTION CONFIDENCE & DATA QUALITY", width=88)
 
     if input_quality:
-        write("\n  Input Quality:")
-        write(
-            f"    Score        : {input_quality.get('score', '-')}/100 ({input_quality.get('label', '-')})"
+        report.heading("Input Quality", "  ", gap=True)
+        report.kv(
+            "Score",
+            f"{input_quality.get('score', '-')}/100 ({input_quality.get('label', '-')})",
+            13, "    ",
+        )
+        report.kv("Place Detail", input_quality.get("birth_place_specificity", "-"), 13, "    ")
+        report.kv(
+            "Location Src",
+            result.get("location_source", input_quality.get("location_source", "-")),
+            13, "    ",
         )
-        write(f"    Place Detail : {input_quality.get('birth_place_specificity', '-')}")
-        write(f"    Location Src : {result.get('location_source', input_quality.get('location_source', '-'))}")
-        write(f"    Timezone     : {result.get('timezone', input_quality.get('timezone', '-'))}")
+        report.kv("Timezone", result.get("timezone", input_quality.get("timezone", "-")), 13, "    ")
         warnings = input_quality.get("warnings", [])
         for warning in warnings[:3]:
-            write(f"    ! {warning}")
+            report.bullet(warning, "!", "    ")
 
     if rectification:
-        write("\n  Birth Time Rectification:")
-        write(f"    Applied      : {'Yes' if rectification.get('applied') else 'No'}")
+        report.heading("Birth Time Rectification", "  ", gap=True)
+        report.kv("Applied", "Yes" if rectification.get("applied") else "No", 13, "    ")
         if rectification.get("corrected_birth_time"):
-            write(f"    Corrected    : {rectification.get('corrected_birth_time')}")
+            report.kv("Corrected", rectification.get("corrected_birth_time"), 13, "    ")
         if rectification.get("confidence_score") is not None:
-            write(
-                f"    Confidence   : {rectification.get('confidence_score')}/100 ({rectification.get('confidence_label', '-')})"
+            report.kv(
+                "Confidence",
+                f"{rectification.get('confidence_score')}/100 ({rectification.get('confidence_label', '-')})",
+                13, "    ",
             )
         if rectification.get("applied_reason"):
-            write(f"    Note         : {rectification.get('applied_reason')}")
+            report.kv("Note", rectification.get("applied_reason"), 13, "    ")
 
     if confidence_summary:
-        write("\n  Overall Prediction Confidence:")
-        write(
-            f"    Average      : {confidence_summary.get('average_score', '-')}/100 ({confidence_summary.get('label', '-')})"
+        report.heading("Overall Prediction Confidence", "  ", gap=True)
+        report.kv(
+            "Average",
+            f"{confidence_summary.get('average_score', '-')}/100 ({confidence_summary.get('label', '-')})",
+            13, "    ",
         )
         for name, score in list((confidence_summary.get("categories", {}) or {}).items())[:8]:
             label = str(name).replace("_", " ").title()
-            write(f"    {label:16}: {score}/100")
+            report.kv(label, f"{score}/100", 16, "    ")
 
-    write("└" + "─" * 89 + "┘")
+    report.rule("└" + "─" * 89 + "┘")
 
 
-def _write_decisions_section(write, all_decisions):
+def _write_decisions_section(report, all_decisions):
     """Write the Life Guidance / Decision Engines section to the report."""
-    
-    write("\n" + "═" * 95)
-    write(" LIFE GUIDANCE — Decision Engines")
-    write("═" * 95)
+    report.banner("LIFE GUIDANCE — Decision Engines")
 
-    _write_prediction_quality_section(write, all_decisions.get("_chart_result", {}), all_decisions)
+    _write_prediction_quality_section(report, all_decisions.get("_chart_result", {}), all_decisions)
 
     # ── Advanced Life Analysis ──────────────────────────────────────────────
     life = all_decisions.get("life_analysis", {})
     if life:
-        write("\n┌─ ADVANCED LIFE ANALYSIS ──────────────────────────────────────────────────────────────┐")
+        report.box("ADVANCED LIFE ANALYSIS")
         confidence = _format_confidence(life)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
 
         phase = life.get("current_life_phase", {})
         if phase:
-            write("\n  Current Life Phase:")
-            write(f"    Mahadasha   : {phase.get('mahadasha', '-')}")
-            write(f"    Antardasha  : {phase.get('antardasha', '-')}")
+            report.heading("Current Life Phase", "  ", gap=True)
+            report.kv("Mahadasha", phase.get("mahadasha", "-"), 12, "    ")
+            report.kv("Antardasha", phase.get("antardasha", "-"), 12, "    ")
             theme = phase.get("theme", "")
             if theme:
-                write(f"    Theme       : {theme}")
+                report.kv("Theme", theme, 12, "    ")
 
         strongest = life.get("strongest_domains", [])
         if strongest:
-            write("\n  Strongest Domains:")
+            report.heading("Strongest Domains", "  ", gap=True)
             for item in strongest[:3]:
-                write(
-                    f"    • {item.get('domain', '')}: {item.get('score', '-')}/100 "
-                    f"({item.get('status', '')})"
+                report.bullet(
+                    f"{item.get('domain', '')}: {item.get('score', '-')}/100 "
+                    f"({item.get('status', '')})",
+                    indent="    ",
                 )
 
         attention = life.get("attention_domains", [])
         if attention:
-            write("\n  Domains Needing Attention:")
+            report.heading("Domains Needing Attention", "  ", gap=True)
             for item in attention[:3]:
-                write(
-                    f"    • {item.get('domain', '')}: {item.get('score', '-')}/100 "
-                    f"({item.get('status', '')})"
+                report.bullet(
+                    f"{item.get('domain', '')}: {item.get('score', '-')}/100 "
+                    f"({item.get('status', '')})",
+                    indent="    ",
                 )
 
         longevity = life.get("longevity_profile", {})
         if longevity:
-            write("\n  Longevity & Risk Profile:")
-            write(
-                f"    Resilience  : {longevity.get('overall_resilience', '-')}"
-                f" ({longevity.get('overall_resilience_score', '-')}/100)"
+            report.heading("Longevity & Risk Profile", "  ", gap=True)
+            report.kv(
+                "Resilience",
+                f"{longevity.get('overall_resilience', '-')}"
+                f" ({longevity.get('overall_resilience_score', '-')}/100)",
+                12, "    ",
             )
             for item in longevity.get("protective_factors", [])[:3]:
-                write(f"    + {item}")
+                report.bullet(item, "+", "    ")
             for item in longevity.get("risk_factors", [])[:3]:
-                write(f"    ! {item}")
+                report.bullet(item, "!", "    ")
             for item in longevity.get("sensitive_periods", [])[:3]:
-                write(f"    • Sensitive: {item}")
+                report.bullet(f"Sensitive: {item}", indent="    ")
             note = longevity.get("note", "")
             if note:
-                write(f"    Note        : {note}")
+                report.kv("Note", note, 12, "    ")
 
         timing = life.get("timing_overview", [])
         if timing:
-            write("\n  Timing Overview:")
+            report.heading("Timing Overview", "  ", gap=True)
             for item in timing[:6]:
-                write(
-                    f"    • {item.get('domain', item.get('event', ''))}: "
-                    f"{item.get('period', '')}"
+                report.bullet(
+                    f"{item.get('domain', item.get('event', ''))}: "
+                    f"{item.get('period', '')}",
+                    indent="    ",
                 )
 
         advice = life.get("master_advice", "")
         if advice:
-            write(f"\n  Life Strategy: {advice}")
+            report.kv("Life Strategy", advice, indent="  ", gap=True)
 
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
     
     # ── Career Guidance ──────────────────────────────────────────────────────
     career = all_decisions.get("career", {})
     if career:
-        write("\n┌─ CAREER GUIDANCE ─────────────────────────────────────────────────────────────────────┐")
+        report.box("CAREER GUIDANCE")
         confidence = _format_confidence(career)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         fields = career.get("recommended_fields", [])
         if fields:
-            write("\n  Recommended Career Fields:")
+            report.heading("Recommended Career Fields", "  ", gap=True)
             for i, field in enumerate(fields[:10], 1):
-                write(f"    {i:2d}. {field}")
+                report.bullet(field, f"{i:2d}.", "    ")
         
         period = career.get("current_dasha", career.get("current_period", {}))
         if period:
-            write("\n  Current Career Period:")
-            write(f"    Mahadasha   : {period.get('mahadasha', '-')}")
-            write(f"    Antardasha  : {period.get('antardasha', '-')}")
+            report.heading("Current Career Period", "  ", gap=True)
+            report.kv("Mahadasha", period.get("mahadasha", "-"), 12, "    ")
+            report.kv("Antardasha", period.get("antardasha", "-"), 12, "    ")
             good = "Yes ✓" if career.get("good_period_for_career_change", period.get("good_for_career")) else "No"
-            write(f"    Good Period : {good}")
+            report.kv("Good Period", good, 12, "    ")
         
         advice = career.get("advice", "")
         if advice:
-            write(f"\n  Career Advice: {advice}")
+            report.kv("Career Advice", advice, indent="  ", gap=True)
         
         d10 = career.get("d10_insights", [])
         if d10:
-            write("\n  Dasamsa (D10) Insights:")
+            report.heading("Dasamsa (D10) Insights", "  ", gap=True)
             for insight in d10[:5]:
-                write(f"    • {insight}")
+                report.bullet(insight, indent="    ")
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Marriage Guidance ────────────────────────────────────────────────────
     marriage = all_decisions.get("marriage", {})
     if marriage:
-        write("\n┌─ MARRIAGE & RELATIONSHIPS ────────────────────────────────────────────────────────────┐")
+        report.box("MARRIAGE & RELATIONSHIPS")
         confidence = _format_confidence(marriage)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         readiness = marriage.get("readiness", "")
         if readiness:
-            write(f"\n  Marriage Readiness: {readiness}")
+            report.kv("Marriage Readiness", readiness, indent="  ", gap=True)
         
         windows = marriage.get("favorable_periods", marriage.get("favorable_windows", []))
         if windows:
-            write("\n  Favorable Marriage Windows:")
+            report.heading("Favorable Marriage Windows", "  ", gap=True)
             for i, window in enumerate(windows[:6], 1):
                 if isinstance(window, dict):
                     period = window.get("period", window.get("window", str(window)))
-                    write(f"    {i}. {period}")
+                    report.bullet(period, f"{i}.", "    ")
                 else:
-                    write(f"    {i}. {window}")
+                    report.bullet(window, f"{i}.", "    ")
         
         spouse = marriage.get("spouse_characteristics", {})
         if spouse:
-            write("\n  Spouse Characteristics:")
+            report.heading("Spouse Characteristics", "  ", gap=True)
             for k, v in list(spouse.items())[:8]:
                 label = str(k).replace("_", " ").title()
-                write(f"    {label:20}: {v}")
+                report.kv(label, v, 20, "    ")
         
         advice = marriage.get("advice", "")
         if advice:
-            write(f"\n  Marriage Advice: {advice}")
+            report.kv("Marriage Advice", advice, indent="  ", gap=True)
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Business & Finance ───────────────────────────────────────────────────
     business = all_decisions.get("business", {})
     if business:
-        write("\n┌─ BUSINESS & FINANCE ──────────────────────────────────────────────────────────────────┐")
+        report.box("BUSINESS & FINANCE")
         confidence = _format_confidence(business)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         aptitude = business.get("aptitude", business.get("business_aptitude", ""))
         if aptitude:
-            write(f"\n  Business Aptitude: {aptitude}")
+            report.kv("Business Aptitude", aptitude, indent="  ", gap=True)
         
         sectors = business.get("recommended_sectors", business.get("sectors", []))
         if sectors:
-            write("\n  Recommended Business Sectors:")
+            report.heading("Recommended Business Sectors", "  ", gap=True)
             for i, sector in enumerate(sectors[:8], 1):
-                write(f"    {i}. {sector}")
+                report.bullet(sector, f"{i}.", "    ")
         
         fin_period = business.get("financial_period", business.get("current_period", {}))
         if fin_period and isinstance(fin_period, dict):
-            write("\n  Current Financial Period:")
+            report.heading("Current Financial Period", "  ", gap=True)
             for k, v in list(fin_period.items())[:6]:
                 label = str(k).replace("_", " ").title()
-                write(f"    {label:20}: {v}")
+                report.kv(label, v, 20, "    ")
         
         invest = business.get("investment_advice", business.get("advice", ""))
         if invest:
-            write(f"\n  Financial Advice: {invest}")
+            report.kv("Financial Advice", invest, indent="  ", gap=True)
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Health Guidance ──────────────────────────────────────────────────────
     health = all_decisions.get("health", {})
     if health:
-        write("\n┌─ HEALTH GUIDANCE ─────────────────────────────────────────────────────────────────────┐")
+        report.box("HEALTH GUIDANCE")
         confidence = _format_confidence(health)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         constitution = health.get("constitution", health.get("body_type", ""))
         if constitution:
-            write(f"\n  Constitution: {constitution}")
+            report.kv("Constitution", constitution, indent="  ", gap=True)
         
         areas = health.get("vulnerable_areas", health.get("health_concerns", []))
         if areas:
-            write("\n  Areas Requiring Attention:")
+            report.heading("Areas Requiring Attention", "  ", gap=True)
             for area in areas[:8]:
                 if isinstance(area, dict):
                     name = area.get("area", area.get("name", str(area)))
-                    write(f"    • {name}")
+                    report.bullet(name, indent="    ")
                 else:
-                    write(f"    • {area}")
+                    report.bullet(area, indent="    ")
         
         practices = health.get("favorable_practices", health.get("recommendations", []))
         if practices:
-            write("\n  Recommended Health Practices:")
+            report.heading("Recommended Health Practices", "  ", gap=True)
             for practice in practices[:8]:
-                write(f"    • {practice}")
+                report.bullet(practice, indent="    ")
         
         advice = health.get("advice", "")
         if advice:
-            write(f"\n  Health Advice: {advice}")
+            report.kv("Health Advice", advice, indent="  ", gap=True)
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Travel Guidance ──────────────────────────────────────────────────────
     travel = all_decisions.get("travel", {})
     if travel:
-        write("\n┌─ TRAVEL & RELOCATION ─────────────────────────────────────────────────────────────────┐")
+        report.box("TRAVEL & RELOCATION")
         confidence = _format_confidence(travel)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         best_dir = travel.get("best_travel_direction", "")
         home_dir = travel.get("home_direction", "")
         if best_dir or home_dir:
-            write("\n  Directions:")
+            report.heading("Directions", "  ", gap=True)
             if best_dir:
-                write(f"    Best for Travel  : {best_dir}")
+                report.kv("Best for Travel", best_dir, 17, "    ")
             if home_dir:
-                write(f"    Home Direction   : {home_dir}")
+                report.kv("Home Direction", home_dir, 17, "    ")
 
         foreign_likelihood = travel.get("foreign_settlement_likelihood", "")
         foreign_score = travel.get("foreign_indicators_score", "")
         if foreign_likelihood:
-            write(f"\n  Foreign Settlement Likelihood: {foreign_likelihood}")
+            report.kv("Foreign Settlement Likelihood", foreign_likelihood, indent="  ", gap=True)
             if foreign_score:
-                write(f"    Indicators Score : {foreign_score}")
+                report.kv("Indicators Score", foreign_score, 17, "    ")
         
         timing = travel.get("favorable_periods", travel.get("timing", []))
         if timing:
-            write("\n  Favorable Travel Periods:")
+            report.heading("Favorable Travel Periods", "  ", gap=True)
             for period in timing[:5]:
-                write(f"    • {period}")
+                report.bullet(period, indent="    ")
         
         advice = travel.get("advice", "")
         if advice:
-            write(f"\n  Travel Advice: {advice}")
+            report.kv("Travel Advice", advice, indent="  ", gap=True)
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Education Guidance ───────────────────────────────────────────────────
     education = all_decisions.get("education", {})
     if education:
-        write("\n┌─ EDUCATION GUIDANCE ──────────────────────────────────────────────────────────────────┐")
+        report.box("EDUCATION GUIDANCE")
         confidence = _format_confidence(education)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
         
         style = education.get("learning_style", "")
         if style:
-            write(f"\n  Learning Style: {style}")
+            report.kv("Learning Style", style, indent="  ", gap=True)
         
         fields = education.get("recommended_fields", education.get("fields", []))
         if fields:
-            write("\n  Recommended Fields of Study:")
+            report.heading("Recommended Fields of Study", "  ", gap=True)
             for i, field in enumerate(fields[:10], 1):
-                write(f"    {i:2d}. {field}")
+                report.bullet(field, f"{i:2d}.", "    ")
         
         periods = education.get("favorable_periods", education.get("academic_periods", []))
         if periods:
-            write("\n  Favorable Academic Periods:")
+            report.heading("Favorable Academic Periods", "  ", gap=True)
             for period in periods[:5]:
                 if isinstance(period, dict):
-                    write(f"    • {period.get('period', str(period))}")
+                    report.bullet(period.get("period", str(period)), indent="    ")
                 else:
-                    write(f"    • {period}")
+                    report.bullet(period, indent="    ")
         
         advice = education.get("advice", "")
         if advice:
-            write(f"\n  Education Advice: {advice}")
+            report.kv("Education Advice", advice, indent="  ", gap=True)
         
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
     # ── Daily Guidance ───────────────────────────────────────────────────────
     daily = all_decisions.get("daily_guidance", {})
     if daily:
-        write("\n┌─ DAILY GUIDANCE & MUHURTHA ───────────────────────────────────────────────────────────┐")
+        report.box("DAILY GUIDANCE & MUHURTHA")
         confidence = _format_confidence(daily)
         if confidence:
-            write(f"\n  Prediction Confidence: {confidence}")
+            report.kv("Prediction Confidence", confidence, indent="  ", gap=True)
 
         day_rating = daily.get("day_rating", "")
         day_score = daily.get("day_score", "")
         if day_rating:
             score_str = f" ({day_score}/100)" if day_score else ""
-            write(f"\n  Day Rating: {day_rating}{score_str}")
+            report.kv("Day Rating", f"{day_rating}{score_str}", indent="  ", gap=True)
 
         dasha = daily.get("current_dasha", {})
         if dasha:
-            write(f"  Current Dasha: {dasha.get('mahadasha', '-')} / {dasha.get('antardasha', '-')}")
+            report.kv(
+                "Current Dasha",
+                f"{dasha.get('mahadasha', '-')} / {dasha.get('antardasha', '-')}",
+                indent="  ",
+            )
 
         favorable = daily.get("favorable_transits", [])
         if favorable:
-            write("\n  Favorable Transits:")
+            report.heading("Favorable Transits", "  ", gap=True)
             for t in favorable[:5]:
-                write(f"    ✓ {t}")
+                report.bullet(t, "✓", "    ")
 
         challenging = daily.get("challenging_transits", [])
         if challenging:
-            write("\n  Challenging Transits:")
+            report.heading("Challenging Transits", "  ", gap=True)
             for t in challenging[:5]:
-                write(f"    ✗ {t}")
+                report.bullet(t, "✗", "    ")
 
         panch = daily.get("panchanga", {})
         if panch and any(panch.values()):
-            write("\n  Panchanga:")
+            report.heading("Panchanga", "  ", gap=True)
             for k in ("tithi", "vara", "yoga", "karana", "nakshatra"):
                 v = panch.get(k)
                 if v:
-                    write(f"    {k.title():12}: {v}")
+                    report.kv(k.title(), v, 12, "    ")
 
         pakshi = daily.get("pancha_pakshi", {})
         if pakshi and any(pakshi.values()):
-            write("\n  Pancha Pakshi:")
+            report.heading("Pancha Pakshi", "  ", gap=True)
             for k, v in pakshi.items():
                 if v:
                     label = str(k).replace("_", " ").title()
-                    write(f"    {label:20}: {v}")
+                    report.kv(label, v, 20, "    ")
 
         muhurtha_grade = daily.get("muhurtha_grade", "")
         muhurtha_score = daily.get("muhurtha_score", "")
         if muhurtha_grade or muhurtha_score:
-            write(f"\n  Muhurtha: {muhurtha_grade} (score {muhurtha_score})")
+            report.kv("Muhurtha", f"{muhurtha_grade} (score {muhurtha_score})", indent="  ", gap=True)
 
         tips = daily.get("daily_tips", [])
         if tips:
-            write("\n  Daily Tips:")
+            report.heading("Daily Tips", "  ", gap=True)
             for tip in tips[:5]:
-                write(f"    • {tip}")
+                report.bullet(tip, indent="    ")
 
-        write("└" + "─" * 89 + "┘")
+        report.rule("└" + "─" * 89 + "┘")
 
-    write("")
+    report.write("")
 
 
-def print_kundali(result, file=None):
-    """Print the complete kundali report to console and optionally to a file."""
-    lines = []
+def build_report(result):
+    """Build the complete kundali report as a ``ReportDocument``."""
+    report = ReportWriter()
+    write = report.write
     gender = result.get("gender", "Male")
 
-    def write(s):
-        lines.append(s)
-
-    write("\n" + "═" * 95)
-    write(" VEDIC KUNDALI – Whole Sign – Lahiri – D7 + D10 + Marriage Timing")
-    write("═" * 95)
-    write(f"Name         : {result.get('name', 'Not provided')}")
-    write(f"Gender       : {gender}")
-    write(f"Birth Date   : {result.get('birth_date', 'N/A')}")
-    write(f"Birth Time   : {result.get('birth_time', 'N/A')}")
-    write(f"Birth Place  : {result.get('birth_place', 'N/A')}")
-    write(f"Lagna        : {result['lagna_sign']} {result['lagna_deg']}°")
-    write(f"Moon (Rasi)  : {result['moon_sign']} – {result['moon_nakshatra']}")
-    write(f"7th Lord     : {short_to_full.get(result['seventh_lord'], result['seventh_lord'])}")
-    write(f"Ayanamsa     : {result.get('ayanamsa', 'Lahiri')}")
+    report.header("VEDIC KUNDALI – Whole Sign – Lahiri – D7 + D10 + Marriage Timing")
+    report.kv("Name", result.get("name", "Not provided"), 13)
+    report.kv("Gender", gender, 13)
+    report.kv("Birth Date", result.get("birth_date", "N/A"), 13)
+    report.kv("Birth Time", result.get("birth_time", "N/A"), 13)
+    report.kv("Birth Place", result.get("birth_place", "N/A"), 13)
+    report.kv("Lagna", f"{result['lagna_sign']} {result['lagna_deg']}°", 13)
+    report.kv("Moon (Rasi)", f"{result['moon_sign']} – {result['moon_nakshatra']}", 13)
+    report.kv("7th Lord", short_to_full.get(result["seventh_lord"], result["seventh_lord"]), 13)
+    report.kv("Ayanamsa", result.get("ayanamsa", "Lahiri"), 13)
     # Panchanga
     pan = result.get("panchanga", {})
     if pan:
-        write(f"Tithi        : {pan.get('tithi','?')}")
-        write(f"Vara         : {pan.get('vara','?')}")
-        write(f"Yoga         : {pan.get('yoga','?')}")
-        write(f"Karana       : {pan.get('karana','?')}")
-    write("")
+        report.kv("Tithi", pan.get("tithi", "?"), 13)
+        report.kv("Vara", pan.get("vara", "?"), 13)
+        report.kv("Yoga", pan.get("yoga", "?"), 13)
+        report.kv("Karana", pan.get("karana", "?"), 13)
 
     order = ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa", "Ra", "Ke"]
-    write("Planets in Rasi (D1):")
-    write("-" * 85)
+    report.section("Planets in Rasi (D1):")
+    rows = []
+    positions = {}
     for pl in order:
         if pl in result["planets"]:
             d = result["planets"][pl]
@@ -473,61 +497,71 @@ def print_kundali(result, file=None):
                 flags += " C"
             # Dignity label — append NB when neecha bhanga cancels debilitation
             dig_label = d["dignity"]
-            if dig_label == "Debilitated" and d.get("neecha_bhanga", False):
+            neecha_bhanga = dig_label == "Debilitated" and bool(d.get("neecha_bhanga", False))
+            if neecha_bhanga:
                 dig_label = "Debilitated (NB)"
             dig = f" ({dig_label})" if dig_label else ""
-            write(
+            rows.append(
                 f"{pl:>3}: {d['deg']:5.2f}° {d['sign']:11} {d['nakshatra']:18}{dig}{flags}"
             )
-    write(
-        "  (R = Retrograde, C = Combust/Astangata – weakened by closeness to Sun, NB = Neecha Bhanga – debilitation cancelled)"
+            positions[pl] = {
+                "sign": d["sign"],
+                "deg": round(d["deg"], 2),
+                "retro": bool(d.get("retro")),
+                "combust": bool(d.get("combust")),
+                "neecha_bhanga": neecha_bhanga,
+            }
+    report.table(rows, data=positions)
+    report.chart = {"lagna": result["lagna_sign"], "planets": positions}
+    report.note(
+        "(R = Retrograde, C = Combust/Astangata – weakened by closeness to Sun, NB = Neecha Bhanga – debilitation cancelled)",
+        "  ",
     )
 
-    for div, title, interp_fn in [
-        ("navamsa", "Navamsa (D9 – Marriage/Spouse/Dharma)", interpret_navamsa),
-        ("d7", "Saptamsa (D7 – Children/Progeny)", interpret_d7),
-        ("d10", "Dasamsa (D10 – Career/Profession)", interpret_d10),
-        ("d60", "Shashtiamsa (D60 – Past Life Karma)", interpret_d60),
+    for div, title, write_analysis in [
+        ("navamsa", "Navamsa (D9 – Marriage/Spouse/Dharma)", write_navamsa_analysis),
+        ("d7", "Saptamsa (D7 – Children/Progeny)", write_d7_analysis),
+        ("d10", "Dasamsa (D10 – Career/Profession)", write_d10_analysis),
+        ("d60", "Shashtiamsa (D60 – Past Life Karma)", write_d60_analysis),
     ]:
-        write(f"\n{title}:")
-        write("-" * 85)
-        for pl in order:
-            if pl in result[div]:
-                d = result[div][pl]
-                write(f"{pl:>3}: {d['deg']:5.2f}° {d['sign']:11}")
-        write(f"\nDetailed {title.split('(')[1].rstrip(')')} Analysis:")
-        write("-" * 85)
-        for line in interp_fn(result):
-            write(line)
-
-    write("\nHouses (Whole Sign):")
-    write("-" * 85)
+        report.section(f"{title}:")
+        report.table(
+            [
+                f"{pl:>3}: {result[div][pl]['deg']:5.2f}° {result[div][pl]['sign']:11}"
+                for pl in order
+                if pl in result[div]
+            ]
+        )
+        report.section(f"Detailed {title.split('(')[1].rstrip(')')} Analysis:")
+        write_analysis(report, result)
+
+    report.section("Houses (Whole Sign):")
     lagna_idx = zodiac_signs.index(result["lagna_sign"])
+    rows = []
+    occupants = {}
     for h in range(1, 13):
         sidx = (lagna_idx + h - 1) % 12
         sign = zodiac_signs[sidx]
         pls = sorted(result["houses"][h])
         content = " ".join(pls) if pls else "—"
-        write(f"House {h:2d} ({sign:11}): {content}")
+        rows.append(f"House {h:2d} ({sign:11}): {content}")
+        occupants[h] = {"sign": sign, "planets": pls}
+    report.table(rows, data=occupants)
 
-    write("\nAspects (Drishti) – Summary:")
-    write("-" * 85)
+    report.section("Aspects (Drishti) – Summary:")
     for h in range(1, 13):
         if result["aspects"][h]:
-            write(f"House {h:2d}: {', '.join(result['aspects'][h])}")
+            report.kv(f"House {h:2d}", ", ".join(result["aspects"][h]))
 
-    write("\nAspects (Drishti) – Full Analysis:")
-    write("-" * 85)
-    write(
+    report.section("Aspects (Drishti) – Full Analysis:")
+    report.note(
         "Aspect strengths: 7th=100% | Jupiter 5th/9th=75% | Mars 8th=75% | Saturn 10th=75% | Mars 4th=50% | Saturn 3rd=25%"
     )
-    for line in interpret_aspects(result):
-        write(line)
+    write_aspect_analysis(report, result)
 
     # Ashtakavarga (SAV)
-    write("\nAshtakavarga (Sarvashtakavarga - Marriage & Life Support Index):")
-    write("-" * 85)
-    write(
+    report.section("Ashtakavarga (Sarvashtakavarga - Marriage & Life Support Index):")
+    report.note(
         "(SAV measures accumulated benefic points for each house. Marriage astrology heavily relies on 7th house SAV.)"
     )
     ashtak = result.get("ashtakavarga", {})
@@ -538,7 +572,8 @@ def print_kundali(result, file=None):
         lagna_idx_av = zodiac_signs.index(result["lagna_sign"])
 
         # Show all house SAV scores
-        write("\nSAV Points by House:")
+        report.heading("SAV Points by House", gap=True)
+        rows = []
         for h in range(1, 13):
             house_idx = (h - 1 + lagna_idx_av) % 12
             score = sav_scores[house_idx] if house_idx < len(sav_scores) else 0
@@ -554,14 +589,15 @@ def print_kundali(result, file=None):
 
             # Highlight 7th house (marriage)
             marker = " ★ MARRIAGE HOUSE" if h == 7 else ""
-            write(f"  H{h:02d} ({sign:11}): [{bar}] {score:2} pts - {strength}{marker}")
+            rows.append(f"  H{h:02d} ({sign:11}): [{bar}] {score:2} pts - {strength}{marker}")
+        report.table(rows)
 
         # Special focus on 7th house
         h7_data = interpretation.get(7, {})
         h7_score = h7_data.get("score", 0)
         h7_strength = h7_data.get("strength", "Unknown")
 
-        write(f"\n  ★ 7th House (Marriage) SAV: {h7_score} points - {h7_strength}")
+        report.kv("★ 7th House (Marriage) SAV", f"{h7_score} points - {h7_strength}", indent="  ", gap=True)
 
         if h7_score >= 28:
             marriage_interp = (
@@ -574,19 +610,21 @@ def print_kundali(result, file=None):
         else:
             marriage_interp = "Weak marriage support. Extra effort, patience, or remedies recommended."
 
-        write(f"     Interpretation for Marriage: {marriage_interp}")
+        report.kv("Interpretation for Marriage", marriage_interp, indent="     ")
 
-        write(
-            "\n  SAV Scoring Legend: ≥28 = Excellent | 25-27 = Good | 22-24 = Average | <22 = Weak"
+        report.note(
+            "SAV Scoring Legend: ≥28 = Excellent | 25-27 = Good | 22-24 = Average | <22 = Weak",
+            "  ",
+            gap=True,
         )
-        write(
-            "  Note: Low SAV doesn't mean 'no marriage' - it indicates more effort/karma to work through."
+        report.note(
+            "Note: Low SAV doesn't mean 'no marriage' - it indicates more effort/karma to work through.",
+            "  ",
         )
 
     # Functional Benefics/Malefics with Strength Index
-    write("\nFunctional Classification Strength Index (by Lagna):")
-    write("-" * 85)
-    write(
+    report.section("Functional Classification Strength Index (by Lagna):")
+    report.note(
         "(Nuanced scoring: Base functional status + D1 dignity + D9 dignity + House placement)"
     )
     write("")
@@ -598,17 +636,16 @@ def print_kundali(result, file=None):
         maraka_names = [short_to_full.get(p, p) for p in fq.get("maraka", [])]
         mixed_names = [short_to_full.get(p, p) for p in fq.get("mixed", [])]
         yk = fq.get("yk")
-        write(f"  Base Benefics    : {', '.join(ben_names) if ben_names else '—'}")
-        write(f"  Base Malefics    : {', '.join(mal_names) if mal_names else '—'}")
-        write(
-            f"  Marakas (2/7)    : {', '.join(maraka_names) if maraka_names else '—'}"
-        )
-        write(f"  Mixed Nature     : {', '.join(mixed_names) if mixed_names else '—'}")
+        report.kv("Base Benefics", ", ".join(ben_names) if ben_names else "—", 17, "  ")
+        report.kv("Base Malefics", ", ".join(mal_names) if mal_names else "—", 17, "  ")
+        report.kv("Marakas (2/7)", ", ".join(maraka_names) if maraka_names else "—", 17, "  ")
+        report.kv("Mixed Nature", ", ".join(mixed_names) if mixed_names else "—", 17, "  ")
         if yk:
-            write(f"  Yogakaraka       : {short_to_full.get(yk, yk)}")
+            report.kv("Yogakaraka", short_to_full.get(yk, yk), 17, "  ")
         write("")
-        write("  FUNCTIONAL STRENGTH INDEX (Adjusted for this chart):")
-        write("  " + "-" * 80)
+        report.heading("FUNCTIONAL STRENGTH INDEX (Adjusted for this chart)", "  ")
+        report.rule("  " + "-" * 80)
+        rows = []
         for pl in ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa"]:
             if pl in result["planets"]:
                 fsi = calculate_functional_strength_index(result, pl)
@@ -616,22 +653,23 @@ def print_kundali(result, file=None):
                 bar = "█" * (score // 5) + "░" * (20 - score // 5)
                 pl_full = short_to_full.get(pl, pl)
                 mods = ", ".join(fsi["modifiers"]) if fsi["modifiers"] else "—"
-                write(f"  {pl_full:9} [{bar}] {score:3}/100 | {fsi['effective_class']}")
-                write(f"             Base: {fsi['base_class']:12} | Modifiers: {mods}")
+                rows.append(f"  {pl_full:9} [{bar}] {score:3}/100 | {fsi['effective_class']}")
+                rows.append(f"             Base: {fsi['base_class']:12} | Modifiers: {mods}")
+        report.table(rows)
         write("")
-        write(
-            "  Legend: ≥80 Strong Benefic | ≥65 Conditional Benefic | ≥50 Neutral-Positive"
+        report.note(
+            "Legend: ≥80 Strong Benefic | ≥65 Conditional Benefic | ≥50 Neutral-Positive", "  "
         )
-        write("          ≥35 Conditional Malefic | <35 Functional Malefic")
-        write(
-            "  Note: A 'Malefic' planet in own sign/exalted becomes Conditional Benefic."
+        report.note("≥35 Conditional Malefic | <35 Functional Malefic", "          ")
+        report.note(
+            "Note: A 'Malefic' planet in own sign/exalted becomes Conditional Benefic.", "  "
         )
 
     # House Lord Placements
-    write("\nHouse Lord Placements:")
-    write("-" * 85)
+    report.section("House Lord Placements:")
     hl_map = result.get("house_lords", {})
     lagna_idx_p = zodiac_signs.index(result["lagna_sign"])
+    rows = []
     for h_num in range(1, 13):
         h_sign = zodiac_signs[(lagna_idx_p + h_num - 1) % 12]
         info = hl_map.get(h_num, {})
@@ -647,38 +685,39 @@ def print_kundali(result, file=None):
                 f"Lord of House {h_num} ({h_sign}) placed in House {placed} ({placed_sign}): "
                 f"House {h_num} themes expressed through the environment of House {placed}."
             )
-        write(
+        rows.append(
             f"  H{h_num:02d} ({h_sign:11}) lord {lord_full:9} → H{placed:02d} ({placed_sign:11}): "
             f"{meaning.split(':')[-1].strip()}"
         )
+    report.table(rows)
 
     # Jaimini Charakaraka
-    write("\nJaimini Charakaraka (The Seven Significators):")
-    write("-" * 85)
-    write("(Based on highest planetary longitude – nodes excluded)")
+    report.section("Jaimini Charakaraka (The Seven Significators):")
+    report.note("(Based on highest planetary longitude – nodes excluded)")
     jai = result.get("jaimini", {})
     karakas = jai.get("charakaraka", {})
     if karakas:
         for role, planet in karakas.items():
-            write(f"  {role:14} : {short_to_full.get(planet, planet)}")
+            report.kv(role, short_to_full.get(planet, planet), 14, "  ", sep=" : ")
         atm = jai.get("atmakaraka")
         kl = jai.get("karakamsa_lagna")
         if atm and kl:
-            write(f"\n  Karakamsa Lagna (Atmakaraka in D9) : {kl}")
-            write(
-                f"    → The soul's ultimate direction; planets conjunct or aspecting {kl} in D9 gain immense power."
+            report.kv("Karakamsa Lagna (Atmakaraka in D9)", kl, indent="  ", sep=" : ", gap=True)
+            report.bullet(
+                f"The soul's ultimate direction; planets conjunct or aspecting {kl} in D9 gain immense power.",
+                "→", "    ",
             )
     else:
         write("  Could not determine karakas.")
 
     # Cross-Chart Planetary Integrity Index
-    write("\nCross-Chart Planetary Integrity Index (D1-D9-D10-D7):")
-    write("-" * 85)
-    write(
+    report.section("Cross-Chart Planetary Integrity Index (D1-D9-D10-D7):")
+    report.note(
         "(Measures each planet's consistency across divisional charts – D9 weighted ×2 for marriage context)"
     )
     write("")
 
+    rows = []
     for pl in ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa"]:
         if pl not in result["planets"]:
             continue
@@ -742,15 +781,15 @@ def print_kundali(result, file=None):
         bar = "█" * (integrity_score // 5) + "░" * (20 - integrity_score // 5)
         pl_full = short_to_full.get(pl, pl)
         pos_str = " | ".join([f"{k}:{v}" for k, v in positions.items()])
-        write(f"  {pl_full:9} [{bar}] {integrity_score:3}/100 | {reliability}")
-        write(f"             Positions: {pos_str}")
+        rows.append(f"  {pl_full:9} [{bar}] {integrity_score:3}/100 | {reliability}")
+        rows.append(f"             Positions: {pos_str}")
+    report.table(rows)
     write("")
 
-    write("\nVimshottari Dasha:")
-    write("-" * 85)
+    report.section("Vimshottari Dasha:")
     vim = result["vimshottari"]
-    write(
-        f"Starting MD : {vim['starting_lord']} (balance {vim['balance_at_birth_years']} yrs)"
+    report.kv(
+        "Starting MD", f"{vim['starting_lord']} (balance {vim['balance_at_birth_years']} yrs)", sep=" : "
     )
     if vim["current_md"]:
         pd_info = result.get("vimshottari_pd", {})
@@ -760,19 +799,20 @@ def print_kundali(result, file=None):
             pd_end_yr = int(
                 result["birth_year"] + (pd_end_jd - result["birth_jd"]) / 365.25
             )
-            write(
-                f"Current (MD/AD/PD) : {vim['current_md']} / {vim['current_ad']} / {current_pd} (PD until ~{pd_end_yr})"
+            report.kv(
+                "Current (MD/AD/PD)",
+                f"{vim['current_md']} / {vim['current_ad']} / {current_pd} (PD until ~{pd_end_yr})",
+                sep=" : ",
             )
         else:
-            write(f"Current (MD/AD) : {vim['current_md']} / {vim['current_ad']}")
+            report.kv("Current (MD/AD)", f"{vim['current_md']} / {vim['current_ad']}", sep=" : ")
 
     # Gender-specific marriage analysis
     spouse_term = "husband" if gender == "Female" else "wife"
     spouse_karaka = "Jupiter" if gender == "Female" else "Venus"
     spouse_karaka_short = "Ju" if gender == "Female" else "Ve"
 
-    write(f"\nMarriage Timing Insights (Enhanced Parashari) – For {gender}:")
-    write("-" * 85)
+    report.section(f"Marriage Timing Insights (Enhanced Parashari) – For {gender}:")
     # Calculate key factors
     lagna_idx = zodiac_signs.index(result["lagna_sign"])
 
@@ -782,12 +822,12 @@ def print_kundali(result, file=None):
     seventh_lord = result["seventh_lord"]
     second_lord = lord_of_h(2)
 
-    write(
-        f"  7th Lord ({spouse_term}): {short_to_full.get(seventh_lord, seventh_lord)}"
-    )
-    write(f"  2nd Lord (family)    : {short_to_full.get(second_lord, second_lord)}")
-    write(
-        f"  {spouse_karaka} ({spouse_term} karaka): {result['planets'].get(spouse_karaka_short, {}).get('sign', '?')}"
+    report.kv(f"7th Lord ({spouse_term})", short_to_full.get(seventh_lord, seventh_lord), indent="  ")
+    report.kv("2nd Lord (family)", short_to_full.get(second_lord, second_lord), 21, "  ")
+    report.kv(
+        f"{spouse_karaka} ({spouse_term} karaka)",
+        result["planets"].get(spouse_karaka_short, {}).get("sign", "?"),
+        indent="  ",
     )
 
     # D9 spouse karaka status (gender-specific)
@@ -797,15 +837,18 @@ def print_kundali(result, file=None):
         d9_status = f"{karaka_d9.get('sign', '?')}"
         if karaka_d9_dig:
             d9_status += f" ({karaka_d9_dig})"
-        write(f"  D9 {spouse_karaka}          : {d9_status}")
+        report.kv(f"D9 {spouse_karaka}", d9_status, indent="  ", sep="          : ")
 
-    write(
-        f"\n  Probability factors scored: 7th lord (+3), {spouse_karaka} (+3), 2nd lord (+2),"
+    report.note(
+        f"Probability factors scored: 7th lord (+3), {spouse_karaka} (+3), 2nd lord (+2),",
+        "  ",
+        gap=True,
     )
-    write(
-        f"  {'Venus' if gender == 'Female' else 'Jupiter'} (+1), D9 {spouse_karaka} dignity (+1), D9 7th lord (+1), house placement (+1)"
+    report.note(
+        f"{'Venus' if gender == 'Female' else 'Jupiter'} (+1), D9 {spouse_karaka} dignity (+1), D9 7th lord (+1), house placement (+1)",
+        "  ",
     )
-    write("  Score legend: ★★★ (7-10) High | ★★ (4-6) Moderate | ★ (1-3) Lower")
+    report.note("Score legend: ★★★ (7-10) High | ★★ (4-6) Moderate | ★ (1-3) Lower", "  ")
     vm = vim["current_md"]
     va = vim["current_ad"]
     if (
@@ -816,66 +859,76 @@ def print_kundali(result, file=None):
     ):
         write("*** CURRENT DASHA IS HIGHLY FAVOURABLE FOR MARRIAGE ***")
     else:
-        write(
-            f"Next favourable periods: {spouse_karaka} or 7th-lord Mahadasha/Antardasha (check full list)"
+        report.kv(
+            "Next favourable periods",
+            f"{spouse_karaka} or 7th-lord Mahadasha/Antardasha (check full list)",
         )
 
-    write("\nCurrent Gochara (from Moon):")
-    write("-" * 85)
-    for pl, t in sorted(result["transits"].items()):
-        write(
+    report.section("Current Gochara (from Moon):")
+    transits = sorted(result["transits"].items())
+    report.table(
+        [
             f"{pl:>3}: {t['sign']:11} (house {t['house_from_moon']:2d}) – {t['effect']}"
-        )
+            for pl, t in transits
+        ],
+        data=dict(transits),
+    )
     sade = result.get("sade_sati")
     if sade:
-        write(f"\n  ⚠ SATURN SPECIAL TRANSIT: {sade}")
+        report.bullet(f"SATURN SPECIAL TRANSIT: {sade}", "⚠", "  ", gap=True)
     else:
-        write(
-            "  ✓ No active Sade Sati or Dhaiya (Saturn not in critical position from Moon)"
+        report.bullet(
+            "No active Sade Sati or Dhaiya (Saturn not in critical position from Moon)", "✓", "  "
         )
 
-    write("\n🔥 YOGAS WITH STRENGTH (1-10) & ACCURATE TIMINGS")
-    write("-" * 95)
+    report.section("🔥 YOGAS WITH STRENGTH (1-10) & ACCURATE TIMINGS", rule="-" * 95)
     for yoga in result.get("yogas", []):
-        write(f"• {yoga}")
+        report.bullet(yoga)
 
     birth_year = result.get("birth_year", "N/A")
-    write(f"\n📅 FRUCTIFICATION PERIODS (Full Life Timeline from {birth_year})")
-    write("-" * 95)
-    write(
-        "  [PAST] = Already occurred | [NOW] = Currently active | [FUTURE] = Upcoming"
+    report.section(f"📅 FRUCTIFICATION PERIODS (Full Life Timeline from {birth_year})", rule="-" * 95)
+    report.note(
+        "[PAST] = Already occurred | [NOW] = Currently active | [FUTURE] = Upcoming", "  "
     )
-    for event, periods in result.get("timings", {}).items():
-        write(f"\n{event}:")
+    timings = result.get("timings", {})
+    for event in timings:
+        report.heading(event, gap=True)
+        if not hasattr(timings, "periods"):
+            # plain {event: [report lines]} timings (e.g. loaded from JSON)
+            for line in timings[event] or [" No major period found"]:
+                write(line)
+            continue
+        periods = timings.periods(event)
+        for p in periods:
+            if p.antara is None:
+                block = report.bullet(p.describe())
+            else:
+                block = report.bullet(p.describe(), "└─", " ")
         if periods:
-            for p in periods:
-                write(p)
+            block.data = periods
         else:
             write(" No major period found")
 
-    write("\n⚠️ PROBLEMS/DOSHAS IN KUNDALI")
-    write("-" * 95)
+    report.section("⚠️ PROBLEMS/DOSHAS IN KUNDALI", rule="-" * 95)
     for prob in result.get("problems", []):
-        write(f"• {prob['summary']}")
+        report.bullet(prob["summary"])
 
-    write("\nDetailed Explanation of Doshas:")
-    write("-" * 95)
+    report.section("Detailed Explanation of Doshas:", rule="-" * 95)
     for prob in result.get("problems", []):
         if prob["detail"]:
-            write(f"{prob['summary'].split(':')[0]}:")
-            write(prob["detail"])
+            report.heading(prob["summary"].split(":")[0])
+            _write_markdown(report, prob["detail"])
             write("")
 
-    write("\n🔧 TARGETED REMEDIES (per detected Dosha)")
-    write("-" * 95)
+    report.section("🔧 TARGETED REMEDIES (per detected Dosha)", rule="-" * 95)
     has_remedy = False
     for prob in result.get("problems", []):
         rems = prob.get("remedies", [])
         if rems:
             has_remedy = True
-            write(f"\n{prob['summary'].split(':')[0]}:")
+            report.heading(prob["summary"].split(":")[0], gap=True)
             for r in rems:
-                write(f"  • {r}")
+                report.bullet(r, indent="  ")
     if not has_remedy:
         write("  No specific remedies needed – maintain positive practices.")
 
@@ -883,28 +936,28 @@ def print_kundali(result, file=None):
     _lagna = result.get("lagna_sign", "")
     _seventh_lord = result.get("seventh_lord", "")
     _seventh_lord_full = short_to_full.get(_seventh_lord, _seventh_lord)
-    write(f"\n🛡️ PERSONALIZED REMEDIES (For {_lagna} Lagna)")
-    write("-" * 85)
+    report.section(f"🛡️ PERSONALIZED REMEDIES (For {_lagna} Lagna)")
     # Lagna-specific mantras and deities
     lagna_rem = LAGNA_REMEDIES.get(_lagna)
     if lagna_rem:
         deity, mantra, day = lagna_rem
-        write(f"  Lagna Lord Worship: {deity}")
-        write(f"  Primary Mantra: {mantra} (108× on {day}s)")
+        report.kv("Lagna Lord Worship", deity, indent="  ")
+        report.kv("Primary Mantra", f"{mantra} (108× on {day}s)", indent="  ")
     # 7th lord specific remedy for marital harmony
     seventh_rem = SEVENTH_LORD_REMEDIES.get(_seventh_lord)
     if seventh_rem:
-        write(f"  For {_seventh_lord_full} (7th Lord – marital harmony): {seventh_rem}")
+        report.kv(f"For {_seventh_lord_full} (7th Lord – marital harmony)", seventh_rem, indent="  ")
 
     # ── Ashtottari Dasha ─────────────────────────────────────────────────────
     ashto = result.get("ashtottari", {})
     if ashto and ashto.get("current_md"):
-        write("\nAshtottari Dasha (108-year system — alternate method):")
-        write("-" * 85)
-        write(
-            f"Starting MD : {ashto['starting_lord']} (balance {ashto['balance_at_birth_years']} yrs)"
+        report.section("Ashtottari Dasha (108-year system — alternate method):")
+        report.kv(
+            "Starting MD",
+            f"{ashto['starting_lord']} (balance {ashto['balance_at_birth_years']} yrs)",
+            sep=" : ",
         )
-        write(f"Current MD/AD : {ashto['current_md']} / {ashto['current_ad']}")
+        report.kv("Current MD/AD", f"{ashto['current_md']} / {ashto['current_ad']}", sep=" : ")
 
     # ── Sookshma Dasha (4th level) ────────────────────────────────────────────
     sd_info = result.get("vimshottari_sd", {})
@@ -918,64 +971,66 @@ def print_kundali(result, file=None):
         )
         vim = result.get("vimshottari", {})
         pd_info = result.get("vimshottari_pd", {})
-        write(
-            f"  Sookshma (4th level): {vim.get('current_md','?')} / "
+        report.kv(
+            "Sookshma (4th level)",
+            f"{vim.get('current_md','?')} / "
             f"{vim.get('current_ad','?')} / {pd_info.get('current_pd','?')} / "
-            f"{current_sd} (until ~{sd_end_yr})"
+            f"{current_sd} (until ~{sd_end_yr})",
+            indent="  ",
         )
 
     # ── Upagrahas ─────────────────────────────────────────────────────────────
     upagrahas = result.get("upagrahas", {})
     if upagrahas:
-        write("\nUpagrahas (Shadow / Sub-Planets):")
-        write("-" * 85)
+        report.section("Upagrahas (Shadow / Sub-Planets):")
         for name, data in upagrahas.items():
-            write(f"  {name:14}: {data['sign']:12} {data['deg']:5.2f}°")
+            report.kv(name, f"{data['sign']:12} {data['deg']:5.2f}°", 14, "  ")
 
     # ── Arudha Lagna ──────────────────────────────────────────────────────────
     al = result.get("arudha_lagna", {})
     if al:
-        write(
-            f"\nArudha Lagna (AL1) : {al.get('sign','?')} (House {al.get('house','?')})"
+        report.kv(
+            "Arudha Lagna (AL1)",
+            f"{al.get('sign','?')} (House {al.get('house','?')})",
+            sep=" : ",
+            gap=True,
         )
-        write("  (Reflects worldly image/perception — the 'mask' shown to society)")
+        report.note("(Reflects worldly image/perception — the 'mask' shown to society)", "  ")
 
     # ── Avasthas ──────────────────────────────────────────────────────────────
     avasthas = result.get("avasthas", {})
     if avasthas:
-        write("\nPlanetary Avasthas (States):")
-        write("-" * 85)
-        write("(Qualitative states that modify how each planet delivers its results)")
+        report.section("Planetary Avasthas (States):")
+        report.note("(Qualitative states that modify how each planet delivers its results)")
         for pl in order:
             if pl in avasthas:
                 av = avasthas[pl]
                 pl_full = short_to_full.get(pl, pl)
                 state_str = ", ".join(av["avasthas"])
-                write(f"  {pl_full:9}: {state_str}")
+                report.kv(pl_full, state_str, 9, "  ")
                 for desc in av["description"]:
-                    write(f"             → {desc}")
+                    report.bullet(desc, "→", " " * 13)
 
     # ── Shadbala ──────────────────────────────────────────────────────────────
     shadbala = result.get("shadbala", {})
     if shadbala:
-        write("\nShadbala — Six Sources of Planetary Strength:")
-        write("-" * 85)
-        write(
+        report.section("Shadbala — Six Sources of Planetary Strength:")
+        report.note(
             "(Total strength in Rupas. Minimum for strength: Su≥5, Mo≥6, Ma≥5, Me≥7, Ju≥6.5, Ve≥5.5, Sa≥5)"
         )
-        write(
+        header = (
             f"{'Planet':<10} {'Rupas':>6} {'Min':>5} {'Status':<10} "
             f"{'Sthana':>7} {'Dig':>5} {'Kala':>6} {'Chesta':>7} "
             f"{'Naisarg':>8} {'Drik':>6} {'Ishta':>6} {'Kashta':>7}"
         )
-        write("-" * 85)
+        rows = []
         for pl in order:
             if pl in shadbala:
                 sb = shadbala[pl]
                 c = sb["components"]
                 status = "STRONG" if sb["strong"] else "weak"
                 bar = "█" * int(sb["rupas"]) + "░" * max(0, 8 - int(sb["rupas"]))
-                write(
+                rows.append(
                     f"  {short_to_full.get(pl,pl):<9} {sb['rupas']:>6.2f} "
                     f"{sb['min_rupas']:>5.1f} {status:<10} "
                     f"{c['sthana_bala']:>7.1f} {c['dig_bala']:>5.1f} "
@@ -983,17 +1038,17 @@ def print_kundali(result, file=None):
                     f"{c['naisargika_bala']:>8.1f} {c['drik_bala']:>6.1f} "
                     f"{sb['ishta']:>6.1f} {sb['kashta']:>7.1f}"
                 )
-        write(
-            "  Ishta = benefic potential (higher=better); Kashta = malefic tendency (lower=better)"
+        report.table(rows, header=header, rule="-" * 85)
+        report.note(
+            "Ishta = benefic potential (higher=better); Kashta = malefic tendency (lower=better)", "  "
         )
 
     # ── Bhinnashtakavarga ─────────────────────────────────────────────────────
     ashtak = result.get("ashtakavarga", {})
     by_house = ashtak.get("by_house", {})
     if by_house:
-        write("\nBhinnashtakavarga — Per-Planet Bindus per House:")
-        write("-" * 85)
-        write("(Number of benefic dots each planet contributes to each house)")
+        report.section("Bhinnashtakavarga — Per-Planet Bindus per House:")
+        report.note("(Number of benefic dots each planet contributes to each house)")
         header = (
             f"{'House':<8} {'Sign':<12}"
             + "".join(
@@ -1002,17 +1057,17 @@ def print_kundali(result, file=None):
             )
             + f"{'SAV':>6} {'Strength':<10}"
         )
-        write(header)
-        write("-" * 85)
+        rows = []
         for h in range(1, 13):
             hd = by_house[h]
             planet_cols = "".join(
                 f"{hd['planets'].get(pl, 0):>8}"
                 for pl in ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa"]
             )
-            write(
+            rows.append(
                 f"  H{h:02d} ({hd['sign']:<10}) {planet_cols}  {hd['sav']:>3}  {hd['strength']}"
             )
+        report.table(rows, header=header, rule="-" * 85)
 
     # ── Additional Divisional Charts ──────────────────────────────────────────
     extra_vargas = [
@@ -1027,60 +1082,68 @@ def print_kundali(result, file=None):
         ("d40", "Khavedamsha (D40 – Auspicious/Inauspicious Effects)"),
         ("d45", "Akshavedamsha (D45 – All-round Strength)"),
     ]
-    write("\nAdditional Divisional Charts:")
-    write("-" * 85)
+    report.section("Additional Divisional Charts:")
     for chart_key, chart_title in extra_vargas:
         chart_data = result.get(chart_key, {})
         if not chart_data:
             continue
-        write(f"\n{chart_title}:")
-        write("-" * 50)
-        for pl in order:
-            if pl in chart_data:
-                d = chart_data[pl]
-                write(f"  {pl:>3}: {d.get('deg', 0):5.2f}° {d.get('sign','?'):<12}")
+        report.section(f"{chart_title}:", rule="-" * 50)
+        report.table(
+            [
+                f"  {pl:>3}: {chart_data[pl].get('deg', 0):5.2f}° {chart_data[pl].get('sign','?'):<12}"
+                for pl in order
+                if pl in chart_data
+            ]
+        )
 
     # ── Numerology ────────────────────────────────────────────────────────────
     num = result.get("numerology", {})
     if num:
-        write("\nVedic Numerology:")
-        write("-" * 85)
-        write(
-            f"  Birth Number   : {num['birth_number']} ({num['birth_planet']}) — {num['birth_meaning']}"
+        report.section("Vedic Numerology:")
+        report.kv(
+            "Birth Number",
+            f"{num['birth_number']} ({num['birth_planet']}) — {num['birth_meaning']}",
+            15, "  ",
         )
-        write(
-            f"  Destiny Number : {num['destiny_number']} ({num['destiny_planet']}) — {num['destiny_meaning']}"
+        report.kv(
+            "Destiny Number",
+            f"{num['destiny_number']} ({num['destiny_planet']}) — {num['destiny_meaning']}",
+            15, "  ",
         )
         if num.get("name_number"):
-            write(
-                f"  Name Number    : {num['name_number']} ({num.get('name_planet','')}) — {num.get('name_meaning','')}"
+            report.kv(
+                "Name Number",
+                f"{num['name_number']} ({num.get('name_planet','')}) — {num.get('name_meaning','')}",
+                15, "  ",
             )
-        write(f"  Lucky Days     : {num['lucky_days']}")
-        write(f"  Lucky Color    : {num['lucky_color']}")
-        write(f"  Lucky Gem      : {num['lucky_gem']}")
-        write(f"  Compatibility  : {num['compatibility']}")
+        report.kv("Lucky Days", num["lucky_days"], 15, "  ")
+        report.kv("Lucky Color", num["lucky_color"], 15, "  ")
+        report.kv("Lucky Gem", num["lucky_gem"], 15, "  ")
+        report.kv("Compatibility", num["compatibility"], 15, "  ")
 
     # ── Yogini Dasha ──────────────────────────────────────────────────────────
     yd = result.get("yogini_dasha", {})
     if yd:
-        write("\nYogini Dasha (36-Year Cycle):")
-        write("-" * 85)
-        write(
-            f"  Birth Yogini   : {yd.get('start_yogini','?')} | Balance: {yd.get('balance_years',0):.2f} years"
+        report.section("Yogini Dasha (36-Year Cycle):")
+        report.kv(
+            "Birth Yogini",
+            f"{yd.get('start_yogini','?')} | Balance: {yd.get('balance_years',0):.2f} years",
+            15, "  ",
         )
         cur = yd.get("current", {})
         if cur:
-            write(
-                f"  Current Yogini : {cur.get('yogini','?')} (Lord: {cur.get('lord','?')})"
+            report.kv(
+                "Current Yogini", f"{cur.get('yogini','?')} (Lord: {cur.get('lord','?')})", 15, "  "
             )
             ad_info = cur.get("antardasha")
             if ad_info:
-                write(
-                    f"  Current AD     : {ad_info.get('yogini','?')} (Lord: {ad_info.get('lord','?')})"
+                report.kv(
+                    "Current AD",
+                    f"{ad_info.get('yogini','?')} (Lord: {ad_info.get('lord','?')})",
+                    15, "  ",
                 )
         write("")
-        write(f"  {'Yogini':<14} {'Lord':<10} {'Years':<6}  Period")
-        write("  " + "-" * 60)
+        rows = []
         for md in yd.get("dashas", [])[:12]:
             start_yr = md.get("start_jd", 0)
             end_yr = md.get("end_jd", 0)
@@ -1092,119 +1155,136 @@ def print_kundali(result, file=None):
                 period_str = f"{s_yr}–{e_yr}"
             except Exception:
                 period_str = ""
-            write(
+            rows.append(
                 f"  {md['yogini']:<14} {md['lord']:<10} {md['years']:<6.1f}  {period_str}"
             )
+        report.table(
+            rows, header=f"  {'Yogini':<14} {'Lord':<10} {'Years':<6}  Period", rule="  " + "-" * 60
+        )
 
     # ── Tajika / Solar Return ─────────────────────────────────────────────────
     taj = result.get("tajika", {})
     if taj:
-        write("\nTajika Solar Return Analysis:")
-        write("-" * 85)
-        write(f"  Year          : {taj.get('year','?')} (Age {taj.get('age','?')})")
-        write(f"  Solar Return  : {taj.get('solar_return_date','?')}")
-        write(f"  Year Lord     : {taj.get('year_lord','?')}")
+        report.section("Tajika Solar Return Analysis:")
+        report.kv("Year", f"{taj.get('year','?')} (Age {taj.get('age','?')})", 14, "  ")
+        report.kv("Solar Return", taj.get("solar_return_date", "?"), 14, "  ")
+        report.kv("Year Lord", taj.get("year_lord", "?"), 14, "  ")
         mun = taj.get("muntha", {})
         if mun:
-            write(
-                f"  Muntha Sign   : {mun.get('sign','?')} (House {mun.get('house_from_lagna','?')}, Lord: {mun.get('lord','?')})"
+            report.kv(
+                "Muntha Sign",
+                f"{mun.get('sign','?')} (House {mun.get('house_from_lagna','?')}, Lord: {mun.get('lord','?')})",
+                14, "  ",
             )
         for line in taj.get("interpretation", [])[:6]:
-            write(f"  • {line}")
+            report.bullet(line, indent="  ")
         applying = taj.get("applying_aspects", [])
         if applying:
-            write(f"  Applying Aspects ({len(applying)}):")
-            for a in applying:
-                write(
+            report.heading(f"Applying Aspects ({len(applying)})", "  ")
+            report.table(
+                [
                     f"    {a.get('p1', a.get('planet1','?'))} → {a.get('p2', a.get('planet2','?'))} : {a.get('aspect','?')} (orb {a.get('orb','?')}°)"
-                )
+                    for a in applying
+                ],
+                data=applying,
+            )
 
     # ── Muhurtha (Birth Moment Quality) ───────────────────────────────────────
     muh = result.get("muhurtha", {})
     if muh:
-        write("\nMuhurtha — Birth Moment Quality:")
-        write("-" * 85)
+        report.section("Muhurtha — Birth Moment Quality:")
         score = muh.get("total_score", muh.get("overall_score", "?"))
         grade = muh.get("grade", "?")
-        write(f"  Overall Score : {score}/{muh.get('max_score',100)}")
-        write(f"  Grade         : {grade}")
+        report.kv("Overall Score", f"{score}/{muh.get('max_score',100)}", 14, "  ")
+        report.kv("Grade", grade, 14, "  ")
         if muh.get("tarabala"):
             tb = muh["tarabala"]
-            write(
-                f"  Tarabala      : {tb.get('tara_name','?')} (Score {tb.get('score','?')}/5)"
+            report.kv(
+                "Tarabala", f"{tb.get('tara_name','?')} (Score {tb.get('score','?')}/5)", 14, "  "
             )
         if muh.get("chandrabala"):
             cb = muh["chandrabala"]
-            write(
-                f"  Chandrabala   : H{cb.get('count','?')} from Moon — Score {cb.get('score','?')}/5"
+            report.kv(
+                "Chandrabala",
+                f"H{cb.get('count','?')} from Moon — Score {cb.get('score','?')}/5",
+                14, "  ",
             )
         if muh.get("panchanga"):
             mp = muh["panchanga"]
-            write(f"  Tithi         : {mp.get('tithi_name', mp.get('tithi','?'))}")
-            write(f"  Yoga          : {mp.get('yoga_name', mp.get('yoga','?'))}")
+            report.kv("Tithi", mp.get("tithi_name", mp.get("tithi", "?")), 14, "  ")
+            report.kv("Yoga", mp.get("yoga_name", mp.get("yoga", "?")), 14, "  ")
         for w in muh.get("warnings", [])[:5]:
-            write(f"  ⚠  {w}")
+            report.bullet(w, "⚠ ", "  ")
 
     # ── Pancha Pakshi ─────────────────────────────────────────────────────────
     pp = result.get("pancha_pakshi", {})
     if pp:
-        write("\nPancha Pakshi — Five Bird Activity System:")
-        write("-" * 85)
-        write(
-            f"  Birth Bird     : {pp.get('birth_bird','?')} (Moon in {pp.get('moon_nakshatra','?')})"
+        report.section("Pancha Pakshi — Five Bird Activity System:")
+        report.kv(
+            "Birth Bird",
+            f"{pp.get('birth_bird','?')} (Moon in {pp.get('moon_nakshatra','?')})",
+            15, "  ",
         )
-        write(f"  Today ({pp.get('query_weekday','?')}):")
-        write(
-            f"    Period       : {'Day' if pp.get('is_day') else 'Night'} Yama {pp.get('current_yama','?')}"
+        report.heading(f"Today ({pp.get('query_weekday','?')})", "  ")
+        report.kv(
+            "Period",
+            f"{'Day' if pp.get('is_day') else 'Night'} Yama {pp.get('current_yama','?')}",
+            13, "    ",
         )
-        write(
-            f"    Activity     : {pp.get('current_activity','?')} (Strength {pp.get('current_strength','?')}/5)"
+        report.kv(
+            "Activity",
+            f"{pp.get('current_activity','?')} (Strength {pp.get('current_strength','?')}/5)",
+            13, "    ",
         )
-        write(f"    Advice       : {pp.get('current_advice','')}")
-        write(f"  Ruling Bird Now: {pp.get('ruling_bird_now','?')}")
+        report.kv("Advice", pp.get("current_advice", ""), 13, "    ")
+        report.kv("Ruling Bird Now", pp.get("ruling_bird_now", "?"), indent="  ")
         day_yamas = pp.get("auspicious_day_yamas", [])
         night_yamas = pp.get("auspicious_night_yamas", [])
         if day_yamas:
-            write(f"  Best Day Yamas : {', '.join(f'Yama {y}' for y in day_yamas)}")
+            report.kv("Best Day Yamas", ", ".join(f"Yama {y}" for y in day_yamas), 15, "  ")
         if night_yamas:
-            write(f"  Best Night Yamas: {', '.join(f'Yama {y}' for y in night_yamas)}")
+            report.kv("Best Night Yamas", ", ".join(f"Yama {y}" for y in night_yamas), indent="  ")
         write("")
-        write("  All Birds — Current Activity:")
+        report.heading("All Birds — Current Activity", "  ")
         for bird, info in pp.get("all_bird_activities", {}).items():
-            write(f"    {bird:<10}: {info['activity']:<10} ({info['strength']}/5)")
+            report.kv(bird, f"{info['activity']:<10} ({info['strength']}/5)", 10, "    ")
         write("")
-        write("  Today's Full Forecast (Birth Bird activities):")
-        write(f"  {'Period':<18} {'Activity':<12} {'Str':<4} Advice (short)")
-        write("  " + "-" * 70)
+        report.heading("Today's Full Forecast (Birth Bird activities)", "  ")
+        rows = []
         for slot in pp.get("day_forecast", []):
             advice_short = slot["advice"].split(";")[0][:38]
             strength_bar = "★" * slot["strength"] + "☆" * (5 - slot["strength"])
-            write(
+            rows.append(
                 f"  {slot['period']:<18} {slot['activity']:<12} {strength_bar}  {advice_short}"
             )
+        report.table(
+            rows,
+            header=f"  {'Period':<18} {'Activity':<12} {'Str':<4} Advice (short)",
+            rule="  " + "-" * 70,
+        )
 
     # ── Sky Chart SVG ─────────────────────────────────────────────────────────
     sky_path = result.get("sky_chart_path", "")
     if sky_path:
-        write("\nSky Chart (SVG):")
-        write("-" * 85)
-        write(f"  South Indian chart saved to: {sky_path}")
+        report.section("Sky Chart (SVG):")
+        report.kv("South Indian chart saved to", sky_path, indent="  ")
         write("  Open the SVG file in any browser or vector graphics editor.")
 
     # ── Chara Dasha ───────────────────────────────────────────────────────────
     cd = result.get("chara_dasha", {})
     if cd and cd.get("dashas"):
-        write("\nJaimini Chara Dasha (Sign-Based):")
-        write("-" * 85)
+        report.section("Jaimini Chara Dasha (Sign-Based):")
         cur_cd = cd.get("current") or {}
         if cur_cd:
-            write(
-                f"  Current : {cur_cd.get('current_sign','?')} "
+            report.kv(
+                "Current",
+                f"{cur_cd.get('current_sign','?')} "
                 f"(Lord: {cur_cd.get('current_lord','?')}) — "
-                f"{cur_cd.get('years_remaining',0):.1f} yrs remaining"
+                f"{cur_cd.get('years_remaining',0):.1f} yrs remaining",
+                indent="  ",
+                sep=" : ",
             )
-        write(f"  {'Sign':<14} {'Lord':<8} {'Yrs':<5}  Period")
-        write("  " + "-" * 55)
+        rows = []
         for md in cd.get("dashas", []):
             by = result.get("birth_year", 2000)
             bjd = result.get("birth_jd", 0)
@@ -1214,39 +1294,38 @@ def print_kundali(result, file=None):
                 period_str = f"{s_yr}–{e_yr}"
             except Exception:
                 period_str = ""
-            write(
+            rows.append(
                 f"  {md['sign']:<14} {md['lord']:<8} {md['years']:<5.1f}  {period_str}"
             )
+        report.table(rows, header=f"  {'Sign':<14} {'Lord':<8} {'Yrs':<5}  Period", rule="  " + "-" * 55)
 
     # ── Pada Lagnas (Arudha) ──────────────────────────────────────────────────
     pada = result.get("pada_lagnas", {})
     if pada:
-        write("\nPada Lagnas (Arudha A1–A12):")
-        write("-" * 85)
-        write("  (Each Pada = worldly reflection of that house in the outer world)")
+        report.section("Pada Lagnas (Arudha A1–A12):")
+        report.note("(Each Pada = worldly reflection of that house in the outer world)", "  ")
         for key in [f"A{i}" for i in range(1, 13)]:
             info = pada.get(key, {})
             if info:
-                write(
-                    f"  {key}: {info.get('sign','?'):13} (House {info.get('house','?')})"
-                )
+                report.kv(key, f"{info.get('sign','?'):13} (House {info.get('house','?')})", indent="  ")
         ul = result.get("upapadha_lagna", {})
         if ul:
-            write(
-                f"\n  Upapadha Lagna (UL / A12 of H12): {ul.get('sign','?')} (House {ul.get('house','?')})"
+            report.kv(
+                "Upapadha Lagna (UL / A12 of H12)",
+                f"{ul.get('sign','?')} (House {ul.get('house','?')})",
+                indent="  ",
+                gap=True,
             )
             interp = ul.get("interpretation", "")
             if interp:
-                write(f"  → {interp}")
+                report.bullet(interp, "→", "  ")
 
     # ── Vimshopak Bala ────────────────────────────────────────────────────────
     vb = result.get("vimshopak_bala", {})
     if vb:
-        write("\nVimshopak Bala — 20-Point Strength Across 16 Vargas:")
-        write("-" * 85)
-        write("  (Score /20. Strong ≥ 15. Key weights: D60=4, D1=3.5, D9=3, D16=2)")
-        write(f"  {'Planet':<10} {'Score':>6} {'Status':<8}  Bar")
-        write("  " + "-" * 60)
+        report.section("Vimshopak Bala — 20-Point Strength Across 16 Vargas:")
+        report.note("(Score /20. Strong ≥ 15. Key weights: D60=4, D1=3.5, D9=3, D16=2)", "  ")
+        rows = []
         for pl in ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa", "Ra", "Ke"]:
             if pl in vb:
                 pv = vb[pl]
@@ -1255,14 +1334,14 @@ def print_kundali(result, file=None):
                 bar = "█" * int(score) + "░" * max(0, 20 - int(score))
                 status = "STRONG" if strong else "weak"
                 pl_full = short_to_full.get(pl, pl)
-                write(f"  {pl_full:<10} {score:>6.2f} {status:<8}  {bar}")
+                rows.append(f"  {pl_full:<10} {score:>6.2f} {status:<8}  {bar}")
+        report.table(rows, header=f"  {'Planet':<10} {'Score':>6} {'Status':<8}  Bar", rule="  " + "-" * 60)
 
     # ── Graha Yuddha ──────────────────────────────────────────────────────────
     gy = result.get("graha_yuddha", [])
     if gy:
-        write("\nGraha Yuddha (Planetary War):")
-        write("-" * 85)
-        write("  (Planets within 1° of each other — lower degree planet wins)")
+        report.section("Graha Yuddha (Planetary War):")
+        report.note("(Planets within 1° of each other — lower degree planet wins)", "  ")
         for war in gy:
             write(
                 f"  {war.get('planet1','?')} vs {war.get('planet2','?')} "
@@ -1271,76 +1350,89 @@ def print_kundali(result, file=None):
             )
             interp = war.get("interpretation", "")
             if interp:
-                write(f"    → {interp}")
+                report.bullet(interp, "→", "    ")
 
     # ── Transit Calendar ──────────────────────────────────────────────────────
     tc = result.get("transit_calendar", {})
     if tc:
-        write("\nTransit Calendar — Next 30 Days:")
-        write("-" * 85)
+        report.section("Transit Calendar — Next 30 Days:")
         summary = tc.get("summary_next_30_days", [])
         if summary:
+            rows = []
             for evt in summary[:15]:
                 evt_type = str(evt.get("type", evt.get("event_type", "event"))).replace("_", " ").upper()
                 desc = evt.get("description", evt.get("planet", ""))
-                write(f"  {evt.get('date','?')}  {evt_type:<18} {desc}")
+                rows.append(f"  {evt.get('date','?')}  {evt_type:<18} {desc}")
+            report.table(rows, data=summary[:15])
         ingresses = tc.get("ingresses", [])
         if ingresses:
-            write(f"\n  Upcoming Sign Ingresses (next {min(8,len(ingresses))}):")
-            for ing in ingresses[:8]:
-                write(
+            report.heading(f"Upcoming Sign Ingresses (next {min(8,len(ingresses))})", "  ", gap=True)
+            report.table(
+                [
                     f"    {ing.get('date','?')}: {ing.get('planet','?')} "
                     f"→ {ing.get('to_sign','?')} (from {ing.get('from_sign','?')})"
-                )
+                    for ing in ingresses[:8]
+                ],
+                data=ingresses[:8],
+            )
         retros = tc.get("retrogrades", [])
         if retros:
-            write(f"\n  Retrograde Stations (next {min(6,len(retros))}):")
-            for r in retros[:6]:
-                write(
+            report.heading(f"Retrograde Stations (next {min(6,len(retros))})", "  ", gap=True)
+            report.table(
+                [
                     f"    {r.get('date','?')}: {r.get('planet','?')} "
                     f"{r.get('type','').replace('_',' ')} in {r.get('sign','?')}"
-                )
+                    for r in retros[:6]
+                ],
+                data=retros[:6],
+            )
         eclipses = tc.get("eclipses", [])
         if eclipses:
-            write(f"\n  Eclipses (next {min(4,len(eclipses))}):")
-            for ec in eclipses[:4]:
-                write(
+            report.heading(f"Eclipses (next {min(4,len(eclipses))})", "  ", gap=True)
+            report.table(
+                [
                     f"    {ec.get('date','?')}: {ec.get('type','?').upper()} "
                     f"Eclipse ({ec.get('subtype','?')})"
-                )
+                    for ec in eclipses[:4]
+                ],
+                data=eclipses[:4],
+            )
 
     # ── North Indian Chart ────────────────────────────────────────────────────
     north_path = result.get("north_chart_path", "")
     if north_path:
-        write("\nNorth Indian Chart (SVG):")
-        write("-" * 85)
-        write(f"  Chart saved to: {north_path}")
+        report.section("North Indian Chart (SVG):")
+        report.kv("Chart saved to", north_path, indent="  ")
 
     # ── PDF Report ────────────────────────────────────────────────────────────
     pdf_path = result.get("pdf_report_path", "")
     if pdf_path:
-        write("\nPDF Report:")
-        write("-" * 85)
-        write(f"  Full report saved to: {pdf_path}")
+        report.section("PDF Report:")
+        report.kv("Full report saved to", pdf_path, indent="  ")
     # ── Life Guidance (Decision Engines) ─────────────────────────────────────────────
     try:
         all_decisions = decisions.get_all_decisions(result)
         if all_decisions:
             all_decisions["_chart_result"] = result
-            _write_decisions_section(write, all_decisions)
+            _write_decisions_section(report, all_decisions)
     except Exception:
         pass  # Skip if decisions module fails
-    write("\n" + result.get("final_analysis", ""))
-    write("\nNote: Highest probability when dasha + transit + gochara align.")
+    write("")
+    _write_markdown(report, result.get("final_analysis", ""))
+    report.note("Note: Highest probability when dasha + transit + gochara align.", gap=True)
     birth_year = result.get("birth_year", "N/A")
     current_year = datetime.datetime.now().year
-    write(
+    report.note(
         f"Timings calculated from birth year {birth_year}; current year {current_year}."
     )
-    write("Doshas indicate challenges; remedies like mantras/gemstones can mitigate.")
-    write("\n" + "═" * 95)
+    report.note("Doshas indicate challenges; remedies like mantras/gemstones can mitigate.")
+    report.close()
+    return report.document()
 
-    output = "\n".join(lines) + "\n"
+
+def print_kundali(result, file=None):
+    """Print the complete kundali report to console and optionally to a file."""
+    output = build_report(result).text()
     print(output, end="")
     if file:
         file.write(output)
@@ -9,9 +9,9 @@ import pytz
 from .constants import (
     nakshatra_lord_index,
     dasha_lords,
-    AYANAMSA_OPTIONS,
     short_to_full,
 )
+from .ephemeris import get_ephemeris
 from .utils import get_sign
 
 
@@ -74,9 +74,7 @@ def get_house_sub_lord(jd, lat, lon, house_num, ayanamsa_name="Lahiri", verbose=
     """
     Compute sub-lord of house cusp longitude (KP method: cusp star sub-lord rules house).
     """
-    ayanamsa_code = AYANAMSA_OPTIONS.get(ayanamsa_name, swe.SIDM_LAHIRI)
-    swe.set_sid_mode(ayanamsa_code)
-    cusps, ascmc = swe.houses_ex(jd, lat, lon, b"W", swe.FLG_SIDEREAL)
+    cusps, ascmc = get_ephemeris(ayanamsa_name).houses(jd, lat, lon, b"W")
     house_cusp_lon = cusps[house_num - 1]  # 1-based to 0-index
     _log(verbose, f"House {house_num}: Cusp longitude {house_cusp_lon:.2f}")
     return get_nakshatra_sub_lord(house_cusp_lon, verbose=verbose)
@@ -95,10 +93,9 @@ def check_prenatal_epoch(birth_jd, birth_lat, birth_lon, ayanamsa_name="Lahiri",
     Score prenatal epoch: Moon at conception ~ Asc at birth (sign/nakshatra lord).
     """
     conception_jd = get_prenatal_epoch_jd(birth_jd)
-    ayanamsa_code = AYANAMSA_OPTIONS.get(ayanamsa_name, swe.SIDM_LAHIRI)
-    swe.set_sid_mode(ayanamsa_code)
+    eph = get_ephemeris(ayanamsa_name)
     # Moon at conception
-    moon_lon = swe.calc_ut(conception_jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+    moon_lon = eph.longitude(conception_jd, swe.MOON)
     moon_sign = get_sign(moon_lon)
     moon_nak_idx = int(moon_lon / (360 / 27)) % 27
     moon_nak_lord_idx = nakshatra_lord_index[moon_nak_idx]
@@ -107,7 +104,7 @@ def check_prenatal_epoch(birth_jd, birth_lat, birth_lon, ayanamsa_name="Lahiri",
         f"Prenatal epoch: Moon longitude {moon_lon:.2f}, sign {moon_sign}, nakshatra index {moon_nak_idx}, nakshatra lord {moon_nak_lord_idx}"
     )
     # Asc at birth
-    cusps, ascmc = swe.houses_ex(birth_jd, birth_lat, birth_lon, b"W", swe.FLG_SIDEREAL)
+    cusps, ascmc = eph.houses(birth_jd, birth_lat, birth_lon, b"W")
     asc_lon = ascmc[0]
     asc_sign = get_sign(asc_lon)
     asc_nak_idx = int(asc_lon / (360 / 27)) % 27
@@ -127,6 +124,111 @@ def check_prenatal_epoch(birth_jd, birth_lat, birth_lon, ayanamsa_name="Lahiri",
     return score
 
 
+# -------------------------------------------------------------------
+# Candidate scoring
+# -------------------------------------------------------------------
+_NAK_SPAN = 360 / 27
+# Largest Ascendant/Moon motion between two samples that still guarantees at
+# most one boundary of each kind was crossed (nakshatras are 13°20' wide).
+_MAX_SAMPLE_MOTION = _NAK_SPAN / 2
+
+
+class _CandidateScorer:
+    """
+    Score candidate birth JDs with one house computation per candidate.
+
+    The score only depends on the Ascendant's sign and nakshatra (which also
+    fix the whole-sign cusps and their sub-lords) and on the Moon's sign and
+    nakshatra at the prenatal epoch, so it is piecewise constant in time.
+    ``state()`` returns that key alongside the raw longitudes used to make
+    sure no boundary was skipped between two samples.
+    """
+
+    def __init__(self, lat, lon, ayanamsa, parsed_events):
+        self.lat = lat
+        self.lon = lon
+        self.eph = get_ephemeris(ayanamsa)
+        self.events = parsed_events
+        self._states = {}
+
+    def state(self, jd):
+        cached = self._states.get(jd)
+        if cached is not None:
+            return cached
+        cusps, ascmc = self.eph.houses(jd, self.lat, self.lon, b"W")
+        asc_lon = ascmc[0]
+        moon_lon = self.eph.longitude(get_prenatal_epoch_jd(jd), swe.MOON)
+        key = (
+            int(asc_lon // 30) % 12,
+            int(asc_lon / _NAK_SPAN) % 27,
+            int(moon_lon // 30) % 12,
+            int(moon_lon / _NAK_SPAN) % 27,
+        )
+        cached = (key, asc_lon, moon_lon, cusps)
+        self._states[jd] = cached
+        return cached
+
+    def score(self, jd, verbose=False):
+        key, asc_lon, moon_lon, cusps = self.state(jd)
+        asc_sign, asc_nak, moon_sign, moon_nak = key
+        epoch_score = 0
+        if moon_sign == asc_sign:
+            epoch_score += 2
+        if nakshatra_lord_index[moon_nak] == nakshatra_lord_index[asc_nak]:
+            epoch_score += 1
+        score = epoch_score * 5
+        _log(verbose, f"JD {jd:.5f}: Asc {asc_lon:.2f}, epoch Moon {moon_lon:.2f}, epoch score (x5) {score}")
+        for event in self.events:
+            sub_lord = get_nakshatra_sub_lord(cusps[event["house"] - 1])
+            if sub_lord in event["expected_planets"]:
+                _log(verbose, f"  House {event['house']} sub-lord {sub_lord} matches event planets: +10")
+                score += 10
+        return score
+
+    def same_segment(self, jd_a, jd_b):
+        """True when the score cannot change anywhere between *jd_a* and *jd_b*."""
+        key_a, asc_a, moon_a, _ = self.state(jd_a)
+        key_b, asc_b, moon_b, _ = self.state(jd_b)
+        return (
+            key_a == key_b
+            and (asc_b - asc_a) % 360 < _MAX_SAMPLE_MOTION
+            and abs((moon_b - moon_a + 180) % 360 - 180) < _MAX_SAMPLE_MOTION
+        )
+
+
+def _grid_scores(scorer, jds, coarse_every, verbose=False):
+    """
+    Scores for every JD in *jds* (ascending), evaluated coarse-to-fine.
+
+    Coarse samples are taken every *coarse_every* grid points; spans whose
+    ends share a segment inherit that score, others are bisected down to
+    neighbouring grid points, so only boundary crossings are refined.
+    """
+    scores = [None] * len(jds)
+
+    def fill(i, j):
+        # scores[i] and scores[j] are known
+        if j - i <= 1:
+            return
+        if scorer.same_segment(jds[i], jds[j]):
+            for k in range(i + 1, j):
+                scores[k] = scores[i]
+            return
+        mid = (i + j) // 2
+        scores[mid] = scorer.score(jds[mid], verbose)
+        fill(i, mid)
+        fill(mid, j)
+
+    anchors = list(range(0, len(jds), max(1, coarse_every)))
+    if anchors[-1] != len(jds) - 1:
+        anchors.append(len(jds) - 1)
+    for i in anchors:
+        scores[i] = scorer.score(jds[i], verbose)
+    for i, j in zip(anchors, anchors[1:]):
+        fill(i, j)
+    return scores
+
+
 # -------------------------------------------------------------------
 # Main rectification
 # -------------------------------------------------------------------
@@ -136,10 +238,17 @@ def rectify_birth_time(
     *,
     step_minutes=2,
     search_window_minutes=60,
+    coarse_minutes=8,
     verbose=False,
 ):
     """
-    Rectify birth time iterating ±1h in 2min steps.
+    Rectify birth time over ±search_window_minutes in step_minutes steps.
+
+    The search is coarse-to-fine: candidates are sampled every
+    ``coarse_minutes`` and refined only where the Ascendant or prenatal-epoch
+    Moon crosses a sign/nakshatra boundary, which gives the same result as
+    testing every step (±4 h at 1-minute resolution stays well under a second).
+
     original_result: from calculate_kundali()
     events: [{'date': datetime, 'house': int, 'description': str, 'planets': list}]
     """
@@ -193,29 +302,12 @@ def rectify_birth_time(
     best_jd = orig_jd
     best_offset = 0
     runner_up_score = None
-    for offset_minutes in range(-search_window_minutes, search_window_minutes + 1, step_minutes):
-        test_jd = orig_jd + (offset_minutes / (24 * 60))
-        score = 0
-        _log(verbose, f"\nTesting offset {offset_minutes} min (JD {test_jd:.5f})")
-        # Prenatal epoch (weighted heavily)
-        epoch_score = check_prenatal_epoch(test_jd, lat, lon, ayanamsa, verbose=verbose)
-        score += epoch_score * 5
-        _log(verbose, f"Epoch score (x5): {epoch_score * 5}")
-        # Life events: house sub-lord at birth time matches event planets?
-        for event in parsed_events:
-            house = event["house"]
-            sub_lord = get_house_sub_lord(
-                test_jd, lat, lon, house, ayanamsa, verbose=verbose
-            )
-            expected_planets = event["expected_planets"]
-            _log(
-                verbose,
-                f"Event: house {house}, expected planets {expected_planets}, sub-lord {sub_lord}"
-            )
-            if sub_lord in expected_planets:
-                _log(verbose, f"Sub-lord {sub_lord} matches event planets: +10")
-                score += 10
-        _log(verbose, f"Total score for offset {offset_minutes}: {score}")
+    offsets = list(range(-search_window_minutes, search_window_minutes + 1, step_minutes))
+    jds = [orig_jd + (offset_minutes / (24 * 60)) for offset_minutes in offsets]
+    scorer = _CandidateScorer(lat, lon, ayanamsa, parsed_events)
+    coarse_every = max(1, coarse_minutes // max(1, step_minutes))
+    scores = _grid_scores(scorer, jds, coarse_every, verbose=verbose)
+    for offset_minutes, test_jd, score in zip(offsets, jds, scores):
         if score > best_score:
             if best_score >= 0:
                 runner_up_score = best_score if runner_up_score is None else max(runner_up_score, best_score)
@@ -0,0 +1,283 @@
+# report_document.py
+"""
+Structured report document shared by the text, PDF and chart renderers.
+
+``printing.build_report`` writes the report once into a ``ReportWriter``,
+which records explicit sections (header, titled sections, banners and the
+free-form guidance that follows them) as they are written.  The resulting
+``ReportDocument`` renders the text report verbatim and exposes each
+section as typed blocks (key-values, bullet lists, tables, notes,
+headings, paragraphs) for the PDF renderer, plus the D1 chart positions
+for the chart scripts.  Block types come from the writer call that wrote
+the content; text written with plain ``write()`` is a paragraph.
+"""
+
+import re
+
+# Block kinds
+BLANK = "blank"
+BOX = "box"
+HEADING = "heading"
+NOTE = "note"
+BULLETS = "bullets"
+KEY_VALUES = "key_values"
+TABLE = "table"
+PARAGRAPH = "paragraph"
+# Rules and box borders: text only, never a block
+RULE = "rule"
+
+HEADER_TITLE = "Birth Details & Panchanga"
+
+
+class ReportBlock:
+    """
+    A typed run of report content.
+
+    ``items`` depends on the kind: the title text for BOX/HEADING,
+    ``(label, value)`` rows for KEY_VALUES, ``(marker, text)`` pairs for
+    BULLETS and the report lines for NOTE/TABLE/PARAGRAPH.  Blocks written
+    through ``ReportWriter`` also keep their text ``lines`` and may carry
+    structured ``data``.
+    """
+
+    __slots__ = ("kind", "items", "lines", "data")
+
+    def __init__(self, kind, items=None, lines=None, data=None):
+        self.kind = kind
+        self.items = items if items is not None else []
+        self.lines = lines if lines is not None else []
+        self.data = data
+
+    def __eq__(self, other):
+        if not isinstance(other, ReportBlock):
+            return NotImplemented
+        return (self.kind, self.items) == (other.kind, other.items)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ReportBlock({self.kind}, {self.items!r})"
+
+
+class ReportSection:
+    """
+    One report section.
+
+    *kind* is ``header`` (birth details), ``section`` (a titled section),
+    ``banner`` (a major ═══ banner that opens a part) or ``free`` (untitled
+    prose, e.g. the guidance after the LIFE GUIDANCE banner).
+    """
+
+    __slots__ = ("kind", "title", "heading", "entries")
+
+    def __init__(self, kind, title="", heading=None):
+        self.kind = kind
+        self.title = title
+        # text lines that introduce the section (title, rule, banner)
+        self.heading = list(heading or [])
+        # report lines (str) and directly written blocks, in order
+        self.entries = []
+
+    def lines(self):
+        """The section as report text lines."""
+        out = list(self.heading)
+        for entry in self.entries:
+            if isinstance(entry, ReportBlock):
+                out.extend(entry.lines)
+            else:
+                out.append(entry)
+        return out
+
+    @property
+    def blocks(self):
+        """Typed blocks of the section body, without rules and edge blank lines."""
+        blocks = []
+        paragraph = None
+        for entry in self.entries:
+            if isinstance(entry, ReportBlock):
+                paragraph = None
+                if entry.kind != RULE:
+                    blocks.append(entry)
+            elif not entry.strip():
+                paragraph = None
+                blocks.append(ReportBlock(BLANK))
+            elif paragraph is None:
+                paragraph = ReportBlock(PARAGRAPH, [entry])
+                blocks.append(paragraph)
+            else:
+                paragraph.items.append(entry)
+        while blocks and blocks[0].kind == BLANK:
+            blocks.pop(0)
+        while blocks and blocks[-1].kind == BLANK:
+            blocks.pop()
+        return blocks
+
+    def __repr__(self):
+        return f"ReportSection({self.kind}, {self.title!r})"
+
+
+class ReportDocument:
+    """
+    The complete report: ordered sections, closing lines and chart data.
+
+    ``chart`` holds the D1 positions written in the planets table:
+    ``{"lagna": sign, "planets": {code: {"sign", "deg", "retro",
+    "combust", "neecha_bhanga"}}}``.
+    """
+
+    __slots__ = ("sections", "trailer", "chart")
+
+    def __init__(self, sections, trailer=None, chart=None):
+        self.sections = list(sections)
+        self.trailer = list(trailer or [])
+        self.chart = chart or {}
+
+    def lines(self):
+        out = []
+        for section in self.sections:
+            out.extend(section.lines())
+        out.extend(self.trailer)
+        return out
+
+    def text(self):
+        """The text report, exactly as ``print_kundali`` writes it."""
+        return "\n".join(self.lines()) + "\n"
+
+    def section(self, title):
+        """First section titled *title*, or None."""
+        for section in self.sections:
+            if section.title == title:
+                return section
+        return None
+
+    def __repr__(self):
+        return f"ReportDocument({len(self.sections)} sections)"
+
+
+class ReportWriter:
+    """
+    Collects report output into a ``ReportDocument``.
+
+    ``header()``, ``section()`` and ``banner()`` write the usual title
+    lines and start a new section.  Section content is written with the
+    typed methods (``kv``, ``bullet``, ``note``, ``heading``, ``box``,
+    ``table``), each of which writes its text line and records the block
+    the PDF renders; ``write()`` takes plain paragraph text (embedded
+    newlines allowed) and blank lines.
+    """
+
+    def __init__(self):
+        self.sections = []
+        self.chart = {}
+        self._trailer = []
+
+    @property
+    def current(self):
+        """The section being written, opening a free section when needed."""
+        if not self.sections or self.sections[-1].kind == "banner":
+            self.sections.append(ReportSection("free"))
+        return self.sections[-1]
+
+    def write(self, text):
+        """Write plain paragraph text."""
+        self.current.entries.extend(str(text).split("\n"))
+
+    def header(self, title, rule="═" * 95):
+        """Start the birth-details block under the top banner."""
+        self.sections.append(
+            ReportSection("header", HEADER_TITLE, ["", rule, f" {title}", rule])
+        )
+
+    def section(self, heading, rule="-" * 85):
+        """Start a titled section: a blank line, *heading*, then *rule*."""
+        self.sections.append(
+            ReportSection("section", section_title(heading), ["", heading, rule])
+        )
+
+    def banner(self, title, rule="═" * 95):
+        """Write a major banner; following text forms a free section."""
+        self.sections.append(ReportSection("banner", title.strip(), ["", rule, f" {title}", rule]))
+
+    def _append(self, kind, line, item, gap=False):
+        """Write *line* as part of a *kind* block, extending a block just written."""
+        entries = self.current.entries
+        if gap:
+            entries.append("")
+        if entries and isinstance(entries[-1], ReportBlock) and entries[-1].kind == kind:
+            block = entries[-1]
+        else:
+            block = ReportBlock(kind)
+            entries.append(block)
+        block.items.append(item)
+        block.lines.append(line)
+        return block
+
+    def kv(self, label, value, width=0, indent="", sep=": ", gap=False):
+        """Write ``label: value`` (label padded to *width*) as a key-value row."""
+        line = f"{indent}{label:<{width}}{sep}{value}"
+        item = (_collapse_inline_spaces(label), _collapse_inline_spaces(str(value)))
+        return self._append(KEY_VALUES, line, item, gap)
+
+    def bullet(self, text, marker="•", indent="", gap=False):
+        """Write ``marker text`` as a bullet item."""
+        line = f"{indent}{marker} {text}"
+        item = (marker.strip(), _collapse_inline_spaces(str(text)))
+        return self._append(BULLETS, line, item, gap)
+
+    def note(self, text, indent="", gap=False):
+        """Write a note line (legends, caveats, "(...)" explanations)."""
+        return self._append(NOTE, f"{indent}{text}", text.strip(), gap)
+
+    def heading(self, title, indent="", suffix=":", gap=False):
+        """Write a sub-heading line inside the current section."""
+        entries = self.current.entries
+        if gap:
+            entries.append("")
+        block = ReportBlock(HEADING, _collapse_inline_spaces(title), [f"{indent}{title}{suffix}"])
+        entries.append(block)
+        return block
+
+    def box(self, title, width=89):
+        """Write a blank line and a ``┌─ TITLE ───┐`` box top *width* characters wide."""
+        top = f"┌─ {title} "
+        self.current.entries.extend(
+            ["", ReportBlock(BOX, title, [top + "─" * (width - len(top) - 1) + "┐"])]
+        )
+
+    def rule(self, line):
+        """Write a rule or box border (text only)."""
+        self.current.entries.append(ReportBlock(RULE, lines=[line]))
+
+    def table(self, lines, header=None, rule=None, data=None, gap=False):
+        """Write preformatted table *lines* (after an optional header and rule)."""
+        text = [line for line in (header, rule) if line is not None] + list(lines)
+        items = ([header] if header is not None else []) + list(lines)
+        block = ReportBlock(TABLE, items, text, data)
+        if gap:
+            self.current.entries.append("")
+        self.current.entries.append(block)
+        return block
+
+    def close(self, rule="═" * 95):
+        """Write the closing rule."""
+        self._trailer = ["", rule]
+
+    def document(self):
+        return ReportDocument(self.sections, self._trailer, self.chart)
+
+
+def _strip_leading_symbols(s):
+    """Drop leading emoji / symbols / whitespace from a section title."""
+    i = 0
+    while i < len(s) and not (s[i].isalnum() or s[i] in "(["):
+        i += 1
+    return s[i:]
+
+
+def section_title(heading):
+    """Display title for a section heading line ("🔥 YOGAS ...", "Houses:")."""
+    return _strip_leading_symbols(heading.rstrip(": ").strip()).strip()
+
+
+def _collapse_inline_spaces(text):
+    return re.sub(r"\s{2,}", " ", text.strip())
@@ -0,0 +1,385 @@
+# report_jobs.py
+"""
+Background PDF report jobs.
+
+Rendering the PDF report takes far longer than calculating the chart, so the
+server does not do it inline: ``ReportJobs.submit()`` queues the render on a
+pool of worker processes and returns a job at once; clients poll the job and
+download the file when it is done.
+
+Finished PDFs live in a ``ReportStore`` under a key hashed from the report
+request (birth details, name, settings and the UTC day the "now" sections
+refer to), so identical requests share one render and two natives with the
+same name never overwrite each other.  Files older than the store's TTL are
+purged.  Job status lives in the store too, so with several server
+processes any of them can answer for a job another one queued.
+"""
+
+import datetime
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+REPORT_TTL = 24 * 3600
+# Queued/running markers older than this belong to a job whose process died
+PENDING_TIMEOUT = 1800
+_MARKER_SUFFIX = ".job"
+_REPORT_VERSION = 1
+_KEY_RE = re.compile(r"[0-9a-f]{64}")
+# How often submit() sweeps the store for expired files (seconds)
+_PURGE_INTERVAL = 600
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def report_key(birth, kind="pdf", day=None):
+    """
+    Content key for a report request.
+
+    Args:
+        birth: calculate() keyword arguments (birth_date, birth_time, place, ...)
+        kind: artifact kind (only "pdf" is rendered today)
+        day: date the time-dependent sections refer to (default: today, UTC)
+
+    Returns:
+        str: 64-character SHA-256 hex digest.
+    """
+    if day is None:
+        day = datetime.datetime.now(datetime.timezone.utc).date()
+    payload = {
+        "version": _REPORT_VERSION,
+        "kind": kind,
+        "day": str(day),
+        "birth": {k: v for k, v in birth.items() if v not in (None, "")},
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ReportStore:
+    """Rendered reports on disk, keyed by ``report_key()`` and expired by age.
+
+    Files are written to a temporary name and moved into place, so readers
+    (in any process) only ever see complete files.  A file's age is taken
+    from its modification time.
+
+    Next to the reports the store keeps a small JSON marker per job that is
+    queued, running or failed, so every process sharing the directory can
+    answer status queries for jobs submitted elsewhere.  Queued and running
+    markers older than *pending_timeout* are treated as abandoned (their
+    owner died) and ignored.
+    """
+
+    def __init__(self, root, ttl=REPORT_TTL, suffix=".pdf", pending_timeout=PENDING_TIMEOUT):
+        self.root = os.path.abspath(root)
+        self.ttl = ttl
+        self.suffix = suffix
+        self.pending_timeout = pending_timeout
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, key):
+        """Final path for *key*.  Raises ValueError for malformed keys."""
+        if not isinstance(key, str) or not _KEY_RE.fullmatch(key):
+            raise ValueError(f"Invalid report key: {key!r}")
+        return os.path.join(self.root, key + self.suffix)
+
+    def temp_path(self, key):
+        """A unique scratch path next to the final file for *key*."""
+        return f"{self.path(key)}.{uuid.uuid4().hex}.tmp"
+
+    def get(self, key):
+        """Path of the stored report for *key*, or None (missing or expired)."""
+        path = self.path(key)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > self.ttl:
+            self._remove(path)
+            return None
+        return path
+
+    # -- job markers ----------------------------------------------------------
+    def _marker_path(self, key):
+        return self.path(key)[: -len(self.suffix)] + _MARKER_SUFFIX
+
+    def mark(self, key, status, **fields):
+        """Record *status* (and e.g. ``name``, ``error``) for the job *key*."""
+        marker = self.marker(key) or {"created": time.time()}
+        marker.update(fields, status=status, updated=time.time())
+        path = self._marker_path(key)
+        temp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp, "w", encoding="utf-8") as fh:
+                json.dump(marker, fh)
+            os.replace(temp, path)
+        except OSError:
+            self._remove(temp)
+
+    def marker(self, key):
+        """The job marker for *key* as a dict, or None (absent, stale or expired)."""
+        path = self._marker_path(key)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            with open(path, encoding="utf-8") as fh:
+                marker = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        limit = self.ttl if marker.get("status") == FAILED else self.pending_timeout
+        if age > limit:
+            self._remove(path)
+            return None
+        return marker
+
+    def clear_marker(self, key):
+        self._remove(self._marker_path(key))
+
+    def purge_expired(self):
+        """Delete expired reports, markers and stale scratch files; returns the count."""
+        removed = 0
+        cutoff = time.time() - self.ttl
+        try:
+            entries = list(os.scandir(self.root))
+        except OSError:
+            return 0
+        for entry in entries:
+            if not entry.name.endswith((self.suffix, _MARKER_SUFFIX, ".tmp")):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    removed += self._remove(entry.path)
+            except OSError:
+                continue
+        return removed
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+def _error_text(exc):
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _render_report(store, key, birth):
+    """Worker job: calculate the chart, render its PDF and publish it."""
+    from .api import calculate
+    from .report_pdf import generate_pdf_report
+
+    store.mark(key, RUNNING)
+    temp_path = store.temp_path(key)
+    try:
+        result = calculate(**birth)
+        if not generate_pdf_report(result, output_path=temp_path):
+            raise RuntimeError("PDF rendering is unavailable (fpdf2 is not installed)")
+        os.replace(temp_path, store.path(key))
+    except Exception as exc:
+        store.mark(key, FAILED, error=_error_text(exc))
+        raise
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    store.clear_marker(key)
+    return store.path(key)
+
+
+def _future_error(future):
+    """Error text of a finished future ("" when it succeeded)."""
+    if future.cancelled():
+        return "Report job was cancelled"
+    exc = future.exception()
+    return _error_text(exc) if exc is not None else ""
+
+
+class ReportJob:
+    """
+    One queued, running or finished report render.
+
+    Jobs submitted in this process follow their future; jobs seen through
+    the store (submitted by another process) carry the stored status.
+    """
+
+    __slots__ = ("id", "name", "created", "finished", "future", "_status", "_error")
+
+    def __init__(self, job_id, name="", future=None, status=DONE, error="", created=None):
+        self.id = job_id
+        self.name = name
+        self.created = time.time() if created is None else created
+        self.finished = None
+        self.future = future
+        self._status = status
+        self._error = error
+
+    @property
+    def status(self):
+        if self.future is None:
+            return self._status
+        if not self.future.done():
+            return RUNNING if self.future.running() else QUEUED
+        return FAILED if _future_error(self.future) else DONE
+
+    @property
+    def error(self):
+        if self.future is None:
+            return self._error
+        if not self.future.done():
+            return ""
+        return _future_error(self.future)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "finished": self.finished,
+            "error": self.error,
+        }
+
+
+class ReportJobs:
+    """
+    Queue of report renders over a pool of worker processes.
+
+    Args:
+        store: ReportStore receiving the finished files
+        workers: worker processes (0 = one in-process thread, for development)
+
+    Jobs are identified by their report key: submitting a request that is
+    already queued, running or stored returns the existing job, also when
+    another process sharing the store submitted it.  Futures are kept in
+    this process; everything else is read from the store, so any process
+    can answer for any job.
+    """
+
+    def __init__(self, store, workers=1):
+        self.store = store
+        self.workers = max(0, workers)
+        self._executor = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._executor
+
+    @property
+    def pending(self):
+        """Jobs queued or running in this process."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status in (QUEUED, RUNNING))
+
+    def submit(self, birth, day=None):
+        """
+        Queue a PDF report for *birth* (calculate() keyword arguments).
+
+        Returns:
+            ReportJob: the new job, or the existing one for the same request.
+        """
+        self._maybe_purge()
+        key = report_key(birth, day=day)
+        name = birth.get("name", "")
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status in (QUEUED, RUNNING):
+                return job
+            stored = self._stored_job(key)
+            if stored is not None and stored.status != FAILED:
+                return stored
+            self.store.mark(key, QUEUED, name=name, error="")
+            args = (self.store, key, dict(birth))
+            try:
+                future = self._get_executor().submit(_render_report, *args)
+            except BrokenExecutor:
+                # a worker died (e.g. killed for memory); start a fresh pool
+                self.shutdown()
+                future = self._get_executor().submit(_render_report, *args)
+            job = ReportJob(key, name=name, future=future)
+            self._jobs[key] = job
+        future.add_done_callback(lambda f, job=job: self._finish(job))
+        return job
+
+    def _finish(self, job):
+        error = _future_error(job.future)
+        if error:
+            # covers failures the worker could not record (crash, cancel)
+            self.store.mark(job.id, FAILED, error=error)
+        with self._lock:
+            job.finished = time.time()
+
+    def _stored_job(self, key):
+        """Job state as recorded in the store, or None."""
+        path = self.store.get(key)
+        marker = self.store.marker(key)
+        if path is not None:
+            job = ReportJob(key, name=(marker or {}).get("name", ""))
+            job.finished = os.path.getmtime(path)
+            return job
+        if marker is None:
+            return None
+        job = ReportJob(
+            key, name=marker.get("name", ""), status=marker.get("status", QUEUED),
+            error=marker.get("error", ""), created=marker.get("created"),
+        )
+        if job.status == FAILED:
+            job.finished = marker.get("updated")
+        return job
+
+    def get(self, job_id):
+        """The job for *job_id*, or None when it is unknown or its report expired."""
+        try:
+            stored = self._stored_job(job_id)
+        except ValueError:
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and (job.status in (QUEUED, RUNNING) or stored is not None):
+                return job
+            self._jobs.pop(job_id, None)
+        return stored
+
+    def artifact(self, job_id):
+        """Path of the finished report for *job_id*, or None."""
+        job = self.get(job_id)
+        if job is None or job.status != DONE:
+            return None
+        return self.store.get(job_id)
+
+    def _maybe_purge(self):
+        now = time.time()
+        if now - self._last_purge < _PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        self.store.purge_expired()
+        cutoff = now - self.store.ttl
+        with self._lock:
+            for job_id in [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished is not None and job.finished < cutoff
+            ]:
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -14,14 +14,22 @@ except ImportError:
     XPos = YPos = None
 
 import os
-import io
 import datetime
 import math
 import re
-import contextlib
 
 from . import decisions
 from . import printing
+from .report_document import (
+    BLANK,
+    BOX,
+    BULLETS,
+    HEADING,
+    KEY_VALUES,
+    NOTE,
+    TABLE,
+    section_title,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -433,7 +441,8 @@ def _as_list(value):
     return [value]
 
 
-def _safe_filename(value, default="native"):
+def safe_filename(value, default="native"):
+    """Lower-case *value* reduced to characters safe in a file name."""
     cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", str(value).strip().lower()).strip("._")
     return cleaned or default
 
@@ -616,7 +625,7 @@ def _sf(v, decimals=2):
 # ---------------------------------------------------------------------------
 
 
-def generate_pdf_report(result, output_path=None):
+def generate_pdf_report(result, output_path=None, report=None):
     """
     Generate a complete kundali PDF report.
 
@@ -624,6 +633,8 @@ def generate_pdf_report(result, output_path=None):
         result : Full kundali result dict from calculate_kundali().
         output_path : Optional file path.  Defaults to
                       kundali/outputs/<name>_report.pdf
+        report : Optional ReportDocument already built for *result*
+                 (printing.build_report); built here when omitted.
 
     Returns:
         Absolute path to the generated PDF, or None if fpdf2 is not installed.
@@ -639,7 +650,7 @@ def generate_pdf_report(result, output_path=None):
         here = os.path.dirname(os.path.abspath(__file__))
         out_dir = os.path.join(here, "outputs")
         os.makedirs(out_dir, exist_ok=True)
-        safe_name = _safe_filename(name)
+        safe_name = safe_filename(name)
         output_path = os.path.join(out_dir, f"{safe_name}_report.pdf")
     else:
         output_path = os.path.abspath(output_path)
@@ -654,14 +665,10 @@ def generate_pdf_report(result, output_path=None):
     pdf.set_creator("vedic-kundali")
     pdf.set_subject("Astrological Birth Chart Report")
 
-    # Capture the authoritative text report (single source of truth)
-    buf = io.StringIO()
-    with contextlib.redirect_stdout(io.StringIO()):
-        printing.print_kundali(result, file=buf)
-    txt = buf.getvalue()
-
-    sections = _parse_txt_sections(txt)
-    parts = _group_sections_into_parts(sections)
+    # The report document is the single source of truth for the text report
+    if report is None:
+        report = printing.build_report(result)
+    parts = _group_sections_into_parts(report.sections)
 
     _render_cover_page(pdf, result, name)
 
@@ -680,93 +687,9 @@ def generate_pdf_report(result, output_path=None):
 
 
 # ---------------------------------------------------------------------------
-# Text-driven rendering (mirrors print_kundali output verbatim)
+# Document-driven rendering (sections of printing.build_report)
 # ---------------------------------------------------------------------------
 
-_RULE_RE = re.compile(r"^\s*[-=─═]{5,}\s*$")
-_BANNER_RE = re.compile(r"^[═=]{20,}\s*$")
-
-
-def _parse_txt_sections(txt):
-    """Split the txt report into (kind, title, body_lines) sections.
-
-    kind is one of:
-      'header'  — top-of-file banner block (name/birth/panchanga)
-      'banner'  — major ═══ banner (e.g. LIFE GUIDANCE)
-      'section' — title line followed by a --- rule
-      'free'    — trailing prose (Final Analysis etc.)
-    """
-    lines = txt.splitlines()
-    # Drop leading blank lines so the banner lands at index 0
-    while lines and not lines[0].strip():
-        lines.pop(0)
-    n = len(lines)
-    sections = []
-    i = 0
-
-    # 1) Leading banner: ═══ / VEDIC KUNDALI / ═══ + key-value lines up to first blank
-    if i < n and _BANNER_RE.match(lines[i] or ""):
-        header_body = []
-        header_body.append(lines[i]); i += 1
-        while i < n and lines[i].strip():
-            header_body.append(lines[i]); i += 1
-        sections.append(("header", "Birth Details & Panchanga", header_body))
-
-    while i < n:
-        line = lines[i]
-        # Skip blanks between sections
-        if not line.strip():
-            i += 1
-            continue
-
-        # Major banner: ═══ / TITLE / ═══
-        if _BANNER_RE.match(line):
-            if i + 2 < n and _BANNER_RE.match(lines[i + 2] or ""):
-                title = lines[i + 1].strip()
-                i += 3
-                sections.append(("banner", title, []))
-                continue
-            # Lone banner (end of file) — skip
-            i += 1
-            continue
-
-        # Titled section: "Some Title:" followed by a rule line
-        if i + 1 < n and _RULE_RE.match(lines[i + 1] or ""):
-            title = _strip_leading_symbols(line.rstrip(": ").strip()).strip()
-            i += 2
-            body = []
-            while i < n:
-                if not lines[i].strip():
-                    # Lookahead: blank + new titled section → end
-                    j = i + 1
-                    while j < n and not lines[j].strip():
-                        j += 1
-                    if j < n and (
-                        _BANNER_RE.match(lines[j] or "")
-                        or (j + 1 < n and _RULE_RE.match(lines[j + 1] or ""))
-                    ):
-                        break
-                    body.append(lines[i])
-                    i += 1
-                    continue
-                body.append(lines[i])
-                i += 1
-            sections.append(("section", title, body))
-            continue
-
-        # Free prose block (e.g. Final Analysis after LIFE GUIDANCE banner)
-        body = []
-        while i < n and not _BANNER_RE.match(lines[i] or ""):
-            if i + 1 < n and _RULE_RE.match(lines[i + 1] or ""):
-                break
-            body.append(lines[i])
-            i += 1
-        if any(b.strip() for b in body):
-            sections.append(("free", "", body))
-
-    return sections
-
-
 # Map of section title → (part_index, part_title)
 _PART_DEFS = [
     ("I",    "Foundations",              "Birth, Panchanga & Planetary Positions"),
@@ -849,21 +772,6 @@ _TITLE_TO_PART = {
 }
 
 
-def _strip_leading_symbols(s):
-    """Drop leading emoji / symbols / whitespace from a section title."""
-    i = 0
-    while i < len(s) and not (s[i].isalnum() or s[i] in "(["):
-        i += 1
-    return s[i:]
-
-
-def _normalise_title(title):
-    """Strip trailing punctuation/case quirks for lookup."""
-    t = title.strip().rstrip(":").strip()
-    t = _strip_leading_symbols(t).strip()
-    return t
-
-
 def _group_sections_into_parts(sections):
     """Return [(part_title, part_subtitle, [section,...]), ...] for every part
     that has at least one section assigned.
@@ -872,13 +780,12 @@ def _group_sections_into_parts(sections):
     in_life_guidance = False
 
     for sec in sections:
-        kind, title, body = sec
-        if kind == "banner":
-            if "LIFE GUIDANCE" in title.upper():
+        if sec.kind == "banner":
+            if "LIFE GUIDANCE" in sec.title.upper():
                 in_life_guidance = True
             continue
 
-        if kind == "free":
+        if sec.kind == "free":
             # Trailing prose → Life Guidance part (VIII)
             buckets[7].append(sec)
             continue
@@ -887,7 +794,7 @@ def _group_sections_into_parts(sections):
             buckets[7].append(sec)
             continue
 
-        key = _normalise_title(title)
+        key = section_title(sec.title)
         idx = _TITLE_TO_PART.get(key)
         if idx is None:
             # Fallback heuristics
@@ -918,31 +825,9 @@ def _group_sections_into_parts(sections):
 
 
 # ---------------------------------------------------------------------------
-# Page renderers for the txt-driven layout
+# Block renderers for the document-driven layout
 # ---------------------------------------------------------------------------
 
-_SHORT_PLANET_LINE_RE = re.compile(r"^\s*(Su|Mo|Ma|Me|Ju|Ve|Sa|Ra|Ke):\s+.+$")
-_LONG_PLANET_LINE_RE = re.compile(
-    r"^\s*(Sun|Moon|Mars|Mercury|Jupiter|Venus|Saturn|Rahu|Ketu)\s+in\s+.+$"
-)
-_KV_LINE_RE = re.compile(r"^\s*([A-Za-z0-9()/'&.+ \-]{2,42})\s*:\s*(.+)\s*$")
-_BULLET_LINE_RE = re.compile(
-    r"^\s*(\d+\.)\s+(.+)$|^\s*(\?\?|└─|├─|[*•\-~✓⚠!]|->|=>|→)\s*(.+)$"
-)
-_BOX_TITLE_RE = re.compile(r"^\s*[┌├]\s*[-─]*\s*(.+?)\s*[-─]*[┐┤]\s*$")
-_BOX_BORDER_RE = re.compile(r"^\s*[└┘┌┐├┤][─-]{8,}[└┘┌┐├┤]?\s*$")
-_TRANSIT_SUMMARY_RE = re.compile(
-    r"^\s*(Su|Mo|Ma|Me|Ju|Ve|Sa|Ra|Ke):\s+.+\(house\s+\d+\)\s+[–-]\s+.+$"
-)
-_ASPECT_DETAIL_RE = re.compile(r"^\s*[A-Za-z]{2}\s*(?:->|→)\s*[A-Za-z]{2}\s*:\s+.+$")
-_DATED_EVENT_RE = re.compile(r"^\s*\d{4}-\d{2}-\d{2}\s{2,}\S.+$")
-_TABULAR_HEADER_RE = re.compile(r"^\s*(Yogini|Sign|Period)\s{2,}.+$")
-_TABULAR_ROW_RE = re.compile(
-    r"^\s*(?:Day|Night)\s+Yama\s+\d+\s{2,}.+$|"
-    r"^\s*[A-Za-z][A-Za-z0-9/()\- ]{0,18}\s{2,}[A-Za-z]{1,10}\s{2,}\d+(?:\.\d+)?\s{2,}\d{4}[–-]\d{4}\s*$"
-)
-
-
 def _collapse_inline_spaces(text):
     return re.sub(r"\s{2,}", " ", text.strip())
 
@@ -967,64 +852,6 @@ def _ensure_content_space(pdf, height, section_title=None):
         pdf.continuation_heading(section_title)
 
 
-def _looks_note_line(line):
-    stripped = line.strip()
-    if not stripped:
-        return False
-    if stripped.startswith("(") and stripped.endswith(")"):
-        return True
-    lowered = stripped.lower()
-    return lowered.startswith(("note:", "legend:", "aspect strengths:"))
-
-
-def _looks_preformatted_line(line):
-    stripped = line.strip()
-    if not stripped:
-        return False
-    if _SHORT_PLANET_LINE_RE.match(stripped) or _LONG_PLANET_LINE_RE.match(stripped):
-        return True
-    if re.match(r"^H\d{2}\s+\(", stripped):
-        return True
-    if "████" in stripped or "░" in stripped:
-        return True
-    if "[" in stripped and "]" in stripped and " | " in stripped:
-        return True
-    if re.match(
-        r"^(Sun|Moon|Mars|Mercury|Jupiter|Venus|Saturn|Rahu|Ketu)\s+\[",
-        stripped,
-    ):
-        return True
-    if (
-        _TRANSIT_SUMMARY_RE.match(stripped)
-        or _ASPECT_DETAIL_RE.match(stripped)
-        or _DATED_EVENT_RE.match(stripped)
-        or _TABULAR_HEADER_RE.match(stripped)
-        or _TABULAR_ROW_RE.match(stripped)
-    ):
-        return True
-    return False
-
-
-def _parse_kv_line(line):
-    if _looks_preformatted_line(line):
-        return None
-    match = _KV_LINE_RE.match(line)
-    if not match:
-        return None
-    key, value = match.groups()
-    return _collapse_inline_spaces(key), _collapse_inline_spaces(value)
-
-
-def _parse_bullet_line(line):
-    stripped = line.strip()
-    match = _BULLET_LINE_RE.match(stripped)
-    if not match:
-        return None
-    if match.group(1):
-        return match.group(1), match.group(2).strip()
-    return match.group(3), match.group(4).strip()
-
-
 def _bullet_marker(prefix):
     prefix = (prefix or "*").strip()
     if prefix.endswith("."):
@@ -1051,37 +878,6 @@ def _bullet_indent(prefix):
     return 5 if (prefix or "").strip() in {"??", "└─", "├─"} else 0
 
 
-def _parse_box_title(line):
-    stripped = line.strip()
-    match = _BOX_TITLE_RE.match(stripped)
-    if not match:
-        return None
-    title = re.sub(r"\s{2,}", " ", match.group(1)).strip(" -─")
-    return title or None
-
-
-def _is_inline_subheading(line):
-    stripped = line.strip()
-    if not stripped or len(stripped) > 72 or not stripped.endswith(":"):
-        return False
-    if _parse_bullet_line(stripped) is not None:
-        return False
-    kv = _parse_kv_line(stripped)
-    return kv is None
-
-
-def _expand_compound_bullet_lines(lines):
-    expanded = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("?? ") and stripped.count("?? ") > 1:
-            parts = re.split(r"\s+(?=\?\?\s+)", stripped)
-            expanded.extend(part.strip() for part in parts if part.strip())
-            continue
-        expanded.append(line)
-    return expanded
-
-
 def _render_paragraph_block(pdf, lines, section_title=None):
     text = " ".join(_collapse_inline_spaces(line) for line in lines if line.strip())
     if not text:
@@ -1299,7 +1095,7 @@ def _render_part_divider(pdf, number, part_title, subtitle, sections):
     pdf.rect(0, 22, pdf.w, 1.2, "F")
 
     title_body = part_title.split("—", 1)[-1].strip() if "—" in part_title else part_title
-    section_titles = [title for _, title, _ in sections if title]
+    section_titles = [sec.title for sec in sections if sec.title]
 
     pdf.set_xy(pdf.l_margin, 7)
     pdf.set_font("Helvetica", "B", 8.5)
@@ -1374,121 +1170,35 @@ def _render_part_divider(pdf, number, part_title, subtitle, sections):
 
 
 def _render_section(pdf, sec):
-    kind, title, body = sec
-
-    body = [
-        line
-        for line in body
-        if not _RULE_RE.match(line or "") and not _BOX_BORDER_RE.match((line or "").strip())
-    ]
-    body = _expand_compound_bullet_lines(body)
-
     if pdf.get_y() + 25 > pdf.page_break_trigger:
         pdf.start_new_standard_page()
 
-    if title:
-        pdf.section_title(title)
+    if sec.title:
+        pdf.section_title(sec.title)
 
-    while body and not body[0].strip():
-        body = body[1:]
-    while body and not body[-1].strip():
-        body = body[:-1]
-
-    section_name = title or "Guidance"
-    idx = 0
-    while idx < len(body):
-        raw = body[idx]
-        stripped = raw.strip()
-
-        if not stripped:
+    section_name = sec.title or "Guidance"
+    for block in sec.blocks:
+        kind = block.kind
+        if kind == BLANK:
             pdf.ln(1.2)
-            idx += 1
-            continue
-
-        box_title = _parse_box_title(stripped)
-        if box_title:
-            pdf.section_title(box_title.title())
-            idx += 1
-            continue
-
-        if _is_inline_subheading(stripped):
+        elif kind == BOX:
+            pdf.section_title(block.items.title())
+        elif kind == HEADING:
             _ensure_content_space(pdf, 10, section_title=section_name)
-            pdf.sub_section(stripped.rstrip(":"))
-            idx += 1
-            continue
-
-        if _looks_note_line(stripped):
-            end = idx + 1
-            while end < len(body) and body[end].strip() and _looks_note_line(body[end].strip()):
-                end += 1
-            _render_note_block(pdf, body[idx:end], section_title=section_name)
-            idx = end
-            continue
-
-        bullet = _parse_bullet_line(stripped)
-        if bullet is not None:
-            items = []
-            end = idx
-            while end < len(body):
-                current = body[end].strip()
-                parsed = _parse_bullet_line(current)
-                if not current or parsed is None:
-                    break
-                items.append(parsed)
-                end += 1
-            _render_bullet_block(pdf, items, section_title=section_name)
-            idx = end
-            continue
-
-        kv = _parse_kv_line(stripped)
-        if kv is not None:
-            rows = []
-            end = idx
-            while end < len(body):
-                current = body[end].strip()
-                parsed = _parse_kv_line(current)
-                if not current or parsed is None:
-                    break
-                rows.append(parsed)
-                end += 1
-            _ensure_content_space(pdf, len(rows) * 8 + 2, section_title=section_name)
-            for row_idx, (label, value) in enumerate(rows):
+            pdf.sub_section(block.items)
+        elif kind == NOTE:
+            _render_note_block(pdf, block.items, section_title=section_name)
+        elif kind == BULLETS:
+            _render_bullet_block(pdf, block.items, section_title=section_name)
+        elif kind == KEY_VALUES:
+            _ensure_content_space(pdf, len(block.items) * 8 + 2, section_title=section_name)
+            for row_idx, (label, value) in enumerate(block.items):
                 pdf.kv_row(label, value, row_idx=row_idx)
             pdf.ln(1.2)
-            idx = end
-            continue
-
-        if _looks_preformatted_line(stripped):
-            lines = []
-            end = idx
-            while end < len(body):
-                current = body[end].strip()
-                if not current or not _looks_preformatted_line(current):
-                    break
-                lines.append(body[end])
-                end += 1
-            _render_preformatted_block(pdf, lines, section_title=section_name)
-            idx = end
-            continue
-
-        lines = []
-        end = idx
-        while end < len(body):
-            current = body[end].strip()
-            if not current:
-                break
-            if (
-                _is_inline_subheading(current)
-                or _looks_note_line(current)
-                or _parse_bullet_line(current) is not None
-                or _parse_kv_line(current) is not None
-                or _looks_preformatted_line(current)
-            ):
-                break
-            lines.append(body[end])
-            end += 1
-        _render_paragraph_block(pdf, lines, section_title=section_name)
-        idx = end
+        elif kind == TABLE:
+            _render_preformatted_block(pdf, block.items, section_title=section_name)
+        else:
+            _render_paragraph_block(pdf, block.items, section_title=section_name)
     pdf.ln(1.5)
 
 
@@ -15,10 +15,11 @@ Also computes Ishta / Kashta Phala per planet.
 References: B.V. Raman "A Manual of Hindu Astrology", Mantreswara "Phaladeepika".
 """
 
+import functools
 import math
-import swisseph as swe
 
 from .constants import zodiac_signs, sign_lords, NATURAL_BENEFICS, NATURAL_MALEFICS
+from .solar_events import get_sun_rise_set
 
 # ---------------------------------------------------------------------------
 # Exaltation/Debilitation degrees (full longitude 0-360)
@@ -96,6 +97,11 @@ _VARGA_SCORES = {
     "Debilitated": 0.0,
 }
 
+# Sapta-Varga charts besides D1: (label, varga table key)
+_SAPTA_VARGA_KEYS = (
+    ("D2", "d2"), ("D3", "d3"), ("D9", "navamsa"), ("D12", "d12"), ("D30", "d30"), ("D7", "d7"),
+)
+
 # Moolatrikona signs
 _MOOLATRIKONA = {
     "Su": "Leo",
@@ -143,6 +149,7 @@ def _sign_of(full_lon):
     return zodiac_signs[int(full_lon % 360 // 30)]
 
 
+@functools.lru_cache(maxsize=None)
 def _dignity_label(planet, sign):
     """Return dignity category string for Sapta Varga scoring."""
     from .constants import dignity_table
@@ -478,34 +485,7 @@ def calculate_shadbala(result):
     # Sunrise / sunset at birth location
     lat = result.get("lat", 0.0)
     lon_geo = result.get("lon", 0.0)
-    try:
-        sunrise_res, sunrise_tret = swe.rise_trans(
-            birth_jd - 1,
-            swe.SUN,
-            swe.CALC_RISE,
-            (lon_geo, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        sunrise_jd = (
-            sunrise_tret[0] if sunrise_res == 0 and sunrise_tret else birth_jd - 0.25
-        )
-        sunset_res, sunset_tret = swe.rise_trans(
-            birth_jd - 1,
-            swe.SUN,
-            swe.CALC_SET,
-            (lon_geo, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        sunset_jd = (
-            sunset_tret[0] if sunset_res == 0 and sunset_tret else birth_jd + 0.25
-        )
-    except Exception:
-        sunrise_jd = birth_jd - 0.25
-        sunset_jd = birth_jd + 0.25
+    sunrise_jd, sunset_jd = get_sun_rise_set(birth_jd, lat, lon_geo)
 
     sun_lon = planet_data["Su"]["full_lon"]
     moon_lon = planet_data["Mo"]["full_lon"]
@@ -524,15 +504,21 @@ def calculate_shadbala(result):
         speed = pd.get("speed", 0.5)
 
         # Build planet signs across 7 vargas for Sapta Varga Bala
-        planet_signs = {
-            "D1": d1_sign,
-            "D2": pd.get("d2_sign", d1_sign),
-            "D3": pd.get("d3_sign", d1_sign),
-            "D9": pd.get("navamsa_sign", d1_sign),
-            "D12": pd.get("d12_sign", d1_sign),
-            "D30": pd.get("d30_sign", d1_sign),
-            "D7": pd.get("d7_sign", d1_sign),
-        }
+        vargas = result.get("vargas")
+        if vargas is not None and pl in vargas.planets:
+            planet_signs = {"D1": d1_sign}
+            for name, key in _SAPTA_VARGA_KEYS:
+                planet_signs[name] = vargas.sign(pl, key)
+        else:
+            planet_signs = {
+                "D1": d1_sign,
+                "D2": pd.get("d2_sign", d1_sign),
+                "D3": pd.get("d3_sign", d1_sign),
+                "D9": pd.get("navamsa_sign", d1_sign),
+                "D12": pd.get("d12_sign", d1_sign),
+                "D30": pd.get("d30_sign", d1_sign),
+                "D7": pd.get("d7_sign", d1_sign),
+            }
 
         stb, stb_parts = sthana_bala(pl, full_lon, d1_sign, house, planet_signs)
         dgb = dig_bala(pl, house)
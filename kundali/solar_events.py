@@ -0,0 +1,104 @@
+"""
+Shared sunrise/sunset service.
+
+Sunrise and sunset are needed by the Vara (sunrise-based weekday), Shadbala,
+Upagrahas, Pancha Pakshi and every Muhurtha panchanga.  Each local day's
+events are computed once per location with ``swe.rise_trans`` and kept in a
+bounded LRU keyed by (day number, rounded lat/lon), so a chart needs only a
+couple of rise/set computations and multi-day scans reuse each day's sunrise.
+"""
+
+import functools
+import math
+
+import swisseph as swe
+
+SOLAR_EVENT_CACHE_SIZE = 4096
+# 4 decimals ≈ 11 m — far below the precision of a rise/set time.
+_COORD_DECIMALS = 4
+
+
+def _rise_trans(start_jd, lat, lon, rsmi):
+    """Uncached first sunrise/sunset (per *rsmi*) after *start_jd*, or None."""
+    try:
+        res, tret = swe.rise_trans(
+            start_jd,
+            swe.SUN,
+            rsmi,
+            (lon, lat, 0),
+            0,
+            0,
+            swe.FLG_SWIEPH,
+        )
+        if res == 0 and tret and tret[0] > 0:
+            return tret[0]
+    except Exception:
+        pass
+    return None
+
+
+def _day_start_jd(day, lon):
+    """Julian Day of local mean midnight that starts *day*."""
+    return day - 0.5 - lon / 360.0
+
+
+def _day_of(jd, lon):
+    """Local mean day number containing *jd*."""
+    return math.floor(jd + 0.5 + lon / 360.0)
+
+
+@functools.lru_cache(maxsize=SOLAR_EVENT_CACHE_SIZE)
+def _day_events(day, lat, lon):
+    """Return (sunrise_jd, sunset_jd) of local day *day*; either may be None."""
+    start = _day_start_jd(day, lon)
+    return (
+        _rise_trans(start, lat, lon, swe.CALC_RISE),
+        _rise_trans(start, lat, lon, swe.CALC_SET),
+    )
+
+
+def _event_after(start_jd, lat, lon, index, rsmi):
+    lat = round(lat, _COORD_DECIMALS)
+    lon = round(lon, _COORD_DECIMALS)
+    day = _day_of(start_jd, lon)
+    for offset in range(3):
+        event_jd = _day_events(day + offset, lat, lon)[index]
+        if event_jd is not None and event_jd > start_jd:
+            return event_jd
+    # Polar day/night: fall back to an open-ended search.
+    return _rise_trans(start_jd, lat, lon, rsmi)
+
+
+def sunrise_after(start_jd, lat, lon):
+    """Return the first sunrise after *start_jd* at (lat, lon), or None."""
+    return _event_after(start_jd, lat, lon, 0, swe.CALC_RISE)
+
+
+def sunset_after(start_jd, lat, lon):
+    """Return the first sunset after *start_jd* at (lat, lon), or None."""
+    return _event_after(start_jd, lat, lon, 1, swe.CALC_SET)
+
+
+def get_sun_rise_set(jd, lat, lon):
+    """
+    Return (sunrise_jd, sunset_jd) for the day of *jd*.
+
+    Both are the first events after ``jd - 1``; when an event cannot be found
+    the fallbacks are 6 h before / after *jd*.
+    """
+    sunrise_jd = sunrise_after(jd - 1, lat, lon)
+    sunset_jd = sunset_after(jd - 1, lat, lon)
+    return (
+        sunrise_jd if sunrise_jd is not None else jd - 0.25,
+        sunset_jd if sunset_jd is not None else jd + 0.25,
+    )
+
+
+def clear_solar_event_cache():
+    """Drop all cached sunrise/sunset values."""
+    _day_events.cache_clear()
+
+
+def solar_event_cache_info():
+    """Return the ``functools`` cache statistics for the solar event LRU."""
+    return _day_events.cache_info()
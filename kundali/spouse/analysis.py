@@ -1,4 +1,3 @@
-import re
 from datetime import datetime
 import pytz
 
@@ -11,6 +10,7 @@ from ..constants import (
     MEETING_CIRCUMSTANCES,
     PROFESSION_BY_HOUSE,
 )
+from ..timings import marriage_dasha_periods
 from ..utils import (
     get_dignity,
     get_navamsa_sign,
@@ -309,19 +309,7 @@ def analyze_marriage_dashas(chart_data, lagna_idx, birth_jd, birth_year):
     """Dasha windows with scores, sandhi detection."""
     periods = chart_data.get("dasha_periods_for_marriage", [])
     if not periods:
-        timings = chart_data.get("timings", {}).get("Marriage", [])
-        for line in timings:
-            m = re.search(r"─\s*(\w+)/(\w+)\s*\((\d{4})-(\d{4})\)", line)
-            if m:
-                periods.append(
-                    {
-                        "maha": m.group(1),
-                        "antara": m.group(2),
-                        "start": int(m.group(3)),
-                        "end": int(m.group(4)),
-                        "score": 8,
-                    }
-                )
+        periods = marriage_dasha_periods(chart_data.get("timings"))
 
     # Dasha Sandhi boundaries
     vim = chart_data.get("vimshottari", {})
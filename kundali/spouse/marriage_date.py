@@ -9,6 +9,9 @@ from ..marriage_date_prediction import (
     get_moon_transit_days,
     get_sidereal_lon,
     approximate_lahiri_ayanamsa,
+    AstropyBackend,
+    SwissEphBackend,
+    cross_check_backends,
     check_nadi_promise,
     format_prediction_result,
 )
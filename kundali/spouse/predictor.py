@@ -7,6 +7,7 @@ from . import analysis
 from . import report
 from ..utils import get_navamsa_sign_and_deg
 from ..constants import SHORT_TO_FULL, ZODIAC_SIGNS, SIGN_LORDS
+from ..timings import marriage_dasha_periods
 
 
 class AdvancedSpousePredictor:
@@ -85,24 +86,10 @@ class AdvancedSpousePredictor:
             self.data["birth_year"],
         )
         # If high-score periods missing but present in timings, add them
-        if not dasha_timing.get("high_score_periods") and self.data.get(
-            "timings", {{}}
-        ).get("Marriage"):
-            timings = self.data["timings"]["Marriage"]
-            import re
-
-            for line in timings:
-                m = re.search(r"─\s*(\w+)/(\w+)\s*\((\d{4})-(\d{4})\)", line)
-                if m:
-                    dasha_timing.setdefault("high_score_periods", []).append(
-                        {
-                            "maha": m.group(1),
-                            "antara": m.group(2),
-                            "start": int(m.group(3)),
-                            "end": int(m.group(4)),
-                            "score": 8,
-                        }
-                    )
+        if not dasha_timing.get("high_score_periods"):
+            marriage_periods = marriage_dasha_periods(self.data.get("timings"))
+            if marriage_periods:
+                dasha_timing["high_score_periods"] = marriage_periods
         pred["dasha_timing"] = dasha_timing
         pred["current_transits"] = analysis.analyze_current_transits(
             self.data, self.lagna_idx
@@ -9,6 +9,7 @@ Covers:
   - Tajika Aspects: Itthasala (applying), Ishrafa (separating), Muthasila,
                     Nakta, Yamaya, Manau, Dutthottha, Radd, Kamboola
   - Varsha Tithi Pravesha: Moon returns to natal tithi position
+  - Tajika series: Annual charts for many years in one pass
 """
 
 import datetime
@@ -16,11 +17,12 @@ import datetime
 import swisseph as swe
 
 from .constants import sign_lords, zodiac_signs
+from .ephemeris import get_ephemeris
 
 # ─── Solar Return (Varsha Pravesh) ────────────────────────────────────────────
 
 
-def find_solar_return_jd(natal_sun_lon, year, birth_jd):
+def find_solar_return_jd(natal_sun_lon, year, birth_jd, ephemeris=None):
     """
     Find Julian Day when Sun returns to natal longitude in a given year.
 
@@ -28,11 +30,12 @@ def find_solar_return_jd(natal_sun_lon, year, birth_jd):
         natal_sun_lon (float): Natal Sun longitude (sidereal, 0-360).
         year (int): Target year (e.g. 2024 for the 2024 solar return).
         birth_jd (float): Julian Day of birth (for starting search point).
+        ephemeris (Ephemeris): Ayanamsa context of *natal_sun_lon* (default Lahiri).
 
     Returns:
         float: Julian Day of solar return.
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    eph = ephemeris or get_ephemeris()
 
     # Start the search around the actual birth anniversary, not January 1.
     birth_year, birth_month, birth_day, birth_hour = swe.revjul(birth_jd, swe.GREG_CAL)
@@ -59,41 +62,39 @@ def find_solar_return_jd(natal_sun_lon, year, birth_jd):
         swe.GREG_CAL,
     )
 
-    # The Sun moves ~1 degree/day, so a +/- 7 day window around the anniversary
-    # is plenty while staying anchored near the real solar return.
-    step = 1.0 / 48.0  # 30 minutes
-    best_jd = approx_jd
-    best_diff = 360.0
-
-    for i in range(-7 * 48, 7 * 48 + 1):
-        jd_test = approx_jd + i * step
-        sun_lon = swe.calc_ut(jd_test, swe.SUN, swe.FLG_SIDEREAL)[0][0]
-        diff = abs((sun_lon - natal_sun_lon + 180) % 360 - 180)
-        if diff < best_diff:
-            best_diff = diff
-            best_jd = jd_test
-
-    # Refine with bisection to minute precision
-    lo, hi = best_jd - step, best_jd + step
-    for _ in range(40):
-        mid = (lo + hi) / 2
-        sun_mid = swe.calc_ut(mid, swe.SUN, swe.FLG_SIDEREAL)[0][0]
-        d = (sun_mid - natal_sun_lon + 180) % 360 - 180
-        if d < 0:
-            lo = mid
-        else:
-            hi = mid
-    return (lo + hi) / 2
+    return _solar_return_near(natal_sun_lon, approx_jd, eph)
+
+
+# Mean interval between two returns of the Sun to a sidereal longitude.
+SIDEREAL_YEAR_DAYS = 365.256363
 
 
-def get_tajika_planets(jd, lat, lon):
+def _solar_return_near(natal_sun_lon, seed_jd, eph, tolerance=1e-8):
+    """
+    Newton iteration for the solar return closest to *seed_jd*.
+
+    The Sun's speed (~1°/day) changes by a few percent over a year, so from a
+    seed within a few days each step gains several digits; typically three
+    or four Sun positions are enough for sub-millisecond precision.
+    """
+    jd = seed_jd
+    for _ in range(20):
+        sun_lon, _lat, _dist, sun_speed = eph.calc(jd, swe.SUN, swe.FLG_SPEED)[:4]
+        step = ((sun_lon - natal_sun_lon + 180) % 360 - 180) / sun_speed
+        jd -= step
+        if abs(step) < tolerance:
+            break
+    return jd
+
+
+def get_tajika_planets(jd, lat, lon, ephemeris=None):
     """
     Calculate planet positions for a Tajika chart (Solar Return).
 
     Returns list of (planet_code, longitude) in sidereal.
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
-    flags = swe.FLG_SIDEREAL | swe.FLG_SPEED
+    eph = ephemeris or get_ephemeris()
+    flags = swe.FLG_SPEED
 
     planet_map = {
         "Su": swe.SUN,
@@ -106,8 +107,8 @@ def get_tajika_planets(jd, lat, lon):
         "Ra": swe.MEAN_NODE,
     }
     result = {}
-    for code, sweid in planet_map.items():
-        data = swe.calc_ut(jd, sweid, flags)[0]
+    positions = eph.calc_many(jd, planet_map.values(), flags)
+    for code, data in zip(planet_map, positions):
         lon_val = data[0] % 360
         speed = data[3]
         result[code] = {
@@ -122,7 +123,7 @@ def get_tajika_planets(jd, lat, lon):
 
     # Ascendant
     try:
-        houses = swe.houses_ex(jd, lat, lon, b"P", swe.FLG_SIDEREAL)[0]
+        houses = eph.houses(jd, lat, lon, b"P")[0]
         asc_lon = houses[0] % 360
         result["Asc"] = {"lon": asc_lon, "sign_idx": int(asc_lon / 30) % 12, "speed": 0}
     except Exception:
@@ -261,52 +262,40 @@ def get_all_tajika_aspects(tajika_planets):
 # ─── Main Tajika Function ─────────────────────────────────────────────────────
 
 
-def calculate_tajika(result, target_year=None, lat=None, lon=None):
-    """
-    Calculate the Annual Tajika (Solar Return) chart for a given year.
-
-    Args:
-        result (dict): Natal kundali result dict.
-        target_year (int): Year for solar return (defaults to current year).
-        lat (float): Latitude for solar return chart.
-        lon (float): Longitude for solar return chart.
-
-    Returns:
-        dict: {
-            year, solar_return_jd, solar_return_date,
-            tajika_planets, muntha, year_lord, aspects,
-            natal_sun_lon, interpretation
-        }
-    """
-    if target_year is None:
-        target_year = datetime.date.today().year
-
+def _natal_basis(result, lat, lon, ephemeris):
+    """Natal inputs shared by every annual chart of *result*."""
     # Use natal coordinates if not provided
     if lat is None:
         lat = result.get("lat", 0.0)
     if lon is None:
         lon = result.get("lon", 0.0)
-
-    birth_jd = result.get("birth_jd", 0)
-    natal_sun_lon = result.get("planets", {}).get("Su", {}).get("full_lon", 0)
     birth_lagna_idx = result.get("lagna_sign_idx")
     if birth_lagna_idx is None:
         birth_lagna_idx = zodiac_signs.index(result.get("lagna_sign", "Aries"))
-    birth_year = result.get("birth_year", 1990)
-    age_years = target_year - birth_year
+    return {
+        "lat": lat,
+        "lon": lon,
+        "eph": ephemeris or get_ephemeris(result.get("ayanamsa")),
+        "birth_jd": result.get("birth_jd", 0),
+        "natal_sun_lon": result.get("planets", {}).get("Su", {}).get("full_lon", 0),
+        "birth_lagna_idx": birth_lagna_idx,
+        "birth_year": result.get("birth_year", 1990),
+    }
+
 
-    # Find solar return JD
-    sr_jd = find_solar_return_jd(natal_sun_lon, target_year, birth_jd)
+def _annual_chart(basis, target_year, sr_jd):
+    """Tajika chart for the solar return at *sr_jd* (see calculate_tajika)."""
+    age_years = target_year - basis["birth_year"]
 
     # Convert to calendar date
     cal = swe.revjul(sr_jd, swe.GREG_CAL)
     sr_date = f"{int(cal[0])}-{int(cal[1]):02d}-{int(cal[2]):02d} {int(cal[3]):02d}:{int((cal[3] % 1)*60):02d}"
 
     # Calculate planet positions for solar return
-    tajika_planets = get_tajika_planets(sr_jd, lat, lon)
+    tajika_planets = get_tajika_planets(sr_jd, basis["lat"], basis["lon"], ephemeris=basis["eph"])
 
     # Muntha
-    muntha = calculate_muntha(birth_lagna_idx, age_years)
+    muntha = calculate_muntha(basis["birth_lagna_idx"], age_years)
 
     # Year lord
     year_lord = calculate_year_lord(sr_jd)
@@ -348,6 +337,72 @@ def calculate_tajika(result, target_year=None, lat=None, lon=None):
         "year_lord": year_lord,
         "aspects": aspects,
         "applying_aspects": applying,
-        "natal_sun_lon": natal_sun_lon,
+        "natal_sun_lon": basis["natal_sun_lon"],
         "interpretation": interp_parts,
     }
+
+
+def calculate_tajika(result, target_year=None, lat=None, lon=None, ephemeris=None):
+    """
+    Calculate the Annual Tajika (Solar Return) chart for a given year.
+
+    Args:
+        result (dict): Natal kundali result dict.
+        target_year (int): Year for solar return (defaults to current year).
+        lat (float): Latitude for solar return chart.
+        lon (float): Longitude for solar return chart.
+        ephemeris (Ephemeris): Ayanamsa context (default: the chart's ayanamsa).
+
+    Returns:
+        dict: {
+            year, solar_return_jd, solar_return_date,
+            tajika_planets, muntha, year_lord, aspects,
+            natal_sun_lon, interpretation
+        }
+    """
+    if target_year is None:
+        target_year = datetime.date.today().year
+
+    basis = _natal_basis(result, lat, lon, ephemeris)
+    sr_jd = find_solar_return_jd(
+        basis["natal_sun_lon"], target_year, basis["birth_jd"], ephemeris=basis["eph"]
+    )
+    return _annual_chart(basis, target_year, sr_jd)
+
+
+def calculate_tajika_series(result, years=None, lat=None, lon=None, ephemeris=None):
+    """
+    Calculate annual Tajika charts for several years in one pass.
+
+    Equivalent to calling calculate_tajika() for each year, but the natal
+    inputs are prepared once and each solar return is seeded from the
+    previous one (one sidereal year later), so Newton converges in a couple
+    of steps.
+
+    Args:
+        result (dict): Natal kundali result dict.
+        years (iterable of int): Target years (default: the next 10 years,
+            starting with the current one).
+        lat, lon, ephemeris: As for calculate_tajika().
+
+    Returns:
+        list of dicts: calculate_tajika() results in the order of *years*.
+    """
+    if years is None:
+        this_year = datetime.date.today().year
+        years = range(this_year, this_year + 10)
+
+    basis = _natal_basis(result, lat, lon, ephemeris)
+    series = []
+    previous = None  # (year, solar_return_jd)
+    for year in years:
+        if previous is None:
+            sr_jd = find_solar_return_jd(
+                basis["natal_sun_lon"], year, basis["birth_jd"], ephemeris=basis["eph"]
+            )
+        else:
+            seed = previous[1] + (year - previous[0]) * SIDEREAL_YEAR_DAYS
+            sr_jd = _solar_return_near(basis["natal_sun_lon"], seed, basis["eph"])
+        previous = (year, sr_jd)
+        series.append(_annual_chart(basis, year, sr_jd))
+    return series
@@ -4,11 +4,20 @@ Fructification timings for major life events (marriage, career, children, wealth
 based on Vimshottari Dasha periods and planetary significations.
 """
 
-import re
+import array
 import datetime
+from collections.abc import Mapping
+
 from .constants import short_to_full, sign_lords, zodiac_signs
 from .marriage_scoring import calculate_marriage_score
 
+# Lords as written in timing periods (full names), indexed in TimingTable
+_LORDS = tuple(short_to_full[code] for code in ("Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa", "Ra", "Ke"))
+_LORD_IDX = {lord: idx for idx, lord in enumerate(_LORDS)}
+# Period tags replacing the [PAST]/[NOW]/[FUTURE] status
+_TAGS = (None, "KARMIC SEED", "KARMIC SEED - too young", "FORMATIVE")
+_TAG_IDX = {tag: idx for idx, tag in enumerate(_TAGS)}
+
 
 def lord_of(house_no, lagna_sign):
     """Return the lord of a given house (1-12) for the given Lagna sign."""
@@ -17,10 +26,186 @@ def lord_of(house_no, lagna_sign):
     return sign_lords[sign]
 
 
-def generate_timings(result, birth_year, birth_jd):
-    """Generate accurate timing predictions from birth to future with probability scores and age awareness."""
+def _year_at(jd, birth_year, birth_jd):
+    """Calendar year of *jd* as the timings count it (birth year + elapsed years)."""
+    return int(birth_year + (jd - birth_jd) / 365.25)
+
+
+class TimingPeriod:
+    """One Mahadasha (``antara`` is None) or Antardasha window for an event."""
+
+    __slots__ = (
+        "event", "maha", "antara", "start_jd", "end_jd",
+        "start_year", "end_year", "start_age", "end_age", "status", "tag", "score",
+    )
+
+    def __init__(self, event, maha, antara, start_jd, end_jd, birth_year, birth_jd,
+                 current_year, tag=None, score=None):
+        self.event = event
+        self.maha = maha
+        self.antara = antara
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.start_year = _year_at(start_jd, birth_year, birth_jd)
+        self.end_year = _year_at(end_jd, birth_year, birth_jd)
+        self.start_age = self.start_year - birth_year
+        self.end_age = self.end_year - birth_year
+        if self.end_year < current_year:
+            self.status = "PAST"
+        elif self.start_year <= current_year <= self.end_year:
+            self.status = "NOW"
+        else:
+            self.status = "FUTURE"
+        self.tag = tag
+        self.score = score
+
+    def active_in(self, year):
+        return self.start_year <= year <= self.end_year
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def describe(self):
+        """The period as report text, without the list marker."""
+        years = f"({self.start_year}-{self.end_year})"
+        ages = f"(Age {self.start_age}-{self.end_age})"
+        if self.antara is None:
+            label = f"[{self.tag}]" if self.tag else f"[{self.status}]"
+            return f"{self.maha} Mahadasha {years} {ages} {label}"
+        pair = f"{self.maha}/{self.antara}"
+        if self.tag:
+            return f"{pair} {years} {ages} [{self.tag}]"
+        if self.score is not None:
+            stars = "★★★" if self.score >= 7 else "★★" if self.score >= 4 else "★"
+            return f"{pair} {years} {ages} {stars} [{self.score}/10] [{self.status}]"
+        return f"{pair} Antardasha {years} {ages} [{self.status}]"
+
+    def render(self):
+        """The period as a report line (the legacy ``timings`` string)."""
+        if self.antara is None:
+            return f"• {self.describe()}"
+        return f" └─ {self.describe()}"
+
+    __str__ = render
+
+    def __repr__(self):
+        return f"TimingPeriod({self.render().strip()!r})"
+
+
+class TimingTable(Mapping):
+    """
+    Timing periods for every event, stored as compact columns.
+
+    Reads like the old ``{event: [report lines]}`` dict (lines are rendered
+    on access), while ``periods()`` / ``active_in()`` give typed periods
+    with Julian Days, lords, tags and marriage scores.
+    """
+
+    __slots__ = (
+        "events", "birth_year", "birth_jd", "current_year",
+        "_event", "_maha", "_antara", "_start_jd", "_end_jd", "_score", "_tag",
+    )
+
+    def __init__(self, events, rows, birth_year, birth_jd, current_year):
+        """*rows*: (event index, maha, antara or None, start_jd, end_jd, score or None, tag or None)."""
+        self.events = tuple(events)
+        self.birth_year = birth_year
+        self.birth_jd = birth_jd
+        self.current_year = current_year
+        self._event = array.array("B")
+        self._maha = array.array("B")
+        self._antara = array.array("b")
+        self._start_jd = array.array("d")
+        self._end_jd = array.array("d")
+        self._score = array.array("b")
+        self._tag = array.array("B")
+        for event_idx, maha, antara, start_jd, end_jd, score, tag in rows:
+            self._event.append(event_idx)
+            self._maha.append(_LORD_IDX[maha])
+            self._antara.append(-1 if antara is None else _LORD_IDX[antara])
+            self._start_jd.append(start_jd)
+            self._end_jd.append(end_jd)
+            self._score.append(-1 if score is None else score)
+            self._tag.append(_TAG_IDX[tag])
+
+    def _rows(self):
+        return zip(self._event, self._maha, self._antara, self._start_jd,
+                   self._end_jd, self._score, self._tag)
+
+    def _period(self, row):
+        event_idx, maha, antara, start_jd, end_jd, score, tag = row
+        return TimingPeriod(
+            self.events[event_idx], _LORDS[maha], None if antara < 0 else _LORDS[antara],
+            start_jd, end_jd, self.birth_year, self.birth_jd, self.current_year,
+            tag=_TAGS[tag], score=None if score < 0 else score,
+        )
+
+    def periods(self, event=None):
+        """Typed periods, for one *event* or all of them, in report order."""
+        if event is None:
+            return [self._period(row) for row in self._rows()]
+        if event not in self.events:
+            return []
+        event_idx = self.events.index(event)
+        return [self._period(row) for row in self._rows() if row[0] == event_idx]
+
+    def active_in(self, year, event=None):
+        """Periods covering calendar *year* (same year counting as the report)."""
+        return [p for p in self.periods(event) if p.active_in(year)]
+
+    def events_active_in(self, year):
+        """Events with a period covering *year*, read straight from the columns."""
+        by, bj = self.birth_year, self.birth_jd
+        active = {
+            event_idx
+            for event_idx, start_jd, end_jd in zip(self._event, self._start_jd, self._end_jd)
+            if _year_at(start_jd, by, bj) <= year <= _year_at(end_jd, by, bj)
+        }
+        return [event for idx, event in enumerate(self.events) if idx in active]
+
+    # Mapping view: event -> rendered report lines
+    def __getitem__(self, event):
+        if event not in self.events:
+            raise KeyError(event)
+        return [p.render() for p in self.periods(event)]
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __reduce__(self):
+        rows = [
+            (e, _LORDS[m], None if a < 0 else _LORDS[a], s, t, None if sc < 0 else sc, _TAGS[tg])
+            for e, m, a, s, t, sc, tg in self._rows()
+        ]
+        return (TimingTable, (self.events, rows, self.birth_year, self.birth_jd, self.current_year))
+
+    def __repr__(self):
+        return f"TimingTable({len(self._event)} periods, events={list(self.events)})"
+
+
+def marriage_dasha_periods(timings):
+    """Marriage Antardashas as ``{"maha", "antara", "start", "end", "score": 8}`` dicts."""
+    if not isinstance(timings, TimingTable):
+        return []
+    return [
+        {"maha": p.maha, "antara": p.antara, "start": p.start_year, "end": p.end_year, "score": 8}
+        for p in timings.periods("Marriage")
+        if p.antara is not None
+    ]
+
+
+def generate_timings(result, birth_year, birth_jd, current_year=None):
+    """Generate accurate timing predictions from birth to future with probability scores and age awareness.
+
+    Returns a ``TimingTable``: ``timings[event]`` is the list of report lines,
+    ``timings.periods(event)`` the typed periods behind them.
+    """
     dashas = result["vimshottari"]["mahadasas"]
-    current_year = datetime.datetime.now().year
+    if current_year is None:
+        current_year = datetime.datetime.now().year
     # Cover from birth to 20 years in future
     start_year = birth_year
     end_year = current_year + 20
@@ -65,8 +250,8 @@ def generate_timings(result, birth_year, birth_jd):
         ],
     }
 
-    output = {}
-    for event, fav_lords in events.items():
+    rows = []
+    for event_idx, (event, fav_lords) in enumerate(events.items()):
         periods = []
         # Set minimum age based on event type
         if event == "Marriage":
@@ -82,106 +267,46 @@ def generate_timings(result, birth_year, birth_jd):
 
         for md in dashas:
             md_lord = md["lord"]
-            md_start_age = (md["start_jd"] - birth_jd) / 365.25
-            md_start_y = int(birth_year + md_start_age)
-            md_end_y = int(birth_year + (md["end_jd"] - birth_jd) / 365.25)
+            md_start_y = _year_at(md["start_jd"], birth_year, birth_jd)
+            md_end_y = _year_at(md["end_jd"], birth_year, birth_jd)
             # Skip if MD is completely outside our window (birth to future)
             if md_end_y < start_year or md_start_y > end_year:
                 continue
-            # Determine status (Past/Current/Future)
-            status = (
-                "[PAST]"
-                if md_end_y < current_year
-                else "[NOW]"
-                if md_start_y <= current_year <= md_end_y
-                else "[FUTURE]"
-            )
-            # Calculate age at period start
-            start_age = md_start_y - birth_year
-            age_str = f"(Age {start_age}-{md_end_y - birth_year})"
-
-            # Include if MD lord is favorable
+            md_row = (event_idx, md_lord, None, md["start_jd"], md["end_jd"], None, None)
+
+            # Include if MD lord is favorable; periods before the minimum
+            # age are marked as "Karmic Seed"
             md_header_emitted = False
             if md_lord in fav_lords:
-                # Mark periods before minimum age as "Karmic Seed"
-                if md_end_y < min_event_year:
-                    periods.append(
-                        f"• {md_lord} Mahadasha ({md_start_y}-{md_end_y}) {age_str} [KARMIC SEED]"
-                    )
-                else:
-                    periods.append(
-                        f"• {md_lord} Mahadasha ({md_start_y}-{md_end_y}) {age_str} {status}"
-                    )
+                tag = "KARMIC SEED" if md_end_y < min_event_year else None
+                periods.append((md_start_y, md_row[:5] + (None, tag)))
                 md_header_emitted = True
             # Check antardashas within our full timeline
             for ad in md.get("antardashas", []):
                 if ad["lord"] in fav_lords:
-                    ad_start_age = (ad["start_jd"] - birth_jd) / 365.25
-                    ad_end_age = (ad["end_jd"] - birth_jd) / 365.25
-                    ad_start_y = int(birth_year + ad_start_age)
-                    ad_end_y = int(birth_year + ad_end_age)
+                    ad_start_y = _year_at(ad["start_jd"], birth_year, birth_jd)
+                    ad_end_y = _year_at(ad["end_jd"], birth_year, birth_jd)
                     # Include if AD starts or overlaps within our full timeline
                     if ad_start_y <= end_year and ad_end_y >= start_year:
                         # Emit parent Mahadasha header if not already printed
                         if not md_header_emitted:
-                            periods.append(
-                                f"• {md_lord} Mahadasha ({md_start_y}-{md_end_y}) {age_str} {status}"
-                            )
+                            periods.append((md_start_y, md_row))
                             md_header_emitted = True
-                        # Determine AD status
-                        ad_status = (
-                            "[PAST]"
-                            if ad_end_y < current_year
-                            else (
-                                "[NOW]"
-                                if ad_start_y <= current_year <= ad_end_y
-                                else "[FUTURE]"
-                            )
-                        )
-                        # Calculate age for this period
-                        ad_age_str = (
-                            f"Age {ad_start_y - birth_year}-{ad_end_y - birth_year}"
-                        )
-
-                        # For marriage, add probability score and age filtering
+                        score = None
                         if event == "Marriage":
-                            score = calculate_marriage_score(
-                                result, md_lord, ad["lord"]
-                            )
-                            prob_label = (
-                                "★★★" if score >= 7 else "★★" if score >= 4 else "★"
-                            )
-                            # Mark pre-21 as karmic seed for marriage
-                            if ad_end_y < min_event_year:
-                                periods.append(
-                                    f" └─ {md_lord}/{ad['lord']} ({ad_start_y}-{ad_end_y}) ({ad_age_str}) [KARMIC SEED - too young]"
-                                )
-                            else:
-                                periods.append(
-                                    f" └─ {md_lord}/{ad['lord']} ({ad_start_y}-{ad_end_y}) ({ad_age_str}) {prob_label} [{score}/10] {ad_status}"
-                                )
+                            # Probability score; pre-21 is a karmic seed
+                            score = calculate_marriage_score(result, md_lord, ad["lord"])
+                            tag = "KARMIC SEED - too young" if ad_end_y < min_event_year else None
                         else:
-                            # For other events, mark appropriately
-                            if ad_end_y < min_event_year:
-                                periods.append(
-                                    f" └─ {md_lord}/{ad['lord']} ({ad_start_y}-{ad_end_y}) ({ad_age_str}) [FORMATIVE]"
-                                )
-                            else:
-                                periods.append(
-                                    f" └─ {md_lord}/{ad['lord']} Antardasha ({ad_start_y}-{ad_end_y}) ({ad_age_str}) {ad_status}"
-                                )
-        # Sort by year and include up to 20 periods
-        output[event] = (
-            sorted(
-                periods,
-                key=lambda x: (
-                    int(re.search(r"\((\d{4})", x).group(1))
-                    if re.search(r"\((\d{4})", x)
-                    else 0
-                ),
-            )[:20]
-            if periods
-            else []
-        )
+                            tag = "FORMATIVE" if ad_end_y < min_event_year else None
+                        periods.append(
+                            (
+                                ad_start_y,
+                                (event_idx, md_lord, ad["lord"], ad["start_jd"], ad["end_jd"], score, tag),
+                            )
+                        )
+        # Sort by start year and include up to 20 periods
+        periods.sort(key=lambda p: p[0])
+        rows.extend(row for _, row in periods[:20])
 
-    return output
+    return TimingTable(tuple(events), rows, birth_year, birth_jd, current_year)
@@ -5,8 +5,12 @@ Uses Swiss Ephemeris for precise event timing.
 """
 
 import datetime
+import math
+
 import swisseph as swe
 
+from .ephemeris import get_ephemeris
+
 PLANET_IDS = {
     "Su": swe.SUN,
     "Mo": swe.MOON,
@@ -33,16 +37,16 @@ ZODIAC_SIGNS = [
     "Pisces",
 ]
 
-# Scan step sizes in days per planet (coarse scan)
-_PLANET_STEP = {
-    "Su": 1,
-    "Ma": 1,
-    "Me": 1,
-    "Ve": 1,
-    "Ju": 7,
-    "Sa": 7,
-    "Ra": 7,
-}
+# Planets scanned for ingresses and stations (the Moon moves too fast)
+_SCAN_PLANETS = ("Su", "Ma", "Me", "Ve", "Ju", "Sa", "Ra")
+
+# Sample spacing in days.  Every step must contain at most one station of a
+# planet (or of a planet pair's relative motion): the shortest gap between
+# two stations is Mercury's ~3-week retrograde.  Ju/Sa/Ra natal hits only
+# turn at Jupiter/Saturn stations, months apart.
+_SCAN_STEP = 8.0
+_SLOW_SCAN_STEP = 16.0
+_ROOT_TOLERANCE = 1e-5  # days (< 1 s)
 
 # Planets that can go retrograde
 _RETROGRADE_PLANETS = {"Ma", "Me", "Ju", "Ve", "Sa"}
@@ -72,54 +76,161 @@ def _jd_to_date(jd):
     return f"{int(y)}-{int(mo):02d}-{int(d):02d}"
 
 
-def _get_lon(planet_id, jd):
-    """Return (sidereal longitude, speed) for a planet at the given JD."""
-    flags = swe.FLG_SIDEREAL | swe.FLG_SPEED
-    result = swe.calc_ut(jd, planet_id, flags)
-    return result[0][0], result[0][3]  # lon, speed
-
-
 def _sign_index(lon):
     """Return sign index (0-11) for an ecliptic longitude."""
     return int(lon / 30) % 12
 
 
-def _bisect_ingress(planet_id, jd_before, jd_after, tolerance=0.001):
+def _wrap(angle):
+    """Signed angle in [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _find_root(f, a, b, fa, fb, tolerance=_ROOT_TOLERANCE):
     """
-    Binary-search for the exact JD when planet crosses a sign boundary.
-    jd_before  → planet still in the 'old' sign
-    jd_after   → planet already in the 'new' sign
+    Root of *f* in [a, b], where fa = f(a) and fb = f(b) differ in sign.
+
+    ``f(t)`` returns (value, slope).  Newton steps use the slope (a planet's
+    speed); when it is None the secant through the last two evaluations is
+    used instead.  Steps that leave the bracket fall back to bisection.
     """
-    sign_before = _sign_index(_get_lon(planet_id, jd_before)[0])
-    for _ in range(50):  # max iterations
-        jd_mid = (jd_before + jd_after) / 2.0
-        if jd_after - jd_before < tolerance:
-            break
-        lon_mid, _ = _get_lon(planet_id, jd_mid)
-        if _sign_index(lon_mid) == sign_before:
-            jd_before = jd_mid
+    t_prev, f_prev = b, fb
+    t = a - fa * (b - a) / (fb - fa)
+    for _ in range(60):
+        value, slope = f(t)
+        if value == 0:
+            return t
+        if (value < 0) == (fa < 0):
+            a, fa = t, value
         else:
-            jd_after = jd_mid
-    return (jd_before + jd_after) / 2.0
+            b, fb = t, value
+        if slope is None and t != t_prev:
+            slope = (value - f_prev) / (t - t_prev)
+        t_next = t - value / slope if slope else (a + b) / 2.0
+        if not a < t_next < b:
+            t_next = (a + b) / 2.0
+        if abs(t_next - t) < tolerance:
+            return t_next
+        t_prev, f_prev, t = t, value, t_next
+    return t
+
+
+class _Scan:
+    """
+    Sidereal (lon, speed) of several planets sampled on a common grid.
+
+    All planets are evaluated together at each instant (one ayanamsa lookup
+    per instant); events are then located between samples and refined with
+    single-instant calls.
+    """
+
+    def __init__(self, eph, start_jd, end_jd, codes, step=_SCAN_STEP):
+        self.eph = eph
+        self.codes = codes
+        self.ids = [PLANET_IDS[code] for code in codes]
+        n = max(1, math.ceil((end_jd - start_jd) / step))
+        self.jds = [start_jd + i * step for i in range(n)] + [end_jd]
+        self.samples = [self.at(jd) for jd in self.jds]
+        self._planet_events = {}
+
+    def at(self, jd, codes=None):
+        """{code: (lon, speed)} at *jd* for *codes* (default: all scanned)."""
+        codes = codes or self.codes
+        positions = self.eph.calc_many(jd, [PLANET_IDS[c] for c in codes], swe.FLG_SPEED)
+        return {code: (pos[0], pos[3]) for code, pos in zip(codes, positions)}
 
+    def steps(self):
+        """Yield (jd_a, jd_b, sample_a, sample_b) for consecutive samples."""
+        for k in range(len(self.jds) - 1):
+            yield self.jds[k], self.jds[k + 1], self.samples[k], self.samples[k + 1]
 
-def _bisect_station(planet_id, jd_before, jd_after, tolerance=0.001):
+
+def _station(scan, code, a, b, speed_a, speed_b):
+    """JD where *code*'s speed changes sign between a and b."""
+    return _find_root(lambda t: (scan.at(t, (code,))[code][1], None), a, b, speed_a, speed_b)
+
+
+def _planet_events(scan, code):
     """
-    Binary-search for the exact JD when planet's speed crosses zero.
-    Returns the JD of the station.
+    Exact ingresses and stations of one scanned planet.
+
+    Each step is split at its station (if any), leaving monotone pieces in
+    which a sign change means exactly one boundary crossing.
+
+    Returns:
+        (ingresses, stations): lists of (jd, from_sign, to_sign) and
+        (jd, speed_before, lon_at_station).
     """
-    spd_before = _get_lon(planet_id, jd_before)[1]
-    for _ in range(50):
-        jd_mid = (jd_before + jd_after) / 2.0
-        if jd_after - jd_before < tolerance:
-            break
-        spd_mid = _get_lon(planet_id, jd_mid)[1]
-        if (spd_before >= 0) == (spd_mid >= 0):
-            jd_before = jd_mid
-            spd_before = spd_mid
-        else:
-            jd_after = jd_mid
-    return (jd_before + jd_after) / 2.0
+    cached = scan._planet_events.get(code)
+    if cached is not None:
+        return cached
+    ingresses, stations = [], []
+    for a, b, sample_a, sample_b in scan.steps():
+        (lon_a, speed_a), (lon_b, speed_b) = sample_a[code], sample_b[code]
+        points = [(a, lon_a)]
+        if (speed_a < 0) != (speed_b < 0):
+            t = _station(scan, code, a, b, speed_a, speed_b)
+            lon_t = scan.at(t, (code,))[code][0]
+            stations.append((t, speed_a, lon_t))
+            points.append((t, lon_t))
+        points.append((b, lon_b))
+
+        for (t0, lon0), (t1, lon1) in zip(points, points[1:]):
+            sign0, sign1 = _sign_index(lon0), _sign_index(lon1)
+            if sign0 == sign1:
+                continue
+            boundary = 30.0 * (sign1 if (sign1 - sign0) % 12 == 1 else sign0)
+
+            def offset(t):
+                lon, speed = scan.at(t, (code,))[code]
+                return _wrap(lon - boundary), speed
+
+            t = _find_root(offset, t0, t1, _wrap(lon0 - boundary), _wrap(lon1 - boundary))
+            ingresses.append((t, sign0, sign1))
+    scan._planet_events[code] = ingresses, stations
+    return ingresses, stations
+
+
+def _closest_approaches(jds, values, refine, orb):
+    """
+    Instants where a relative angle g(t) comes within *orb* of zero.
+
+    ``values[k]`` is (g, dg/dt) at ``jds[k]`` and ``refine(t)`` evaluates the
+    same pair.  Each step is split where dg/dt changes sign, so every piece
+    is monotone and crosses zero at most once.
+
+    Returns:
+        list of (jd, |g|) for every exact crossing and every local minimum
+        of |g| within the orb, in time order.
+    """
+    hits = []
+    for k in range(len(jds) - 1):
+        a, b = jds[k], jds[k + 1]
+        (ga, da), (gb, db) = values[k], values[k + 1]
+        points = [(a, ga)]
+        if (da < 0) != (db < 0):
+            t = _find_root(lambda x: (refine(x)[1], None), a, b, da, db)
+            g = refine(t)[0]
+            if g * da < 0 and abs(g) <= orb:  # |g| was shrinking: a near miss
+                hits.append((t, abs(g)))
+            points.append((t, g))
+        points.append((b, gb))
+
+        for (t0, g0), (t1, g1) in zip(points, points[1:]):
+            if (g0 < 0) != (g1 < 0) and abs(g1 - g0) < 180:
+                t = _find_root(refine, t0, t1, g0, g1)
+                hits.append((t, abs(refine(t)[0])))
+    hits.sort()
+    return hits
+
+
+def _dedupe(hits, min_gap=30):
+    """Drop hits within *min_gap* days of the previously kept one."""
+    kept = []
+    for jd, orb in hits:
+        if not kept or jd - kept[-1][0] > min_gap:
+            kept.append((jd, orb))
+    return kept
 
 
 def _months_to_jd(current_jd, months):
@@ -132,7 +243,45 @@ def _months_to_jd(current_jd, months):
 # ---------------------------------------------------------------------------
 
 
-def get_upcoming_ingresses(current_jd, months=24):
+def _ingress_records(scan):
+    ingresses = []
+    for planet_name in scan.codes:
+        for exact_jd, sign_from, sign_to in _planet_events(scan, planet_name)[0]:
+            to_sign = ZODIAC_SIGNS[sign_to]
+            ingresses.append(
+                {
+                    "planet": planet_name,
+                    "from_sign": ZODIAC_SIGNS[sign_from],
+                    "to_sign": to_sign,
+                    "date": _jd_to_date(exact_jd),
+                    "jd": round(exact_jd, 4),
+                    "description": f"{planet_name} -> {to_sign}",
+                }
+            )
+    ingresses.sort(key=lambda e: e["jd"])
+    return ingresses
+
+
+def _station_records(scan):
+    stations = []
+    for planet_name in scan.codes:
+        if planet_name not in _RETROGRADE_PLANETS:
+            continue
+        for exact_jd, speed_before, lon_exact in _planet_events(scan, planet_name)[1]:
+            stations.append(
+                {
+                    "planet": planet_name,
+                    "type": "station_retrograde" if speed_before >= 0 else "station_direct",
+                    "date": _jd_to_date(exact_jd),
+                    "jd": round(exact_jd, 4),
+                    "sign": ZODIAC_SIGNS[_sign_index(lon_exact)],
+                }
+            )
+    stations.sort(key=lambda e: e["jd"])
+    return stations
+
+
+def get_upcoming_ingresses(current_jd, months=24, ephemeris=None):
     """
     Find sign ingress dates for all planets (except Moon) over the next `months` months.
 
@@ -142,50 +291,12 @@ def get_upcoming_ingresses(current_jd, months=24):
     Returns a list of dicts sorted by date:
         {planet, from_sign, to_sign, date, jd}
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
-    end_jd = _months_to_jd(current_jd, months)
-    ingresses = []
+    eph = ephemeris or get_ephemeris()
+    scan = _Scan(eph, current_jd, _months_to_jd(current_jd, months), _SCAN_PLANETS)
+    return _ingress_records(scan)
 
-    for planet_name, planet_id in PLANET_IDS.items():
-        if planet_name == "Mo":
-            continue  # Moon moves too fast; skip
-
-        step = _PLANET_STEP.get(planet_name, 1)
-        jd = current_jd
-        lon_prev, _ = _get_lon(planet_id, jd)
-        sign_prev = _sign_index(lon_prev)
-
-        while jd < end_jd:
-            jd_next = min(jd + step, end_jd)
-            lon_next, _ = _get_lon(planet_id, jd_next)
-            sign_next = _sign_index(lon_next)
-
-            if sign_next != sign_prev:
-                # Refine with bisection
-                exact_jd = _bisect_ingress(planet_id, jd, jd_next)
-                from_sign = ZODIAC_SIGNS[sign_prev]
-                to_sign = ZODIAC_SIGNS[sign_next]
-                ingresses.append(
-                    {
-                        "planet": planet_name,
-                        "from_sign": from_sign,
-                        "to_sign": to_sign,
-                        "date": _jd_to_date(exact_jd),
-                        "jd": round(exact_jd, 4),
-                        "description": f"{planet_name} -> {to_sign}",
-                    }
-                )
-                sign_prev = sign_next
-            else:
-                sign_prev = sign_next
-
-            jd = jd_next
 
-    ingresses.sort(key=lambda e: e["jd"])
-    return ingresses
-
-
-def get_retrograde_windows(current_jd, months=24):
+def get_retrograde_windows(current_jd, months=24, ephemeris=None):
     """
     Find retrograde station dates for Ma, Me, Ju, Ve, Sa over the next `months` months.
 
@@ -195,52 +306,10 @@ def get_retrograde_windows(current_jd, months=24):
     Returns a list of dicts sorted by date:
         {planet, type: "station_retrograde"|"station_direct", date, jd, sign}
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
-    end_jd = _months_to_jd(current_jd, months)
-    stations = []
-
-    for planet_name in _RETROGRADE_PLANETS:
-        planet_id = PLANET_IDS[planet_name]
-        step = 1  # daily scan
-        jd = current_jd
-        _, spd_prev = _get_lon(planet_id, jd)
-
-        while jd < end_jd:
-            jd_next = min(jd + step, end_jd)
-            lon_next, spd_next = _get_lon(planet_id, jd_next)
-
-            if spd_prev >= 0 and spd_next < 0:
-                # Station retrograde
-                exact_jd = _bisect_station(planet_id, jd, jd_next)
-                lon_exact, _ = _get_lon(planet_id, exact_jd)
-                stations.append(
-                    {
-                        "planet": planet_name,
-                        "type": "station_retrograde",
-                        "date": _jd_to_date(exact_jd),
-                        "jd": round(exact_jd, 4),
-                        "sign": ZODIAC_SIGNS[_sign_index(lon_exact)],
-                    }
-                )
-            elif spd_prev < 0 and spd_next >= 0:
-                # Station direct
-                exact_jd = _bisect_station(planet_id, jd, jd_next)
-                lon_exact, _ = _get_lon(planet_id, exact_jd)
-                stations.append(
-                    {
-                        "planet": planet_name,
-                        "type": "station_direct",
-                        "date": _jd_to_date(exact_jd),
-                        "jd": round(exact_jd, 4),
-                        "sign": ZODIAC_SIGNS[_sign_index(lon_exact)],
-                    }
-                )
-
-            spd_prev = spd_next
-            jd = jd_next
-
-    stations.sort(key=lambda e: e["jd"])
-    return stations
+    eph = ephemeris or get_ephemeris()
+    codes = tuple(c for c in _SCAN_PLANETS if c in _RETROGRADE_PLANETS)
+    scan = _Scan(eph, current_jd, _months_to_jd(current_jd, months), codes)
+    return _station_records(scan)
 
 
 def get_eclipse_dates(current_jd, months=24):
@@ -252,7 +321,6 @@ def get_eclipse_dates(current_jd, months=24):
     Returns a list of dicts sorted by date:
         {type: "lunar"|"solar", subtype: "total"|"partial"|..., date, jd}
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
     end_jd = _months_to_jd(current_jd, months)
     eclipses = []
 
@@ -332,107 +400,108 @@ def get_eclipse_dates(current_jd, months=24):
     return eclipses
 
 
-def get_key_conjunctions(current_jd, months=24):
+_CONJUNCTION_PAIRS = [
+    ("Ju", "Sa"),
+    ("Ju", "Ra"),
+    ("Sa", "Ra"),
+    ("Ma", "Sa"),
+]
+_CONJUNCTION_ORB = 1.0  # degrees
+
+
+def _conjunction_records(scan):
+    conjunctions = []
+    for p1, p2 in _CONJUNCTION_PAIRS:
+
+        def separation(t, p1=p1, p2=p2):
+            pos = scan.at(t, (p1, p2))
+            return _wrap(pos[p1][0] - pos[p2][0]), pos[p1][1] - pos[p2][1]
+
+        values = [
+            (_wrap(s[p1][0] - s[p2][0]), s[p1][1] - s[p2][1]) for s in scan.samples
+        ]
+        for exact_jd, orb in _dedupe(_closest_approaches(scan.jds, values, separation, _CONJUNCTION_ORB)):
+            lon1 = scan.at(exact_jd, (p1,))[p1][0]
+            conjunctions.append(
+                {
+                    "p1": p1,
+                    "p2": p2,
+                    "date": _jd_to_date(exact_jd),
+                    "jd": round(exact_jd, 4),
+                    "sign": ZODIAC_SIGNS[_sign_index(lon1)],
+                    "orb": round(orb, 3),
+                }
+            )
+    conjunctions.sort(key=lambda e: e["jd"])
+    return conjunctions
+
+
+def get_key_conjunctions(current_jd, months=24, ephemeris=None):
     """
     Find rare planetary conjunctions (within 1° orb) over the next `months` months.
 
     Pairs checked: Ju-Sa, Ju-Ra, Sa-Ra, Ma-Sa.
-    Scans weekly; refines exact conjunction with bisection.
+    Each event is the exact conjunction, or the closest approach when the
+    pair comes within the orb without crossing.
 
     Returns a list of dicts sorted by date:
         {p1, p2, date, jd, sign, orb}
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
-    end_jd = _months_to_jd(current_jd, months)
+    eph = ephemeris or get_ephemeris()
+    scan = _Scan(eph, current_jd, _months_to_jd(current_jd, months), ("Ma", "Ju", "Sa", "Ra"))
+    return _conjunction_records(scan)
 
-    PAIRS = [
-        ("Ju", "Sa"),
-        ("Ju", "Ra"),
-        ("Sa", "Ra"),
-        ("Ma", "Sa"),
-    ]
-    STEP = 7  # weekly scan
-    ORB_THRESHOLD = 1.0  # degrees
-    conjunctions = []
 
-    def _angular_diff(lon1, lon2):
-        diff = abs(lon1 - lon2) % 360
-        return diff if diff <= 180 else 360 - diff
-
-    def _refine_conjunction(id1, id2, jd_a, jd_b):
-        """Bisect to find the JD of minimum angular separation."""
-        for _ in range(40):
-            if jd_b - jd_a < 0.01:
-                break
-            jd_m = (jd_a + jd_b) / 2.0
-            lon_a1, _ = _get_lon(id1, jd_a)
-            lon_a2, _ = _get_lon(id2, jd_a)
-            lon_m1, _ = _get_lon(id1, jd_m)
-            lon_m2, _ = _get_lon(id2, jd_m)
-            lon_b1, _ = _get_lon(id1, jd_b)
-            lon_b2, _ = _get_lon(id2, jd_b)
-            diff_a = _angular_diff(lon_a1, lon_a2)
-            diff_m = _angular_diff(lon_m1, lon_m2)
-            diff_b = _angular_diff(lon_b1, lon_b2)
-            if diff_a < diff_b:
-                jd_b = jd_m
-            else:
-                jd_a = jd_m
-        return (jd_a + jd_b) / 2.0
-
-    # Track which conjunctions we've already recorded to avoid duplicates
-    recorded = {}  # (p1, p2) -> last jd recorded
-
-    for p1, p2 in PAIRS:
-        id1 = PLANET_IDS[p1]
-        id2 = PLANET_IDS[p2]
-        jd = current_jd
-        lon1_prev, _ = _get_lon(id1, jd)
-        lon2_prev, _ = _get_lon(id2, jd)
-        orb_prev = _angular_diff(lon1_prev, lon2_prev)
-        in_conjunction = orb_prev <= ORB_THRESHOLD
-
-        # Reset per pair
-        recorded[(p1, p2)] = None
-
-        while jd < end_jd:
-            jd_next = min(jd + STEP, end_jd)
-            lon1, _ = _get_lon(id1, jd_next)
-            lon2, _ = _get_lon(id2, jd_next)
-            orb = _angular_diff(lon1, lon2)
-
-            if orb <= ORB_THRESHOLD and not in_conjunction:
-                # Entered conjunction window; find the closest approach
-                # Search around [jd - STEP, jd_next + STEP] for minimum
-                exact_jd = _refine_conjunction(
-                    id1, id2, max(current_jd, jd - STEP), min(end_jd, jd_next + STEP)
-                )
-                exact_lon1, _ = _get_lon(id1, exact_jd)
-                exact_lon2, _ = _get_lon(id2, exact_jd)
-                exact_orb = _angular_diff(exact_lon1, exact_lon2)
-
-                last = recorded[(p1, p2)]
-                if last is None or exact_jd - last > 30:
-                    conjunctions.append(
-                        {
-                            "p1": p1,
-                            "p2": p2,
-                            "date": _jd_to_date(exact_jd),
-                            "jd": round(exact_jd, 4),
-                            "sign": ZODIAC_SIGNS[_sign_index(exact_lon1)],
-                            "orb": round(exact_orb, 3),
-                        }
-                    )
-                    recorded[(p1, p2)] = exact_jd
-                in_conjunction = True
-            elif orb > ORB_THRESHOLD:
-                in_conjunction = False
-
-            orb_prev = orb
-            jd = jd_next
+# ---------------------------------------------------------------------------
+# Shared sky-event store
+# ---------------------------------------------------------------------------
+# Ingresses, stations, eclipses and conjunctions are the same for every
+# native.  They are computed once per UT day and window length (scanning from
+# 0h UT, one day longer than asked) and then filtered to the exact window.
+
+_SKY_EVENT_VERSION = 2
+_SKY_EVENT_KINDS = ("ingresses", "retrogrades", "eclipses", "conjunctions")
+_ONE_DAY_MONTHS = 1 / 30.4375
+
+
+def _sky_events_for_day(day_start, months, ephemeris):
+    from .cache import get_sky_event_cache
+
+    cache = get_sky_event_cache()
+    key = ("sky_events", _SKY_EVENT_VERSION, ephemeris.sid_mode, day_start, months)
+    events = cache.get(key)
+    if events is None:
+        scan_months = months + _ONE_DAY_MONTHS
+        scan = _Scan(ephemeris, day_start, _months_to_jd(day_start, scan_months), _SCAN_PLANETS)
+        events = {
+            "ingresses": _ingress_records(scan),
+            "retrogrades": _station_records(scan),
+            "eclipses": get_eclipse_dates(day_start, scan_months),
+            "conjunctions": _conjunction_records(scan),
+        }
+        cache.put(key, events)
+    return events
 
-    conjunctions.sort(key=lambda e: e["jd"])
-    return conjunctions
+
+def get_sky_events(current_jd, months=24, ephemeris=None):
+    """
+    Return the native-independent transit events for the next `months` months.
+
+    Results come from the shared sky-event store (see ``cache.get_sky_event_cache``),
+    so every chart calculated on the same day (and ayanamsa, default Lahiri)
+    reuses one computation.
+
+    Returns:
+        {ingresses, retrogrades, eclipses, conjunctions} — lists as returned by
+        the corresponding ``get_*`` functions, restricted to the window.
+    """
+    day_start = math.floor(current_jd - 0.5) + 0.5
+    end_jd = _months_to_jd(current_jd, months)
+    events = _sky_events_for_day(day_start, months, ephemeris or get_ephemeris())
+    return {
+        kind: [e for e in events[kind] if current_jd <= e["jd"] <= end_jd]
+        for kind in _SKY_EVENT_KINDS
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -440,78 +509,50 @@ def get_key_conjunctions(current_jd, months=24):
 # ---------------------------------------------------------------------------
 
 
-def _get_natal_triggers(current_jd, months, natal_positions):
+def _get_natal_triggers(current_jd, months, natal_positions, ephemeris=None):
     """
     Find when transiting outer planets (Ju, Sa, Ra) conjunct natal planet positions
     within 2° orb.
 
+    Each trigger is the exact hit, or the closest approach when a station
+    keeps the planet within the orb without reaching the natal degree.
+
     natal_positions: dict of {planet_code: longitude}
     Returns list of dicts: {transit_planet, natal_planet, date, jd, sign, orb}
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    eph = ephemeris or get_ephemeris()
     end_jd = _months_to_jd(current_jd, months)
 
-    TRANSIT_PLANETS = ["Ju", "Sa", "Ra"]
+    TRANSIT_PLANETS = ("Ju", "Sa", "Ra")
     NATAL_TARGET_PLANETS = ["Su", "Mo", "Ma", "Me", "Ju", "Ve", "Sa"]
-    STEP = 3  # days
     ORB = 2.0  # degrees
 
+    scan = _Scan(eph, current_jd, end_jd, TRANSIT_PLANETS, step=_SLOW_SCAN_STEP)
     triggers = []
 
-    def _angular_diff(lon1, lon2):
-        diff = abs(lon1 - lon2) % 360
-        return diff if diff <= 180 else 360 - diff
-
     for tp in TRANSIT_PLANETS:
-        tp_id = PLANET_IDS[tp]
         for np_code in NATAL_TARGET_PLANETS:
             if np_code not in natal_positions:
                 continue
             natal_lon = natal_positions[np_code]
 
-            jd = current_jd
-            lon_prev, _ = _get_lon(tp_id, jd)
-            orb_prev = _angular_diff(lon_prev, natal_lon)
-            in_trigger = orb_prev <= ORB
-            last_recorded = None
-
-            while jd < end_jd:
-                jd_next = min(jd + STEP, end_jd)
-                lon_next, _ = _get_lon(tp_id, jd_next)
-                orb_next = _angular_diff(lon_next, natal_lon)
-
-                if orb_next <= ORB and not in_trigger:
-                    # Find closest approach by scanning at 0.5-day resolution in window
-                    best_jd = jd
-                    best_orb = orb_prev
-                    scan = jd
-                    while scan <= jd_next + STEP and scan <= end_jd:
-                        lo, _ = _get_lon(tp_id, scan)
-                        ob = _angular_diff(lo, natal_lon)
-                        if ob < best_orb:
-                            best_orb = ob
-                            best_jd = scan
-                        scan += 0.5
-
-                    if last_recorded is None or best_jd - last_recorded > 30:
-                        lon_at, _ = _get_lon(tp_id, best_jd)
-                        triggers.append(
-                            {
-                                "transit_planet": tp,
-                                "natal_planet": np_code,
-                                "date": _jd_to_date(best_jd),
-                                "jd": round(best_jd, 4),
-                                "sign": ZODIAC_SIGNS[_sign_index(lon_at)],
-                                "orb": round(best_orb, 3),
-                            }
-                        )
-                        last_recorded = best_jd
-                    in_trigger = True
-                elif orb_next > ORB:
-                    in_trigger = False
-
-                orb_prev = orb_next
-                jd = jd_next
+            def distance(t, tp=tp, natal_lon=natal_lon):
+                lon, speed = scan.at(t, (tp,))[tp]
+                return _wrap(lon - natal_lon), speed
+
+            values = [(_wrap(s[tp][0] - natal_lon), s[tp][1]) for s in scan.samples]
+            for exact_jd, orb in _dedupe(_closest_approaches(scan.jds, values, distance, ORB)):
+                lon_at = scan.at(exact_jd, (tp,))[tp][0]
+                triggers.append(
+                    {
+                        "transit_planet": tp,
+                        "natal_planet": np_code,
+                        "date": _jd_to_date(exact_jd),
+                        "jd": round(exact_jd, 4),
+                        "sign": ZODIAC_SIGNS[_sign_index(lon_at)],
+                        "orb": round(orb, 3),
+                    }
+                )
 
     triggers.sort(key=lambda e: e["jd"])
     return triggers
@@ -522,7 +563,7 @@ def _get_natal_triggers(current_jd, months, natal_positions):
 # ---------------------------------------------------------------------------
 
 
-def generate_transit_calendar(result, months=24):
+def generate_transit_calendar(result, months=24, start_jd=None, ephemeris=None):
     """
     Generate a complete Vedic transit calendar for a native.
 
@@ -531,6 +572,8 @@ def generate_transit_calendar(result, months=24):
                   - birth_jd     : Julian day of birth (used for natal positions)
                   - planets      : dict of planet dicts, each with 'longitude' key
         months : number of months ahead to scan (default 24)
+        start_jd: Julian day to scan from (default: now)
+        ephemeris: ayanamsa context (default: the chart's ayanamsa)
 
     Returns:
         {
@@ -542,19 +585,22 @@ def generate_transit_calendar(result, months=24):
             summary_next_30_days: most important events in the next 30 days,
         }
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    eph = ephemeris or get_ephemeris((result or {}).get("ayanamsa"))
 
     # Always use current date for transit calendar (not birth date)
-    now = datetime.datetime.utcnow()
-    current_jd = swe.julday(
-        now.year, now.month, now.day, now.hour + now.minute / 60.0
-    )
+    if start_jd is None:
+        now = datetime.datetime.utcnow()
+        start_jd = swe.julday(
+            now.year, now.month, now.day, now.hour + now.minute / 60.0
+        )
+    current_jd = start_jd
 
-    # Compute all event lists
-    ingresses = get_upcoming_ingresses(current_jd, months)
-    retrogrades = get_retrograde_windows(current_jd, months)
-    eclipses = get_eclipse_dates(current_jd, months)
-    conjunctions = get_key_conjunctions(current_jd, months)
+    # Native-independent events come from the shared store
+    sky = get_sky_events(current_jd, months, eph)
+    ingresses = sky["ingresses"]
+    retrogrades = sky["retrogrades"]
+    eclipses = sky["eclipses"]
+    conjunctions = sky["conjunctions"]
 
     # Natal triggers — gracefully skipped if planets not available
     natal_triggers = []
@@ -569,7 +615,7 @@ def generate_transit_calendar(result, months=24):
             elif isinstance(pdata, (int, float)):
                 natal_positions[planet_code] = pdata
         if natal_positions:
-            natal_triggers = _get_natal_triggers(current_jd, months, natal_positions)
+            natal_triggers = _get_natal_triggers(current_jd, months, natal_positions, eph)
 
     # Summary: events in the next 30 days
     cutoff_jd = current_jd + 30.0
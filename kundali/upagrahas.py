@@ -18,9 +18,10 @@ All shadow planets that use day-portion math (Gulika etc.) require:
 """
 
 import math
-import swisseph as swe
 from .constants import zodiac_signs
+from .ephemeris import get_ephemeris
 from .utils import get_sign
+from .solar_events import get_sun_rise_set
 
 
 # ---------------------------------------------------------------------------
@@ -39,37 +40,13 @@ _KAALA_DAY_PART = {0: 2, 1: 7, 2: 5, 3: 3, 4: 1, 5: 6, 6: 4}
 
 def _get_sunrise_sunset(birth_jd, lat, lon_geo):
     """Return (sunrise_jd, sunset_jd) for the birth date."""
-    try:
-        sr_res, sr_tret = swe.rise_trans(
-            birth_jd - 1,
-            swe.SUN,
-            swe.CALC_RISE,
-            (lon_geo, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        ss_res, ss_tret = swe.rise_trans(
-            birth_jd - 1,
-            swe.SUN,
-            swe.CALC_SET,
-            (lon_geo, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        sunrise_jd = sr_tret[0] if sr_res == 0 and sr_tret else birth_jd - 0.25
-        sunset_jd = ss_tret[0] if ss_res == 0 and ss_tret else birth_jd + 0.25
-    except Exception:
-        sunrise_jd = birth_jd - 0.25
-        sunset_jd = birth_jd + 0.25
-    return sunrise_jd, sunset_jd
+    return get_sun_rise_set(birth_jd, lat, lon_geo)
 
 
-def _lagna_at_jd(jd, lat, lon_geo):
+def _lagna_at_jd(jd, lat, lon_geo, ephemeris=None):
     """Return Ascendant longitude at a given JD and geographic location."""
     try:
-        house_data = swe.houses_ex(jd, lat, lon_geo, b"W", swe.FLG_SIDEREAL)
+        house_data = (ephemeris or get_ephemeris()).houses(jd, lat, lon_geo, b"W")
         return house_data[1][0]  # ascmc[0] = Lagna
     except Exception:
         return 0.0
@@ -82,7 +59,7 @@ def _day_portion_jd(sunrise_jd, sunset_jd, part_num):
     return sunrise_jd + (part_num - 1) * portion_len
 
 
-def _upagraha_from_day_part(part_map, birth_jd, lat, lon_geo, vara_idx=None):
+def _upagraha_from_day_part(part_map, birth_jd, lat, lon_geo, vara_idx=None, ephemeris=None):
     """
     Generic: find which day part this upagraha occupies, compute its Lagna.
     Returns (sign_str, deg_in_sign_float).
@@ -91,7 +68,7 @@ def _upagraha_from_day_part(part_map, birth_jd, lat, lon_geo, vara_idx=None):
     weekday = vara_idx if vara_idx is not None else int((birth_jd + 0.5) % 7)
     part = part_map.get(weekday, 1)
     portion_jd = _day_portion_jd(sunrise_jd, sunset_jd, part)
-    asc_lon = _lagna_at_jd(portion_jd, lat, lon_geo)
+    asc_lon = _lagna_at_jd(portion_jd, lat, lon_geo, ephemeris)
     sign = get_sign(asc_lon)
     deg = round(asc_lon % 30, 2)
     return sign, deg, round(asc_lon, 4)
@@ -164,6 +141,7 @@ def calculate_upagrahas(result):
     lat = result.get("lat", 0.0)
     lon_geo = result.get("lon", 0.0)
     vara_idx = result.get("birth_vara_idx")
+    eph = get_ephemeris(result.get("ayanamsa"))
     sun_lon = result["planets"]["Su"]["full_lon"]
     moon_lon = result["planets"]["Mo"]["full_lon"]
 
@@ -177,7 +155,7 @@ def calculate_upagrahas(result):
         ("Kaala", _KAALA_DAY_PART),
     ]:
         sign, deg, full_lon = _upagraha_from_day_part(
-            part_map, birth_jd, lat, lon_geo, vara_idx
+            part_map, birth_jd, lat, lon_geo, vara_idx, ephemeris=eph
         )
         out[name] = {"sign": sign, "deg": deg, "full_lon": full_lon}
 
@@ -4,6 +4,7 @@ Utility functions for Vedic astrology calculations: sign, nakshatra, dignity,
 location, time conversion, divisional charts, and Panchanga.
 """
 
+import functools
 import re
 import swisseph as swe
 import datetime
@@ -20,6 +21,7 @@ from .constants import (
     KARANA_REPEATING,
     COMBUSTION_ORBS,
 )
+from .solar_events import sunrise_after
 
 
 def get_sign(deg):
@@ -27,6 +29,11 @@ def get_sign(deg):
     return zodiac_signs[int(deg / 30) % 12]
 
 
+def get_sign_index(deg):
+    """Return zodiac sign index (0 = Aries) for a given ecliptic longitude."""
+    return int(deg / 30) % 12
+
+
 def get_nakshatra(deg):
     """Return nakshatra name for a given longitude."""
     nak_index = int(deg / (360 / 27)) % 27
@@ -40,6 +47,7 @@ def get_nakshatra_progress(deg):
     return (deg - nak_start) / nak_span
 
 
+@functools.lru_cache(maxsize=None)
 def get_dignity(planet, sign):
     """Determine the dignity of a planet in a sign (Exalt, Own, Deb, Friend, Enemy, Neutral)."""
     if planet not in dignity_table:
@@ -168,23 +176,7 @@ def _weekday_monday0_from_jd(jd, tz_name=None):
 
 def _sunrise_after(start_jd, lat, lon):
     """Return the first sunrise after *start_jd* for the given location."""
-    try:
-        res, tret = swe.rise_trans(
-            start_jd,
-            swe.SUN,
-            swe.CALC_RISE,
-            (lon, lat, 0),
-            0,
-            0,
-            swe.FLG_SWIEPH,
-        )
-        if res == 0 and tret:
-            sunrise_jd = tret[0]
-            if sunrise_jd > 0:
-                return sunrise_jd
-    except Exception:
-        pass
-    return None
+    return sunrise_after(start_jd, lat, lon)
 
 
 def get_sunrise_based_day(jd, lat=None, lon=None, tz_name=None):
@@ -545,7 +537,7 @@ def has_aspect(planet_house, target_house, planet):
 
 def get_seventh_sign(lagna_lon):
     """Get 7th house sign index (0-11) from Lagna longitude."""
-    return (get_sign(lagna_lon) + 6) % 12
+    return (get_sign_index(lagna_lon) + 6) % 12
 
 
 def signs_have_nadi_relation(s1, s2):
@@ -564,7 +556,7 @@ def get_progressed_jupiter_sign(natal_jup_lon, age_floor):
     Returns progressed sign index (0-11).
     """
     progressed_lon = (natal_jup_lon + age_floor * 30) % 360
-    return get_sign(progressed_lon)
+    return get_sign_index(progressed_lon)
 
 
 def safe_sign_index(sign):
@@ -0,0 +1,501 @@
+"""
+Divisional chart (varga) engine and compact storage.
+
+Every varga is a ``VargaRule``: how many parts a sign is divided into and,
+for each of the 12 rasis, which sign each part maps to (plus unequal part
+boundaries for D30).  ``compute_vargas`` applies the rules to whole NumPy
+arrays of longitudes at once (one chart's planets, or charts x planets for
+bulk work); ``varga_position`` is the scalar equivalent, which
+``compute_vargas`` falls back to without NumPy.  Besides the 15 standard vargas the registry has D5, D6, D8, D11, D81, D108
+and D150, and ``register_varga`` adds more.
+
+A chart's vargas live in one ``VargaTable``: sign indices in a ``bytes``
+buffer and degrees in a float ``array``, one row per planet and one column
+per varga.  The dict shapes the rest of the engine reads are views over it,
+so nothing is copied per varga or per planet:
+
+    result["vargas"]["d7"]["Ve"]        -> {"sign": "Libra", "deg": 12.5}
+    result["d7"]["Ve"]                  (the same view)
+    result["planets"]["Ve"]["d7_sign"]  (a PlanetRecord key)
+    result["vargas"].sign_idx("Ve", "d7")
+
+    signs, degs = compute_vargas(lons, ["d9", "d60", "d150"])["d150"]
+    tables = VargaTable.batch(planets, lons, ["navamsa", "d5", "d150"])
+"""
+
+import array
+import itertools
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+
+from .constants import zodiac_signs
+from .utils import (
+    get_d2_sign_and_deg,
+    get_d3_sign_and_deg,
+    get_d4_sign_and_deg,
+    get_d7_sign_and_deg,
+    get_d10_sign_and_deg,
+    get_d12_sign_and_deg,
+    get_d16_sign_and_deg,
+    get_d20_sign_and_deg,
+    get_d24_sign_and_deg,
+    get_d27_sign_and_deg,
+    get_d30_sign_and_deg,
+    get_d40_sign_and_deg,
+    get_d45_sign_and_deg,
+    get_d60_sign_and_deg,
+    get_navamsa_sign_and_deg,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class VargaRule:
+    """Mapping of a rasi position to a sign in one divisional chart.
+
+    Args:
+        parts: divisions per sign
+        signs: 12 rows (Aries..Pisces) of ``parts`` sign indices
+        bounds: optional 12 rows of ``parts + 1`` unequal boundaries in
+            degrees (0 .. 30); equal divisions when omitted
+        scale: degrees in the varga per remaining degree of the part;
+            default maps each part onto a full 30° sign
+    """
+
+    __slots__ = ("parts", "size", "signs", "bounds", "scale")
+
+    def __init__(self, parts, signs, bounds=None, scale=None):
+        self.parts = parts
+        self.size = 30.0 / parts
+        self.signs = tuple(tuple(row) for row in signs)
+        self.bounds = tuple(tuple(row) for row in bounds) if bounds else None
+        self.scale = scale
+        if len(self.signs) != 12 or any(len(row) != parts for row in self.signs):
+            raise ValueError("signs must have 12 rows of `parts` sign indices")
+
+    @classmethod
+    def counted(cls, parts, start, step=1, scale=None):
+        """Parts counted *step* signs apart from ``start[rasi]`` (an int or 12 ints)."""
+        starts = [start] * 12 if isinstance(start, int) else list(start)
+        steps = [step] * 12 if isinstance(step, int) else list(step)
+        return cls(
+            parts,
+            [[(starts[r] + p * steps[r]) % 12 for p in range(parts)] for r in range(12)],
+            scale=scale,
+        )
+
+    @classmethod
+    def sequence(cls, odd, even):
+        """Fixed sign sequences for odd (Aries, Gemini, ...) and even signs."""
+        return cls(len(odd), [odd if r % 2 == 0 else even for r in range(12)])
+
+    def __repr__(self):
+        return f"VargaRule(parts={self.parts})"
+
+
+# Starting signs per rasi (Aries..Pisces)
+_SELF = list(range(12))
+
+
+def _odd_even(odd, even):
+    """Count from the sign itself plus *odd* / *even* signs."""
+    return [(r + (odd if r % 2 == 0 else even)) % 12 for r in range(12)]
+
+
+def _by_element(fire, earth, air, water):
+    return [(fire, earth, air, water)[r % 4] for r in range(12)]
+
+
+def _by_quality(movable, fixed, dual):
+    return [(movable, fixed, dual)[r % 3] for r in range(12)]
+
+
+# D30 Trimsha: unequal parts ruled by Mars, Saturn, Jupiter, Mercury, Venus
+_D30_ODD = ((0, 5, 10, 18, 25, 30), (0, 10, 8, 2, 6))
+_D30_EVEN = ((0, 5, 12, 20, 25, 30), (1, 5, 11, 9, 7))
+
+# Extra vargas (Parashari conventions):
+#   D5  odd signs Ar, Aq, Sg, Ge, Li / even Ta, Vi, Pi, Cp, Sc
+#   D6  from Aries for odd signs, Libra for even
+#   D8  movable from Aries, fixed from Sagittarius, dual from Leo
+#   D11 counted back from Aries by the sign's distance from it
+#   D81, D108  continue the navamsa count (nava-navamsa, navamsa-dwadasamsa)
+#   D150 movable forward from the sign, fixed backward, dual forward from the 5th
+VARGA_RULES = {
+    "d1": VargaRule.counted(1, _SELF),
+    "d2": VargaRule.counted(2, _odd_even(0, 1), step=[1 if r % 2 == 0 else -1 for r in range(12)], scale=2),
+    "d3": VargaRule.counted(3, _SELF, step=4),
+    "d4": VargaRule.counted(4, _SELF, step=3),
+    "d5": VargaRule.sequence((0, 10, 8, 2, 6), (1, 5, 11, 9, 7)),
+    "d6": VargaRule.counted(6, _by_element(0, 6, 0, 6)),
+    "d7": VargaRule.counted(7, _odd_even(0, 6)),
+    "d8": VargaRule.counted(8, _by_quality(0, 8, 4)),
+    "d9": VargaRule.counted(9, _by_element(0, 9, 6, 3), scale=9),
+    "d10": VargaRule.counted(10, _odd_even(0, 8)),
+    "d11": VargaRule.counted(11, [(12 - r) % 12 for r in range(12)]),
+    "d12": VargaRule.counted(12, _SELF),
+    "d16": VargaRule.counted(16, _by_quality(0, 4, 8)),
+    "d20": VargaRule.counted(20, _by_quality(0, 8, 4)),
+    "d24": VargaRule.counted(24, [4 if r % 2 == 0 else 3 for r in range(12)]),
+    "d27": VargaRule.counted(27, _by_element(0, 3, 6, 9)),
+    "d30": VargaRule(
+        5,
+        [(_D30_ODD if r % 2 == 0 else _D30_EVEN)[1] for r in range(12)],
+        bounds=[(_D30_ODD if r % 2 == 0 else _D30_EVEN)[0] for r in range(12)],
+    ),
+    "d40": VargaRule.counted(40, _by_element(0, 6, 0, 6)),
+    "d45": VargaRule.counted(45, _by_quality(0, 4, 8)),
+    "d60": VargaRule.counted(60, _SELF, step=5, scale=60),
+    "d81": VargaRule.counted(81, _by_element(0, 9, 6, 3)),
+    "d108": VargaRule.counted(108, _by_element(0, 9, 6, 3)),
+    "d150": VargaRule.counted(
+        150, [(r, r, r + 4)[r % 3] % 12 for r in range(12)], step=_by_quality(1, -1, 1)
+    ),
+}
+# The engine's D9 is stored under "navamsa" in chart results.
+_ALIASES = {"navamsa": "d9"}
+
+# Vargas stored for every chart (table column order) and their scalar
+# utils functions, which the rules above reproduce exactly
+VARGA_FUNCTIONS = {
+    "navamsa": get_navamsa_sign_and_deg,
+    "d2": get_d2_sign_and_deg,
+    "d3": get_d3_sign_and_deg,
+    "d4": get_d4_sign_and_deg,
+    "d7": get_d7_sign_and_deg,
+    "d10": get_d10_sign_and_deg,
+    "d12": get_d12_sign_and_deg,
+    "d16": get_d16_sign_and_deg,
+    "d20": get_d20_sign_and_deg,
+    "d24": get_d24_sign_and_deg,
+    "d27": get_d27_sign_and_deg,
+    "d30": get_d30_sign_and_deg,
+    "d40": get_d40_sign_and_deg,
+    "d45": get_d45_sign_and_deg,
+    "d60": get_d60_sign_and_deg,
+}
+VARGA_KEYS = tuple(VARGA_FUNCTIONS)
+
+_COLUMNS = {key: col for col, key in enumerate(VARGA_KEYS)}
+# "d7_sign" -> ("d7", "sign"), in the order the planet dicts used to list them
+_PLANET_FIELDS = {
+    f"{key}_{field}": (key, field)
+    for key in VARGA_KEYS
+    for field in ("sign", "deg")
+}
+
+
+def register_varga(key, rule):
+    """Add or replace a varga rule (e.g. a different D11 convention)."""
+    if not isinstance(rule, VargaRule):
+        raise TypeError("rule must be a VargaRule")
+    VARGA_RULES[key] = rule
+    _NUMPY_TABLES.pop(key, None)
+
+
+def get_varga_rule(key):
+    try:
+        return VARGA_RULES[_ALIASES.get(key, key)]
+    except KeyError:
+        raise ValueError(f"Unknown varga '{key}'") from None
+
+
+def _rasi_position(rule, rasi_idx, deg_in_rasi):
+    if rule.bounds is None:
+        part = min(int(deg_in_rasi / rule.size), rule.parts - 1)
+        remainder, span = deg_in_rasi % rule.size, rule.size
+    else:
+        bounds = rule.bounds[rasi_idx]
+        part = sum(1 for b in bounds[1:-1] if deg_in_rasi >= b)
+        remainder, span = deg_in_rasi - bounds[part], bounds[part + 1] - bounds[part]
+    if rule.scale is None:
+        deg = remainder / span * 30
+    else:
+        deg = remainder * rule.scale
+    return rule.signs[rasi_idx][part], deg
+
+
+def varga_position(full_lon, varga):
+    """(sign index, unrounded degree) of *full_lon* in *varga*."""
+    full_lon = full_lon % 360
+    return _rasi_position(get_varga_rule(varga), int(full_lon // 30), full_lon % 30)
+
+
+_NUMPY_TABLES = {}
+
+
+def _numpy_tables(key, rule):
+    tables = _NUMPY_TABLES.get(key)
+    if tables is None:
+        signs = np.array(rule.signs, dtype=np.int8)
+        bounds = np.array(rule.bounds, dtype=float) if rule.bounds else None
+        tables = _NUMPY_TABLES[key] = (signs, bounds)
+    return tables
+
+
+def _round2(values):
+    """``np.round(values, 2)``, agreeing with builtin ``round`` on near-ties."""
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    flat = rounded.reshape(-1)
+    for i in ties.tolist():
+        flat[i] = round(float(values.flat[i]), 2)
+    return rounded
+
+
+def _scalar_vargas(longitudes, rule):
+    """``compute_vargas`` for one rule over nested sequences, without NumPy."""
+    if isinstance(longitudes, (int, float)):
+        lon = longitudes % 360
+        return _rasi_position(rule, int(lon // 30), lon % 30)
+    pairs = [_scalar_vargas(lon, rule) for lon in longitudes]
+    return [sign for sign, _ in pairs], [deg for _, deg in pairs]
+
+
+def compute_vargas(longitudes, vargas=None):
+    """
+    Sign indices and degrees of many longitudes in many vargas at once.
+
+    Args:
+        longitudes: array-like of sidereal longitudes, any shape (planets,
+            or charts x planets for bulk work)
+        vargas: varga keys, standard or registered (default: VARGA_KEYS)
+
+    Returns:
+        dict: varga -> (sign indices, unrounded degrees), both shaped like
+        *longitudes*: int8 and float arrays with NumPy, nested lists without
+    """
+    rules = {key: get_varga_rule(key) for key in vargas or VARGA_KEYS}
+    if not NUMPY_AVAILABLE:
+        return {key: _scalar_vargas(longitudes, rule) for key, rule in rules.items()}
+    lon = np.mod(np.asarray(longitudes, dtype=float), 360)
+    rasi_idx = np.floor_divide(lon, 30).astype(np.intp)
+    deg_in_rasi = np.mod(lon, 30)
+    out = {}
+    for key, rule in rules.items():
+        signs, bounds = _numpy_tables(_ALIASES.get(key, key), rule)
+        if bounds is None:
+            part = np.minimum(np.floor(deg_in_rasi / rule.size).astype(np.intp), rule.parts - 1)
+            remainder, span = np.mod(deg_in_rasi, rule.size), rule.size
+        else:
+            rows = bounds[rasi_idx]
+            part = (deg_in_rasi[..., None] >= rows[..., 1:-1]).sum(axis=-1)
+            start = np.take_along_axis(rows, part[..., None], axis=-1)[..., 0]
+            end = np.take_along_axis(rows, part[..., None] + 1, axis=-1)[..., 0]
+            remainder, span = deg_in_rasi - start, end - start
+        if rule.scale is None:
+            deg = remainder / span * 30
+        else:
+            deg = remainder * rule.scale
+        out[key] = (signs[rasi_idx, part], deg)
+    return out
+
+
+class VargaTable(Mapping):
+    """Sign indices and degrees of every planet in every varga.
+
+    Maps varga key (``"navamsa"``, ``"d2"`` ... ``"d60"`` by default, or the
+    keys the table was built for) to a read-only ``VargaChart`` view.
+    """
+
+    __slots__ = ("planets", "vargas", "_rows", "_columns", "_signs", "_degs")
+
+    def __init__(self, planets, signs, degs, vargas=VARGA_KEYS):
+        self.planets = tuple(planets)
+        self.vargas = tuple(vargas)
+        self._rows = {code: row for row, code in enumerate(self.planets)}
+        if self.vargas == VARGA_KEYS:
+            self._columns = _COLUMNS
+        else:
+            self._columns = {key: col for col, key in enumerate(self.vargas)}
+        self._signs = bytes(signs)
+        self._degs = array.array("d", degs)
+
+    @classmethod
+    def from_longitudes(cls, longitudes, vargas=None):
+        """Build the table from ``{planet: sidereal longitude}`` for *vargas* (default VARGA_KEYS)."""
+        keys = tuple(vargas or VARGA_KEYS)
+        rules = [get_varga_rule(key) for key in keys]
+        signs = bytearray()
+        degs = array.array("d")
+        for lon in longitudes.values():
+            lon = lon % 360
+            rasi_idx, deg_in_rasi = int(lon // 30), lon % 30
+            for rule in rules:
+                sign_idx, deg = _rasi_position(rule, rasi_idx, deg_in_rasi)
+                signs.append(sign_idx)
+                degs.append(round(deg, 2))
+        return cls(longitudes, signs, degs, keys)
+
+    @classmethod
+    def batch(cls, planets, longitudes, vargas=None):
+        """
+        One table per chart from a (charts x planets) longitude array.
+
+        Degrees are rounded to 2 decimals like the per-planet chart fields.
+        Without NumPy each chart is built with ``from_longitudes``.
+        """
+        keys = tuple(vargas or VARGA_KEYS)
+        if not NUMPY_AVAILABLE:
+            return [cls.from_longitudes(dict(zip(planets, row)), keys) for row in longitudes]
+        computed = compute_vargas(longitudes, keys)
+        signs = np.stack([computed[key][0] for key in keys], axis=-1)
+        degs = _round2(np.stack([computed[key][1] for key in keys], axis=-1))
+        return [
+            cls(planets, chart_signs.tobytes(), chart_degs.ravel(), keys)
+            for chart_signs, chart_degs in zip(signs, degs)
+        ]
+
+    def _cell(self, planet, varga):
+        return self._rows[planet] * len(self.vargas) + self._columns[varga]
+
+    def sign_idx(self, planet, varga):
+        """Sign index (0 = Aries) of *planet* in *varga*."""
+        return self._signs[self._cell(planet, varga)]
+
+    def sign(self, planet, varga):
+        return zodiac_signs[self._signs[self._cell(planet, varga)]]
+
+    def deg(self, planet, varga):
+        return self._degs[self._cell(planet, varga)]
+
+    def __getitem__(self, varga):
+        if varga not in self._columns:
+            raise KeyError(varga)
+        return VargaChart(self, varga)
+
+    def __contains__(self, varga):
+        return varga in self._columns
+
+    def __iter__(self):
+        return iter(self.vargas)
+
+    def __len__(self):
+        return len(self.vargas)
+
+    def __reduce__(self):
+        return (VargaTable, (self.planets, self._signs, self._degs, self.vargas))
+
+    def __repr__(self):
+        return f"VargaTable(planets={self.planets!r})"
+
+
+class VargaChart(Mapping):
+    """Read-only ``{planet: {"sign", "deg"}}`` view of one varga."""
+
+    __slots__ = ("table", "varga")
+
+    def __init__(self, table, varga):
+        self.table = table
+        self.varga = varga
+
+    def __getitem__(self, planet):
+        cell = self.table._cell(planet, self.varga)
+        return {"sign": zodiac_signs[self.table._signs[cell]], "deg": self.table._degs[cell]}
+
+    def get(self, planet, default=None):
+        if planet not in self.table._rows:
+            return default
+        return self[planet]
+
+    def __contains__(self, planet):
+        return planet in self.table._rows
+
+    def __iter__(self):
+        return iter(self.table.planets)
+
+    def __len__(self):
+        return len(self.table.planets)
+
+    def __reduce__(self):
+        return (VargaChart, (self.table, self.varga))
+
+    def __repr__(self):
+        return f"VargaChart({self.varga!r}, {dict(self)!r})"
+
+
+class PlanetRecord(dict):
+    """Planet dict whose ``<varga>_sign`` / ``<varga>_deg`` keys read a VargaTable.
+
+    Only the D1 fields are stored; the varga keys are None until a table is
+    bound (as they were while the chart was being built).  Iteration, items()
+    and JSON conversion include them, and an explicit assignment overrides
+    the table value.
+    """
+
+    __slots__ = ("code", "table")
+
+    def __init__(self, fields=(), code=None, table=None):
+        super().__init__(fields)
+        self.code = code
+        self.table = table
+
+    def _varga_value(self, key):
+        varga, field = _PLANET_FIELDS[key]
+        if self.table is None or varga not in self.table._columns:
+            return None
+        cell = self.table._cell(self.code, varga)
+        if field == "sign":
+            return zodiac_signs[self.table._signs[cell]]
+        return self.table._degs[cell]
+
+    def __missing__(self, key):
+        if key in _PLANET_FIELDS:
+            return self._varga_value(key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in _PLANET_FIELDS:
+            return self._varga_value(key)
+        return default
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in _PLANET_FIELDS
+
+    def __iter__(self):
+        return itertools.chain(
+            dict.__iter__(self),
+            (key for key in _PLANET_FIELDS if not dict.__contains__(self, key)),
+        )
+
+    def __len__(self):
+        return dict.__len__(self) + sum(
+            1 for key in _PLANET_FIELDS if not dict.__contains__(self, key)
+        )
+
+    def keys(self):
+        return KeysView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (PlanetRecord, (dict(dict.items(self)), self.code, self.table))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
@@ -68,6 +68,9 @@ def _get_planet_sign_in_varga(result, varga_key, planet):
     Extract a planet's sign from result for a given varga.
     Returns sign string or None if not found.
     """
+    vargas = result.get("vargas")
+    if vargas is not None and varga_key in vargas:
+        return vargas.sign(planet, varga_key) if planet in vargas.planets else None
     result_key, sign_key = _VARGA_RESULT_KEY[varga_key]
     varga_data = result.get(result_key)
     if not varga_data:
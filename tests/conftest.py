@@ -6,26 +6,30 @@ in CI.  The geocoding cache is seeded so Nominatim is never hit.
 """
 
 import pytest
-import json
 import os
 
 
-@pytest.fixture(autouse=True)
-def seed_geocache(tmp_path, monkeypatch):
-    """Seed the geocoding cache so tests never hit the network."""
-    cache_file = tmp_path / ".geocache.json"
-    cache_data = {
-        "mumbai, india": [19.0760, 72.8777],
-        "mumbai, maharashtra, india": [19.0760, 72.8777],
-        "new delhi, india": [28.6139, 77.2090],
-        "london, uk": [51.5074, -0.1278],
-    }
-    cache_file.write_text(json.dumps(cache_data))
-
-    # Patch the cache module to use our temp file
+_SEED_PLACES = {
+    "mumbai, india": [19.0760, 72.8777],
+    "mumbai, maharashtra, india": [19.0760, 72.8777],
+    "new delhi, india": [28.6139, 77.2090],
+    "delhi, india": [28.6517, 77.2219],
+    "london, uk": [51.5074, -0.1278],
+}
+
+
+def _seed_locations(monkeypatch, directory):
+    """Install a seeded location store in *directory* and block the network."""
+    # Patch the cache module to use a fresh store in the temp directory
     import kundali.cache as cache_mod
-    monkeypatch.setattr(cache_mod, "_CACHE_FILE", str(cache_file))
-    monkeypatch.setattr(cache_mod, "_geo_cache", cache_data.copy())
+    store = cache_mod.LocationStore(str(directory / "locations.db"))
+    store.import_places((place, lat, lon) for place, (lat, lon) in _SEED_PLACES.items())
+    monkeypatch.setattr(cache_mod, "_location_store", store)
+
+    # No offline gazetteer unless a test installs one
+    import kundali.gazetteer as gazetteer_mod
+    monkeypatch.setattr(gazetteer_mod, "_shared_gazetteer", None)
+    monkeypatch.setattr(gazetteer_mod, "_shared_loaded", True)
 
     # Also prevent any real network calls via Nominatim
     def _fake_geocode(place, timeout=15):
@@ -35,6 +39,33 @@ def seed_geocache(tmp_path, monkeypatch):
     monkeypatch.setattr(geo, "geocode", _fake_geocode)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def seed_session_geocache(tmp_path_factory):
+    """Seed the geocoding cache for session, module and class fixtures too."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _seed_locations(monkeypatch, tmp_path_factory.mktemp("geocache"))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def seed_geocache(tmp_path, monkeypatch):
+    """Seed the geocoding cache so tests never hit the network."""
+    _seed_locations(monkeypatch, tmp_path)
+
+
+@pytest.fixture(scope="session")
+def chart(seed_session_geocache):
+    """The MUMBAI_BIRTH chart, calculated once and shared; do not mutate it."""
+    from kundali.main import calculate_kundali
+    return calculate_kundali(
+        MUMBAI_BIRTH["date"],
+        MUMBAI_BIRTH["time"],
+        MUMBAI_BIRTH["place"],
+        gender=MUMBAI_BIRTH["gender"],
+        include=["shadbala", "yogini_dasha", "chara_dasha"],
+    )
+
+
 # Known test chart: Mumbai, 1990-05-15 08:30
 MUMBAI_BIRTH = {
     "date": "1990-05-15",
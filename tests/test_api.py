@@ -48,14 +48,18 @@ class TestSerializeResult:
     """Test that serialize_result produces JSON-safe output."""
 
     @pytest.fixture(scope="class")
-    def serialized(self):
-        from kundali.api import calculate, serialize_result
-        raw = calculate(
+    def raw(self):
+        from kundali.api import calculate
+        return calculate(
             MUMBAI_BIRTH["date"],
             MUMBAI_BIRTH["time"],
             MUMBAI_BIRTH["place"],
             gender=MUMBAI_BIRTH["gender"],
         )
+
+    @pytest.fixture(scope="class")
+    def serialized(self, raw):
+        from kundali.api import serialize_result
         return serialize_result(raw)
 
     def test_json_serializable(self, serialized):
@@ -107,6 +111,21 @@ class TestSerializeResult:
         assert "decision_confidence_summary" in serialized
         assert isinstance(serialized["decision_confidence_summary"], dict)
 
+    def test_bytes_match_dict(self, raw, serialized):
+        from kundali.api import serialize_result
+        encoded = serialize_result(raw, as_bytes=True)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(json.dumps(serialized))
+
+    def test_fields_projection(self, raw, serialized):
+        from kundali.api import serialize_result
+        projected = serialize_result(raw, fields=["planets", "lagna_sign", "no_such_field"])
+        assert list(projected) == ["lagna_sign", "planets"]
+        assert projected["planets"] == serialized["planets"]
+        assert json.loads(serialize_result(raw, fields=["houses"], as_bytes=True)) == {
+            "houses": serialized["houses"]
+        }
+
 
 class TestToJson:
     """Test the to_json serializer handles edge cases."""
@@ -130,6 +149,40 @@ class TestToJson:
         dt = datetime.datetime(2024, 1, 15, 10, 30)
         assert to_json(dt) == "2024-01-15T10:30:00"
 
+    def test_numpy_and_unknown_types(self):
+        from kundali.api import to_json
+        np = pytest.importorskip("numpy")
+        assert to_json({1: (np.float64(1.5), np.int32(2)), "x": np.arange(2), "s": {3}}) == {
+            "1": [1.5, 2], "x": [0, 1], "s": "{3}",
+        }
+
+
+class TestDumps:
+    """Test the single-pass bytes encoder agrees with to_json."""
+
+    def test_matches_to_json(self):
+        import datetime
+        from kundali.api import dumps, to_json
+
+        obj = {
+            "date": datetime.date(2024, 1, 15),
+            "at": datetime.datetime(2024, 1, 15, 10, 30),
+            2: [None, True, 1, 2.5, "ग्रह", (1, 2)],
+            "other": {3},
+        }
+        assert json.loads(dumps(obj)) == to_json(obj)
+
+    def test_numpy_values(self):
+        from kundali.api import dumps
+        np = pytest.importorskip("numpy")
+        assert json.loads(dumps({"a": np.float32(0.5), "b": np.arange(3), "c": np.bool_(True)})) == {
+            "a": 0.5, "b": [0, 1, 2], "c": True,
+        }
+
+    def test_tuple_keys_fall_back_to_to_json(self):
+        from kundali.api import dumps
+        assert json.loads(dumps({("Su", "Mo"): 1})) == {"('Su', 'Mo')": 1}
+
 
 class TestBenchmarkApi:
     def test_run_benchmark(self):
@@ -154,3 +207,110 @@ class TestBenchmarkApi:
 
         assert result["total_cases"] == 1
         assert result["cases"][0]["status"] == "PASS"
+
+
+class TestBatch:
+    """Test kundali.api.calculate_many() and the batch runner."""
+
+    RECORD = {
+        "name": "A",
+        "date": MUMBAI_BIRTH["date"],
+        "time": MUMBAI_BIRTH["time"],
+        "place": MUMBAI_BIRTH["place"],
+        "gender": MUMBAI_BIRTH["gender"],
+    }
+    INCLUDE = ("shadbala",)
+
+    def test_calculate_many_keeps_order_and_captures_errors(self):
+        from kundali.api import calculate_many
+
+        records = [self.RECORD, {**self.RECORD, "date": "not-a-date"}, {**self.RECORD, "name": "C"}]
+        items = list(calculate_many(records, workers=0, include=self.INCLUDE))
+        assert [item["index"] for item in items] == [0, 1, 2]
+        assert items[0]["result"]["name"] == "A"
+        assert "error" in items[1] and "result" not in items[1]
+        assert items[2]["result"]["name"] == "C"
+
+    def test_unknown_section_fails_fast(self):
+        from kundali.api import calculate_many
+
+        with pytest.raises(ValueError):
+            list(calculate_many([self.RECORD], workers=0, include=["nope"]))
+
+    def test_run_batch_resumes_from_checkpoint(self, tmp_path):
+        from kundali.batch import run_batch
+
+        src = tmp_path / "in.jsonl"
+        out = tmp_path / "out.jsonl"
+        src.write_text("\n".join(json.dumps({**self.RECORD, "name": n}) for n in "AB") + "\n")
+        stats = run_batch(str(src), str(out), workers=0, include=self.INCLUDE, checkpoint_every=1)
+        assert stats == {"done": 2, "errors": 0, "skipped": 0}
+
+        # Simulate a crash that left a partial line after the checkpoint.
+        with open(out, "a") as f:
+            f.write('{"index": 2, "trunc')
+        with open(src, "a") as f:
+            f.write(json.dumps({**self.RECORD, "name": "C"}) + "\n")
+        stats = run_batch(str(src), str(out), workers=0, include=self.INCLUDE)
+        assert stats == {"done": 1, "errors": 0, "skipped": 2}
+
+        lines = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [line["result"]["name"] for line in lines] == ["A", "B", "C"]
+
+    def test_run_batch_restarts_when_output_is_short(self, tmp_path):
+        from kundali.batch import run_batch
+
+        src = tmp_path / "in.jsonl"
+        out = tmp_path / "out.jsonl"
+        src.write_text("\n".join(json.dumps({**self.RECORD, "name": n}) for n in "AB") + "\n")
+        run_batch(str(src), str(out), workers=0, include=self.INCLUDE, checkpoint_every=1)
+
+        # The checkpoint survived but the output was cut short or removed.
+        out.write_text(out.read_text()[:10])
+        stats = run_batch(str(src), str(out), workers=0, include=self.INCLUDE)
+        assert stats == {"done": 2, "errors": 0, "skipped": 0}
+        out.unlink()
+        stats = run_batch(str(src), str(out), workers=0, include=self.INCLUDE)
+        assert stats == {"done": 2, "errors": 0, "skipped": 0}
+
+        data = out.read_text()
+        assert "\0" not in data
+        assert [json.loads(line)["result"]["name"] for line in data.splitlines()] == ["A", "B"]
+
+    def test_calculate_many_replaces_a_broken_pool(self, monkeypatch):
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        from kundali import api
+
+        pools = []
+
+        class FakePool:
+            def __init__(self, max_workers, mp_context):
+                self.broken = not pools
+                pools.append(self)
+
+            def submit(self, fn, *args):
+                if self.broken:
+                    raise BrokenProcessPool("worker died")
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        monkeypatch.setattr(api, "ProcessPoolExecutor", FakePool)
+        records = [self.RECORD, {**self.RECORD, "name": "B"}]
+        items = list(api.calculate_many(records, workers=2, include=self.INCLUDE))
+        assert len(pools) == 2
+        assert [item["result"]["name"] for item in items] == ["A", "B"]
+
+    def test_reads_csv_records(self, tmp_path):
+        from kundali.batch import read_records
+
+        src = tmp_path / "in.csv"
+        src.write_text("name,date,time,place\nA,1990-05-15,08:30,\"Mumbai, India\"\n")
+        assert list(read_records(str(src))) == [
+            {"name": "A", "date": "1990-05-15", "time": "08:30", "place": "Mumbai, India"}
+        ]
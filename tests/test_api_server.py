@@ -0,0 +1,171 @@
+"""
+Tests for the REST server's engine pool: back-pressure and shutdown.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+BIRTH = {
+    "name": "Test",
+    "year": 1990,
+    "month": 5,
+    "day": 15,
+    "hour": 8,
+    "minute": 30,
+    "place": "Mumbai, India",
+}
+CAREER = "/decisions/career/simple?name=Test&date=1990-05-15&time=08:30&place=Mumbai"
+
+
+class BrokenPool:
+    """Executor stand-in whose worker has died."""
+
+    def __init__(self, max_workers=None):
+        self.closed = False
+
+    def submit(self, *args, **kwargs):
+        from concurrent.futures.process import BrokenProcessPool
+
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.closed = True
+
+
+class BlockingJob:
+    """Engine job stand-in that holds its pool slot until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, *args, **kwargs):
+        self.started.set()
+        assert self.release.wait(10)
+        return {"ok": True}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    import api_server
+
+    monkeypatch.setattr(api_server, "_executor", ThreadPoolExecutor(max_workers=4))
+    monkeypatch.setattr(api_server, "_pending", 0)
+    monkeypatch.setattr(api_server, "_route_active", api_server.collections.Counter())
+    monkeypatch.setattr(api_server, "ENGINE_MAX_PENDING", 4)
+    monkeypatch.setattr(api_server, "ROUTE_CONCURRENCY", dict(api_server.ROUTE_CONCURRENCY))
+    yield api_server
+    api_server._shutdown_executor()
+
+
+@pytest.fixture
+def client(server):
+    from fastapi.testclient import TestClient
+
+    with TestClient(server.app) as client:
+        yield client
+
+
+def _post_in_background(client, path, body):
+    responses = []
+    thread = threading.Thread(target=lambda: responses.append(client.post(path, json=body)))
+    thread.start()
+    return thread, responses
+
+
+class TestBackPressure:
+    """Test the 429 responses when the pool or a route is saturated."""
+
+    def test_rejects_when_pool_is_saturated(self, server, client, monkeypatch):
+        job = BlockingJob()
+        monkeypatch.setattr(server, "_calculate_job", job)
+        monkeypatch.setattr(server, "ENGINE_MAX_PENDING", 1)
+
+        thread, responses = _post_in_background(client, "/calculate", BIRTH)
+        assert job.started.wait(10)
+        busy = client.post("/calculate", json=BIRTH)
+        assert busy.status_code == 429
+        assert busy.headers["Retry-After"] == "1"
+        assert "calculate" in busy.json()["detail"]
+        # the pool is shared: other routes are turned away too
+        monkeypatch.setattr(server, "_decision_job", lambda *args: {"ok": True})
+        assert client.get(CAREER).status_code == 429
+
+        job.release.set()
+        thread.join(10)
+        assert responses[0].status_code == 200 and responses[0].json() == {"ok": True}
+        assert server._pending == 0
+        assert client.get(CAREER).status_code == 200
+
+    def test_route_limit_leaves_other_routes_open(self, server, client, monkeypatch):
+        job = BlockingJob()
+        monkeypatch.setattr(server, "_calculate_job", job)
+        monkeypatch.setattr(server, "_decision_job", lambda *args: {"ok": True})
+        monkeypatch.setitem(server.ROUTE_CONCURRENCY, "calculate", 1)
+
+        thread, responses = _post_in_background(client, "/calculate", BIRTH)
+        assert job.started.wait(10)
+        assert client.post("/calculate", json=BIRTH).status_code == 429
+        assert client.get(CAREER).status_code == 200
+
+        job.release.set()
+        thread.join(10)
+        assert responses[0].status_code == 200
+        assert server._route_active["calculate"] == 0
+
+    def test_failed_job_frees_its_slot(self, server, client, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(server, "_calculate_job", fail)
+        monkeypatch.setattr(server, "ENGINE_MAX_PENDING", 1)
+        for _ in range(2):
+            assert client.post("/calculate", json=BIRTH).status_code == 500
+        assert server._pending == 0 and server._route_active["calculate"] == 0
+
+
+class TestBrokenPool:
+    """Test recovery when an engine worker dies."""
+
+    def test_broken_pool_is_replaced(self, server, client, monkeypatch):
+        broken = BrokenPool()
+        monkeypatch.setattr(server, "_executor", broken)
+        monkeypatch.setattr(server, "ENGINE_WORKERS", 0)
+        monkeypatch.setattr(server, "_calculate_job", lambda **kwargs: {"ok": True})
+
+        response = client.post("/calculate", json=BIRTH)
+        assert response.status_code == 200 and response.json() == {"ok": True}
+        assert broken.closed
+        assert isinstance(server._executor, ThreadPoolExecutor)
+
+    def test_job_that_breaks_every_pool_gets_503(self, server, client, monkeypatch):
+        monkeypatch.setattr(server, "_executor", BrokenPool())
+        monkeypatch.setattr(server, "ENGINE_WORKERS", 0)
+        monkeypatch.setattr(server, "ThreadPoolExecutor", BrokenPool)
+
+        response = client.post("/calculate", json=BIRTH)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert server._pending == 0 and server._route_active["calculate"] == 0
+
+
+class TestLifespan:
+    """Test that leaving the app's lifespan stops the worker pools."""
+
+    def test_shutdown_stops_pools(self, server, monkeypatch, tmp_path):
+        from fastapi.testclient import TestClient
+        from kundali.report_jobs import ReportJobs, ReportStore
+
+        executor = server._executor
+        jobs = ReportJobs(ReportStore(tmp_path / "reports"), workers=0)
+        monkeypatch.setattr(server, "_report_jobs", jobs)
+        with TestClient(server.app) as client:
+            assert client.get("/health").status_code == 200
+            assert server._executor is executor
+        assert server._executor is None and server._report_jobs is None
+        assert executor._shutdown
@@ -32,3 +32,238 @@ class TestGeocache:
         from kundali.cache import get_lat_lon_cached
         with pytest.raises(ValueError, match="Location not found"):
             get_lat_lon_cached("Xyzzy Nonexistent Place 12345")
+
+
+class TestLocationStore:
+    """Verify the persistent geocode/timezone store."""
+
+    @staticmethod
+    def _counting_geocoder(monkeypatch, answer=None, delay=0.0):
+        import time
+        import kundali.cache as cache_mod
+
+        calls = []
+
+        def geocode(place, timeout=15):
+            calls.append(place)
+            time.sleep(delay)
+            return answer
+
+        monkeypatch.setattr(cache_mod.get_geocoder(), "geocode", geocode)
+        return calls
+
+    def test_negative_answers_are_cached(self, monkeypatch):
+        from kundali.cache import get_lat_lon_cached
+
+        calls = self._counting_geocoder(monkeypatch)
+        for _ in range(3):
+            with pytest.raises(ValueError, match="Location not found"):
+                get_lat_lon_cached("Nowhere Town")
+        assert calls == ["Nowhere Town"]
+
+    def test_answers_are_shared_through_the_database(self, tmp_path):
+        from kundali.cache import LocationStore
+
+        db = str(tmp_path / "shared.db")
+        worker_a, worker_b = LocationStore(db), LocationStore(db)
+        worker_a.put_place("Pune, India", (18.52, 73.86))
+        worker_a.put_timezone(18.52, 73.86, "Asia/Kolkata")
+        assert worker_b.get_place("  pune, INDIA ") == (18.52, 73.86)
+        assert worker_b.get_timezone(18.52001, 73.86001) == "Asia/Kolkata"
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        from kundali.cache import LocationStore
+
+        store = LocationStore(str(tmp_path / "ttl.db"))
+        store.put_place("Old Place", (1.0, 2.0), ttl=-1)
+        assert store.get_place("Old Place") is None
+        store.put_place("Old Place", None)
+        assert store.get_place("Old Place") == LocationStore.NOT_FOUND
+
+    def test_concurrent_lookups_are_coalesced(self, monkeypatch):
+        import threading
+        from types import SimpleNamespace
+        from kundali.cache import get_lat_lon_cached
+
+        calls = self._counting_geocoder(
+            monkeypatch, SimpleNamespace(latitude=12.97, longitude=77.59), delay=0.2
+        )
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_lat_lon_cached("Bangalore, India")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [(12.97, 77.59)] * 5
+        assert len(calls) == 1
+
+    def test_timezone_lookup_is_cached(self, monkeypatch):
+        import kundali.cache as cache_mod
+
+        assert cache_mod.get_timezone_cached(19.076, 72.8777) == "Asia/Kolkata"
+
+        def no_finder():
+            raise AssertionError("TimezoneFinder should not be needed")
+
+        monkeypatch.setattr(cache_mod, "get_timezone_finder", no_finder)
+        assert cache_mod.get_timezone_cached(19.076, 72.8777) == "Asia/Kolkata"
+
+    def test_import_gazetteer_file(self, tmp_path, monkeypatch):
+        from kundali.cache import LocationStore, get_lat_lon_cached, get_timezone_cached, set_location_store
+
+        path = tmp_path / "places.csv"
+        path.write_text('name,latitude,longitude,timezone\n"Ujjain, India",23.18,75.78,Asia/Kolkata\n')
+        store = LocationStore(str(tmp_path / "import.db"))
+        assert store.import_file(str(path)) == 1
+        set_location_store(store)
+        calls = self._counting_geocoder(monkeypatch)
+        assert get_lat_lon_cached("Ujjain, India") == (23.18, 75.78)
+        assert get_timezone_cached(23.18, 75.78) == "Asia/Kolkata"
+        assert calls == []
+
+
+class TestSolarEventCache:
+    """Verify the shared sunrise/sunset LRU."""
+
+    MUMBAI = (19.076, 72.8777)
+    BIRTH_JD = 2448026.625  # 1990-05-15 03:00 UT
+
+    def test_matches_direct_rise_trans(self):
+        import swisseph as swe
+        from kundali.solar_events import sunrise_after, sunset_after
+        lat, lon = self.MUMBAI
+        for rsmi, fn in ((swe.CALC_RISE, sunrise_after), (swe.CALC_SET, sunset_after)):
+            res, tret = swe.rise_trans(
+                self.BIRTH_JD, swe.SUN, rsmi, (lon, lat, 0), 0, 0, swe.FLG_SWIEPH
+            )
+            assert res == 0
+            assert abs(fn(self.BIRTH_JD, lat, lon) - tret[0]) < 1e-4
+
+    def test_repeated_day_hits_cache(self):
+        from kundali.solar_events import (
+            clear_solar_event_cache,
+            get_sun_rise_set,
+            solar_event_cache_info,
+        )
+        lat, lon = self.MUMBAI
+        clear_solar_event_cache()
+        first = get_sun_rise_set(self.BIRTH_JD, lat, lon)
+        misses = solar_event_cache_info().misses
+        # Every 2 hours across the same day reuses the cached events
+        for step in range(1, 6):
+            assert get_sun_rise_set(self.BIRTH_JD + step / 12.0 - 0.5, lat, lon)[0] > 0
+        assert get_sun_rise_set(self.BIRTH_JD, lat, lon) == first
+        assert solar_event_cache_info().misses <= misses + 1
+        assert solar_event_cache_info().hits > 0
+
+    def test_events_follow_previous_day(self):
+        from kundali.solar_events import get_sun_rise_set
+        sunrise, sunset = get_sun_rise_set(self.BIRTH_JD, *self.MUMBAI)
+        assert self.BIRTH_JD - 1 < sunrise < self.BIRTH_JD
+        assert self.BIRTH_JD - 1 < sunset < self.BIRTH_JD
+
+
+class TestChartCache:
+    """Verify the natal chart LRU, the SQLite tier and api.calculate reuse."""
+
+    def test_lru_evicts_oldest(self):
+        from kundali.cache import ChartCache
+        cache = ChartCache(maxsize=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+
+    def test_values_are_copied(self):
+        from kundali.cache import ChartCache
+        cache = ChartCache(maxsize=2)
+        cache.put("a", {"v": [1]})
+        cache.get("a")["v"].append(2)
+        assert cache.get("a") == {"v": [1]}
+
+    def test_disk_tier_survives_and_evicts_by_size(self, tmp_path):
+        from kundali.cache import ChartCache
+        db = str(tmp_path / "charts.sqlite")
+        writer = ChartCache(maxsize=0, db_path=db, db_max_bytes=3000)
+        writer.put("old", {"blob": "x" * 1000})
+        writer.put("new", {"blob": "y" * 1000})
+        writer.put("newest", {"blob": "z" * 1000})
+        reader = ChartCache(maxsize=4, db_path=db, db_max_bytes=3000)
+        assert reader.get("old") is None
+        assert reader.get("newest") == {"blob": "z" * 1000}
+
+    def test_unusable_database_falls_back_to_memory(self, tmp_path, monkeypatch):
+        import kundali.cache as cache_mod
+        from kundali.api import calculate
+        from tests.conftest import MUMBAI_BIRTH
+
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        db = str(blocker / "charts.sqlite")
+        cache = cache_mod.ChartCache(maxsize=2, db_path=db)
+        assert cache.db_path is None
+        cache.put("a", {"v": 1})
+        assert cache.get("a") == {"v": 1}
+
+        monkeypatch.setenv("KUNDALI_CHART_CACHE_DB", db)
+        monkeypatch.setattr(cache_mod, "_chart_cache", None)
+        result = calculate(
+            MUMBAI_BIRTH["date"], MUMBAI_BIRTH["time"], MUMBAI_BIRTH["place"], include=("shadbala",)
+        )
+        assert result["lagna_sign"]
+        assert cache_mod.get_chart_cache().db_path is None
+
+    def test_calculate_hit_matches_fresh_chart(self):
+        from kundali.api import calculate, to_json
+        from kundali.cache import get_chart_cache
+        from tests.conftest import MUMBAI_BIRTH
+
+        cache = get_chart_cache()
+        cache.clear()
+        args = (MUMBAI_BIRTH["date"], MUMBAI_BIRTH["time"], MUMBAI_BIRTH["place"])
+        calculate(*args, name="First", include=("shadbala",))
+        cached = calculate(*args, name="Second", include=("shadbala", "numerology", "tajika"))
+        fresh = calculate(
+            *args, name="Second", include=("shadbala", "numerology", "tajika"), use_cache=False
+        )
+        assert cache.hits == 1
+        assert cached["name"] == "Second"
+        assert cached["computed_sections"] == ["shadbala", "numerology", "tajika"]
+        assert to_json(cached) == to_json(fresh)
+
+
+class TestSkyEventStore:
+    """Verify the shared transit sky-event store."""
+
+    START_JD = 2460676.8  # 2025-01-01 07:12 UT
+
+    def test_matches_direct_scan(self):
+        from kundali import transit_calendar as tc
+
+        sky = tc.get_sky_events(self.START_JD, months=6)
+        direct = {
+            "ingresses": tc.get_upcoming_ingresses(self.START_JD, 6),
+            "retrogrades": tc.get_retrograde_windows(self.START_JD, 6),
+            "eclipses": tc.get_eclipse_dates(self.START_JD, 6),
+        }
+        for kind, events in direct.items():
+            assert len(sky[kind]) == len(events), kind
+            for got, want in zip(sky[kind], events):
+                assert got["date"] == want["date"]
+                assert abs(got["jd"] - want["jd"]) < 0.01
+
+    def test_same_day_reuses_store(self):
+        from kundali.cache import get_sky_event_cache
+        from kundali.transit_calendar import generate_transit_calendar
+
+        cache = get_sky_event_cache()
+        generate_transit_calendar({}, months=3, start_jd=self.START_JD)
+        hits = cache.hits
+        later = generate_transit_calendar({}, months=3, start_jd=self.START_JD + 0.1)
+        assert cache.hits == hits + 1
+        assert all(e["jd"] >= self.START_JD + 0.1 for e in later["ingresses"])
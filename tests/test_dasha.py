@@ -0,0 +1,160 @@
+"""
+Tests for the shared dasha timeline (Vimshottari, Ashtottari, Yogini, Chara).
+"""
+
+import pytest
+
+
+def _sample_jds(timeline, n=200):
+    span = timeline.end_jd - timeline.start_jd
+    return [timeline.start_jd + span * (k + 0.5) / n for k in range(n)]
+
+
+class TestVimshottariTimeline:
+    """Test the timeline against the stored antardashas and the finders."""
+
+    def test_mahadashas_match_chart(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        mds = chart["vimshottari"]["mahadasas"]
+        timeline = get_dasha_timeline(chart)
+        assert [(p.lord, p.start_jd, p.end_jd) for p in timeline.mahadashas()] == [
+            (md["lord"], md["start_jd"], md["end_jd"]) for md in mds
+        ]
+
+    def test_antardashas_match_chart(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        for md, period in zip(chart["vimshottari"]["mahadasas"], timeline.mahadashas()):
+            subs = timeline.sub_periods(period)
+            assert [p.lord for p in subs] == [ad["lord"] for ad in md["antardashas"]]
+            for p, ad in zip(subs, md["antardashas"]):
+                assert p.end_jd == pytest.approx(ad["end_jd"], abs=1e-6)
+
+    def test_finders_agree_with_active(self, chart):
+        from kundali.dasha import find_current_dasha, get_current_pratyantar, get_dasha_timeline
+
+        mds = chart["vimshottari"]["mahadasas"]
+        timeline = get_dasha_timeline(chart)
+        for jd in _sample_jds(timeline):
+            md, ad, pd = timeline.active(jd, depth=3)
+            assert find_current_dasha(chart["birth_jd"], jd, mds) == (md.lord, ad.lord)
+            pd_lord, pd_start, pd_end = get_current_pratyantar(
+                chart["birth_jd"], jd, md.lord, ad.lord, mds
+            )
+            assert (pd_lord, pd_start, pd_end) == (pd.lord, pd.start_jd, pd.end_jd)
+
+    def test_levels_nest_down_to_prana(self, chart):
+        from kundali.dasha import DASHA_LEVELS, get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        jd = chart["birth_jd"] + 12345.678
+        path = timeline.active(jd, depth=5)
+        assert [p.level for p in path] == [1, 2, 3, 4, 5]
+        assert path[-1].to_dict()["level"] == DASHA_LEVELS[-1]
+        for parent, child in zip(path, path[1:]):
+            assert parent.start_jd - 1e-6 <= child.start_jd <= jd < child.end_jd <= parent.end_jd + 1e-6
+            assert child.path[:-1] == parent.path
+        assert timeline.sub_periods(path[-1]) == []
+
+    def test_levels_are_expanded_lazily(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        assert len(timeline._levels) == 1
+        timeline.active(chart["birth_jd"] + 100, depth=4)
+        assert len(timeline._levels) == 4
+        timeline.active(chart["birth_jd"] + 101, depth=4)
+        assert len(timeline._levels) == 4
+
+    def test_outside_range_and_bad_depth(self, chart):
+        from kundali.dasha import find_current_dasha, get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        assert timeline.active(timeline.start_jd - 1) == []
+        assert timeline.active(timeline.end_jd) == []
+        mds = chart["vimshottari"]["mahadasas"]
+        assert find_current_dasha(chart["birth_jd"], timeline.end_jd + 1, mds) == (None, None)
+        for depth in (0, 6):
+            with pytest.raises(ValueError, match="depth"):
+                timeline.active(timeline.start_jd + 1, depth=depth)
+        with pytest.raises(ValueError, match="Unknown dasha system"):
+            get_dasha_timeline(chart, "kalachakra")
+
+
+class TestTimelineQueries:
+    """Test range and batch queries."""
+
+    def test_periods_between_are_contiguous(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        jd1, jd2 = chart["birth_jd"] + 9000, chart["birth_jd"] + 9400
+        periods = timeline.periods_between(jd1, jd2, depth=3)
+        assert periods[0].start_jd <= jd1 < periods[0].end_jd
+        assert periods[-1].start_jd < jd2 <= periods[-1].end_jd
+        for a, b in zip(periods, periods[1:]):
+            assert b.start_jd == pytest.approx(a.end_jd, abs=1e-6)
+        assert periods[0] == timeline.active(jd1, depth=3)[-1]
+
+    def test_periods_between_whole_timeline(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        assert timeline.periods_between(timeline.start_jd, timeline.end_jd) == timeline.mahadashas()
+        antardashas = timeline.periods_between(timeline.start_jd, timeline.end_jd, depth=2)
+        assert len(antardashas) == 9 * len(timeline.mahadashas())
+
+    def test_active_many_matches_active(self, chart):
+        from kundali.dasha import get_dasha_timeline
+
+        timeline = get_dasha_timeline(chart)
+        jds = _sample_jds(timeline, 50) + [timeline.end_jd + 10]
+        many = timeline.active_many(jds, depth=4)
+        fresh = get_dasha_timeline(chart)
+        assert many == [fresh.active(jd, depth=4) for jd in jds]
+        assert many[-1] == []
+
+
+class TestOtherSystems:
+    """Test Ashtottari, Yogini and Chara timelines."""
+
+    def test_ashtottari_matches_finder(self, chart):
+        from kundali.dasha import find_current_ashtottari, get_dasha_timeline
+
+        mds = chart["ashtottari"]["mahadasas"]
+        timeline = get_dasha_timeline(chart, "ashtottari")
+        for jd in _sample_jds(timeline, 50):
+            md, ad = timeline.active(jd)
+            assert find_current_ashtottari(chart["birth_jd"], jd, mds) == (md.lord, ad.lord)
+
+    def test_yogini_keys_and_lords(self, chart):
+        from kundali.dasha import YOGINI, get_dasha_timeline
+
+        dashas = chart["yogini_dasha"]["dashas"]
+        timeline = get_dasha_timeline(chart, "yogini")
+        mds = timeline.mahadashas()
+        assert [p.key for p in mds] == [d["yogini"] for d in dashas]
+        assert [p.lord for p in mds] == [YOGINI.lords[d["yogini"]] for d in dashas]
+        subs = timeline.sub_periods(mds[0])
+        assert len(subs) == 8 and subs[0].key == mds[0].key
+        assert subs[-1].end_jd == pytest.approx(mds[0].end_jd, abs=1e-6)
+
+    def test_chara_matches_current(self, chart):
+        from kundali.constants import zodiac_signs
+        from kundali.dasha import get_dasha_timeline
+        from kundali.jaimini import find_current_chara_dasha
+
+        dashas = chart["chara_dasha"]["dashas"]
+        timeline = get_dasha_timeline(chart, "chara")
+        for jd in _sample_jds(timeline, 30):
+            md, ad = timeline.active(jd)
+            current = find_current_chara_dasha(chart["birth_jd"], jd, dashas)
+            assert current["current_sign"] == md.key
+            start = zodiac_signs.index(md.key)
+            assert [p.key for p in timeline.sub_periods(md)][:2] == [
+                zodiac_signs[start], zodiac_signs[(start + 1) % 12]
+            ]
+            assert ad.start_jd <= jd < ad.end_jd + 1e-6
+        assert find_current_chara_dasha(chart["birth_jd"], chart["birth_jd"] - 1, dashas) is None
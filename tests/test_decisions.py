@@ -363,3 +363,54 @@ class TestEdgeCases:
         """Compatibility function should be callable."""
         assert callable(get_compatibility_decision)
         assert callable(get_all_decisions_with_compatibility)
+
+
+# ---------------------------------------------------------------------------
+# Per-chart memo
+# ---------------------------------------------------------------------------
+
+class TestDecisionMemo:
+    """Decision engines run once per chart and reset when the chart changes."""
+
+    @pytest.fixture
+    def chart(self, sample_chart, monkeypatch):
+        import copy
+        import kundali.life_analysis as life_analysis
+
+        calls = []
+        original = life_analysis.build_life_analysis
+
+        def counting(result, decisions_bundle=None):
+            calls.append(1)
+            return original(result, decisions_bundle)
+
+        monkeypatch.setattr(life_analysis, "build_life_analysis", counting)
+        chart = copy.deepcopy(sample_chart)
+        chart.pop("_decision_cache", None)
+        return chart, calls
+
+    def test_shared_by_serialize_and_all_decisions(self, chart):
+        from kundali.api import serialize_result
+
+        chart, calls = chart
+        first = get_all_decisions(chart)
+        serialize_result(chart)
+        assert get_all_decisions(chart) == first
+        assert get_life_analysis(chart) == first["life_analysis"]
+        assert len(calls) == 1
+
+    def test_returned_dict_can_be_extended(self, chart):
+        chart, _ = chart
+        get_all_decisions(chart)["_chart_result"] = chart
+        assert "_chart_result" not in get_all_decisions(chart)
+
+    def test_refresh_and_rectification_invalidate(self, chart):
+        from kundali.main import refresh_current
+
+        chart, calls = chart
+        get_life_analysis(chart)
+        refresh_current(chart, at=chart["current_jd"] + 30)
+        get_life_analysis(chart)
+        chart["birth_time_rectification"] = {"applied": True, "corrected_birth_time": "1990-05-15 08:41"}
+        get_life_analysis(chart)
+        assert len(calls) == 3
@@ -0,0 +1,60 @@
+"""Tests for kundali.ephemeris_table — interpolation accuracy and storage."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import swisseph as swe
+
+from kundali.ephemeris_table import GRAHAS, EphemerisTable, build_table
+
+
+@pytest.fixture(scope="module")
+def table():
+    return build_table(2024, 2025)
+
+
+def _swe_positions(jd):
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+    ids = [swe.SUN, swe.MOON, swe.MARS, swe.MERCURY, swe.JUPITER, swe.VENUS, swe.SATURN, swe.MEAN_NODE]
+    pos = [swe.calc_ut(jd, pid, flags)[0] for pid in ids]
+    lons = [p[0] for p in pos] + [(pos[-1][0] + 180.0) % 360.0]
+    speeds = [p[3] for p in pos] + [pos[-1][3]]
+    return np.array(lons), np.array(speeds)
+
+
+def _angle_error(a, b):
+    return np.abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+class TestEphemerisTable:
+    """Validate interpolated positions against Swiss Ephemeris."""
+
+    def test_matches_swisseph(self, table):
+        rng = np.random.default_rng(7)
+        jds = rng.uniform(table.start_jd, table.end_jd, 300)
+        lons, speeds = table.positions(jds)
+        assert lons.shape == (300, len(GRAHAS))
+        for jd, lon, speed in zip(jds, lons, speeds):
+            want_lon, want_speed = _swe_positions(jd)
+            assert _angle_error(lon, want_lon).max() < 1e-3
+            assert np.abs(speed - want_speed).max() < 1e-2
+
+    def test_scalar_and_single_planet(self, table):
+        jd = table.start_jd + 100.25
+        lon, _ = table.positions(jd)
+        assert lon.shape == (len(GRAHAS),)
+        assert table.longitude("Ju", jd) == pytest.approx(lon[GRAHAS.index("Ju")])
+
+    def test_out_of_range_raises(self, table):
+        with pytest.raises(ValueError, match="outside"):
+            table.positions([table.end_jd + 1])
+
+    def test_save_and_memory_mapped_load(self, table, tmp_path):
+        path = tmp_path / "lahiri.npy"
+        table.save(path)
+        loaded = EphemerisTable.load(path)
+        assert isinstance(loaded.data, np.memmap)
+        jds = np.linspace(table.start_jd, table.end_jd, 50)
+        np.testing.assert_allclose(loaded.positions(jds)[0], table.positions(jds)[0])
@@ -0,0 +1,165 @@
+"""
+Tests for the offline GeoNames gazetteer.
+"""
+
+import pytest
+
+# geonameid, name, asciiname, alternatenames, lat, lon, class, code, country,
+# cc2, admin1, admin2, admin3, admin4, population, elevation, dem, timezone, date
+ROWS = [
+    ("1275339", "Mumbai", "Mumbai", "Bombay,Bombaim,Mumbaj,मुंबई", "19.07283", "72.88261",
+     "P", "PPLA", "IN", "", "16", "", "", "", "12691836", "", "8", "Asia/Kolkata", "2023-01-01"),
+    ("1259229", "Pune", "Pune", "Poona,Puna", "18.51957", "73.85535",
+     "P", "PPL", "IN", "", "16", "", "", "", "2935744", "", "560", "Asia/Kolkata", "2023-01-01"),
+    ("2643743", "London", "London", "Londres,Londra", "51.50853", "-0.12574",
+     "P", "PPLC", "GB", "", "ENG", "", "", "", "8961989", "", "25", "Europe/London", "2023-01-01"),
+    ("6058560", "London", "London", "", "42.98339", "-81.23304",
+     "P", "PPL", "CA", "", "08", "", "", "", "346765", "", "252", "America/Toronto", "2023-01-01"),
+    ("3448439", "São Paulo", "Sao Paulo", "Sampa", "-23.5475", "-46.63611",
+     "P", "PPLA", "BR", "", "27", "", "", "", "10021295", "", "769", "America/Sao_Paulo", "2023-01-01"),
+    ("1264527", "Chennai", "Chennai", "Madras", "13.08784", "80.27847",
+     "P", "PPLA", "IN", "", "25", "", "", "", "4646732", "", "9", "Asia/Kolkata", "2023-01-01"),
+    ("2113779", "Majuro", "Majuro", "", "7.08971", "171.38027",
+     "P", "PPLC", "MH", "", "07", "", "", "", "25400", "", "3", "Pacific/Majuro", "2023-01-01"),
+    ("2464470", "Tunis", "Tunis", "", "36.81897", "10.16579",
+     "P", "PPLC", "TN", "", "38", "", "", "", "693210", "", "10", "Africa/Tunis", "2023-01-01"),
+    ("6255148", "Europe", "Europe", "", "48.69096", "9.14062",
+     "L", "CONT", "", "", "00", "", "", "", "0", "", "", "", "2023-01-01"),
+]
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    from kundali.gazetteer import Gazetteer
+
+    (tmp_path / "cities.txt").write_text(
+        "\n".join("\t".join(row) for row in ROWS) + "\n", encoding="utf-8"
+    )
+    (tmp_path / "countryInfo.txt").write_text(
+        "#ISO\tISO3\tISO-Numeric\tfips\tCountry\n"
+        "IN\tIND\t356\tIN\tIndia\n"
+        "GB\tGBR\t826\tUK\tUnited Kingdom\n"
+        "CA\tCAN\t124\tCA\tCanada\n"
+        "US\tUSA\t840\tUS\tUnited States\n"
+        "MX\tMEX\t484\tMX\tMexico\n"
+        "MH\tMHL\t584\tRM\tMarshall Islands\n"
+        "TN\tTUN\t788\tTS\tTunisia\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "admin1CodesASCII.txt").write_text(
+        "IN.16\tMaharashtra\tMaharashtra\t1264418\n"
+        "IN.25\tTamil Nadu\tTamil Nadu\t1255053\n"
+        "CA.08\tOntario\tOntario\t6093943\n"
+        "US.KY\tKentucky\tKentucky\t6254925\n",
+        encoding="utf-8",
+    )
+    return Gazetteer.load(str(tmp_path / "cities.txt"))
+
+
+class TestGazetteer:
+    """Test normalized, alternate, fuzzy and qualified lookups."""
+
+    def test_skips_non_populated_places(self, gazetteer):
+        assert len(gazetteer) == 8
+        assert gazetteer.lookup("Europe") is None
+
+    @pytest.mark.parametrize("place", ["Mumbai", "  MUMBAI ", "Bombay", "Mumbai, MH", "mumbai, maharashtra, india"])
+    def test_exact_and_alternate_names(self, gazetteer, place):
+        match = gazetteer.lookup(place)
+        assert match["name"] == "Mumbai"
+        assert match["match"] == "exact"
+        assert match["timezone"] == "Asia/Kolkata"
+        assert (match["lat"], match["lon"]) == (19.07283, 72.88261)
+
+    def test_accents_are_folded(self, gazetteer):
+        assert gazetteer.lookup("sao paulo")["name"] == "São Paulo"
+        assert gazetteer.lookup("São-Paulo, Brazil")["timezone"] == "America/Sao_Paulo"
+
+    @pytest.mark.parametrize("typo,name", [("Mumbaai", "Mumbai"), ("Mumabi", "Mumbai"), ("Londn", "London")])
+    def test_fuzzy_matches(self, gazetteer, typo, name):
+        match = gazetteer.lookup(typo)
+        assert match["name"] == name
+        assert match["match"] == "fuzzy"
+
+    def test_unrelated_names_do_not_match(self, gazetteer):
+        assert gazetteer.lookup("Kathmandu") is None
+        assert gazetteer.lookup(" , ") is None
+
+    @pytest.mark.parametrize("typo", ["Puen", "Punr", "Pone"])
+    def test_fuzzy_matches_need_minimum_similarity(self, gazetteer, typo):
+        # one edit in a four-letter name is below the similarity floor
+        assert gazetteer.lookup(typo) is None
+
+    @pytest.mark.parametrize("place", [
+        "London, Kentucky, USA", "London, Kentucky", "London, United States", "Pune, Mexico",
+    ])
+    def test_unmatched_known_qualifier_rejects(self, gazetteer, place):
+        assert gazetteer.search(place) == []
+        assert gazetteer.lookup(place) is None
+
+    @pytest.mark.parametrize("place,name", [
+        ("Mumbai, MH", "Mumbai"), ("Chennai, TN", "Chennai"), ("Chennai, TN, India", "Chennai"),
+    ])
+    def test_codes_of_other_countries_do_not_reject(self, gazetteer, place, name):
+        # MH and TN are also the Marshall Islands and Tunisia
+        assert gazetteer.lookup(place)["name"] == name
+        assert gazetteer.lookup("Chennai, Tunisia") is None
+
+    def test_qualifiers_break_ties(self, gazetteer):
+        assert gazetteer.lookup("London")["country"] == "GB"
+        assert gazetteer.lookup("London, Ontario")["timezone"] == "America/Toronto"
+        assert gazetteer.lookup("London, Canada")["country"] == "CA"
+        assert gazetteer.lookup("London, UK")["country"] == "GB"
+        assert [m["country"] for m in gazetteer.search("London, CA")] == ["CA", "GB"]
+
+
+class TestGazetteerGeocoding:
+    """Test the gazetteer behind get_lat_lon_cached."""
+
+    def test_resolves_offline_with_timezone(self, gazetteer, monkeypatch):
+        import kundali.cache as cache_mod
+        from kundali.gazetteer import set_gazetteer
+        from kundali.main import _resolve_birth_location
+
+        def offline(*args, **kwargs):
+            raise AssertionError("network lookup")
+
+        monkeypatch.setattr(cache_mod.get_geocoder(), "geocode", offline)
+        monkeypatch.setattr(cache_mod, "get_timezone_finder", offline)
+        set_gazetteer(gazetteer)
+
+        location = _resolve_birth_location("Bombay, India")
+        assert (location["lat"], location["lon"]) == (19.07283, 72.88261)
+        assert location["timezone"] == "Asia/Kolkata"
+        assert cache_mod.get_lat_lon_cached("Poona") == (18.51957, 73.85535)
+
+    def test_falls_back_to_geocoder(self, gazetteer, monkeypatch):
+        import kundali.cache as cache_mod
+        from kundali.gazetteer import set_gazetteer
+
+        calls = []
+
+        def geocode(place, timeout=15):
+            calls.append(place)
+
+        monkeypatch.setattr(cache_mod.get_geocoder(), "geocode", geocode)
+        set_gazetteer(gazetteer)
+        with pytest.raises(ValueError, match="Location not found"):
+            cache_mod.get_lat_lon_cached("Kathmandu")
+        assert calls == ["Kathmandu"]
+
+    def test_rejected_qualifier_reaches_geocoder(self, gazetteer, monkeypatch):
+        import types
+        import kundali.cache as cache_mod
+        from kundali.gazetteer import set_gazetteer
+
+        calls = []
+
+        def geocode(place, timeout=15):
+            calls.append(place)
+            return types.SimpleNamespace(latitude=37.12898, longitude=-84.08326)
+
+        monkeypatch.setattr(cache_mod.get_geocoder(), "geocode", geocode)
+        set_gazetteer(gazetteer)
+        assert cache_mod.get_lat_lon_cached("London, Kentucky, USA") == (37.12898, -84.08326)
+        assert calls == ["London, Kentucky, USA"]
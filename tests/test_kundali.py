@@ -219,3 +219,215 @@ class TestRectificationIntegration:
         assert result["birth_time"] == "08:34"
         assert result["birth_time_original_input"] == MUMBAI_BIRTH["time"]
         assert result["birth_time_rectification"]["applied"] is True
+
+
+class TestRectificationSearch:
+    """Test the coarse-to-fine rectification search against a full scan."""
+
+    EVENTS = [
+        {"house": 10, "planets": ["Saturn", "Sun"]},
+        {"house": 7, "planets": ["Venus", "Jupiter"]},
+        {"house": 4, "planets": ["Moon", "Mercury"]},
+    ]
+
+    @pytest.fixture(scope="class")
+    def chart(self):
+        from kundali.main import calculate_kundali
+        return calculate_kundali(
+            MUMBAI_BIRTH["date"],
+            MUMBAI_BIRTH["time"],
+            MUMBAI_BIRTH["place"],
+            gender=MUMBAI_BIRTH["gender"],
+            include=[],
+        )
+
+    @staticmethod
+    def _brute_force(chart, events, window, step):
+        from kundali.rectification import check_prenatal_epoch, get_house_sub_lord
+
+        scores = {}
+        for offset in range(-window, window + 1, step):
+            jd = chart["birth_jd"] + offset / 1440
+            score = check_prenatal_epoch(jd, chart["lat"], chart["lon"], chart["ayanamsa"]) * 5
+            for event in events:
+                sub_lord = get_house_sub_lord(jd, chart["lat"], chart["lon"], event["house"], chart["ayanamsa"])
+                if sub_lord in [p[:2] for p in event["planets"]]:
+                    score += 10
+            scores[offset] = score
+        return scores
+
+    def test_matches_full_scan(self, chart):
+        from kundali.rectification import rectify_birth_time
+
+        result = rectify_birth_time(chart, self.EVENTS, step_minutes=2, search_window_minutes=120)
+        scores = self._brute_force(chart, self.EVENTS, 120, 2)
+        best = max(scores.values())
+        assert result["raw_score"] == best
+        assert result["offset_minutes"] == min(o for o, s in scores.items() if s == best)
+
+    def test_wide_fine_search_refines_only_boundaries(self, chart, monkeypatch):
+        from kundali import rectification
+
+        scored = []
+        score = rectification._CandidateScorer.score
+
+        def counting_score(self, jd, verbose=False):
+            scored.append(jd)
+            return score(self, jd, verbose)
+
+        monkeypatch.setattr(rectification._CandidateScorer, "score", counting_score)
+        result = rectification.rectify_birth_time(
+            chart, self.EVENTS, step_minutes=1, search_window_minutes=240
+        )
+        # 481 one-minute candidates; only the coarse grid and boundary crossings are scored
+        assert len(scored) == len(set(scored)) < 481 // 3
+        assert -240 <= result["offset_minutes"] <= 240
+        assert result["events_used"] == 3
+
+
+class TestSectionSelection:
+    """Test include/exclude selection of optional pipeline sections."""
+
+    @pytest.fixture(scope="class")
+    def core_chart(self):
+        from kundali.main import calculate_kundali
+        return calculate_kundali(
+            MUMBAI_BIRTH["date"],
+            MUMBAI_BIRTH["time"],
+            MUMBAI_BIRTH["place"],
+            gender=MUMBAI_BIRTH["gender"],
+            include=("shadbala",),
+        )
+
+    def test_core_always_computed(self, core_chart):
+        assert core_chart["lagna_sign"]
+        assert core_chart["vimshottari"]["mahadasas"]
+        assert "final_analysis" in core_chart
+
+    def test_only_included_section_computed(self, core_chart):
+        assert core_chart["computed_sections"] == ["shadbala"]
+        assert core_chart["shadbala"]
+
+    def test_skipped_sections_keep_defaults(self, core_chart):
+        assert core_chart["tajika"] == {}
+        assert core_chart["graha_yuddha"] == []
+        assert core_chart["argala"] == {}
+
+    def test_exclude_removes_section(self):
+        from kundali.main import resolve_sections
+        sections = resolve_sections(exclude=["tajika", "argala"])
+        assert "tajika" not in sections
+        assert "argala" not in sections
+        assert "shadbala" in sections
+
+    def test_unknown_section_rejected(self):
+        from kundali.main import calculate_kundali
+        with pytest.raises(ValueError, match="Unknown section"):
+            calculate_kundali("1990-05-15", "08:30", "Mumbai, India", include=["horoscope"])
+
+
+class TestRenderArtifacts:
+    """Test that rendering is opt-in and separate from calculation."""
+
+    @pytest.fixture(scope="class")
+    def chart(self):
+        from kundali.main import calculate_kundali
+        return calculate_kundali(
+            MUMBAI_BIRTH["date"],
+            MUMBAI_BIRTH["time"],
+            MUMBAI_BIRTH["place"],
+            gender=MUMBAI_BIRTH["gender"],
+            name="Render QA",
+            include=(),
+        )
+
+    def test_calculation_writes_no_files(self, chart):
+        assert chart["sky_chart_path"] == ""
+        assert chart["north_chart_path"] == ""
+        assert chart["pdf_report_path"] == ""
+
+    def test_render_selected_formats(self, chart, tmp_path):
+        from kundali.main import render_artifacts
+        paths = render_artifacts(chart, formats=["sky_chart", "north_chart"], output_dir=str(tmp_path))
+        assert set(paths) == {"sky_chart", "north_chart"}
+        assert paths["sky_chart"] == str(tmp_path / "render_qa_sky_chart.svg")
+        assert (tmp_path / "render_qa_north_chart.svg").exists()
+        assert chart["north_chart_path"] == paths["north_chart"]
+        assert chart["pdf_report_path"] == ""
+
+    def test_unknown_format_rejected(self, chart):
+        from kundali.main import render_artifacts
+        with pytest.raises(ValueError, match="Unknown render format"):
+            render_artifacts(chart, formats=["png"])
+
+
+class TestRefreshCurrent:
+    """Test refreshing the time-dependent layer of a natal chart."""
+
+    @pytest.fixture(scope="class")
+    def chart(self):
+        from kundali.main import calculate_kundali
+        return calculate_kundali(
+            MUMBAI_BIRTH["date"],
+            MUMBAI_BIRTH["time"],
+            MUMBAI_BIRTH["place"],
+            gender=MUMBAI_BIRTH["gender"],
+            include=("shadbala", "yogini_dasha", "chara_dasha", "tajika", "current_panchanga"),
+        )
+
+    def test_refresh_at_past_instant(self, chart):
+        import copy
+        import datetime
+        from kundali.dasha import find_current_dasha
+        from kundali.main import refresh_current
+
+        natal = copy.deepcopy(chart)
+        at = datetime.datetime(2005, 3, 1, 6, 0)
+        refreshed = refresh_current(natal, at=at)
+        at_jd = refreshed["current_jd"]
+
+        assert refreshed is natal
+        assert (refreshed["vimshottari"]["current_md"], refreshed["vimshottari"]["current_ad"]) == (
+            find_current_dasha(chart["birth_jd"], at_jd, chart["vimshottari"]["mahadasas"])
+        )
+        assert refreshed["tajika"]["year"] == 2005
+        assert refreshed["current_panchanga"]
+        assert refreshed["planets"] == chart["planets"]
+        assert refreshed["shadbala"] == chart["shadbala"]
+        assert refreshed["yogini_dasha"]["dashas"] == chart["yogini_dasha"]["dashas"]
+
+    def test_refresh_now_matches_fresh_calculation(self, chart):
+        import copy
+        from kundali.api import to_json
+        from kundali.main import refresh_current
+
+        refreshed = refresh_current(copy.deepcopy(chart), at=chart["current_jd"])
+        assert to_json(refreshed) == to_json(chart)
+
+
+class TestConcurrentAyanamsas:
+    """Charts with different ayanamsas can be calculated in parallel threads."""
+
+    def test_threaded_charts_match_sequential(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from kundali.api import to_json
+        from kundali.main import calculate_kundali
+
+        def run(ayanamsa):
+            result = calculate_kundali(
+                MUMBAI_BIRTH["date"],
+                MUMBAI_BIRTH["time"],
+                MUMBAI_BIRTH["place"],
+                gender=MUMBAI_BIRTH["gender"],
+                ayanamsa_name=ayanamsa,
+                include=("tajika", "current_panchanga"),
+            )
+            return to_json({k: result[k] for k in ("planets", "lagna_deg", "tajika")})
+
+        ayanamsas = ["Lahiri", "Raman"] * 3
+        sequential = {a: run(a) for a in set(ayanamsas)}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(run, ayanamsas))
+        for ayanamsa, result in zip(ayanamsas, threaded):
+            assert result == sequential[ayanamsa]
+        assert sequential["Lahiri"]["lagna_deg"] != sequential["Raman"]["lagna_deg"]
@@ -0,0 +1,112 @@
+"""
+Tests for marriage date prediction and its ephemeris backends.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+import swisseph as swe
+
+NATAL = {
+    "planets": {"Venus": 100.0, "Jupiter": 200.0, "Saturn": 50.0, "Mars": 10.0},
+    "lagna": 15.0,
+    "birth_datetime": datetime(2005, 1, 1),
+    "dasha_periods_for_marriage": [(2026, 2060, "Ve", "Venus")],
+}
+
+
+class CountingBackend:
+    """Swiss Ephemeris backend that records each batched call."""
+
+    def __init__(self):
+        from kundali.marriage_date_prediction import SwissEphBackend
+
+        self.inner = SwissEphBackend(table=False)
+        self.calls = []
+
+    def longitudes(self, jds, planets):
+        jds = list(jds)
+        self.calls.append((len(jds), tuple(planets)))
+        return self.inner.longitudes(jds, planets)
+
+
+class TestBackends:
+    """Test the Swiss Ephemeris backend against the engine's ephemeris."""
+
+    def test_matches_engine_ephemeris(self):
+        from kundali.ephemeris import get_ephemeris
+        from kundali.marriage_date_prediction import SwissEphBackend, get_sidereal_lon
+
+        dt = datetime(2030, 5, 3, 12, 0, tzinfo=timezone.utc)
+        jd = swe.julday(2030, 5, 3, 12.0)
+        expected = get_ephemeris().longitude(jd, swe.JUPITER)
+        assert get_sidereal_lon("jupiter", dt) == pytest.approx(expected, abs=1e-9)
+        lons = SwissEphBackend(table=False).longitudes([jd, jd + 1], ("moon", "jupiter"))
+        assert lons["jupiter"][0] == pytest.approx(expected, abs=1e-9)
+        assert len(lons["moon"]) == 2 and lons["moon"][0] != lons["moon"][1]
+
+    def test_batch_matches_single_day_scores(self):
+        from kundali.marriage_date_prediction import (
+            _DAY_PLANETS,
+            _month_days,
+            _score_day,
+            _to_jd,
+            evaluate_marriage_date,
+        )
+
+        backend = CountingBackend()
+        days = _month_days(2030, 2)
+        assert len(days) == 28
+        lons = backend.longitudes([_to_jd(d) for d in days], _DAY_PLANETS)
+        for i in (0, 13, 27):
+            batched = _score_day(days[i], NATAL, *(lons[p][i] for p in _DAY_PLANETS))
+            assert batched == evaluate_marriage_date(days[i], NATAL, "male")
+
+    def test_astropy_cross_check(self):
+        pytest.importorskip("astropy")
+        from kundali.marriage_date_prediction import cross_check_backends
+
+        jds = [swe.julday(2030, 1, 1, 12.0) + 10 * i for i in range(5)]
+        diffs = cross_check_backends(jds, ("sun", "jupiter"))
+        assert all(diff < 0.1 for diff in diffs.values())
+
+
+class TestFindMarriageDate:
+    """Test the prediction end to end on the default backend."""
+
+    def test_one_backend_call_per_year_and_month(self):
+        from kundali.marriage_date_prediction import find_marriage_date
+
+        backend = CountingBackend()
+        text = find_marriage_date(NATAL, future_only=False, backend=backend)
+        assert text.startswith("📅 ")
+        assert "Dasha: Ve/Venus" in text
+        year_calls = [c for c in backend.calls if c[1] == ("jupiter", "saturn")]
+        day_calls = [c for c in backend.calls if c[1] != ("jupiter", "saturn")]
+        assert year_calls and all(n == 12 for n, _ in year_calls)
+        assert day_calls and all(28 <= n <= 31 for n, _ in day_calls)
+
+    def test_default_backend_uses_chart_ayanamsa(self, monkeypatch):
+        from kundali import marriage_date_prediction
+        from kundali.ephemeris import get_ephemeris
+
+        backends = []
+        original = marriage_date_prediction.get_backend
+
+        def get_backend(*args, **kwargs):
+            backends.append(original(*args, **kwargs))
+            return backends[-1]
+
+        monkeypatch.setattr(marriage_date_prediction, "get_backend", get_backend)
+        raman = marriage_date_prediction.find_marriage_date(
+            {**NATAL, "ayanamsa": "Raman"}, future_only=False
+        )
+        assert backends[0].ephemeris is get_ephemeris("Raman")
+        lahiri = marriage_date_prediction.find_marriage_date(NATAL, future_only=False)
+        assert backends[1].ephemeris is get_ephemeris("Lahiri")
+        assert raman.startswith("📅 ") and lahiri.startswith("📅 ")
+
+    def test_promise_uses_sign_names(self):
+        from kundali.marriage_date_prediction import check_nadi_promise
+
+        assert "Saturn in Taurus" in check_nadi_promise(NATAL["planets"])
@@ -0,0 +1,82 @@
+"""
+Tests for the muhurtha panchanga timeline and window search.
+"""
+
+import bisect
+
+import pytest
+
+START_JD = 2461041.5  # 2026-01-01 0h UT
+
+
+@pytest.fixture(scope="module")
+def timeline(chart):
+    from kundali.muhurtha import build_panchanga_timeline
+    return build_panchanga_timeline(
+        START_JD, START_JD + 15, chart["lat"], chart["lon"], chart.get("timezone")
+    )
+
+
+class TestPanchangaTimeline:
+    """Test the exact change-instant timeline."""
+
+    def test_covers_range_contiguously(self, timeline):
+        assert timeline[0]["start_jd"] == START_JD
+        assert timeline[-1]["end_jd"] == pytest.approx(START_JD + 15)
+        for prev, cur in zip(timeline, timeline[1:]):
+            assert prev["end_jd"] == cur["start_jd"]
+            assert cur["end_jd"] > cur["start_jd"]
+
+    def test_neighbouring_segments_differ(self, timeline):
+        def elements(p):
+            return (p["tithi"], p["vara"], p["nakshatra"], p["yoga"], p["karana"], int(p["moon_lon"] // 30))
+
+        for prev, cur in zip(timeline, timeline[1:]):
+            assert elements(prev["panchanga"]) != elements(cur["panchanga"])
+
+    def test_segments_match_pointwise_evaluation(self, chart, timeline):
+        from kundali.muhurtha import evaluate_muhurtha, score_panchanga
+
+        starts = [seg["start_jd"] for seg in timeline]
+        for step in range(0, 15 * 24 * 4, 7):
+            jd = START_JD + step / 96 + 1e-4
+            seg = timeline[bisect.bisect_right(starts, jd) - 1]
+            point = evaluate_muhurtha(jd, chart, chart["lat"], chart["lon"], "marriage")
+            window = score_panchanga(seg["panchanga"], chart, "marriage")
+            assert point["total_score"] == window["total_score"]
+            assert point["summary"] == window["summary"]
+
+
+class TestMuhurthaSearch:
+    """Test the top-K window search."""
+
+    def test_top_windows_sorted_and_clipped(self, chart, timeline):
+        from kundali.muhurtha import find_muhurtha_windows
+
+        windows = find_muhurtha_windows(
+            chart, START_JD + 2, START_JD + 10, lat=chart["lat"], lon=chart["lon"],
+            min_score=0, top_k=5, timeline=timeline,
+        )
+        assert len(windows) == 5
+        scores = [w["total_score"] for w in windows]
+        assert scores == sorted(scores, reverse=True)
+        for w in windows:
+            assert START_JD + 2 <= w["start_jd"] < w["end_jd"] <= START_JD + 10
+            assert w["datetime_str"]
+
+    def test_finds_windows_shorter_than_old_step(self, chart, timeline):
+        from kundali.muhurtha import find_muhurtha_windows
+
+        windows = find_muhurtha_windows(
+            chart, START_JD, START_JD + 15, min_score=0, top_k=len(timeline), timeline=timeline,
+        )
+        assert len(windows) == len(timeline)
+        assert any(w["end_jd"] - w["start_jd"] < 1 / 24 for w in windows)
+
+    def test_find_best_muhurtha_uses_windows(self, chart):
+        from kundali.muhurtha import find_best_muhurtha
+
+        results = find_best_muhurtha(chart, START_JD, days=7, lat=chart["lat"], lon=chart["lon"])
+        assert 0 < len(results) <= 20
+        assert all(r["total_score"] >= 65 for r in results)
+        assert all("jd" in r and "datetime_str" in r for r in results)
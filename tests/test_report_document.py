@@ -0,0 +1,132 @@
+"""
+Tests for the report document shared by the text, PDF and chart renderers.
+"""
+
+import contextlib
+import io
+
+import pytest
+from tests.conftest import MUMBAI_BIRTH
+
+
+@pytest.fixture(scope="module")
+def report(chart):
+    from kundali.printing import build_report
+    return build_report(chart)
+
+
+class TestReportDocument:
+    """Test the document built by printing.build_report."""
+
+    def test_text_matches_print_kundali(self, chart, report):
+        from kundali.printing import print_kundali
+
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_kundali(chart, file=buf)
+        assert report.text() == buf.getvalue()
+        assert report.text().startswith("\n" + "═" * 95 + "\n VEDIC KUNDALI")
+
+    def test_sections_are_explicit(self, report):
+        kinds = [sec.kind for sec in report.sections]
+        assert kinds[0] == "header"
+        assert kinds.count("banner") == 1 and kinds[-1] == "free"
+        titles = [sec.title for sec in report.sections]
+        assert "Planets in Rasi (D1)" in titles
+        assert "YOGAS WITH STRENGTH (1-10) & ACCURATE TIMINGS" in titles
+        # table headers inside a section no longer read as section titles
+        assert not any(title.startswith(("Yogini  ", "Planet  ", "FUNCTIONAL")) for title in titles)
+
+    def test_header_key_values(self, chart, report):
+        from kundali.report_document import HEADER_TITLE, KEY_VALUES
+
+        header = report.sections[0]
+        assert header.title == HEADER_TITLE
+        (block,) = header.blocks
+        assert block.kind == KEY_VALUES
+        rows = dict(block.items)
+        assert rows["Gender"] == MUMBAI_BIRTH["gender"]
+        assert rows["Lagna"] == f"{chart['lagna_sign']} {chart['lagna_deg']}°"
+
+    def test_planet_table_carries_chart(self, chart, report):
+        from kundali.report_document import TABLE
+
+        table = report.section("Planets in Rasi (D1)").blocks[0]
+        assert table.kind == TABLE
+        assert table.data is report.chart["planets"]
+        assert report.chart["lagna"] == chart["lagna_sign"]
+        for code, pos in report.chart["planets"].items():
+            pdata = chart["planets"][code]
+            assert pos["sign"] == pdata["sign"]
+            assert pos["retro"] == bool(pdata.get("retro"))
+        assert len(table.items) == len(report.chart["planets"])
+
+    def test_written_tables_keep_their_header(self, report):
+        from kundali.report_document import TABLE
+
+        for title, header in (
+            ("Yogini Dasha (36-Year Cycle)", "Yogini"),
+            ("Shadbala — Six Sources of Planetary Strength", "Planet"),
+        ):
+            tables = [b for b in report.section(title).blocks if b.kind == TABLE]
+            assert tables and tables[0].items[0].split()[0] == header
+
+    def test_pdf_renders_prebuilt_report(self, chart, report, tmp_path):
+        pytest.importorskip("fpdf")
+        from kundali.report_pdf import generate_pdf_report
+
+        output_path = tmp_path / "report.pdf"
+        assert generate_pdf_report(chart, output_path=str(output_path), report=report)
+        assert output_path.stat().st_size > 0
+
+
+class TestReportWriter:
+    """Test the typed writer calls and the blocks they record."""
+
+    def test_block_kinds(self):
+        from kundali.report_document import ReportWriter
+
+        report = ReportWriter()
+        report.section("Career:")
+        report.box("CAREER", width=20)
+        report.heading("Strengths", "  ", gap=True)
+        report.kv("Score", "72/100", 12, "    ")
+        report.kv("Label", "Good", 12, "    ")
+        report.rule("  " + "-" * 10)
+        report.bullet("first", indent="  ")
+        report.bullet("Venus/Moon (2027-2030)", "└─", " ")
+        report.note("(Houses counted from Lagna)")
+        report.table(["  Su -> Ju : square"], data=[("Su", "Ju")])
+        report.write("Plain sentence one.\nPlain sentence two.")
+        section = report.document().sections[0]
+
+        assert section.lines() == [
+            "", "Career:", "-" * 85,
+            "", "┌─ CAREER ─────────┐",
+            "", "  Strengths:",
+            "    Score       : 72/100",
+            "    Label       : Good",
+            "  " + "-" * 10,
+            "  • first",
+            " └─ Venus/Moon (2027-2030)",
+            "(Houses counted from Lagna)",
+            "  Su -> Ju : square",
+            "Plain sentence one.",
+            "Plain sentence two.",
+        ]
+        blocks = section.blocks
+        assert [b.kind for b in blocks] == [
+            "box", "blank", "heading", "key_values", "bullets", "note", "table", "paragraph",
+        ]
+        assert blocks[0].items == "CAREER"
+        assert blocks[2].items == "Strengths"
+        assert blocks[3].items == [("Score", "72/100"), ("Label", "Good")]
+        assert blocks[4].items == [("•", "first"), ("└─", "Venus/Moon (2027-2030)")]
+        assert blocks[6].data == [("Su", "Ju")]
+        assert blocks[7].items == ["Plain sentence one.", "Plain sentence two."]
+
+    def test_interpretation_lines_match_writer(self, chart, report):
+        from kundali.interpretations import interpret_aspects
+
+        lines = report.section("Aspects (Drishti) – Full Analysis").lines()
+        assert lines[4:] == interpret_aspects(chart)
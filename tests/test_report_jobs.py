@@ -0,0 +1,167 @@
+"""
+Tests for the background report jobs and their artifact store.
+"""
+
+import datetime
+import os
+import time
+
+import pytest
+from tests.conftest import MUMBAI_BIRTH
+
+BIRTH = {
+    "birth_date": MUMBAI_BIRTH["date"],
+    "birth_time": MUMBAI_BIRTH["time"],
+    "place": MUMBAI_BIRTH["place"],
+    "gender": MUMBAI_BIRTH["gender"],
+    "ayanamsa": "Lahiri",
+    "name": "Test",
+}
+
+
+class TestReportKey:
+    """Test the content key of a report request."""
+
+    def test_stable_and_order_independent(self):
+        from kundali.report_jobs import report_key
+
+        day = datetime.date(2026, 1, 1)
+        key = report_key(BIRTH, day=day)
+        assert len(key) == 64
+        assert report_key(dict(reversed(list(BIRTH.items()))), day=day) == key
+        assert report_key({**BIRTH, "latitude": None}, day=day) == key
+
+    def test_differs_by_name_and_day(self):
+        from kundali.report_jobs import report_key
+
+        day = datetime.date(2026, 1, 1)
+        key = report_key(BIRTH, day=day)
+        assert report_key({**BIRTH, "name": "Other"}, day=day) != key
+        assert report_key(BIRTH, day=datetime.date(2026, 1, 2)) != key
+
+
+class TestReportStore:
+    """Test artifact paths and TTL expiry."""
+
+    def test_rejects_malformed_keys(self, tmp_path):
+        from kundali.report_jobs import ReportStore
+
+        store = ReportStore(tmp_path / "reports")
+        for key in ("../../etc/passwd", "abc", "A" * 64, None):
+            with pytest.raises(ValueError, match="Invalid report key"):
+                store.path(key)
+
+    def test_get_and_expiry(self, tmp_path):
+        from kundali.report_jobs import ReportStore, report_key
+
+        store = ReportStore(tmp_path / "reports", ttl=60)
+        fresh, stale = report_key(BIRTH), report_key({**BIRTH, "name": "Old"})
+        assert store.get(fresh) is None
+        for key in (fresh, stale):
+            with open(store.path(key), "wb") as fh:
+                fh.write(b"%PDF")
+        scratch = store.temp_path(fresh)
+        open(scratch, "wb").close()
+        old = time.time() - 120
+        os.utime(store.path(stale), (old, old))
+        os.utime(scratch, (old, old))
+
+        assert store.get(fresh) == store.path(fresh)
+        assert store.purge_expired() == 2
+        assert sorted(os.listdir(store.root)) == [fresh + ".pdf"]
+        os.utime(store.path(fresh), (old, old))
+        assert store.get(fresh) is None
+        assert not os.path.exists(store.path(fresh))
+
+
+class TestReportJobs:
+    """Test the job lifecycle on an in-process worker."""
+
+    @pytest.fixture
+    def jobs(self, tmp_path):
+        from kundali.report_jobs import ReportJobs, ReportStore
+
+        jobs = ReportJobs(ReportStore(tmp_path / "reports"), workers=0)
+        yield jobs
+        jobs.shutdown()
+
+    def test_render_dedupe_and_download(self, jobs):
+        pytest.importorskip("fpdf")
+
+        job = jobs.submit(BIRTH)
+        assert job.status in ("queued", "running", "done")
+        assert jobs.submit(dict(BIRTH)) is job
+        job.future.result(timeout=300)
+        assert job.status == "done" and job.error == ""
+
+        path = jobs.artifact(job.id)
+        assert path == jobs.store.path(job.id)
+        with open(path, "rb") as fh:
+            assert fh.read(4) == b"%PDF"
+        assert [name for name in os.listdir(jobs.store.root) if name.endswith(".tmp")] == []
+        assert jobs.pending == 0
+
+    def test_store_hit_needs_no_render(self, jobs):
+        from kundali.report_jobs import ReportJobs, report_key
+
+        key = report_key(BIRTH)
+        with open(jobs.store.path(key), "wb") as fh:
+            fh.write(b"%PDF")
+        job = jobs.submit(BIRTH)
+        assert job.id == key and job.future is None and job.status == "done"
+        # another process sharing the store finds the file without the job
+        other = ReportJobs(jobs.store, workers=0)
+        assert other.get(key).status == "done"
+        assert other.get("0" * 64) is None
+        assert other.get("not-a-key") is None
+
+    def test_failed_job_reports_error(self, jobs):
+        job = jobs.submit({**BIRTH, "birth_date": "1990-13-45"})
+        with pytest.raises(ValueError):
+            job.future.result(timeout=60)
+        assert job.status == "failed"
+        assert job.error.startswith("ValueError")
+        assert jobs.artifact(job.id) is None
+        assert os.listdir(jobs.store.root) == [job.id + ".job"]
+        assert jobs.store.marker(job.id)["error"] == job.error
+
+    def test_status_is_shared_through_the_store(self, jobs, monkeypatch):
+        import threading
+        from kundali import report_jobs
+        from kundali.report_jobs import ReportJobs
+
+        started, release = threading.Event(), threading.Event()
+
+        def render(store, key, birth):
+            store.mark(key, report_jobs.RUNNING)
+            started.set()
+            release.wait(10)
+            store.mark(key, report_jobs.FAILED, error="RuntimeError: boom")
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(report_jobs, "_render_report", render)
+        job = jobs.submit(BIRTH)
+        assert started.wait(10)
+        # a second server process sharing the store
+        other = ReportJobs(jobs.store, workers=0)
+        seen = other.get(job.id)
+        assert seen.status == "running" and seen.name == "Test"
+        resubmitted = other.submit(BIRTH)
+        assert resubmitted.future is None and resubmitted.status == "running"
+        assert other.pending == 0
+
+        release.set()
+        with pytest.raises(RuntimeError):
+            job.future.result(timeout=10)
+        failed = other.get(job.id)
+        assert failed.status == "failed" and failed.error == "RuntimeError: boom"
+
+    def test_abandoned_markers_are_ignored(self, jobs):
+        from kundali.report_jobs import report_key
+
+        key = report_key(BIRTH)
+        jobs.store.mark(key, "queued", name="Test")
+        assert jobs.get(key).status == "queued"
+        old = time.time() - jobs.store.pending_timeout - 1
+        os.utime(jobs.store._marker_path(key), (old, old))
+        assert jobs.get(key) is None
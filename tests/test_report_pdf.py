@@ -31,9 +31,9 @@ def _pdf_bytes(builder):
 
 
 def test_safe_filename_strips_unsafe_characters():
-    from kundali.report_pdf import _safe_filename
+    from kundali.report_pdf import safe_filename
 
-    assert _safe_filename(" Jane / Doe?? ") == "jane_doe"
+    assert safe_filename(" Jane / Doe?? ") == "jane_doe"
 
 
 def test_generate_pdf_report_creates_custom_output_path(chart, tmp_path):
@@ -115,41 +115,34 @@ def test_generate_pdf_report_emits_no_ln_deprecation(chart, tmp_path):
     assert not ln_warnings
 
 
-def test_txt_renderer_recognizes_nested_timing_bullets():
-    from kundali.report_pdf import _bullet_marker, _parse_bullet_line
-
-    parsed = _parse_bullet_line("?? Mercury/Venus (2027-2030) (Age 28-31) [FUTURE]")
-    tree_parsed = _parse_bullet_line("└─ Mercury/Moon (2031-2032) (Age 32-33) [FUTURE]")
-
-    assert parsed == ("??", "Mercury/Venus (2027-2030) (Age 28-31) [FUTURE]")
-    assert tree_parsed == ("└─", "Mercury/Moon (2031-2032) (Age 32-33) [FUTURE]")
-    assert _bullet_marker("??") == "-"
-    assert _bullet_marker("└─") == "-"
-
-
-def test_txt_renderer_detects_problematic_rows_as_preformatted():
-    from kundali.report_pdf import _looks_preformatted_line
-
-    assert _looks_preformatted_line("Ju: Gemini      (house  5) - Wisdom")
-    assert _looks_preformatted_line("Su -> Ju : square (orb 7.03deg)")
-    assert _looks_preformatted_line("2026-04-14  INGRESS            Su -> Aries")
-    assert _looks_preformatted_line("Yogini         Lord       Years   Period")
-    assert _looks_preformatted_line("Mangala        Mo         0.4     1999-1999")
-    assert _looks_preformatted_line(
-        "Day Yama 1         Sleeping     ****o  Good for constructive work"
-    )
-
-
-def test_txt_renderer_splits_compound_timing_lines():
-    from kundali.report_pdf import _expand_compound_bullet_lines
-
-    lines = [
-        "?? Mercury/Venus (2027-2030) [FUTURE] ?? Mercury/Moon (2031-2032) [FUTURE]",
-        "* Mercury Mahadasha (2024-2041) [NOW]",
-    ]
-
-    assert _expand_compound_bullet_lines(lines) == [
-        "?? Mercury/Venus (2027-2030) [FUTURE]",
-        "?? Mercury/Moon (2031-2032) [FUTURE]",
-        "* Mercury Mahadasha (2024-2041) [NOW]",
-    ]
+def test_report_writes_nested_timing_bullets(chart):
+    from kundali.printing import build_report
+    from kundali.report_document import BULLETS
+    from kundali.report_pdf import _bullet_indent, _bullet_marker
+
+    report = build_report(chart)
+    section = next(s for s in report.sections if s.title.startswith("FRUCTIFICATION PERIODS"))
+    bullets = [b for b in section.blocks if b.kind == BULLETS]
+
+    assert len(bullets) == len(chart["timings"])
+    for block, event in zip(bullets, chart["timings"]):
+        assert [p.event for p in block.data] == [event] * len(block.items)
+        for (marker, text), period in zip(block.items, block.data):
+            assert marker == ("•" if period.antara is None else "└─")
+            assert text == period.describe()
+    assert _bullet_marker("└─") == "-" and _bullet_indent("└─") == 5
+
+
+def test_report_writes_tabular_sections_as_tables(chart):
+    from kundali.printing import build_report
+    from kundali.report_document import KEY_VALUES, TABLE
+
+    report = build_report(chart)
+    gochara = report.section("Current Gochara (from Moon)").blocks[0]
+    assert gochara.kind == TABLE
+    assert set(gochara.data) == set(chart["transits"])
+    houses = report.section("Houses (Whole Sign)").blocks[0]
+    assert houses.kind == TABLE and sorted(houses.data) == list(range(1, 13))
+    aspects = report.section("Aspects (Drishti) – Summary").blocks[0]
+    assert aspects.kind == KEY_VALUES
+    assert all(label.startswith("House ") for label, _ in aspects.items)
@@ -0,0 +1,64 @@
+"""
+Tests for the Tajika solar return solver and annual series.
+"""
+
+import pytest
+
+
+class TestSolarReturn:
+    """Test the Newton solar return solver."""
+
+    @pytest.mark.parametrize("ayanamsa", ["Lahiri", "Raman"])
+    def test_sun_returns_to_natal_longitude(self, ayanamsa):
+        import swisseph as swe
+        from kundali.ephemeris import get_ephemeris
+        from kundali.tajika import find_solar_return_jd
+
+        eph = get_ephemeris(ayanamsa)
+        birth_jd = swe.julday(1990, 5, 15, 3.0)
+        natal_sun = eph.longitude(birth_jd, swe.SUN)
+        for year in (1991, 2024, 2060):
+            jd = find_solar_return_jd(natal_sun, year, birth_jd, ephemeris=eph)
+            diff = (eph.longitude(jd, swe.SUN) - natal_sun + 180) % 360 - 180
+            assert abs(diff) < 1e-7
+            assert int(swe.revjul(jd)[0]) == year
+            assert abs(jd - swe.julday(year, 5, 15, 3.0)) < 3
+
+    def test_leap_day_birth(self):
+        import swisseph as swe
+        from kundali.ephemeris import get_ephemeris
+        from kundali.tajika import find_solar_return_jd
+
+        eph = get_ephemeris()
+        birth_jd = swe.julday(1992, 2, 29, 12.0)
+        natal_sun = eph.longitude(birth_jd, swe.SUN)
+        jd = find_solar_return_jd(natal_sun, 2023, birth_jd, ephemeris=eph)
+        assert abs(jd - swe.julday(2023, 3, 1, 12.0)) < 2
+
+
+class TestTajikaSeries:
+    """Test multi-year Tajika charts."""
+
+    def test_matches_single_year_charts(self, chart):
+        from kundali.tajika import calculate_tajika, calculate_tajika_series
+
+        years = [2024, 2025, 2026, 2030]
+        series = calculate_tajika_series(chart, years=years)
+        assert [entry["year"] for entry in series] == years
+        for entry, year in zip(series, years):
+            single = calculate_tajika(chart, target_year=year)
+            assert entry["solar_return_jd"] == pytest.approx(single["solar_return_jd"], abs=1e-6)
+            assert entry["muntha"] == single["muntha"]
+            assert entry["year_lord"] == single["year_lord"]
+            assert entry["solar_return_date"] == single["solar_return_date"]
+
+    def test_defaults_to_next_ten_years(self, chart):
+        import datetime
+        from kundali.tajika import calculate_tajika_series
+
+        series = calculate_tajika_series(chart)
+        this_year = datetime.date.today().year
+        assert [entry["year"] for entry in series] == list(range(this_year, this_year + 10))
+        assert [entry["muntha"]["sign_idx"] for entry in series[:2]] == [
+            (chart["lagna_sign_idx"] + this_year - chart["birth_year"] + k) % 12 for k in range(2)
+        ]
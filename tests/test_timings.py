@@ -0,0 +1,62 @@
+"""
+Tests for the structured timing periods behind ``result["timings"]``.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+
+class TestTimingTable:
+    """Test the typed periods and their report-line view."""
+
+    def test_lines_render_periods(self, chart):
+        timings = chart["timings"]
+        assert list(timings) == ["Marriage", "Career Rise / Fame", "Children / Progeny", "Major Wealth / Property"]
+        for event, lines in timings.items():
+            periods = timings.periods(event)
+            assert lines == [p.render() for p in periods]
+            assert len(lines) <= 20
+            assert [p.start_year for p in periods] == sorted(p.start_year for p in periods)
+
+    def test_period_fields(self, chart):
+        birth_year, birth_jd = chart["birth_year"], chart["birth_jd"]
+        for period in chart["timings"].periods("Marriage"):
+            assert period.start_jd < period.end_jd
+            assert period.start_year == int(birth_year + (period.start_jd - birth_jd) / 365.25)
+            assert period.start_age == period.start_year - birth_year
+            if period.antara is None:
+                assert period.score is None
+                assert period.render().startswith(f"• {period.maha} Mahadasha")
+            else:
+                assert 0 <= period.score <= 10
+                assert f"{period.maha}/{period.antara} ({period.start_year}-{period.end_year})" in period.render()
+
+    def test_marriage_periods_come_from_the_table(self, chart):
+        periods = chart["timings"].periods("Marriage")
+        expected = [
+            {"maha": p.maha, "antara": p.antara, "start": p.start_year, "end": p.end_year, "score": 8}
+            for p in periods
+            if p.antara
+        ]
+        assert chart["dasha_periods_for_marriage"] == expected
+
+    def test_active_in_year(self, chart):
+        timings = chart["timings"]
+        year = chart["birth_year"] + 30
+        active = timings.active_in(year)
+        assert all(p.start_year <= year <= p.end_year for p in active)
+        assert timings.events_active_in(year) == [e for e in timings if any(p.event == e for p in active)]
+        assert timings.active_in(year, "Marriage") == [] or {p.event for p in timings.active_in(year, "Marriage")} == {"Marriage"}
+
+    def test_copies_and_json(self, chart):
+        from kundali.api import dumps, to_json
+
+        timings = chart["timings"]
+        for clone in (copy.deepcopy(timings), pickle.loads(pickle.dumps(timings))):
+            assert dict(clone) == dict(timings)
+            assert [p.to_dict() for p in clone.periods()] == [p.to_dict() for p in timings.periods()]
+        assert to_json(timings) == {event: lines for event, lines in timings.items()}
+        assert json.loads(dumps({"timings": timings}))["timings"] == to_json(timings)
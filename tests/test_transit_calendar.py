@@ -0,0 +1,119 @@
+"""
+Tests for the transit calendar event finder.
+
+Expected station and ingress instants were produced by the previous
+day-by-day bisection scanner (tolerance 0.001 day) for 2026.
+"""
+
+import pytest
+
+START_JD = 2461041.5  # 2026-01-01 0h UT
+
+PREVIOUS_STATIONS = [
+    ("Me", "station_retrograde", 2461097.7827, "Aquarius"),
+    ("Ju", "station_direct", 2461110.6616, "Gemini"),
+    ("Me", "station_direct", 2461120.3149, "Aquarius"),
+    ("Me", "station_retrograde", 2461221.2319, "Cancer"),
+    ("Me", "station_direct", 2461245.4575, "Gemini"),
+    ("Sa", "station_retrograde", 2461248.2905, "Pisces"),
+    ("Ve", "station_retrograde", 2461316.8013, "Libra"),
+    ("Me", "station_retrograde", 2461337.8003, "Libra"),
+    ("Me", "station_direct", 2461358.1626, "Libra"),
+    ("Ve", "station_direct", 2461358.521, "Virgo"),
+    ("Sa", "station_direct", 2461385.521, "Pisces"),
+    ("Ju", "station_retrograde", 2461387.522, "Leo"),
+]
+
+PREVIOUS_INGRESSES = [
+    ("Ma", "Sagittarius", "Capricorn", 2461056.4575),
+    ("Ma", "Capricorn", "Aquarius", 2461094.7642),
+    ("Ma", "Aquarius", "Pisces", 2461132.9165),
+    ("Ma", "Pisces", "Aries", 2461171.7974),
+    ("Ju", "Gemini", "Cancer", 2461193.3471),
+    ("Ma", "Aries", "Taurus", 2461212.271),
+    ("Ma", "Taurus", "Gemini", 2461255.2231),
+    ("Ma", "Gemini", "Cancer", 2461301.9624),
+    ("Ju", "Cancer", "Leo", 2461344.7725),
+    ("Ma", "Cancer", "Leo", 2461357.1167),
+    ("Ra", "Aquarius", "Capricorn", 2461380.21),
+]
+
+
+def _separation(lon1, lon2):
+    diff = abs(lon1 - lon2) % 360
+    return min(diff, 360 - diff)
+
+
+class TestTransitEvents:
+    """Regression tests against the previous scanner's output."""
+
+    def test_stations_match_previous_scanner(self):
+        from kundali.transit_calendar import get_retrograde_windows
+
+        stations = get_retrograde_windows(START_JD, 12)
+        assert len(stations) == len(PREVIOUS_STATIONS)
+        for event, (planet, kind, jd, sign) in zip(stations, PREVIOUS_STATIONS):
+            assert (event["planet"], event["type"], event["sign"]) == (planet, kind, sign)
+            assert event["jd"] == pytest.approx(jd, abs=1e-3)
+
+    def test_ingresses_match_previous_scanner(self):
+        from kundali.transit_calendar import get_upcoming_ingresses
+
+        ingresses = [
+            e for e in get_upcoming_ingresses(START_JD, 12) if e["planet"] in ("Ma", "Ju", "Ra")
+        ]
+        assert len(ingresses) == len(PREVIOUS_INGRESSES)
+        for event, (planet, from_sign, to_sign, jd) in zip(ingresses, PREVIOUS_INGRESSES):
+            assert (event["planet"], event["from_sign"], event["to_sign"]) == (planet, from_sign, to_sign)
+            assert event["jd"] == pytest.approx(jd, abs=1e-3)
+
+    def test_ingress_lands_on_sign_boundary(self):
+        from kundali.ephemeris import get_ephemeris
+        from kundali.transit_calendar import PLANET_IDS, get_upcoming_ingresses
+
+        eph = get_ephemeris()
+        for event in get_upcoming_ingresses(START_JD, 3):
+            lon = eph.longitude(event["jd"], PLANET_IDS[event["planet"]])
+            assert min(lon % 30, 30 - lon % 30) < 0.01
+
+    def test_finds_double_ingress_at_station(self):
+        from kundali.transit_calendar import get_upcoming_ingresses
+
+        # Mercury stations direct on the Libra/Scorpio cusp (Nov 1912) and
+        # spends ~0.2 days back in Libra; a daily scan steps over it.
+        mercury = [
+            e for e in get_upcoming_ingresses(2420100.0, 0.5) if e["planet"] == "Me"
+        ]
+        pairs = [(e["from_sign"], e["to_sign"]) for e in mercury if 2420104 < e["jd"] < 2420105]
+        assert pairs == [("Scorpio", "Libra"), ("Libra", "Scorpio")]
+
+    def test_conjunction_is_exact(self):
+        from kundali.ephemeris import get_ephemeris
+        from kundali.transit_calendar import PLANET_IDS, get_key_conjunctions
+
+        eph = get_ephemeris()
+        conjunctions = get_key_conjunctions(2451545.0, 24)
+        assert [(c["p1"], c["p2"]) for c in conjunctions] == [("Ma", "Sa"), ("Ju", "Sa"), ("Ju", "Ra")]
+        for c in conjunctions:
+            lon1 = eph.longitude(c["jd"], PLANET_IDS[c["p1"]])
+            lon2 = eph.longitude(c["jd"], PLANET_IDS[c["p2"]])
+            assert _separation(lon1, lon2) < 1e-3
+        # The 2000 Jupiter-Saturn great conjunction (exact 2000-05-28)
+        assert conjunctions[1]["date"] == "2000-05-28"
+
+    def test_natal_triggers_are_closest_approaches(self):
+        from kundali.ephemeris import get_ephemeris
+        from kundali.transit_calendar import PLANET_IDS, _get_natal_triggers
+
+        eph = get_ephemeris()
+        natal = {"Mo": 95.5, "Me": 350.0, "Ju": 123.4}
+        triggers = _get_natal_triggers(START_JD, 24, natal, eph)
+        assert triggers
+        for t in triggers:
+            pid = PLANET_IDS[t["transit_planet"]]
+            target = natal[t["natal_planet"]]
+            orb = _separation(eph.longitude(t["jd"], pid), target)
+            assert orb <= 2.0
+            assert t["orb"] == pytest.approx(orb, abs=2e-3)
+            for delta in (-0.5, 0.5):
+                assert _separation(eph.longitude(t["jd"] + delta, pid), target) >= orb - 1e-4
@@ -207,3 +207,58 @@ class TestCheckCombustion:
 
     def test_rahu_not_combustible(self):
         assert check_combustion("Ra", 100.0, 100.0, False) is False
+
+
+class TestEphemeris:
+    """kundali.ephemeris.Ephemeris matches swisseph's global sidereal mode."""
+
+    JD = 2460676.8
+
+    @pytest.mark.parametrize("ayanamsa", ["Lahiri", "Raman", "KP (Krishnamurti)"])
+    def test_matches_flg_sidereal(self, ayanamsa):
+        import swisseph as swe
+        from kundali.constants import AYANAMSA_OPTIONS
+        from kundali.ephemeris import Ephemeris
+
+        eph = Ephemeris(ayanamsa)
+        swe.set_sid_mode(AYANAMSA_OPTIONS[ayanamsa])
+        for pid in (swe.SUN, swe.MOON, swe.MERCURY, swe.MEAN_NODE):
+            want = swe.calc_ut(self.JD, pid, swe.FLG_SIDEREAL | swe.FLG_SPEED)[0]
+            got = eph.calc(self.JD, pid, swe.FLG_SPEED)
+            assert got[0] == pytest.approx(want[0], abs=1e-9)
+            assert got[3] == pytest.approx(want[3], abs=1e-5)
+        for hsys in (b"W", b"P"):
+            swe.set_sid_mode(AYANAMSA_OPTIONS[ayanamsa])
+            want_cusps, want_ascmc = swe.houses_ex(self.JD, 19.0, 72.8, hsys, swe.FLG_SIDEREAL)
+            cusps, ascmc = eph.houses(self.JD, 19.0, 72.8, hsys)
+            assert cusps == pytest.approx(want_cusps, abs=1e-9)
+            assert ascmc == pytest.approx(want_ascmc, abs=1e-9)
+
+    def test_calc_many_matches_calc(self):
+        import swisseph as swe
+        from kundali.ephemeris import Ephemeris
+
+        eph = Ephemeris("Raman")
+        ids = (swe.SUN, swe.MOON, swe.SATURN)
+        many = eph.calc_many(self.JD, ids, swe.FLG_SPEED)
+        assert many == [eph.calc(self.JD, pid, swe.FLG_SPEED) for pid in ids]
+
+    def test_ayanamsa_rate_is_cached(self, monkeypatch):
+        from kundali.ephemeris import Ephemeris
+
+        eph = Ephemeris("Lahiri")
+        for jd in (self.JD, self.JD + 0.25, self.JD + 3.6):
+            exact = eph.ayanamsa(jd + 0.5) - eph.ayanamsa(jd - 0.5)
+            assert eph.ayanamsa_rate(jd) == pytest.approx(exact, abs=1e-6)
+        monkeypatch.setattr(eph, "ayanamsa", lambda jd: pytest.fail("rate was not cached"))
+        eph.ayanamsa_rate(self.JD + 0.1)
+
+    def test_ignores_global_sid_mode(self):
+        import swisseph as swe
+        from kundali.ephemeris import Ephemeris
+
+        eph = Ephemeris("Lahiri")
+        swe.set_sid_mode(swe.SIDM_RAMAN)
+        first = eph.longitude(self.JD, swe.MOON)
+        swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+        assert eph.longitude(self.JD, swe.MOON) == first
@@ -0,0 +1,197 @@
+"""
+Tests for the varga engine, the compact varga table and its dict-style views.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def longitudes():
+    import random
+
+    rng = random.Random(20)
+    lons = [rng.uniform(0, 360) for _ in range(5000)]
+    # part and D30 boundaries, sign cusps, wrap-around
+    lons += [r * 30 + k * 30 / n for r in range(12) for n in (7, 9, 27, 45) for k in range(n)]
+    lons += [r * 30 + b for r in range(12) for b in (5, 10, 12, 18, 20, 25)]
+    return lons + [359.9999, 360.0, -15.5, 725.25]
+
+
+class TestVargaTable:
+    """Test the table against the per-varga utils functions."""
+
+    def test_matches_utils_functions(self, chart):
+        from kundali.constants import zodiac_signs
+        from kundali.vargas import VARGA_FUNCTIONS
+
+        vargas = chart["vargas"]
+        for code, pdata in chart["planets"].items():
+            for key, fn in VARGA_FUNCTIONS.items():
+                sign, deg = fn(pdata["full_lon"])
+                assert chart[key][code] == {"sign": sign, "deg": deg}
+                assert vargas.sign_idx(code, key) == zodiac_signs.index(sign)
+                assert pdata[f"{key}_sign"] == sign
+                assert pdata.get(f"{key}_deg") == deg
+
+    def test_views_behave_like_dicts(self, chart):
+        navamsa = chart["navamsa"]
+        assert list(navamsa) == list(chart["planets"])
+        assert "Su" in navamsa and "Asc" not in navamsa
+        assert navamsa.get("Asc", {}) == {}
+        assert set(chart["vargas"]) >= {"navamsa", "d2", "d60"}
+        with pytest.raises(KeyError):
+            chart["vargas"]["d5"]
+
+    def test_unknown_keys_still_raise(self, chart):
+        pdata = chart["planets"]["Su"]
+        with pytest.raises(KeyError):
+            pdata["no_such_key"]
+        assert pdata.get("no_such_key", 1) == 1
+
+
+class TestPlanetRecord:
+    """Test that planet records keep the old 40-key dict shape."""
+
+    def test_items_include_varga_keys(self, chart):
+        pdata = chart["planets"]["Ma"]
+        keys = list(pdata)
+        assert {"sign", "full_lon", "navamsa_sign", "d60_deg"} <= set(keys)
+        assert len(pdata) == len(keys) == len(dict(pdata))
+        assert dict(pdata) == dict(pdata.items())
+
+    def test_json_includes_varga_keys(self, chart):
+        from kundali.api import dumps, to_json
+
+        pdata = chart["planets"]["Ju"]
+        assert to_json(pdata)["d10_sign"] == pdata["d10_sign"]
+        assert json.loads(dumps({"Ju": pdata}))["Ju"] == to_json(pdata)
+        assert json.loads(json.dumps(pdata)) == to_json(pdata)
+
+    def test_copies_stay_compact(self, chart):
+        from kundali.vargas import PlanetRecord
+
+        planets = {code: chart["planets"][code] for code in ("Su", "Ke")}
+        for clone in (copy.deepcopy(planets), pickle.loads(pickle.dumps(planets))):
+            for code, pdata in clone.items():
+                assert isinstance(pdata, PlanetRecord)
+                assert pdata == planets[code]
+                assert dict.__len__(pdata) < len(pdata)
+            assert clone["Su"].table is clone["Ke"].table
+
+    def test_assignment_overrides_table(self, chart):
+        pdata = copy.deepcopy(chart["planets"]["Ve"])
+        pdata["d7_sign"] = "Aries"
+        assert pdata["d7_sign"] == "Aries"
+        assert pdata.get("d7_sign") == "Aries"
+        assert len(pdata) == len(chart["planets"]["Ve"])
+
+    def test_unbound_record_has_empty_varga_keys(self):
+        from kundali.vargas import PlanetRecord
+
+        pdata = PlanetRecord({"sign": "Leo"}, "Su")
+        assert pdata["navamsa_sign"] is None
+        assert pdata.get("d60_deg", 0) is None
+
+
+class TestVargaEngine:
+    """Test the table-driven rules against the utils functions."""
+
+    def test_scalar_rules_match_utils(self, longitudes):
+        from kundali.constants import zodiac_signs
+        from kundali.vargas import VARGA_FUNCTIONS, varga_position
+
+        for key, fn in VARGA_FUNCTIONS.items():
+            for lon in longitudes:
+                sign_idx, deg = varga_position(lon, key)
+                assert (zodiac_signs[sign_idx], round(deg, 2)) == fn(lon), (key, lon)
+
+    def test_arrays_match_scalar_rules(self, longitudes):
+        np = pytest.importorskip("numpy")
+        from kundali.vargas import VARGA_RULES, compute_vargas, varga_position
+
+        lons = np.array(longitudes[:4000]).reshape(400, 10)
+        computed = compute_vargas(lons, list(VARGA_RULES) + ["navamsa"])
+        for key, (signs, degs) in computed.items():
+            assert signs.shape == degs.shape == lons.shape
+            for lon, sign_idx, deg in zip(lons.ravel().tolist(), signs.ravel().tolist(), degs.ravel().tolist()):
+                assert (sign_idx, deg) == varga_position(lon, key), (key, lon)
+
+    def test_lists_without_numpy(self, longitudes, monkeypatch):
+        from kundali import vargas
+        from kundali.vargas import compute_vargas, varga_position
+
+        monkeypatch.setattr(vargas, "NUMPY_AVAILABLE", False)
+        lons = [longitudes[:5], longitudes[5:10]]
+        signs, degs = compute_vargas(lons, ["d150"])["d150"]
+        assert [[varga_position(lon, "d150") for lon in row] for row in lons] == [
+            list(zip(*pair)) for pair in zip(signs, degs)
+        ]
+        with pytest.raises(ValueError, match="Unknown varga"):
+            compute_vargas(lons, ["d13"])
+
+    def test_extra_vargas(self):
+        from kundali.vargas import varga_position
+
+        assert [varga_position(lon, "d5")[0] for lon in (1, 7, 13, 19, 25)] == [0, 10, 8, 2, 6]
+        assert varga_position(31, "d5")[0] == 1
+        assert varga_position(32, "d6")[0] == 6 and varga_position(35, "d6")[0] == 7
+        assert varga_position(31, "d8")[0] == 8
+        assert varga_position(0.1, "d81")[0] == 0 and varga_position(29.9, "d81")[0] == 8
+        assert varga_position(30.1, "d150")[0] == 1 and varga_position(30.3, "d150")[0] == 0
+        assert varga_position(60.1, "d150")[0] == 6
+
+    def test_register_and_unknown(self):
+        from kundali.vargas import VARGA_RULES, VargaRule, register_varga, varga_position
+
+        register_varga("d11", VargaRule.counted(11, list(range(12))))
+        try:
+            assert varga_position(31, "d11")[0] == 1
+        finally:
+            register_varga("d11", VargaRule.counted(11, [(12 - r) % 12 for r in range(12)]))
+        assert VARGA_RULES["d11"].parts == 11
+        with pytest.raises(ValueError, match="Unknown varga"):
+            varga_position(10, "d13")
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_batch_tables_match_single_charts(self, chart, monkeypatch, numpy_available):
+        from kundali import vargas
+        from kundali.vargas import VargaTable, varga_position
+
+        if numpy_available:
+            pytest.importorskip("numpy")
+        monkeypatch.setattr(vargas, "NUMPY_AVAILABLE", numpy_available and vargas.NUMPY_AVAILABLE)
+        planets = list(chart["planets"])
+        lons = [chart["planets"][p]["full_lon"] for p in planets]
+        batch = [lons, [(lon + 123.456) % 360 for lon in lons]]
+        tables = VargaTable.batch(planets, batch)
+        assert len(tables) == 2
+        for table, row in zip(tables, batch):
+            single = VargaTable.from_longitudes(dict(zip(planets, row)))
+            assert dict(table["d60"]) == dict(single["d60"])
+            assert [table.deg(p, "d30") for p in planets] == [single.deg(p, "d30") for p in planets]
+        assert dict(tables[0]["navamsa"]) == dict(chart["navamsa"])
+
+        custom = VargaTable.batch(planets, batch, ["navamsa", "d5", "d150"])
+        assert [list(table) for table in custom] == [["navamsa", "d5", "d150"]] * 2
+        assert dict(custom[0]["navamsa"]) == dict(chart["navamsa"])
+        for table, row in zip(custom, batch):
+            assert [table.sign_idx(p, "d150") for p in planets] == [
+                varga_position(lon, "d150")[0] for lon in row
+            ]
+        assert "d60" not in custom[0]
+
+    def test_custom_vargas_for_one_chart(self, chart):
+        import pickle
+
+        from kundali.vargas import PlanetRecord, VargaTable
+
+        lons = {code: pdata["full_lon"] for code, pdata in chart["planets"].items()}
+        table = VargaTable.from_longitudes(lons, ["d5", "d81"])
+        assert len(table) == 2 and table.vargas == ("d5", "d81")
+        assert pickle.loads(pickle.dumps(table))["d81"] == table["d81"]
+        record = PlanetRecord({"full_lon": lons["Ve"]}, code="Ve", table=table)
+        assert record["d7_sign"] is None